@@ -0,0 +1,165 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Fingerprints of analysis actions for incremental analysis.
+
+The fingerprint of an action covers the analyzer command (which contains the
+compilation flags and the checker configuration), the version of the analyzer
+binary, the skip lists and the review status config which filter the results,
+and the content of the translation unit's files. The list of these files is
+the dependency list emitted by the compiler. The files are hashed before the
+analyzer starts, so a file modified during the analysis makes the action
+outdated. The fingerprint is saved next to the analysis results after a
+successful analysis, so the action can be skipped by the next analysis if
+none of its inputs changed.
+"""
+
+
+import hashlib
+import json
+import os
+
+from typing import Dict, Iterable, List, Optional
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# Name of the directory in the report directory where the fingerprints of the
+# analysis actions are stored.
+FINGERPRINT_DIR = 'fingerprints'
+
+
+def get_fingerprint_file(fingerprint_dir: str, action_str: str) -> str:
+    """
+    Return the path of the fingerprint file belonging to the analysis action
+    with the given action string (see ResultHandler.analyzer_action_str).
+    """
+    return os.path.join(fingerprint_dir, action_str + '.json')
+
+
+def get_content_hash(file_path: str) -> Optional[str]:
+    """
+    Return the hash of the given file's content or None if the file can not
+    be read.
+    """
+    hasher = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+    except OSError:
+        return None
+
+    return hasher.hexdigest()
+
+
+def get_content_hashes(files: Iterable[str]) -> Dict[str, Optional[str]]:
+    """ Return the content hash of the given files. """
+    return {f: get_content_hash(f) for f in sorted(set(files))}
+
+
+def get_config_hash(skip_handlers, filter_handlers, rs_handler) -> str:
+    """
+    Return the hash of the configuration which filters the results of the
+    analysis: the lines of the skip lists and the review status config.
+    """
+    skip_lines = [
+        [handler.skip_file_lines for handler in handlers or []]
+        for handlers in [skip_handlers, filter_handlers]]
+    review_status_config = \
+        rs_handler.review_status_config if rs_handler else None
+
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([skip_lines, review_status_config],
+                             sort_keys=True, default=str).encode(
+                                 errors='ignore'))
+    return hasher.hexdigest()
+
+
+def compute_fingerprint(
+    analyzer_cmd: List[str],
+    analyzer_version: Optional[str],
+    config_hash: str,
+    content_hashes: Dict[str, Optional[str]]
+) -> str:
+    """
+    Compute the fingerprint of an analysis action from the analyzer command,
+    the analyzer version, the hash of the result filtering configuration
+    (see get_config_hash()) and the content hashes of the translation unit's
+    files.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([analyzer_cmd,
+                              str(analyzer_version),
+                              config_hash,
+                              sorted(content_hashes.items())]).encode(
+                                  errors='ignore'))
+    return hasher.hexdigest()
+
+
+def is_up_to_date(
+    fingerprint_file: str,
+    analyzer_cmd: List[str],
+    analyzer_version: Optional[str],
+    config_hash: str
+) -> bool:
+    """
+    Returns True if the fingerprint saved by the previous analysis matches
+    the current inputs of the action.
+    """
+    try:
+        with open(fingerprint_file, 'r',
+                  encoding='utf-8', errors='ignore') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    dependencies = previous.get('dependencies')
+    if not dependencies:
+        return False
+
+    content_hashes = get_content_hashes(dependencies)
+    if None in content_hashes.values():
+        return False
+
+    return previous.get('fingerprint') == compute_fingerprint(
+        analyzer_cmd, analyzer_version, config_hash, content_hashes)
+
+
+def save(
+    fingerprint_file: str,
+    analyzer_cmd: List[str],
+    analyzer_version: Optional[str],
+    config_hash: str,
+    content_hashes: Dict[str, Optional[str]]
+):
+    """
+    Save the fingerprint of an analysis action with the content hashes of its
+    dependencies which were computed before the analysis started.
+    """
+    if not content_hashes or None in content_hashes.values():
+        LOG.debug("Not all dependencies of the action are readable, no "
+                  "fingerprint is saved to '%s'.", fingerprint_file)
+        remove(fingerprint_file)
+        return
+
+    with open(fingerprint_file, 'w',
+              encoding='utf-8', errors='ignore') as f:
+        json.dump({
+            'fingerprint': compute_fingerprint(
+                analyzer_cmd, analyzer_version, config_hash, content_hashes),
+            'dependencies': sorted(content_hashes)}, f)
+
+
+def remove(fingerprint_file: str):
+    """ Remove the fingerprint file if it exists. """
+    try:
+        os.remove(fingerprint_file)
+    except OSError:
+        pass
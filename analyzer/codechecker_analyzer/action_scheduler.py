@@ -0,0 +1,130 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Order build actions by their predicted analysis cost.
+
+The analysis pool hands out actions to the workers in the order they are
+submitted. If a few expensive translation units are submitted last, the whole
+analysis waits for them on a single core. To avoid this the actions are
+scheduled longest job first, where the cost of an action is the wall time it
+took in a previous analysis (stored in the metadata.json of the report
+directory) or, if there is no such information, an estimation based on the
+size of the source file and the number of its includes.
+"""
+
+
+import re
+
+from statistics import median
+from typing import Dict, List, Optional
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# Key in the metadata of the CodeChecker tool under which the wall time of the
+# analysis actions are stored: {analyzer_type: {source_file: seconds}}.
+METADATA_DURATIONS_KEY = 'analysis_durations'
+
+# An include directive is counted as this many bytes of source code when the
+# cost of an action is estimated.
+INCLUDE_WEIGHT = 4096
+
+INCLUDE_PATTERN = re.compile(rb'^\s*#\s*(include|import)\b', re.MULTILINE)
+
+AnalysisDurations = Dict[str, Dict[str, float]]
+
+
+def get_durations(metadata: Optional[dict]) -> AnalysisDurations:
+    """
+    Return the analysis durations from the given metadata. Both the tool
+    level dict of the current metadata format and the whole metadata dict are
+    accepted.
+    """
+    if not metadata:
+        return {}
+
+    if METADATA_DURATIONS_KEY in metadata:
+        return metadata[METADATA_DURATIONS_KEY]
+
+    durations: AnalysisDurations = {}
+    for tool in metadata.get('tools', []):
+        for analyzer_type, sources in \
+                tool.get(METADATA_DURATIONS_KEY, {}).items():
+            durations.setdefault(analyzer_type, {}).update(sources)
+
+    return durations
+
+
+def estimate_source_cost(source_file: str) -> int:
+    """
+    Estimate the analysis cost of the given source file based on its size and
+    the number of its include directives. The unit of the result is an
+    abstract size: it can be compared only to other estimations.
+    """
+    try:
+        with open(source_file, 'rb') as f:
+            content = f.read()
+    except OSError:
+        return 0
+
+    return len(content) + \
+        len(INCLUDE_PATTERN.findall(content)) * INCLUDE_WEIGHT
+
+
+def order_by_cost(actions: List, durations: AnalysisDurations) -> List:
+    """
+    Return the given build actions ordered by their predicted cost, the most
+    expensive one first.
+
+    Actions which were analyzed before are predicted by their previous wall
+    time. The estimation of the other actions is converted to seconds by the
+    median time per estimated unit of the known actions.
+    """
+    known = {}
+    estimated = {}
+    source_costs: Dict[str, int] = {}
+
+    for idx, action in enumerate(actions):
+        duration = durations.get(action.analyzer_type, {}).get(action.source)
+        if duration is not None:
+            known[idx] = duration
+
+        if action.source not in source_costs:
+            source_costs[action.source] = \
+                estimate_source_cost(action.source)
+        estimated[idx] = source_costs[action.source]
+
+    ratios = [known[idx] / estimated[idx] for idx in known
+              if estimated[idx]]
+    seconds_per_unit = median(ratios) if ratios else 1.0
+
+    def cost(idx):
+        if idx in known:
+            return known[idx]
+        return estimated[idx] * seconds_per_unit
+
+    LOG.debug("Analysis cost of %d actions out of %d is predicted by "
+              "previous analysis durations.", len(known), len(actions))
+
+    # Sorting is stable, so actions with equal cost keep the order of the
+    # compilation database.
+    order = sorted(range(len(actions)), key=cost, reverse=True)
+    return [actions[idx] for idx in order]
+
+
+def worker_utilization(durations: List[float], wall_time: float,
+                       jobs: int) -> float:
+    """
+    Return the ratio of the time the workers were busy with analysis
+    actions and the time they were available.
+    """
+    if wall_time <= 0 or jobs <= 0:
+        return 0.0
+
+    return min(1.0, sum(durations) / (wall_time * jobs))
@@ -9,13 +9,16 @@
 
 import glob
 import os
+import queue
 import shlex
 import shutil
 import signal
 import sys
+import time
 import traceback
 import zipfile
 
+from collections import deque
 from functools import lru_cache
 from threading import Timer
 
@@ -28,7 +31,8 @@ from codechecker_common.review_status_handler import ReviewStatusHandler
 from codechecker_statistics_collector.collectors.special_return_value import \
     SpecialReturnValueCollector
 
-from . import gcc_toolchain
+from . import action_fingerprint, action_scheduler, analysis_progress, \
+    gcc_toolchain, memory_control
 
 from .analyzers import analyzer_types
 from .analyzers.config_handler import CheckerState
@@ -57,16 +61,29 @@ def print_analyzer_statistic_summary(metadata_analyzers, status, msg=None):
             LOG.info("  %s: %s", analyzer_type, res)
 
 
-def worker_result_handler(results, metadata_tool, output_path):
-    """ Print the analysis summary. """
+def worker_result_handler(results, metadata_tool, output_path,
+                          progress: analysis_progress.AnalysisProgress):
+    """
+    Record the results of the analysis actions in the metadata as they
+    arrive, and print the analysis summary at the end.
+    """
     skipped_num = 0
     reanalyzed_num = 0
     metadata_analyzers = metadata_tool['analyzers']
-    for res, skipped, reanalyzed, analyzer_type, _, sources in results:
+    durations = metadata_tool.setdefault(
+        action_scheduler.METADATA_DURATIONS_KEY, {})
+    peak_memory = metadata_tool.setdefault(
+        memory_control.METADATA_PEAK_MEMORY_KEY, {})
+    for res, skipped, reanalyzed, analyzer_type, result_file, sources, \
+            peak, duration in results:
         statistics = metadata_analyzers[analyzer_type]['analyzer_statistics']
         if skipped:
             skipped_num += 1
         else:
+            durations.setdefault(analyzer_type, {})[sources] = duration
+            if peak:
+                peak_memory.setdefault(analyzer_type, {})[sources] = peak
+
             if reanalyzed:
                 reanalyzed_num += 1
 
@@ -77,6 +94,14 @@ def worker_result_handler(results, metadata_tool, output_path):
                 statistics['failed'] += 1
                 statistics['failed_sources'].append(sources)
 
+        if result_file:
+            __soak_source_file(result_file + ".source", metadata_tool)
+
+        metadata_tool['skipped'] = skipped_num
+        progress.update(res, skipped, duration)
+
+    progress.close()
+
     LOG.info("----==== Summary ====----")
     print_analyzer_statistic_summary(metadata_analyzers,
                                      'successful',
@@ -93,16 +118,10 @@ def worker_result_handler(results, metadata_tool, output_path):
 
     metadata_tool['skipped'] = skipped_num
 
-    # check() created the result .plist files and additional, per-analysis
-    # meta information in forms of .plist.source files.
-    # We now soak these files into the metadata dict, as they are not needed
-    # as loose files on the disk... but synchronizing LARGE dicts between
-    # threads would be more error prone.
-    source_map = {}
+    # The .source files of the finished actions are already soaked. Only
+    # those remain which are left behind by an interrupted analysis.
     for f in glob.glob(os.path.join(output_path, "*.source")):
-        with open(f, 'r', encoding="utf-8", errors="ignore") as sfile:
-            source_map[f[:-7]] = sfile.read().strip()
-        os.remove(f)
+        __soak_source_file(f, metadata_tool)
 
     for f in glob.glob(os.path.join(output_path, 'failed', "*.error")):
         err_file, _ = os.path.splitext(f)
@@ -110,18 +129,47 @@ def worker_result_handler(results, metadata_tool, output_path):
         plist_file = os.path.join(output_path, plist_file)
         metadata_tool['result_source_files'].pop(plist_file, None)
 
-    metadata_tool['result_source_files'].update(source_map)
+
+def __soak_source_file(source_file, metadata_tool):
+    """
+    check() created the result .plist files and additional, per-analysis
+    meta information in forms of .plist.source files.
+    We soak these files into the metadata dict, as they are not needed
+    as loose files on the disk... but synchronizing LARGE dicts between
+    processes would be more error prone.
+    """
+    try:
+        with open(source_file, 'r', encoding="utf-8",
+                  errors="ignore") as sfile:
+            metadata_tool['result_source_files'][source_file[:-7]] = \
+                sfile.read().strip()
+        os.remove(source_file)
+    except OSError:
+        pass
 
 
 # Progress reporting.
 PROGRESS_CHECKED_NUM = None
 PROGRESS_ACTIONS = None
 
+# The pid of the worker process which runs the action of the given index, so
+# the main process can measure the memory of the running actions.
+ACTION_PIDS = None
+
 
-def init_worker(checked_num, action_num):
-    global PROGRESS_CHECKED_NUM, PROGRESS_ACTIONS
+def init_worker(checked_num, action_num, action_pids=None):
+    global PROGRESS_CHECKED_NUM, PROGRESS_ACTIONS, ACTION_PIDS
     PROGRESS_CHECKED_NUM = checked_num
     PROGRESS_ACTIONS = action_num
+    ACTION_PIDS = action_pids
+
+
+def check_action(index, check_data):
+    """ Run check() on the action of the given index in a worker. """
+    if ACTION_PIDS is not None:
+        ACTION_PIDS[index] = os.getpid()
+
+    return check(check_data)
 
 
 def save_output(base_file_name, out, err):
@@ -432,6 +480,25 @@ def collect_ctu_involved_files(result_handler, source_analyzer, output_dir):
         os.remove(out)
 
 
+def get_fingerprint_content_hashes(action):
+    """
+    Return the content hashes of the files of the translation unit before it
+    is analyzed, or None if the files couldn't be collected. The files are
+    collected from the dependency list emitted by the compiler.
+    """
+    from tu_collector import tu_collector
+
+    dependencies, error = tu_collector.get_dependent_headers(
+        action.original_command, action.directory)
+
+    if error:
+        LOG.debug("Failed to collect the dependencies of %s, it will be "
+                  "reanalyzed next time.", action.source)
+        return None
+
+    return action_fingerprint.get_content_hashes(dependencies)
+
+
 def check(check_data):
     """
     Invoke clang with an action which called by processes.
@@ -444,12 +511,23 @@ def check(check_data):
         rs_handler, quiet_output_on_stdout, \
         capture_analysis_output, generate_reproducer, analysis_timeout, \
         ctu_reanalyze_on_failure, \
-        output_dirs, statistics_data = check_data
+        output_dirs, statistics_data, incremental, \
+        analyzer_version = check_data
 
     failed_dir = output_dirs["failed"]
     success_dir = output_dirs["success"]
     reproducer_dir = output_dirs["reproducer"]
 
+    start_time = time.time()
+
+    # Peak memory usage of the analyzer processes of this action. The CTU
+    # reanalysis runs after the first analysis, so the maximum of the two is
+    # stored.
+    samplers = []
+
+    def __peak_memory():
+        return max((sampler.stop() for sampler in samplers), default=0)
+
     try:
         # If one analysis fails the check fails.
         return_codes = 0
@@ -469,6 +547,39 @@ def check(check_data):
         # Construct the analyzer cmd.
         analyzer_cmd = source_analyzer.construct_analyzer_cmd(rh)
 
+        ctu_active = isinstance(source_analyzer, ClangSA) and \
+            source_analyzer.is_ctu_available() and \
+            source_analyzer.is_ctu_enabled()
+
+        # The result of a CTU analysis depends on other translation units
+        # too, so it is not covered by the fingerprint.
+        fingerprint_file = None
+        if incremental and not ctu_active:
+            fingerprint_file = action_fingerprint.get_fingerprint_file(
+                output_dirs['fingerprints'], rh.analyzer_action_str)
+            config_hash = action_fingerprint.get_config_hash(
+                skip_handlers, filter_handlers, rs_handler)
+
+            if os.path.exists(rh.analyzer_result_file.replace(r'\ ', ' ')) \
+                    and action_fingerprint.is_up_to_date(
+                        fingerprint_file, analyzer_cmd, analyzer_version,
+                        config_hash):
+                LOG.info("[%d/%d] %s skipped %s, its inputs are unchanged.",
+                         PROGRESS_CHECKED_NUM.value, PROGRESS_ACTIONS.value,
+                         action.analyzer_type,
+                         os.path.basename(action.source))
+                PROGRESS_CHECKED_NUM.value += 1
+
+                return 0, True, False, action.analyzer_type, \
+                    rh.analyzer_result_file, action.source, 0, \
+                    time.time() - start_time
+
+            action_fingerprint.remove(fingerprint_file)
+
+            # The files are hashed before the analysis, so a file which is
+            # modified during the analysis is analyzed again next time.
+            content_hashes = get_fingerprint_content_hashes(action)
+
         # The analyzer invocation calls __create_timeout as a callback
         # when the analyzer starts. This callback creates the timeout
         # watcher over the analyzer process, which in turn returns a
@@ -481,19 +592,24 @@ def check(check_data):
         # "function pointer" is captured by reference.
         timeout_cleanup = [lambda: False]
 
+        def __sample_memory(analyzer_process):
+            samplers.append(
+                memory_control.PeakMemorySampler(analyzer_process.pid))
+
         if analysis_timeout and analysis_timeout > 0:
             def __create_timeout(analyzer_process):
                 """
                 Once the analyzer process is started, this method is
                 called. Set up a timeout for the analysis.
                 """
+                __sample_memory(analyzer_process)
                 timeout_cleanup[0] = setup_process_timeout(
                     analyzer_process, analysis_timeout)
         else:
-            def __create_timeout(_):
-                # If no timeout is given by the client, this callback
-                # shouldn't do anything.
-                pass
+            def __create_timeout(analyzer_process):
+                # If no timeout is given by the client, only the memory
+                # usage of the analyzer is measured.
+                __sample_memory(analyzer_process)
 
         result_file_exists = os.path.exists(rh.analyzer_result_file)
 
@@ -519,10 +635,6 @@ def check(check_data):
         result_file = rh.analyzer_result_file.replace(r'\ ', ' ')
         result_base = os.path.basename(result_file)
 
-        ctu_active = isinstance(source_analyzer, ClangSA) and \
-            source_analyzer.is_ctu_available() and \
-            source_analyzer.is_ctu_enabled()
-
         zip_suffix = '_CTU' if ctu_active else ''
 
         failure_type = "_unknown"
@@ -575,6 +687,11 @@ def check(check_data):
                      PROGRESS_CHECKED_NUM.value, PROGRESS_ACTIONS.value,
                      action.analyzer_type, source_file_name)
 
+            if fingerprint_file:
+                action_fingerprint.save(fingerprint_file, analyzer_cmd,
+                                        analyzer_version, config_hash,
+                                        content_hashes)
+
             if result_file_exists:
                 LOG.debug("Previous analysis results in '%s' has been "
                           "overwritten.", rh.analyzer_result_file)
@@ -605,7 +722,7 @@ def check(check_data):
 
                 # Fills up the result handler with
                 # the analyzer information.
-                source_analyzer.analyze(analyzer_cmd, rh)
+                source_analyzer.analyze(analyzer_cmd, rh, __sample_memory)
 
                 return_codes = rh.analyzer_returncode
                 if rh.analyzer_returncode == 0:
@@ -644,13 +761,14 @@ def check(check_data):
         PROGRESS_CHECKED_NUM.value += 1
 
         return return_codes, False, reanalyzed, action.analyzer_type, \
-            result_file, action.source
+            result_file, action.source, __peak_memory(), \
+            time.time() - start_time
 
     except Exception as e:
         LOG.debug(str(e))
         traceback.print_exc(file=sys.stdout)
         return 1, False, reanalyzed, action.analyzer_type, None, \
-            action.source
+            action.source, __peak_memory(), time.time() - start_time
 
 
 def skip_cpp(compile_actions, skip_handlers):
@@ -674,19 +792,76 @@ def skip_cpp(compile_actions, skip_handlers):
     return analyze, skip
 
 
+def __run_actions(pool, analyzed_actions, jobs, admission_controller,
+                  action_pids):
+    """
+    Run check() on the given actions in the pool, in their order, and yield
+    the results as the actions finish. At most jobs actions run at the same
+    time, and a new action is started only if the admission controller
+    admits it. Otherwise the actions wait until a running action finishes.
+    The workers store their pid in action_pids by the index of the action.
+    """
+    finished = queue.Queue()
+    errors = []
+
+    def __error(err):
+        errors.append(err)
+        finished.put((None, None))
+
+    pending = deque(enumerate(analyzed_actions))
+    running = set()
+    while pending or running:
+        admission_controller.refresh(
+            {idx: action_pids[idx] for idx in running if action_pids[idx]})
+
+        while pending and len(running) < jobs and \
+                admission_controller.admit(pending[0][0], pending[0][1][1]):
+            idx, check_data = pending.popleft()
+            pool.apply_async(
+                check_action, (idx, check_data),
+                callback=lambda result, idx=idx: finished.put((idx, result)),
+                error_callback=__error)
+            running.add(idx)
+
+        # The main process does not get signals while it is blocked without
+        # a timeout. It is a python bug, so the result is polled.
+        try:
+            idx, result = finished.get(timeout=1)
+        except queue.Empty:
+            continue
+
+        if errors:
+            raise errors[0]
+
+        running.discard(idx)
+        admission_controller.finished(idx)
+
+        yield result
+
+
 def start_workers(actions_map, actions, analyzer_config_map,
                   jobs, output_path, skip_handlers, filter_handlers,
                   rs_handler: ReviewStatusHandler, metadata_tool,
                   quiet_analyze, capture_analysis_output, generate_reproducer,
                   timeout, ctu_reanalyze_on_failure, statistics_data, manager,
-                  compile_cmd_count):
+                  compile_cmd_count, incremental=False, memory_budget=None,
+                  progress_file=None):
     """
     Start the workers in the process pool.
     For every build action there is worker which makes the analysis.
+
+    A new action is started only if the memory of the system (and the
+    memory_budget in bytes, if given) is enough for it, so the number of
+    parallel analyses can be less than jobs.
+
+    The metadata is saved periodically while the analysis is running. If
+    progress_file is given, the progress of the analysis is written to it.
     """
     # Handle SIGINT to stop this script running.
     def signal_handler(signum, _):
         try:
+            if progress:
+                progress.checkpoint()
             pool.terminate()
             pool.join()
             manager.shutdown()
@@ -697,13 +872,22 @@ def start_workers(actions_map, actions, analyzer_config_map,
         finally:
             sys.exit(128 + signum)
 
+    progress = None
+
     actions, skipped_actions = skip_cpp(actions, skip_handlers)
+
+    # Start the most expensive actions first so that the analysis doesn't end
+    # with a few long running actions occupying only some of the workers.
+    actions = action_scheduler.order_by_cost(
+        actions, action_scheduler.get_durations(metadata_tool))
+
     # Start checking parallel.
     checked_var = multiprocess.Value('i', 1)
     actions_num = multiprocess.Value('i', len(actions))
+    action_pids = multiprocess.Array('i', len(actions), lock=False)
     pool = multiprocess.Pool(jobs,
                              initializer=init_worker,
-                             initargs=(checked_var, actions_num))
+                             initargs=(checked_var, actions_num, action_pids))
     signal.signal(signal.SIGINT, signal_handler)
 
     # If the analysis has failed, we help debugging.
@@ -731,10 +915,18 @@ def start_workers(actions_map, actions, analyzer_config_map,
     if not os.path.exists(ctu_connections_dir):
         os.makedirs(ctu_connections_dir)
 
+    # Fingerprints of the successfully analyzed actions for incremental
+    # analysis.
+    fingerprints_dir = os.path.join(output_path,
+                                    action_fingerprint.FINGERPRINT_DIR)
+    if not os.path.exists(fingerprints_dir) and incremental:
+        os.makedirs(fingerprints_dir)
+
     output_dirs = {'success': success_dir,
                    'failed': failed_dir,
                    'reproducer': reproducer_dir,
-                   'ctu_connections': ctu_connections_dir}
+                   'ctu_connections': ctu_connections_dir,
+                   'fingerprints': fingerprints_dir}
 
     @lru_cache
     def __analyzer_config_map_get(analyzer_type):
@@ -744,6 +936,10 @@ def start_workers(actions_map, actions, analyzer_config_map,
         """
         return analyzer_config_map.get(analyzer_type)
 
+    def __analyzer_version(analyzer_type):
+        return metadata_tool['analyzers'].get(analyzer_type, {}) \
+            .get('analyzer_statistics', {}).get('version')
+
     analyzed_actions = [(actions_map,
                          build_action,
                          __analyzer_config_map_get(build_action.analyzer_type),
@@ -757,29 +953,37 @@ def start_workers(actions_map, actions, analyzer_config_map,
                          timeout,
                          ctu_reanalyze_on_failure,
                          output_dirs,
-                         statistics_data)
+                         statistics_data,
+                         incremental,
+                         __analyzer_version(build_action.analyzer_type))
                         for build_action in actions]
 
     if analyzed_actions:
         try:
-
-            # Workaround, equivalent of map.
-            # The main script does not get signal
-            # while map or map_async function is running.
-            # It is a python bug, this does not happen if a timeout is
-            # specified, then receive the interrupt immediately.
-
             # FIXME: Ensure all shared data structures are wrapped in manager
             #        proxy objects before passing them to other processes via
-            #        map_async.
+            #        apply_async.
             #        Note that even deep-copying is known to be insufficient.
-            timeout = 3155760 if sys.platform == 'win32' else 31557600
-            pool.map_async(check,
-                           analyzed_actions,
-                           1,
-                           callback=lambda results: worker_result_handler(
-                               results, metadata_tool, output_path)
-                           ).get(timeout)
+            start_time = time.time()
+            progress = analysis_progress.AnalysisProgress(
+                len(analyzed_actions), metadata_tool, output_path,
+                progress_file)
+            results = __run_actions(
+                pool, analyzed_actions, jobs,
+                memory_control.AdmissionController(
+                    memory_budget,
+                    memory_control.get_peak_memory(metadata_tool)),
+                action_pids)
+
+            worker_result_handler(results, metadata_tool, output_path,
+                                  progress)
+
+            utilization = action_scheduler.worker_utilization(
+                [progress.busy_time],
+                time.time() - start_time,
+                min(jobs, len(analyzed_actions)))
+            metadata_tool['worker_utilization'] = utilization
+            LOG.info("Worker utilization: %.1f%%", utilization * 100)
 
             pool.close()
         except Exception:
@@ -0,0 +1,155 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Progress of the analysis while its actions are running.
+
+The results of the analysis actions are recorded in the metadata as they
+arrive. The metadata is saved to the report directory periodically, so if
+the analysis is interrupted, the results of the finished actions are not
+lost and a new analysis with --incremental continues where the interrupted
+one stopped. The progress can also be written to a file as JSON lines, e.g.:
+
+{"event": "progress", "finished": 120, "total": 1000, "successful": 118,
+ "failed": 1, "skipped": 1, "elapsed": 60.2, "throughput": 1.99,
+ "eta": 441.8}
+
+The last line of the file has "finished" as event.
+"""
+
+
+import json
+import os
+import tempfile
+import time
+
+from typing import Optional
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# The metadata is saved at most this often, in seconds.
+CHECKPOINT_INTERVAL = 60
+
+# The progress is written at most this often, in seconds.
+PROGRESS_INTERVAL = 1
+
+
+def save_metadata(metadata_tool: dict, output_path: str):
+    """
+    Save the metadata of the given CodeChecker tool to the metadata.json of
+    the report directory. The file is replaced atomically, so an interrupted
+    analysis never leaves a partially written file behind.
+    """
+    metadata_file = os.path.join(output_path, 'metadata.json')
+    tmp_file_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+                'w', dir=output_path, prefix='metadata.', suffix='.tmp',
+                delete=False, encoding="utf-8") as f:
+            tmp_file_path = f.name
+            json.dump({'version': 2, 'tools': [metadata_tool]}, f)
+
+        os.replace(tmp_file_path, metadata_file)
+    except (OSError, TypeError, ValueError) as err:
+        LOG.warning("Failed to save analysis checkpoint to %s: %s",
+                    metadata_file, err)
+        if tmp_file_path and os.path.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+
+
+class AnalysisProgress:
+    """
+    Count the finished analysis actions, and save the metadata and the
+    progress periodically.
+    """
+
+    def __init__(self, total: int, metadata_tool: dict, output_path: str,
+                 progress_file: Optional[str] = None):
+        self.total = total
+        self.finished = 0
+        self.successful = 0
+        self.failed = 0
+        self.skipped = 0
+
+        # Sum of the wall time of the finished actions.
+        self.busy_time = 0.0
+
+        self.__metadata_tool = metadata_tool
+        self.__output_path = output_path
+        self.__start_time = time.time()
+        self.__last_checkpoint = self.__start_time
+        self.__last_progress = 0.0
+
+        self.__progress_file = None
+        if progress_file:
+            try:
+                self.__progress_file = open(progress_file, 'w',
+                                            encoding="utf-8",
+                                            errors="ignore")
+            except OSError as err:
+                LOG.warning("Failed to open progress file %s: %s",
+                            progress_file, err)
+
+    def update(self, return_code: int, skipped: bool, duration: float):
+        """ Count a finished action. """
+        self.finished += 1
+        self.busy_time += duration
+
+        if skipped:
+            self.skipped += 1
+        elif return_code == 0:
+            self.successful += 1
+        else:
+            self.failed += 1
+
+        now = time.time()
+        if now - self.__last_progress >= PROGRESS_INTERVAL:
+            self.__last_progress = now
+            self.__write_progress('progress', now)
+
+        if now - self.__last_checkpoint >= CHECKPOINT_INTERVAL:
+            self.__last_checkpoint = now
+            self.checkpoint()
+
+    def checkpoint(self):
+        """ Save the metadata of the finished actions. """
+        LOG.debug("Saving analysis checkpoint after %d actions.",
+                  self.finished)
+        save_metadata(self.__metadata_tool, self.__output_path)
+
+    def close(self):
+        """ Write the final progress and close the progress file. """
+        if self.__progress_file:
+            self.__write_progress('finished', time.time())
+            self.__progress_file.close()
+            self.__progress_file = None
+
+    def __write_progress(self, event: str, now: float):
+        if not self.__progress_file:
+            return
+
+        elapsed = now - self.__start_time
+        throughput = self.finished / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - self.finished) / throughput \
+            if throughput > 0 else None
+
+        try:
+            self.__progress_file.write(json.dumps({
+                'event': event,
+                'finished': self.finished,
+                'total': self.total,
+                'successful': self.successful,
+                'failed': self.failed,
+                'skipped': self.skipped,
+                'elapsed': round(elapsed, 3),
+                'throughput': round(throughput, 3),
+                'eta': round(eta, 3) if eta is not None else None}) + '\n')
+            self.__progress_file.flush()
+        except OSError as err:
+            LOG.debug("Failed to write progress: %s", err)
@@ -378,7 +378,12 @@ def perform_analysis(args, skip_handlers, filter_handlers,
                                        ctu_reanalyze_on_failure,
                                        statistics_data,
                                        manager,
-                                       compile_cmd_count)
+                                       compile_cmd_count,
+                                       'incremental' in args,
+                                       args.memory_budget
+                                       if 'memory_budget' in args else None,
+                                       args.progress_file
+                                       if 'progress_file' in args else None)
         LOG.info("Analysis finished.")
         LOG.info("To view results in the terminal use the "
                  "\"CodeChecker parse\" command.")
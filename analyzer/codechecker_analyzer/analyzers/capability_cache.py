@@ -0,0 +1,161 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+On-disk cache of the analyzer capabilities.
+
+Listing the checkers, the checker options, the analyzer configuration and the
+version of an analyzer requires running the analyzer binary. The output of
+these commands depends only on the binary and the checker plugins given in
+the command, so it is stored in a cache directory which is shared by the
+CodeChecker invocations. The entries are invalidated when the binary or a
+plugin changes. Commands which would read configuration files found from the
+current directory (e.g. the .clang-tidy files) are run in an empty directory,
+so their output doesn't depend on where CodeChecker is invoked.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from shutil import which
+from typing import List, Optional
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# Increase it when the format of the entries changes, so the earlier entries
+# are not used anymore.
+CACHE_VERSION = 2
+
+
+def get_default_cache_dir() -> Optional[str]:
+    """
+    Returns the directory of the analyzer capability cache. It can be set by
+    the CC_ANALYZER_CAPABILITY_CACHE_DIR environment variable, and the cache
+    is disabled if this variable is set to an empty value.
+    """
+    cache_dir = os.environ.get('CC_ANALYZER_CAPABILITY_CACHE_DIR')
+    if cache_dir is not None:
+        return cache_dir or None
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(cache_home, 'codechecker', 'analyzer_capabilities')
+
+
+def get_key(command: List[str]) -> Optional[list]:
+    """
+    Returns the cache key of the given command or None if its binary can not
+    be found. The key contains the resolved path, the modification time and
+    the size of the binary and of every other file given in the command, e.g.
+    the checker plugins loaded by the analyzer.
+    """
+    binary = which(command[0])
+    if not binary:
+        return None
+
+    files = []
+    try:
+        for path in [binary] + [arg for arg in command[1:]
+                                if os.path.isfile(arg)]:
+            path = os.path.realpath(path)
+            stat = os.stat(path)
+            files.append([path, stat.st_mtime_ns, stat.st_size])
+    except OSError:
+        return None
+
+    return [CACHE_VERSION, command, files]
+
+
+def _get_file_path(cache_dir: str, key: list) -> str:
+    digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+    return os.path.join(cache_dir, digest[:2], digest + '.json')
+
+
+def get(cache_dir: str, key: list) -> Optional[str]:
+    """ Returns the output of the command of the given key if cached. """
+    try:
+        with open(_get_file_path(cache_dir, key), encoding="utf-8",
+                  errors="ignore") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get('key') != key:
+        return None
+
+    return entry.get('output')
+
+
+def put(cache_dir: str, key: list, output: str):
+    """
+    Stores the output of the command of the given key. The file is replaced
+    atomically, so other processes never read a partially written entry.
+    """
+    file_path = _get_file_path(cache_dir, key)
+    tmp_file_path = None
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+                'w', dir=os.path.dirname(file_path), suffix='.tmp',
+                delete=False, encoding="utf-8") as f:
+            tmp_file_path = f.name
+            json.dump({'key': key, 'output': output}, f)
+
+        os.replace(tmp_file_path, file_path)
+    except OSError as err:
+        LOG.debug("Failed to write analyzer capability cache %s: %s",
+                  file_path, err)
+        if tmp_file_path and os.path.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+
+
+def check_output(command: List[str], env=None, stderr=None,
+                 isolate_cwd: bool = False) -> str:
+    """
+    Runs the given command like subprocess.check_output() in text mode, or
+    returns its output from the cache if the command was already run with the
+    same binary and files.
+
+    If isolate_cwd is True, the command is run in an empty temporary
+    directory instead of the current one. This has to be set for commands
+    whose output depends on the configuration files found from the current
+    directory, because the directory is not part of the cache key.
+
+    Only the output of successful commands is cached, errors are raised the
+    same way as subprocess.check_output() does.
+    """
+    command = [str(arg) for arg in command]
+
+    cache_dir = get_default_cache_dir()
+    key = get_key(command) if cache_dir else None
+
+    if key:
+        output = get(cache_dir, key)
+        if output is not None:
+            return output
+
+    with tempfile.TemporaryDirectory() if isolate_cwd \
+            else contextlib.nullcontext() as cwd:
+        output = subprocess.check_output(
+            command,
+            env=env,
+            stderr=stderr,
+            cwd=cwd,
+            universal_newlines=True,
+            encoding="utf-8",
+            errors="ignore")
+
+    if key:
+        put(cache_dir, key, output)
+
+    return output
@@ -29,6 +29,7 @@ from codechecker_statistics_collector.collectors.return_value import \
     ReturnValueCollector
 
 from .. import analyzer_base
+from .. import capability_cache
 from ..config_handler import CheckerState
 from ..flag import has_flag
 from ..flag import prepend_all
@@ -43,16 +44,13 @@ LOG = get_logger('analyzer')
 def clang_command_output(command: List[str]) -> str:
     """
     Runs the given Clang command in its proper environment and returns its
-    output as a string.
+    output as a string. The output is cached until the binary changes.
     Throws an exception if the command cannot be executed as a subprocess.
     """
-    return subprocess.check_output(
+    return capability_cache.check_output(
         command,
         stderr=subprocess.STDOUT,
-        env=analyzer_context.get_context().get_env_for_bin(command[0]),
-        universal_newlines=True,
-        encoding="utf-8",
-        errors="ignore")
+        env=analyzer_context.get_context().get_env_for_bin(command[0]))
 
 
 def parse_clang_help_page(
@@ -198,11 +196,7 @@ class ClangSA(analyzer_base.SourceAnalyzer):
         version = [cls.analyzer_binary(), '-dumpversion']
 
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             universal_newlines=True,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = capability_cache.check_output(version, env=environ)
             return Version.parse(output.strip())
         except (subprocess.CalledProcessError, OSError) as oerr:
             LOG.warning("Failed to get analyzer version: %s",
@@ -753,6 +747,9 @@ class ClangSA(analyzer_base.SourceAnalyzer):
             handler.ctu_on_demand = \
                 'ctu_ast_mode' in args and \
                 args.ctu_ast_mode == 'parse-on-demand'
+            if 'ctu_triple_arch_from_compiler_info' in args:
+                handler.ctu_compiler_info_file = os.path.join(
+                    args.output_path, 'compiler_info.json')
 
         checkers = ClangSA.get_analyzer_checkers()
 
@@ -24,6 +24,9 @@ class ClangSAConfigHandler(config_handler.AnalyzerConfigHandler):
         super().__init__()
         self.ctu_dir = ''
         self.ctu_on_demand = False
+        # The triple archs of the CTU analysis are seeded from the compiler
+        # targets of this compiler info file if it is set.
+        self.ctu_compiler_info_file = ''
         self.enable_z3 = False
         self.enable_z3_refutation = False
         self.environ = environ
@@ -19,6 +19,7 @@ from pathlib import Path
 from sys import maxsize
 from yaml import Dumper
 
+from codechecker_common.compatibility import multiprocessing
 from codechecker_common.logger import get_logger
 
 from codechecker_merge_clang_extdef_mappings.merge_clang_extdef_mappings \
@@ -45,25 +46,43 @@ class LLVMComatibleYamlDumper(Dumper):
         return True
 
 
-def merge_clang_extdef_mappings(ctu_dir, ctu_func_map_file,
-                                ctu_temp_fnmap_folder):
-    """ Merge individual function maps into a global one."""
+def __merge_triple_arch_dir(params):
+    """ Merge the function maps of a triple arch directory. """
+    triple_path, ctu_func_map_file, ctu_temp_fnmap_folder = params
+
+    fnmap_dir = os.path.join(triple_path, ctu_temp_fnmap_folder)
+    merged_fn_map = os.path.join(triple_path, ctu_func_map_file)
+    conflicts = merge(fnmap_dir, merged_fn_map)
 
-    triple_arches = glob.glob(os.path.join(ctu_dir, '*'))
-    for triple_path in triple_arches:
-        if not os.path.isdir(triple_path):
-            continue
+    # Remove all temporary files.
+    shutil.rmtree(fnmap_dir, ignore_errors=True)
 
-        triple_arch = os.path.basename(triple_path)
-        fnmap_dir = os.path.join(ctu_dir, triple_arch,
-                                 ctu_temp_fnmap_folder)
+    return os.path.basename(triple_path), conflicts
 
-        merged_fn_map = os.path.join(ctu_dir, triple_arch,
-                                     ctu_func_map_file)
-        merge(fnmap_dir, merged_fn_map)
 
-        # Remove all temporary files.
-        shutil.rmtree(fnmap_dir, ignore_errors=True)
+def merge_clang_extdef_mappings(ctu_dir, ctu_func_map_file,
+                                ctu_temp_fnmap_folder, jobs=1):
+    """ Merge individual function maps into a global one. The function maps
+    of the triple arch directories are merged in parallel. """
+
+    triple_paths = [triple_path for triple_path
+                    in glob.glob(os.path.join(ctu_dir, '*'))
+                    if os.path.isdir(triple_path)]
+    params = [(triple_path, ctu_func_map_file, ctu_temp_fnmap_folder)
+              for triple_path in triple_paths]
+
+    jobs = min(jobs, len(params))
+    if jobs > 1:
+        with multiprocessing.Pool(jobs) as pool:
+            results = list(pool.map(__merge_triple_arch_dir, params))
+    else:
+        results = list(map(__merge_triple_arch_dir, params))
+
+    for triple_arch, conflicts in results:
+        if conflicts:
+            LOG.debug("%d functions of '%s' are defined in multiple "
+                      "translation units, these are left out of CTU.",
+                      conflicts, triple_arch)
 
 
 def generate_ast_cmd(action, config, triple_arch, source):
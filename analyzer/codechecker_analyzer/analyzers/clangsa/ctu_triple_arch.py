@@ -7,14 +7,47 @@
 # -------------------------------------------------------------------------
 """
 Helpers for determining triple arch of a compile action
+
+Determining the triple arch requires running the compiler, but it depends on
+the few compiler flags only which select the target. The triple arch is
+memoized by these flags, and the triple archs collected before the CTU
+pre-analysis are stored in the CTU directory, so the pre-analysis and the
+analysis processes read them instead of running the compiler again.
 """
 
 
+import json
+import os
+import tempfile
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from codechecker_common.logger import get_logger
+from codechecker_common.util import load_json
+
 from . import analyzer
 from .. import analyzer_base
 from ..flag import has_flag
 from ..flag import prepend_all
 
+LOG = get_logger('analyzer')
+
+# The triple archs of the compiler flag sets are stored in this file of the
+# CTU directory.
+TRIPLE_ARCH_MAP_FILE = 'triple_arch_map.json'
+
+# Flags with a separate argument which may change the target triple.
+TARGET_FLAGS_WITH_ARG = {'-target', '-arch', '-mllvm', '--config', '-x'}
+
+# Prefixes of the flags which may change the target triple.
+TARGET_FLAG_PREFIXES = ('--target', '-target', '-arch', '-m', '--config',
+                        '--driver-mode')
+
+# Triple archs by the keys of the target selecting compiler flags.
+_TRIPLE_ARCHS: Dict[str, str] = {}
+
+# CTU directories of which the triple arch map file has already been read.
+_LOADED_CTU_DIRS: Set[str] = set()
+
 
 def get_compile_command(action, config, source='', output=''):
     """ Generate a standardized and cleaned compile command serving as a base
@@ -68,9 +101,28 @@ def _find_arch_in_command(output):
     return None
 
 
-def get_triple_arch(action, source, config):
+def get_triple_arch_key(action, config) -> str:
+    """
+    Returns the key of the flags in the compile command of the action which
+    may select the target triple. Actions with the same key have the same
+    triple arch.
+    """
+    cmd = get_compile_command(action, config)
+
+    target_flags = []
+    flags = iter(cmd[1:])
+    for flag in flags:
+        if flag in TARGET_FLAGS_WITH_ARG:
+            target_flags.extend((flag, next(flags, '')))
+        elif flag.startswith(TARGET_FLAG_PREFIXES):
+            target_flags.append(flag)
+
+    return json.dumps([cmd[0], target_flags])
+
+
+def detect_triple_arch(action, source, config):
     """Returns the architecture part of the target triple for the given
-    compilation command. """
+    compilation command by running the compiler. """
 
     cmd = get_compile_command(action, config, source)
     cmd.insert(1, '-###')
@@ -81,3 +133,110 @@ def get_triple_arch(action, source, config):
     # build process (compilation phase, link phase, etc.). If there is -c flag
     # in the build command then there is no linking.
     return _find_arch_in_command(stdout + stderr) or ""
+
+
+def load_triple_arch_map(ctu_dir: str) -> Dict[str, str]:
+    """
+    Returns the triple archs stored in the given CTU directory by their
+    keys.
+    """
+    triple_archs = load_json(os.path.join(ctu_dir, TRIPLE_ARCH_MAP_FILE), {},
+                             display_warning=False)
+    return triple_archs if isinstance(triple_archs, dict) else {}
+
+
+def save_triple_arch_map(ctu_dir: str, triple_archs: Dict[str, str]):
+    """
+    Stores the given triple archs in the CTU directory. The file is replaced
+    atomically, so the analysis processes never read a partially written
+    file.
+    """
+    _TRIPLE_ARCHS.update(triple_archs)
+    _LOADED_CTU_DIRS.add(ctu_dir)
+
+    os.makedirs(ctu_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+            'w', dir=ctu_dir, suffix='.tmp', delete=False,
+            encoding="utf-8") as f:
+        json.dump(triple_archs, f)
+
+    os.replace(f.name, os.path.join(ctu_dir, TRIPLE_ARCH_MAP_FILE))
+
+
+def get_triple_arch(action, source, config):
+    """Returns the architecture part of the target triple for the given
+    compilation command. The compiler runs only once for the same target
+    selecting flags in a process, and not at all if the triple arch of the
+    flags is stored in the CTU directory. """
+    key = get_triple_arch_key(action, config)
+
+    triple_arch = _TRIPLE_ARCHS.get(key)
+    if triple_arch is None and config.ctu_dir and \
+            config.ctu_dir not in _LOADED_CTU_DIRS:
+        _LOADED_CTU_DIRS.add(config.ctu_dir)
+        _TRIPLE_ARCHS.update(load_triple_arch_map(config.ctu_dir))
+        triple_arch = _TRIPLE_ARCHS.get(key)
+
+    if triple_arch is None:
+        triple_arch = detect_triple_arch(action, source, config)
+        _TRIPLE_ARCHS[key] = triple_arch
+
+    return triple_arch
+
+
+def get_compiler_info_targets(compiler_info_file: str) -> Set[str]:
+    """ Returns the compiler targets in the given compiler info file. """
+    compiler_info = load_json(compiler_info_file, {})
+    if not isinstance(compiler_info, dict):
+        return set()
+
+    return {info['target'] for info in compiler_info.values()
+            if isinstance(info, dict) and info.get('target')}
+
+
+def __detect_triple_arch(params):
+    action, config = params
+    return detect_triple_arch(action, action.source, config)
+
+
+def collect_triple_archs(
+    actions: Iterable,
+    config,
+    map_func: Callable = map,
+    compiler_info_file: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Returns the triple archs of the given actions by their keys. The compiler
+    runs once per distinct key, and these runs are distributed by the given
+    map function.
+
+    If a compiler info file is given, the triple arch of the actions which
+    are selected by their compiler target only is the architecture part of
+    this target, and the compiler is not run for them. This is the
+    architecture name of the original compiler which may differ from the
+    one chosen by Clang (e.g. 'arm' instead of 'armv7'), but it is used
+    consistently in both phases of the CTU analysis.
+    """
+    targets = get_compiler_info_targets(compiler_info_file) \
+        if compiler_info_file else set()
+
+    triple_archs = {}
+    pending = {}
+    for action in actions:
+        key = get_triple_arch_key(action, config)
+        if key in triple_archs or key in pending:
+            continue
+
+        _, target_flags = json.loads(key)
+        if action.target in targets and target_flags == \
+                [f"--target={action.target}", '-x', action.lang]:
+            triple_archs[key] = action.target.split('-')[0]
+        else:
+            pending[key] = action
+
+    triple_archs.update(zip(
+        pending,
+        map_func(__detect_triple_arch,
+                 [(action, config) for action in pending.values()])))
+
+    return triple_archs
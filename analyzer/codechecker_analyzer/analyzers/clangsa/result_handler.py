@@ -15,6 +15,7 @@ from typing import Optional
 
 from codechecker_report_converter.report.parser.base import AnalyzerInfo
 from codechecker_report_converter.report import report_file
+from codechecker_report_converter.report.parser import plist
 from codechecker_report_converter.report.hash import get_report_hash, HashType
 from codechecker_common.logger import get_logger
 from codechecker_common.skiplist_handler import SkipListHandlers
@@ -42,19 +43,30 @@ class ClangSAResultHandler(ResultHandler):
         """
         Generate analyzer result output file which can be parsed and stored
         into the database.
+
+        Reports have to be created only if their hash is replaced or they are
+        matched against the review status config file. Otherwise the reports
+        in skipped files are filtered out from the plist file directly.
         """
         if os.path.exists(self.analyzer_result_file):
-            reports = report_file.get_reports(
-                self.analyzer_result_file, self.checker_labels,
-                source_dir_path=self.source_dir_path)
-            reports = [r for r in reports if not r.skip(skip_handlers)]
-
             hash_type = None
             if self.report_hash_type in ['context-free', 'context-free-v2']:
                 hash_type = HashType.CONTEXT_FREE
             elif self.report_hash_type == 'diagnostic-message':
                 hash_type = HashType.DIAGNOSTIC_MESSAGE
 
+            if hash_type is None and \
+                    not (rs_handler and rs_handler.has_ignore_rules()) and \
+                    plist.filter_analyzer_result(
+                        self.analyzer_result_file, self.source_dir_path,
+                        skip_handlers, self.analyzer_info):
+                return
+
+            reports = report_file.get_reports(
+                self.analyzer_result_file, self.checker_labels,
+                source_dir_path=self.source_dir_path)
+            reports = [r for r in reports if not r.skip(skip_handlers)]
+
             if hash_type is not None:
                 for report in reports:
                     report.report_hash = get_report_hash(report, hash_type)
@@ -29,6 +29,7 @@ from codechecker_common.logger import get_logger
 from codechecker_analyzer import analyzer_context, env
 
 from .. import analyzer_base
+from .. import capability_cache
 from ..config_handler import CheckerState
 from ..flag import has_flag
 from ..flag import prepend_all
@@ -180,12 +181,8 @@ def get_warnings():
     environment = analyzer_context.get_context().get_env_for_bin(diagtool_bin)
 
     try:
-        result = subprocess.check_output(
-            [diagtool_bin, 'tree'],
-            env=environment,
-            universal_newlines=True,
-            encoding="utf-8",
-            errors="ignore")
+        result = capability_cache.check_output(
+            [diagtool_bin, 'tree'], env=environment)
         return [w[2:] for w in result.split()
                 if w.startswith("-W") and w != "-W"]
     except subprocess.CalledProcessError as exc:
@@ -276,11 +273,7 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
 
         version = [cls.analyzer_binary(), '--version']
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             universal_newlines=True,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = capability_cache.check_output(version, env=environ)
             version_re = re.compile(r'.*version (?P<version>[\d\.]+)', re.S)
             match = version_re.match(output)
             if match:
@@ -310,12 +303,9 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
                 ["blacklist:true"], cls.ANALYZER_NAME)
 
             environ = context.get_env_for_bin(cls.analyzer_binary())
-            result = subprocess.check_output(
+            result = capability_cache.check_output(
                 [cls.analyzer_binary(), "-list-checks", "-checks=*"],
-                env=environ,
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="ignore")
+                env=environ)
             checker_description = parse_checkers(result)
 
             checker_description.extend(
@@ -333,19 +323,27 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
         except (subprocess.CalledProcessError, OSError):
             return []
 
+    @classmethod
+    def __dump_config(cls) -> str:
+        """
+        Return the default configuration of clang-tidy with all checkers
+        enabled. The .clang-tidy files of the current directory and its
+        parents would be merged into the dumped configuration, so it is
+        dumped in an empty directory.
+        """
+        return capability_cache.check_output(
+            [cls.analyzer_binary(), "-dump-config", "-checks=*"],
+            env=analyzer_context.get_context()
+            .get_env_for_bin(cls.analyzer_binary()),
+            isolate_cwd=True)
+
     @classmethod
     def get_checker_config(cls) -> List[analyzer_base.CheckerConfig]:
         """
         Return the checker configuration of the all of the supported checkers.
         """
         try:
-            help_page = subprocess.check_output(
-                [cls.analyzer_binary(), "-dump-config", "-checks=*"],
-                env=analyzer_context.get_context()
-                .get_env_for_bin(cls.analyzer_binary()),
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="ignore")
+            help_page = cls.__dump_config()
         except (subprocess.CalledProcessError, OSError):
             return []
 
@@ -364,13 +362,7 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
             return []
 
         try:
-            result = subprocess.check_output(
-                [cls.analyzer_binary(), "-dump-config", "-checks=*"],
-                env=analyzer_context.get_context()
-                .get_env_for_bin(cls.analyzer_binary()),
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="ignore")
+            result = cls.__dump_config()
             native_config = parse_analyzer_config(result)
         except (subprocess.CalledProcessError, OSError):
             native_config = []
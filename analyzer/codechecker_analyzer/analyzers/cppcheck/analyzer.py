@@ -27,6 +27,7 @@ from codechecker_analyzer import analyzer_context
 from codechecker_analyzer.env import get_binary_in_path
 
 from .. import analyzer_base
+from .. import capability_cache
 
 from .config_handler import CppcheckConfigHandler
 from .result_handler import CppcheckResultHandler
@@ -98,11 +99,7 @@ class Cppcheck(analyzer_base.SourceAnalyzer):
             cls.analyzer_binary())
         version = [cls.analyzer_binary(), '--version']
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             universal_newlines=True,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = capability_cache.check_output(version, env=environ)
             return parse_version(output)
         except (subprocess.CalledProcessError, OSError) as oerr:
             LOG.warning("Failed to get analyzer version: %s",
@@ -295,7 +292,8 @@ class Cppcheck(analyzer_base.SourceAnalyzer):
         environ = analyzer_context.get_context().get_env_for_bin(
             command[0])
         try:
-            errorlist_output = subprocess.check_output(command, env=environ)
+            errorlist_output = capability_cache.check_output(
+                command, env=environ)
             checkers = parse_checkers(errorlist_output)
 
             # Cppcheck can and will report with checks that have a different
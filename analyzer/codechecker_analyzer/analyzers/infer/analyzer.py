@@ -24,6 +24,7 @@ from codechecker_common.logger import get_logger
 from codechecker_analyzer import analyzer_context
 
 from .. import analyzer_base
+from .. import capability_cache
 from ..config_handler import CheckerState
 
 from .config_handler import InferConfigHandler
@@ -114,10 +115,10 @@ class Infer(analyzer_base.SourceAnalyzer):
             env = analyzer_context.get_context().get_env_for_bin(
                 cls.analyzer_binary())
             env.update(TZ='UTC')
-            output = subprocess.check_output(command,
-                                             stderr=subprocess.DEVNULL,
-                                             env=env)
-            for entry in output.decode().split('\n'):
+            output = capability_cache.check_output(command,
+                                                   stderr=subprocess.DEVNULL,
+                                                   env=env)
+            for entry in output.split('\n'):
                 data = entry.strip().split(":")
                 if len(data) < 7:
                     continue
@@ -191,10 +192,7 @@ class Infer(analyzer_base.SourceAnalyzer):
             cls.analyzer_binary())
         environ.update(TZ='UTC')
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = capability_cache.check_output(version, env=environ)
             output = output.split('\n', maxsplit=1)[0]
             return Version.parse(output.strip().split(" ")[-1][1:])
         except (subprocess.CalledProcessError, OSError) as oerr:
@@ -157,3 +157,21 @@ def analyzer_binary(arg: str) -> AnalyzerBinary:
             "<analyzer>:</path/to/bin/>")
 
     return AnalyzerBinary(m.group("analyzer"), m.group("path"))
+
+
+def memory_size(arg: str) -> int:
+    """
+    This function can be used at "type" argument of argparse.add_argument().
+    It converts a memory size like 512M, 16G or 1073741824 to bytes. The K,
+    M, G and T units are powers of 1024.
+    """
+    m = re.fullmatch(r"(?P<size>\d+(\.\d+)?)\s*(?P<unit>[KMGT]?)(i?B)?",
+                     arg.strip(), re.IGNORECASE)
+
+    if not m or float(m.group("size")) <= 0:
+        raise argparse.ArgumentTypeError(
+            f"Memory size in wrong format: {arg}, should be a positive "
+            "number optionally followed by a K, M, G or T unit, e.g. 16G")
+
+    exponent = " KMGT".index(m.group("unit").upper() or " ")
+    return int(float(m.group("size")) * 1024 ** exponent)
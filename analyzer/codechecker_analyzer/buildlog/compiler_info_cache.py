@@ -0,0 +1,127 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+On-disk cache of the implicit compiler information.
+
+Collecting the implicit include paths, the default standard and the target
+of a compiler requires running the compiler a few times. The results depend
+on the compiler binary, the language, some of the compiler flags and a few
+environment variables only, so they are stored in a cache directory which
+is shared by the processes of a run and by the subsequent runs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from shutil import which
+from typing import List, Optional
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('buildlogger')
+
+# Environment variables which modify the implicit include paths of the
+# compilers.
+INCLUDE_ENV_VARS = ['CPATH', 'C_INCLUDE_PATH', 'CPLUS_INCLUDE_PATH',
+                    'OBJC_INCLUDE_PATH', 'GCC_EXEC_PREFIX', 'COMPILER_PATH']
+
+# Increase it when the format or the collection of the compiler information
+# changes, so the earlier entries are not used anymore.
+CACHE_VERSION = 1
+
+
+def get_default_cache_dir() -> Optional[str]:
+    """
+    Returns the directory of the compiler information cache. It can be set by
+    the CC_COMPILER_INFO_CACHE_DIR environment variable, and the cache is
+    disabled if this variable is set to an empty value.
+    """
+    cache_dir = os.environ.get('CC_COMPILER_INFO_CACHE_DIR')
+    if cache_dir is not None:
+        return cache_dir or None
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(cache_home, 'codechecker', 'compiler_info')
+
+
+class CompilerInfoCache:
+    """
+    Compiler information stored in JSON files of a directory, one file per
+    compiler, language and compiler flags. The entries of a compiler binary
+    are invalidated when its modification time or size changes.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def get_key(
+        self,
+        compiler: str,
+        language: str,
+        compiler_flags: List[str]
+    ) -> Optional[list]:
+        """
+        Returns the key of the given compiler invocation or None if the
+        compiler binary can not be found.
+        """
+        compiler_path = which(compiler)
+        if not compiler_path:
+            return None
+
+        try:
+            stat = os.stat(compiler_path)
+        except OSError:
+            return None
+
+        return [CACHE_VERSION, compiler, os.path.abspath(compiler_path),
+                stat.st_mtime_ns, stat.st_size, language,
+                list(compiler_flags),
+                [os.environ.get(var) for var in INCLUDE_ENV_VARS]]
+
+    def __get_file_path(self, key: list) -> str:
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest + '.json')
+
+    def get(self, key: list) -> Optional[dict]:
+        """ Returns the compiler information of the given key if cached. """
+        try:
+            with open(self.__get_file_path(key), encoding="utf-8",
+                      errors="ignore") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+
+        return entry.get('info')
+
+    def put(self, key: list, info: dict):
+        """
+        Stores the compiler information of the given key. The file is replaced
+        atomically, so other processes never read a partially written entry.
+        """
+        file_path = self.__get_file_path(key)
+        tmp_file_path = None
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    'w', dir=os.path.dirname(file_path), suffix='.tmp',
+                    delete=False, encoding="utf-8") as f:
+                tmp_file_path = f.name
+                json.dump({'key': key, 'info': info}, f)
+
+            os.replace(tmp_file_path, file_path)
+        except OSError as err:
+            LOG.debug("Failed to write compiler info cache %s: %s",
+                      file_path, err)
+            if tmp_file_path and os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
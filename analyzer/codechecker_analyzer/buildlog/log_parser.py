@@ -14,6 +14,7 @@ from functools import lru_cache
 from pathlib import Path
 
 import glob
+import itertools
 import json
 import os
 import re
@@ -28,10 +29,11 @@ from codechecker_analyzer.analyzers.clangsa.analyzer import ClangSA
 
 from codechecker_common.compatibility import multiprocessing
 from codechecker_common.logger import get_logger
-from codechecker_common.util import load_json
+from codechecker_common.util import chunks, load_json
 
 from .. import gcc_toolchain
 from .build_action import BuildAction
+from .compiler_info_cache import CompilerInfoCache, get_default_cache_dir
 
 LOG = get_logger('buildlogger')
 
@@ -327,6 +329,11 @@ class ImplicitCompilerInfo:
         ['compiler', 'language', 'compiler_flags'])
 
     compiler_info: Dict[ImplicitInfoSpecifierKey, dict] = {}
+    # The compiler info file which compiler_info was loaded from.
+    compiler_info_file: Optional[str] = None
+    # On-disk cache of the compiler info shared by the processes and runs.
+    # It is created on first use, and it is False if it is disabled.
+    compiler_info_cache = None
     compiler_isexecutable = {}
     # Store the already detected compiler version information.
     # If the value is False the compiler is not clang otherwise the value
@@ -563,6 +570,7 @@ class ImplicitCompilerInfo:
         """Load compiler information from a file."""
         ICI = ImplicitCompilerInfo
         ICI.compiler_info = {}
+        ICI.compiler_info_file = file_path
 
         contents = load_json(file_path, {})
         for k, v in contents.items():
@@ -570,6 +578,51 @@ class ImplicitCompilerInfo:
             ICI.compiler_info[
                 ICI.ImplicitInfoSpecifierKey(k[0], k[1], tuple(k[2]))] = v
 
+    @staticmethod
+    def get_cache() -> Optional[CompilerInfoCache]:
+        """
+        Returns the on-disk cache of the compiler info or None if it is
+        disabled.
+        """
+        ICI = ImplicitCompilerInfo
+        if ICI.compiler_info_cache is None:
+            cache_dir = get_default_cache_dir()
+            ICI.compiler_info_cache = \
+                CompilerInfoCache(cache_dir) if cache_dir else False
+
+        return ICI.compiler_info_cache or None
+
+    @staticmethod
+    def collect(iisk) -> dict:
+        """
+        Returns the implicit compiler information of the given key from the
+        on-disk cache, or by running the compiler if it is not cached yet.
+        """
+        ICI = ImplicitCompilerInfo
+
+        cache = ICI.get_cache()
+        cache_key = cache.get_key(
+            iisk.compiler, iisk.language, iisk.compiler_flags) \
+            if cache else None
+
+        if cache_key:
+            info = cache.get(cache_key)
+            if info is not None:
+                return info
+
+        info = {
+            'compiler_includes': ICI.get_compiler_includes(
+                iisk.compiler, iisk.language, iisk.compiler_flags),
+            'compiler_standard': ICI.get_compiler_standard(
+                iisk.compiler, iisk.language),
+            'target': ICI.get_compiler_target(iisk.compiler)
+        }
+
+        if cache_key:
+            cache.put(cache_key, info)
+
+        return info
+
     @staticmethod
     def set(details, compiler_info_file=None):
         """Detect and set the impicit compiler information.
@@ -589,16 +642,11 @@ class ImplicitCompilerInfo:
 
         if compiler_info_file and os.path.exists(compiler_info_file):
             # Compiler info file exists, load it.
-            ICI.load_compiler_info(compiler_info_file)
+            if ICI.compiler_info_file != compiler_info_file:
+                ICI.load_compiler_info(compiler_info_file)
         else:
             if iisk not in ICI.compiler_info:
-                ICI.compiler_info[iisk] = {
-                    'compiler_includes': ICI.get_compiler_includes(
-                        iisk.compiler, iisk.language, iisk.compiler_flags),
-                    'compiler_standard': ICI.get_compiler_standard(
-                        iisk.compiler, iisk.language),
-                    'target': ICI.get_compiler_target(iisk.compiler)
-                }
+                ICI.compiler_info[iisk] = ICI.collect(iisk)
 
         for k, v in ICI.compiler_info.get(iisk, {}).items():
             if not details.get(k):
@@ -1206,20 +1254,66 @@ def _process_entry_worker(args):
     Worker function for processing compilation database entries in parallel.
 
     args -- Tuple containing (entry, compiler_info_file,
-            keep_gcc_include_fixed, keep_gcc_intrin, analyzer_clang_version)
+            keep_gcc_include_fixed, keep_gcc_intrin)
+
+    Returns the build action of the entry, or None if it can't be processed,
+    and the implicit compiler info items collected by this call.
     """
     (entry, compiler_info_file, keep_gcc_include_fixed,
      keep_gcc_intrin) = args
 
+    # The compiler info collected by this call is returned, so the parent
+    # process can dump it.
+    known_compiler_info = len(ImplicitCompilerInfo.compiler_info)
     try:
         action = parse_options(entry,
                                compiler_info_file,
                                keep_gcc_include_fixed,
                                keep_gcc_intrin)
-        return action
     except Exception as e:
         LOG.error("Error processing entry: %s", e)
-        return None
+        action = None
+
+    # The keys are converted to plain tuples, because the key type, which is
+    # defined in a class, can't be pickled.
+    new_compiler_info = []
+    if len(ImplicitCompilerInfo.compiler_info) > known_compiler_info:
+        new_compiler_info = [
+            (tuple(k), v) for k, v in itertools.islice(
+                ImplicitCompilerInfo.compiler_info.items(),
+                known_compiler_info, None)]
+
+    return action, new_compiler_info
+
+
+# Number of compilation database entries per job which are sent to the worker
+# processes at once. The results of the previous window are processed while
+# the next one is parsed, so this bounds the number of entries and build
+# actions in memory.
+PARSE_WINDOW_ENTRIES_PER_JOB = 1024
+PARSE_CHUNK_SIZE = 64
+
+
+def _process_entries(pool, jobs, worker_args):
+    """
+    Process the entries of the given worker arguments in the pool and yield
+    the results in the order of the entries. The entries are consumed in
+    windows, so a streamed compilation database is never fully read into
+    memory.
+    """
+    window_size = jobs * PARSE_WINDOW_ENTRIES_PER_JOB
+    chunk_size = min(PARSE_CHUNK_SIZE, max(1, window_size // (jobs * 4)))
+
+    processed = None
+    for window in chunks(worker_args, window_size):
+        processing = pool.map(_process_entry_worker, list(window),
+                              chunksize=chunk_size)
+        if processed is not None:
+            yield from processed
+        processed = processing
+
+    if processed is not None:
+        yield from processed
 
 
 def parse_unique_log(compilation_database,
@@ -1250,7 +1344,9 @@ def parse_unique_log(compilation_database,
                             and "command" keys. The "command" may be replaced
                             by "arguments" which is a split command. Older
                             versions of intercept-build provide the build
-                            command this way.
+                            command this way. Any iterable of these objects
+                            can be given, they are processed while they are
+                            read (see CompilationDatabaseFile).
     report_dir  -- The output report directory. The compiler infos
                    will be written to <report_dir>/compiler.info.json.
     compile_uniqueing -- Compilation database uniqueing mode.
@@ -1304,6 +1400,11 @@ def parse_unique_log(compilation_database,
         if jobs is None:
             jobs = multiprocessing.cpu_count()
 
+        # The compiler info file is loaded once, before the worker processes
+        # are started.
+        if compiler_info_file and os.path.exists(compiler_info_file):
+            ImplicitCompilerInfo.load_compiler_info(compiler_info_file)
+
         # Prepare entries for parallel processing
         entries = extend_compilation_database_entries(compilation_database)
 
@@ -1312,13 +1413,14 @@ def parse_unique_log(compilation_database,
                        keep_gcc_intrin)
                        for entry in entries)
 
-        # Process entries in parallel using imap_unordered with chunk size 1024
         with multiprocessing.Pool(jobs) as pool:
-            # Convert generator to list for map function
-            worker_args_list = list(worker_args)
-            results = pool.map(_process_entry_worker, worker_args_list)
+            results = _process_entries(pool, jobs, worker_args)
+
+            for action, new_compiler_info in results:
+                for k, v in new_compiler_info:
+                    ImplicitCompilerInfo.compiler_info[
+                        ImplicitCompilerInfo.ImplicitInfoSpecifierKey(*k)] = v
 
-            for action in results:
                 if action is None:
                     skipped_cmp_cmd_count += 1
                     continue
@@ -21,12 +21,13 @@ from functools import partial
 
 from tu_collector import tu_collector
 
-from codechecker_analyzer import analyzer, analyzer_context, \
-    compilation_database
+from codechecker_analyzer import action_scheduler, analyzer, \
+    analyzer_context, compilation_database, memory_control
 from codechecker_analyzer.analyzers import analyzer_types, clangsa
 from codechecker_analyzer.arg import \
     OrderedCheckersAction, OrderedConfigAction, existing_abspath, \
-    analyzer_config, checker_config, AnalyzerConfigArg, CheckerConfigArg
+    analyzer_config, checker_config, AnalyzerConfigArg, CheckerConfigArg, \
+    memory_size
 
 from codechecker_analyzer.buildlog import log_parser
 
@@ -53,6 +54,21 @@ EPILOG_ENV_VAR = """
                            is set you can configure the plugin directory of the
                            Clang Static Analyzer by using this environment
                            variable.
+  CC_COMPILER_INFO_CACHE_DIR
+                           Directory of the cache of the implicit compiler
+                           information (include paths, target, standard),
+                           which is shared by the analysis runs. By default it
+                           is '~/.cache/codechecker/compiler_info'. Set it to
+                           an empty value to disable the cache.
+  CC_ANALYZER_CAPABILITY_CACHE_DIR
+                           Directory of the cache of the checker lists,
+                           checker and analyzer options and versions of the
+                           analyzer binaries, which is shared by the
+                           CodeChecker invocations. An entry is invalidated
+                           when the analyzer binary or a checker plugin
+                           changes. By default it is
+                           '~/.cache/codechecker/analyzer_capabilities'. Set it
+                           to an empty value to disable the cache.
 """
 
 EPILOG_ISSUE_HASHES = """
@@ -174,6 +190,34 @@ def add_arguments_to_parser(parser):
                              "threads mean faster analysis at the cost of "
                              "using more memory.")
 
+    parser.add_argument('--memory-budget',
+                        type=memory_size,
+                        dest="memory_budget",
+                        required=False,
+                        default=argparse.SUPPRESS,
+                        help="Maximal memory used by the analyzer processes "
+                             "together, e.g. 16G or 512M. A new analysis is "
+                             "started only if this budget, reduced by the "
+                             "memory of the running analyses, is enough for "
+                             "the peak memory of the analysis measured at "
+                             "its previous run. New analyses are also held "
+                             "back if the available memory of the system is "
+                             "low. At least one analysis always runs, so "
+                             "fewer parallel analyses than --jobs can run.")
+
+    parser.add_argument('--progress-file',
+                        type=str,
+                        dest="progress_file",
+                        required=False,
+                        default=argparse.SUPPRESS,
+                        help="Write the progress of the analysis to this "
+                             "file as JSON lines. Each line contains the "
+                             "number of the finished, successful, failed and "
+                             "skipped analyses, the elapsed time, the "
+                             "throughput in analyses per second and the "
+                             "estimated remaining time in seconds. The last "
+                             "line has \"finished\" as \"event\".")
+
     skip_mode = parser.add_argument_group("file filter arguments")
     skip_mode.add_argument('-i', '--ignore', '--skip',
                            dest="skipfile",
@@ -303,6 +347,20 @@ def add_arguments_to_parser(parser):
                              "reports and overwrites only those files that "
                              "were update by the current build command).")
 
+    parser.add_argument('--incremental',
+                        dest="incremental",
+                        required=False,
+                        action='store_true',
+                        default=argparse.SUPPRESS,
+                        help="Skip the analysis of those compilation "
+                             "commands of which the analyzer command, the "
+                             "analyzer version and the content of the "
+                             "source file and its included headers are the "
+                             "same as at their previous successful analysis. "
+                             "The results of the previous analysis are kept "
+                             "for these compilation commands. CTU analysis "
+                             "is never skipped.")
+
     parser.add_argument('--compile-uniqueing',
                         type=str,
                         dest="compile_uniqueing",
@@ -612,6 +670,21 @@ Cross-TU analysis. By default, no CTU analysis is run when
                                "available if CTU mode is enabled. "
                                "(default: parse-on-demand)")
 
+    ctu_opts.add_argument('--ctu-triple-arch-from-compiler-info',
+                          action='store_true',
+                          dest='ctu_triple_arch_from_compiler_info',
+                          default=argparse.SUPPRESS,
+                          help="Take the target architecture of the "
+                               "translation units from the compiler "
+                               "targets in '<OUTPUT_DIR>/compiler_info.json' "
+                               "during the 'collect' phase of Cross-TU "
+                               "analysis, instead of asking Clang for it. "
+                               "Clang is still asked if target specific "
+                               "flags (e.g. '-m32') are given. The "
+                               "architecture names of the original compiler "
+                               "may differ from the ones of Clang, but they "
+                               "are used consistently in both phases.")
+
     stats_capable = analyzer_types.is_statistics_capable()
 
     stat_opts = parser.add_argument_group(
@@ -1104,6 +1177,15 @@ def __cleanup_metadata(metadata_prev, metadata):
             except OSError:
                 LOG.warning("Failed to remove plist file: %s", plist_file)
 
+    # Forget the analysis durations and peak memory of removed source files.
+    for tool in metadata.get('tools', []):
+        for key in [action_scheduler.METADATA_DURATIONS_KEY,
+                    memory_control.METADATA_PEAK_MEMORY_KEY]:
+            for sources in tool.get(key, {}).values():
+                for source_file in [s for s in sources
+                                    if not os.path.exists(s)]:
+                    del sources[source_file]
+
 
 def __del_result_source_file(metadata, file_path):
     """ Remove file path from metadata result source files. """
@@ -1279,8 +1361,10 @@ def main(args):
             sys.exit(1)
         compiler_info_file = args.compiler_info_file
 
-    compile_commands = \
-        compilation_database.gather_compilation_database(args.input)
+    # A compilation database file is read while its build actions are
+    # processed, instead of loading it into memory at once.
+    compile_commands = compilation_database.gather_compilation_database(
+        args.input, streaming=True)
     if compile_commands is None:
         LOG.error(f"Found no compilation commands in '{args.input}'")
         sys.exit(1)
@@ -1325,10 +1409,6 @@ def main(args):
 
     context = analyzer_context.get_context()
 
-    # Number of all the compilation commands in the parsed log files,
-    # logged by the logger.
-    all_cmp_cmd_count = len(compile_commands)
-
     # We clear the output directory in the following cases.
     ctu_dir = os.path.join(args.output_path, 'ctu-dir')
     if 'ctu_phases' in args and args.ctu_phases[0] and \
@@ -1365,6 +1445,10 @@ def main(args):
         pre_analysis_skip_handlers,
         ctu_or_stats_enabled)
 
+    # Number of all the compilation commands in the parsed log files,
+    # logged by the logger.
+    all_cmp_cmd_count = len(compile_commands)
+
     if not actions:
         LOG.warning("No analysis is required.")
         LOG.warning("There were no compilation commands in the provided "
@@ -1403,6 +1487,10 @@ def main(args):
         metadata_prev = load_json(metadata_file)
         metadata_tool['result_source_files'] = \
             __get_result_source_files(metadata_prev)
+        metadata_tool[action_scheduler.METADATA_DURATIONS_KEY] = \
+            action_scheduler.get_durations(metadata_prev)
+        metadata_tool[memory_control.METADATA_PEAK_MEMORY_KEY] = \
+            memory_control.get_peak_memory(metadata_prev)
 
     CompileCmdParseCount = \
         collections.namedtuple('CompileCmdParseCount',
@@ -1447,8 +1535,8 @@ def main(args):
 
     # WARN: store command will search for this file!!!!
     compile_cmd_json = os.path.join(args.output_path, 'compile_cmd.json')
-    with open(compile_cmd_json, 'w', encoding="utf-8", errors="ignore") as f:
-        json.dump(compile_commands, f, indent=2)
+    compilation_database.dump_compilation_database(
+        compile_commands, compile_cmd_json)
 
     try:
         # pylint: disable=no-name-in-module
@@ -20,7 +20,7 @@ import tempfile
 from codechecker_analyzer.analyzers import analyzer_types
 from codechecker_analyzer.arg import \
     OrderedCheckersAction, OrderedConfigAction, \
-    analyzer_config, checker_config, existing_abspath
+    analyzer_config, checker_config, existing_abspath, memory_size
 
 from codechecker_analyzer.cli.analyze import \
     EPILOG_ENV_VAR as analyzer_epilog_env_var, \
@@ -215,6 +215,38 @@ used to generate a log file on the fly.""")
                                     "More threads mean faster analysis at "
                                     "the cost of using more memory.")
 
+    analyzer_opts.add_argument('--memory-budget',
+                               type=memory_size,
+                               dest="memory_budget",
+                               required=False,
+                               default=argparse.SUPPRESS,
+                               help="Maximal memory used by the analyzer "
+                                    "processes together, e.g. 16G or 512M. A "
+                                    "new analysis is started only if this "
+                                    "budget, reduced by the memory of the "
+                                    "running analyses, is enough for the "
+                                    "peak memory of the analysis measured at "
+                                    "its previous run. New analyses are also "
+                                    "held back if the available memory of "
+                                    "the system is low. At least one "
+                                    "analysis always runs, so fewer parallel "
+                                    "analyses than --jobs can run.")
+
+    analyzer_opts.add_argument('--progress-file',
+                               type=str,
+                               dest="progress_file",
+                               required=False,
+                               default=argparse.SUPPRESS,
+                               help="Write the progress of the analysis to "
+                                    "this file as JSON lines. Each line "
+                                    "contains the number of the finished, "
+                                    "successful, failed and skipped "
+                                    "analyses, the elapsed time, the "
+                                    "throughput in analyses per second and "
+                                    "the estimated remaining time in "
+                                    "seconds. The last line has \"finished\" "
+                                    "as \"event\".")
+
     analyzer_opts.add_argument('-c', '--clean',
                                dest="clean",
                                required=False,
@@ -226,6 +258,21 @@ used to generate a log file on the fly.""")
                                     "overwrites only those files that were "
                                     "update by the current build command).")
 
+    analyzer_opts.add_argument('--incremental',
+                               dest="incremental",
+                               required=False,
+                               action='store_true',
+                               default=argparse.SUPPRESS,
+                               help="Skip the analysis of those compilation "
+                                    "commands of which the analyzer command, "
+                                    "the analyzer version and the content of "
+                                    "the source file and its included headers "
+                                    "are the same as at their previous "
+                                    "successful analysis. The results of the "
+                                    "previous analysis are kept for these "
+                                    "compilation commands. CTU analysis is "
+                                    "never skipped.")
+
     parser.add_argument('--compile-uniqueing',
                         type=str,
                         dest="compile_uniqueing",
@@ -571,6 +618,21 @@ Cross-TU analysis. By default, no CTU analysis is run when
                                "available if CTU mode is enabled. "
                                "(default: parse-on-demand)")
 
+    ctu_opts.add_argument('--ctu-triple-arch-from-compiler-info',
+                          action='store_true',
+                          dest='ctu_triple_arch_from_compiler_info',
+                          default=argparse.SUPPRESS,
+                          help="Take the target architecture of the "
+                               "translation units from the compiler "
+                               "targets in '<OUTPUT_DIR>/compiler_info.json' "
+                               "during the 'collect' phase of Cross-TU "
+                               "analysis, instead of asking Clang for it. "
+                               "Clang is still asked if target specific "
+                               "flags (e.g. '-m32') are given. The "
+                               "architecture names of the original compiler "
+                               "may differ from the ones of Clang, but they "
+                               "are used consistently in both phases.")
+
     stats_capable = analyzer_types.is_statistics_capable()
 
     stat_opts = parser.add_argument_group(
@@ -950,6 +1012,8 @@ def main(args):
         # We can't set these keys to None because it would result in an error
         # after the call.
         args_to_update = ['quiet',
+                          'memory_budget',
+                          'progress_file',
                           'skipfile',
                           'drop_skipped_reports',
                           'files',
@@ -966,6 +1030,7 @@ def main(args):
                           'ctu_ast_mode',
                           'ctu_phases',
                           'ctu_reanalyze_on_failure',
+                          'ctu_triple_arch_from_compiler_info',
                           'stats_output',
                           'stats_dir',
                           'stats_enabled',
@@ -976,6 +1041,7 @@ def main(args):
                           'no_missing_checker_error',
                           'ordered_checkers',  # --enable and --disable.
                           'timeout',
+                          'incremental',
                           'review_status_config',
                           'compile_uniqueing',
                           'report_hash',
@@ -14,11 +14,12 @@ human-readable format.
 import argparse
 import os
 import sys
-from typing import Dict, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import fnmatch
 
-from codechecker_report_converter.util import dump_json_output
-from codechecker_report_converter.report import report_file, \
+from codechecker_report_converter.util import dump_json_output, \
+    dump_json_stream
+from codechecker_report_converter.report import Report, report_file, \
     reports as reports_helper
 from codechecker_report_converter.report.output import baseline, codeclimate, \
     gerrit, sarif, json as report_to_json, plaintext
@@ -30,6 +31,7 @@ from codechecker_report_converter.report.statistics import Statistics
 from codechecker_analyzer import analyzer_context, suppress_handler
 
 from codechecker_common import arg, logger, cmd_config
+from codechecker_common.compatibility.multiprocessing import Pool
 from codechecker_common.review_status_handler import ReviewStatusHandler
 from codechecker_common.skiplist_handler import SkipListHandler, \
     SkipListHandlers
@@ -199,6 +201,17 @@ def add_arguments_to_parser(parser):
                              "match will be removed. You may also use Unix "
                              "shell-like wildcards (e.g. '/*/jsmith/').")
 
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        dest="jobs",
+                        required=False,
+                        default=1,
+                        help="Number of processes to use for parsing the "
+                             "analyzer result files. The reports are "
+                             "filtered and printed in the order of the "
+                             "result files, while the next files are parsed "
+                             "in the background.")
+
     parser.add_argument('--review-status',
                         nargs='*',
                         dest="review_status",
@@ -263,6 +276,70 @@ def get_metadata(dir_path: str) -> Optional[Dict]:
     return None
 
 
+# Number of result files parsed ahead of the ones which are processed, per
+# parser process. This bounds the number of reports kept in memory.
+PARSE_AHEAD_FILES_PER_JOB = 8
+
+# Arguments of the result file parser processes.
+PARSE_CHECKER_LABELS = None
+PARSE_SKIP_HANDLERS: Optional[SkipListHandlers] = None
+PARSE_FILE_CACHE: Dict = {}
+
+
+def _init_result_file_parser(checker_labels, skip_handlers):
+    """ Initialize the process which parses analyzer result files. """
+    global PARSE_CHECKER_LABELS, PARSE_SKIP_HANDLERS, PARSE_FILE_CACHE
+    PARSE_CHECKER_LABELS = checker_labels
+    PARSE_SKIP_HANDLERS = skip_handlers
+    PARSE_FILE_CACHE = {}
+
+
+def _parse_result_file(file_path: str) -> List[Report]:
+    """
+    Get the reports from the given analyzer result file, except the reports
+    of skipped files.
+    """
+    reports = report_file.get_reports(
+        file_path, PARSE_CHECKER_LABELS, PARSE_FILE_CACHE)
+
+    return reports_helper.skip(reports, skip_handlers=PARSE_SKIP_HANDLERS)
+
+
+def parse_result_files(
+    file_paths: List[str],
+    checker_labels,
+    skip_handlers: SkipListHandlers,
+    jobs: int = 1
+) -> Iterator[Tuple[str, List[Report]]]:
+    """
+    Parse the given analyzer result files and yield the not skipped reports
+    of them in the order of the files. If more jobs are given the files are
+    parsed in a process pool, and only a limited number of files are parsed
+    ahead of the ones which are consumed.
+    """
+    if jobs <= 1 or len(file_paths) <= 1:
+        _init_result_file_parser(checker_labels, skip_handlers)
+        for file_path in file_paths:
+            yield file_path, _parse_result_file(file_path)
+        return
+
+    window = jobs * PARSE_AHEAD_FILES_PER_JOB
+    with Pool(jobs, initializer=_init_result_file_parser,
+              initargs=(checker_labels, skip_handlers)) as executor:
+        # The next window of files is being parsed while the reports of the
+        # previous one are consumed.
+        parsed = None
+        for idx in range(0, len(file_paths), window):
+            chunk = file_paths[idx:idx + window]
+            parsing = zip(chunk, executor.map(_parse_result_file, chunk))
+            if parsed:
+                yield from parsed
+            parsed = parsing
+
+        if parsed:
+            yield from parsed
+
+
 def main(args):
     """
     Entry point for parsing some analysis results and printing them to the
@@ -387,9 +464,7 @@ def main(args):
     trim_path_prefixes = args.trim_path_prefix if \
         'trim_path_prefix' in args else None
 
-    all_reports = []
     statistics = Statistics()
-    file_cache = {}  # For memory effiency.
     changed_files: Set[str] = set()
     processed_path_hashes = set()
     processed_file_paths = set()
@@ -402,16 +477,8 @@ def main(args):
             context.path_plist_to_html_dist,
             context.checker_labels)
 
+    result_files: List[Tuple[str, Optional[Dict], str]] = []
     for dir_path, file_paths in report_file.analyzer_result_files(args.input):
-        review_status_cfg = os.path.join(dir_path, 'review_status.yaml')
-        if os.path.lexists(review_status_cfg):
-            try:
-                review_status_handler.set_review_status_config(
-                    review_status_cfg)
-            except ValueError as err:
-                LOG.error(err)
-                sys.exit(1)
-
         metadata = get_metadata(dir_path)
 
         if metadata and 'files' in args:
@@ -429,26 +496,45 @@ def main(args):
                 else []
             file_paths = specifed_file_paths or file_paths
 
-        for file_path in file_paths:
-            reports = report_file.get_reports(
-                file_path, context.checker_labels, file_cache)
+        result_files.extend(
+            (dir_path, metadata, file_path) for file_path in file_paths)
+
+    def filter_reports() -> Iterator[Tuple[str, Optional[Dict],
+                                           List[Report]]]:
+        """
+        Yield the reports of the result files which are not filtered out,
+        and collect their statistics.
+        """
+        parsed_files = parse_result_files(
+            [file_path for _, _, file_path in result_files],
+            context.checker_labels, skip_handlers,
+            args.jobs if 'jobs' in args else 1)
+
+        current_dir_path = None
+        for (dir_path, metadata, _), (file_path, reports) in \
+                zip(result_files, parsed_files):
+            if dir_path != current_dir_path:
+                current_dir_path = dir_path
+                review_status_cfg = os.path.join(
+                    dir_path, 'review_status.yaml')
+                if os.path.lexists(review_status_cfg):
+                    try:
+                        review_status_handler.set_review_status_config(
+                            review_status_cfg)
+                    except ValueError as err:
+                        LOG.error(err)
+                        sys.exit(1)
 
             for report in reports:
                 try:
-                    # TODO: skip_handler is used later in reports_helper.skip()
-                    # too. However, skipped reports shouldn't check source code
-                    # comments because they potentially raise an exception.
-                    # Skipped files shouldn't raise an exception, also, "skip"
-                    # shouldn't be checked twice.
-                    if not report.skip(skip_handlers):
-                        report.review_status = \
-                            review_status_handler.get_review_status(report)
+                    report.review_status = \
+                        review_status_handler.get_review_status(report)
                 except ValueError as err:
                     LOG.error(err)
                     sys.exit(1)
 
             reports = reports_helper.skip(
-                reports, processed_path_hashes, skip_handlers, suppr_handler,
+                reports, processed_path_hashes, None, suppr_handler,
                 src_comment_status_filter)
 
             statistics.num_of_analyzer_result_files += 1
@@ -461,46 +547,53 @@ def main(args):
                 if trim_path_prefixes:
                     report.trim_path_prefixes(trim_path_prefixes)
 
-            all_reports.extend(reports)
-
-            # Print reports continously.
-            if not export:
-                file_report_map = plaintext.get_file_report_map(
-                    reports, file_path, metadata)
-                plaintext.convert(
-                    review_status_handler,
-                    file_report_map, processed_file_paths, print_steps)
-            elif export == 'html':
-                print(f"Parsing input file '{file_path}'.")
-                report_to_html.convert(
-                    file_path, reports, output_dir_path,
-                    html_builder)
+            yield file_path, metadata, reports
 
-    for warning in review_status_handler.source_comment_warnings():
-        LOG.warning(warning)
+    def all_reports() -> Iterator[Report]:
+        """ Yield the reports of every result file. """
+        for _, _, reports in filter_reports():
+            yield from reports
 
     if export is None:  # Plain text output
-        statistics.write()
+        # Print reports continously.
+        for file_path, metadata, reports in filter_reports():
+            file_report_map = plaintext.get_file_report_map(
+                reports, file_path, metadata)
+            plaintext.convert(
+                review_status_handler,
+                file_report_map, processed_file_paths, print_steps)
     elif export == 'html':
-        html_builder.finish(output_dir_path, statistics)
+        for file_path, _, reports in filter_reports():
+            print(f"Parsing input file '{file_path}'.")
+            report_to_html.convert(
+                file_path, reports, output_dir_path,
+                html_builder)
     elif export == 'json':
-        data = report_to_json.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
+        dump_json_stream(report_to_json.convert_stream(all_reports()),
+                         get_output_file_path("reports.json"))
     elif export == 'codeclimate':
-        data = codeclimate.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
+        dump_json_stream(codeclimate.convert_stream(all_reports()),
+                         get_output_file_path("reports.json"))
     elif export == 'gerrit':
-        data = gerrit.convert(all_reports)
+        data = gerrit.convert(all_reports())
         dump_json_output(data, get_output_file_path("reports.json"))
     elif export == 'sarif':
-        data = sarif.convert(all_reports)
+        data = sarif.convert(all_reports())
         dump_json_output(data, get_output_file_path("reports.json"))
     elif export == 'baseline':
-        data = baseline.convert(all_reports)
+        data = baseline.convert(all_reports())
         output_path = get_output_file_path("reports.baseline")
         if output_path:
             baseline.write(output_path, data)
 
+    for warning in review_status_handler.source_comment_warnings():
+        LOG.warning(warning)
+
+    if export is None:  # Plain text output
+        statistics.write()
+    elif export == 'html':
+        html_builder.finish(output_dir_path, statistics)
+
     reports_helper.dump_changed_files(changed_files)
 
     if statistics.num_of_reports:
@@ -10,11 +10,12 @@ Utilities for compilation database handling.
 """
 
 
+import json
 import os
 import shlex
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Union
 
-from codechecker_common.util import load_json
+from codechecker_common.util import iter_json_array, load_json
 
 
 # For details see
@@ -71,6 +72,74 @@ def change_args_to_command_in_comp_db(compile_commands: List[Dict]):
             del cc['arguments']
 
 
+class CompilationDatabaseFile:
+    """
+    The build actions of a compilation database JSON file. The file is read
+    incrementally every time the build actions are iterated, so the whole
+    compilation database is never kept in memory. The "arguments" of the
+    build actions are converted to "command" like by
+    change_args_to_command_in_comp_db().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__count: Optional[int] = None
+
+    @staticmethod
+    def is_compilation_database_file(path: str) -> bool:
+        """ True if the given file starts like a JSON array. """
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read(4096).lstrip().startswith('[')
+        except OSError:
+            return False
+
+    def __iter__(self) -> Iterator[Dict]:
+        count = 0
+        for build_action in iter_json_array(self.path):
+            change_args_to_command_in_comp_db([build_action])
+            count += 1
+            yield build_action
+
+        self.__count = count
+
+    def __bool__(self) -> bool:
+        """
+        False only if the build actions were iterated and there were none.
+        This doesn't read the file, which may be invalid.
+        """
+        return self.__count != 0
+
+    def __len__(self) -> int:
+        """
+        The number of build actions. The file is read for this only if the
+        build actions haven't been iterated yet.
+        """
+        if self.__count is None:
+            self.__count = sum(1 for _ in iter_json_array(self.path))
+
+        return self.__count
+
+
+def dump_compilation_database(
+    compile_commands: Union[List[Dict], CompilationDatabaseFile],
+    file_path: str
+):
+    """
+    Write the build actions to the given file. The output is the same as
+    json.dump() with indent=2, but the build actions are written one by one.
+    """
+    with open(file_path, 'w', encoding="utf-8", errors="ignore") as f:
+        empty = True
+        f.write('[')
+        for build_action in compile_commands:
+            f.write('\n  ' if empty else ',\n  ')
+            f.write(json.dumps(build_action, indent=2).replace('\n', '\n  '))
+            empty = False
+
+        f.write(']' if empty else '\n]')
+
+
 def find_all_compilation_databases(path: str) -> List[str]:
     """
     Collect all compilation database paths that may be relevant for the source
@@ -137,7 +206,10 @@ def find_build_actions_for_file(file_path: str) -> List[Dict]:
         load_json(comp_db)))
 
 
-def gather_compilation_database(analysis_input: str) -> Optional[List[Dict]]:
+def gather_compilation_database(
+    analysis_input: str,
+    streaming: bool = False
+) -> Optional[Union[List[Dict], CompilationDatabaseFile]]:
     """
     Return a compilation database that describes the build of the given
     analysis_input:
@@ -153,6 +225,10 @@ def gather_compilation_database(analysis_input: str) -> Optional[List[Dict]]:
 
     If none of these apply (e.g. analysis_input is a Python source file which
     doesn't have a compilation database) then None returns.
+
+    If streaming is set, a compilation database JSON file is not loaded, but
+    a CompilationDatabaseFile returns, which reads the build actions while
+    they are iterated.
     """
     def __select_compilation_database(
         comp_db_paths: List[str],
@@ -172,6 +248,11 @@ def gather_compilation_database(analysis_input: str) -> Optional[List[Dict]]:
 
     # Case 1: analysis_input is a compilation database JSON file.
 
+    if streaming and \
+            CompilationDatabaseFile.is_compilation_database_file(
+                analysis_input):
+        return CompilationDatabaseFile(analysis_input)
+
     build_actions = load_json(analysis_input, display_warning=False)
 
     if build_actions is not None:
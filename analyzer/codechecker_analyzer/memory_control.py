@@ -0,0 +1,267 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Memory-aware admission of the analysis actions.
+
+Some analyzer processes, e.g. CTU analysis of huge translation units, need
+a lot of memory. If too many of them run at the same time, the machine runs
+out of memory and the kernel kills arbitrary analyzers. To avoid this, a new
+action is started only if the memory used by the running analyzers, together
+with the expected peak memory of the new action, fits into the memory
+budget, and the system has enough available memory. The expected peak memory
+of an action is the one measured at its previous analysis (stored in the
+metadata.json of the report directory).
+"""
+
+
+import threading
+import time
+
+from collections import defaultdict
+from statistics import median
+from typing import Dict, Hashable, Iterable, Optional
+
+import psutil
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# Key in the metadata of the CodeChecker tool under which the peak memory
+# usage of the analysis actions are stored: {analyzer_type: {source: bytes}}.
+METADATA_PEAK_MEMORY_KEY = 'analysis_peak_memory'
+
+# New actions are held back if the available memory of the system is less
+# than this ratio of the total memory.
+MIN_AVAILABLE_MEMORY_RATIO = 0.1
+
+# Interval of the memory measurements in seconds.
+SAMPLE_INTERVAL = 0.5
+
+# Expected peak memory of an action if no action was analyzed before.
+DEFAULT_PEAK_MEMORY = 1024 ** 3
+
+AnalysisPeakMemory = Dict[str, Dict[str, int]]
+
+
+def get_peak_memory(metadata: Optional[dict]) -> AnalysisPeakMemory:
+    """
+    Return the peak memory usage of the actions from the given metadata. Both
+    the tool level dict of the current metadata format and the whole metadata
+    dict are accepted.
+    """
+    if not metadata:
+        return {}
+
+    if METADATA_PEAK_MEMORY_KEY in metadata:
+        return metadata[METADATA_PEAK_MEMORY_KEY]
+
+    peak_memory: AnalysisPeakMemory = {}
+    for tool in metadata.get('tools', []):
+        for analyzer_type, sources in \
+                tool.get(METADATA_PEAK_MEMORY_KEY, {}).items():
+            peak_memory.setdefault(analyzer_type, {}).update(sources)
+
+    return peak_memory
+
+
+def process_tree_rss(pid: int, include_root: bool = True) -> int:
+    """
+    Return the resident memory of the given process and of its descendants
+    in bytes. Processes which terminate in the meantime are skipped.
+    """
+    try:
+        root = psutil.Process(pid)
+        processes = root.children(recursive=True)
+    except psutil.Error:
+        return 0
+
+    if include_root:
+        processes.append(root)
+
+    rss = 0
+    for proc in processes:
+        try:
+            rss += proc.memory_info().rss
+        except psutil.Error:
+            pass
+
+    return rss
+
+
+def descendants_rss(pids: Iterable[int]) -> Dict[int, int]:
+    """
+    Return the resident memory of the descendants of the given processes in
+    bytes (without the memory of the given processes). The processes are
+    listed only once for all the given pids.
+    """
+    children = defaultdict(list)
+    rss = {}
+    for proc in psutil.process_iter(['ppid', 'memory_info']):
+        children[proc.info['ppid']].append(proc.pid)
+        memory_info = proc.info['memory_info']
+        rss[proc.pid] = memory_info.rss if memory_info else 0
+
+    result = {}
+    for pid in pids:
+        total = 0
+        descendants = list(children.get(pid, []))
+        while descendants:
+            child = descendants.pop()
+            total += rss.get(child, 0)
+            descendants.extend(children.get(child, []))
+        result[pid] = total
+
+    return result
+
+
+class PeakMemorySampler:
+    """
+    Measure the peak resident memory of an analyzer process and its children
+    in a background thread while the process is running.
+    """
+
+    def __init__(self, pid: int, interval: float = SAMPLE_INTERVAL):
+        self.__pid = pid
+        self.__interval = interval
+        self.__stopped = threading.Event()
+        self.peak = 0
+
+        self.__thread = threading.Thread(target=self.__sample, daemon=True)
+        self.__thread.start()
+
+    def __sample(self):
+        while True:
+            self.peak = max(self.peak, process_tree_rss(self.__pid))
+            if self.__stopped.wait(self.__interval):
+                break
+
+    def stop(self) -> int:
+        """ Stop the measurement and return the peak memory in bytes. """
+        self.__stopped.set()
+        self.__thread.join()
+        return self.peak
+
+
+class AdmissionController:
+    """
+    Decide whether a new analysis action can be started based on the memory
+    reserved by the running actions and the available memory of the system.
+
+    Every running action reserves the larger of its expected peak memory
+    and the measured memory of its analyzer processes. An action which has
+    just been started didn't allocate its memory yet, so the reservations
+    are counted even if several actions are admitted before the memory is
+    measured again.
+    """
+
+    def __init__(self, memory_budget: Optional[int],
+                 peak_memory: AnalysisPeakMemory):
+        """
+        memory_budget -- The maximal memory in bytes which can be used by the
+                         analyzer processes together, or None if only the
+                         available memory of the system is considered.
+        peak_memory -- The peak memory of the actions measured at their
+                       previous analysis.
+        """
+        self.__memory_budget = memory_budget
+        self.__peak_memory = peak_memory
+        self.__min_available = \
+            psutil.virtual_memory().total * MIN_AVAILABLE_MEMORY_RATIO
+
+        # Actions which were not analyzed before are expected to use as much
+        # memory as a typical action.
+        known = [peak for sources in peak_memory.values()
+                 for peak in sources.values()]
+        self.__default_peak = int(median(known)) if known \
+            else DEFAULT_PEAK_MEMORY
+
+        # Expected peak and measured memory of the running actions.
+        self.__expected: Dict[Hashable, int] = {}
+        self.__measured: Dict[Hashable, int] = {}
+
+        self.__available = psutil.virtual_memory().available
+        self.__last_refresh = 0.0
+
+        self.__holding_back = False
+
+    def expected_peak(self, action) -> int:
+        """ Return the expected peak memory of the given action in bytes. """
+        return self.__peak_memory.get(action.analyzer_type, {}) \
+            .get(action.source, self.__default_peak)
+
+    def refresh(self, worker_pids: Dict[Hashable, int]):
+        """
+        Measure the memory of the analyzer processes of the running actions
+        and the available memory of the system. worker_pids contains the
+        pid of the worker process of the running actions which are already
+        started by a worker. The memory is measured at most once in every
+        SAMPLE_INTERVAL seconds.
+        """
+        now = time.time()
+        if now - self.__last_refresh < SAMPLE_INTERVAL:
+            return
+        self.__last_refresh = now
+
+        rss = descendants_rss(set(worker_pids.values()))
+        for key, pid in worker_pids.items():
+            if key in self.__expected:
+                self.__measured[key] = rss.get(pid, 0)
+
+        self.__available = psutil.virtual_memory().available
+
+    def reservation(self, key: Hashable) -> int:
+        """ Return the memory reserved by the given running action. """
+        return max(self.__expected[key], self.__measured.get(key, 0))
+
+    def admit(self, key: Hashable, action) -> bool:
+        """
+        Return True if the given action can be started, and reserve memory
+        for it. An action is always admitted if no other action is running,
+        so the analysis makes progress even if a single action exceeds the
+        limits. finished() has to be called when an admitted action ends.
+        """
+        expected = self.expected_peak(action)
+
+        if self.__expected:
+            # The available memory already lacks the measured memory of the
+            # running actions, only the rest of their reservation is
+            # subtracted.
+            outstanding = sum(self.reservation(k) - self.__measured.get(k, 0)
+                              for k in self.__expected)
+            fits = self.__available - outstanding - expected >= \
+                self.__min_available
+
+            if fits and self.__memory_budget:
+                reserved = sum(self.reservation(k) for k in self.__expected)
+                fits = reserved + expected <= self.__memory_budget
+
+            self.__set_holding_back(not fits)
+            if not fits:
+                return False
+        else:
+            self.__set_holding_back(False)
+
+        self.__expected[key] = expected
+        return True
+
+    def finished(self, key: Hashable):
+        """ Release the memory reserved by the given action. """
+        self.__expected.pop(key, None)
+        self.__measured.pop(key, None)
+
+    def __set_holding_back(self, holding_back: bool):
+        if holding_back and not self.__holding_back:
+            LOG.info("Not enough memory for more analysis processes, "
+                     "continuing with %d parallel processes.",
+                     len(self.__expected))
+        elif not holding_back and self.__holding_back:
+            LOG.info("Memory is available again for more analysis "
+                     "processes.")
+
+        self.__holding_back = holding_back
@@ -184,6 +184,23 @@ def run_pre_analysis(actions, clangsa_config,
         os.makedirs(stat_tmp_dir)
 
     try:
+        if ctu_data:
+            # The triple archs are detected once per distinct set of target
+            # selecting flags, and the workers read them from the CTU
+            # directory instead of running the compiler for every action.
+            ctu_actions = [
+                action for action in actions
+                if action.analyzer_type == ClangSA.ANALYZER_NAME and
+                not (skip_handlers and
+                     skip_handlers.should_skip(action.source))]
+            triple_archs = ctu_triple_arch.collect_triple_archs(
+                ctu_actions, clangsa_config, pool.map,
+                clangsa_config.ctu_compiler_info_file or None)
+            ctu_triple_arch.save_triple_arch_map(clangsa_config.ctu_dir,
+                                                 triple_archs)
+            LOG.debug("Collected %d target triple architectures.",
+                      len(triple_archs))
+
         collect_actions = [(build_action,
                             clangsa_config,
                             skip_handlers,
@@ -212,7 +229,8 @@ def run_pre_analysis(actions, clangsa_config,
         ctu_manager.merge_clang_extdef_mappings(
                 ctu_data.get('ctu_dir'),
                 ctu_data.get('ctu_func_map_file'),
-                ctu_data.get('ctu_temp_fnmap_folder'))
+                ctu_data.get('ctu_temp_fnmap_folder'),
+                jobs)
 
     if statistics_data:
 
@@ -0,0 +1,137 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the fingerprints of the analysis actions. """
+
+
+import os
+import tempfile
+import unittest
+
+from codechecker_analyzer import action_fingerprint
+from codechecker_common.review_status_handler import ReviewStatusHandler
+from codechecker_common.skiplist_handler import SkipListHandler, \
+    SkipListHandlers
+
+
+class ActionFingerprintTest(unittest.TestCase):
+    """
+    Test that a saved fingerprint detects the changes of the action inputs.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.source = self.__write('main.cpp', '#include "a.h"\nint main();\n')
+        self.header = self.__write('a.h', 'int a;\n')
+        self.fingerprint_file = action_fingerprint.get_fingerprint_file(
+            self.tmp_dir.name, 'main.cpp_clangsa_1234')
+        self.cmd = ['clang', '--analyze', '-Xclang', '-analyzer-checker=core',
+                    self.source]
+
+        self.config_hash = action_fingerprint.get_config_hash(
+            None, None, None)
+
+        self.__save()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def __write(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def __save(self, content_hashes=None):
+        if content_hashes is None:
+            content_hashes = action_fingerprint.get_content_hashes(
+                [self.source, self.header])
+
+        action_fingerprint.save(self.fingerprint_file, self.cmd, '17.0.0',
+                                self.config_hash, content_hashes)
+
+    def __is_up_to_date(self, cmd=None, version='17.0.0', config_hash=None):
+        return action_fingerprint.is_up_to_date(
+            self.fingerprint_file, cmd or self.cmd, version,
+            config_hash or self.config_hash)
+
+    def test_unchanged(self):
+        """ The action is up to date if nothing has changed. """
+        self.assertTrue(self.__is_up_to_date())
+
+    def test_header_changed(self):
+        """ Changing an included header invalidates the fingerprint. """
+        self.__write('a.h', 'int b;\n')
+        self.assertFalse(self.__is_up_to_date())
+
+    def test_header_removed(self):
+        """ Removing an included header invalidates the fingerprint. """
+        os.remove(self.header)
+        self.assertFalse(self.__is_up_to_date())
+
+    def test_command_changed(self):
+        """ Changing the checker configuration invalidates the fingerprint. """
+        cmd = self.cmd[:-1] + ['-analyzer-checker=unix', self.source]
+        self.assertFalse(self.__is_up_to_date(cmd=cmd))
+
+    def test_version_changed(self):
+        """ Changing the analyzer version invalidates the fingerprint. """
+        self.assertFalse(self.__is_up_to_date(version='18.0.0'))
+
+    def test_missing_fingerprint(self):
+        """ An action without fingerprint is never up to date. """
+        action_fingerprint.remove(self.fingerprint_file)
+        self.assertFalse(self.__is_up_to_date())
+
+    def test_modified_during_analysis(self):
+        """
+        The content hashes are taken before the analysis, so a header which
+        is modified during the analysis invalidates the fingerprint.
+        """
+        content_hashes = action_fingerprint.get_content_hashes(
+            [self.source, self.header])
+
+        # The analysis is running...
+        self.__write('a.h', 'int b;\n')
+
+        self.__save(content_hashes)
+        self.assertFalse(self.__is_up_to_date())
+
+    def test_unknown_dependencies(self):
+        """ No fingerprint is saved if the dependencies are unknown. """
+        self.__save({})
+        self.assertFalse(os.path.exists(self.fingerprint_file))
+
+    def test_skip_list_changed(self):
+        """ Changing the skip list invalidates the fingerprint. """
+        skip_handlers = SkipListHandlers([SkipListHandler('-*/a.h')])
+        self.assertFalse(self.__is_up_to_date(
+            config_hash=action_fingerprint.get_config_hash(
+                skip_handlers, None, None)))
+        self.assertFalse(self.__is_up_to_date(
+            config_hash=action_fingerprint.get_config_hash(
+                None, skip_handlers, None)))
+
+    def test_review_status_config_changed(self):
+        """ Changing the review status config invalidates the fingerprint. """
+        config_file = self.__write(
+            'review_status.yaml',
+            '$version: 1\n'
+            'rules:\n'
+            '  - filters:\n'
+            '      filepath: "*/a.h"\n'
+            '    actions:\n'
+            '      review_status: false_positive\n')
+        rs_handler = ReviewStatusHandler()
+        rs_handler.set_review_status_config(config_file)
+
+        config_hash = action_fingerprint.get_config_hash(
+            None, None, rs_handler)
+        self.assertFalse(self.__is_up_to_date(config_hash=config_hash))
+        self.assertEqual(config_hash, action_fingerprint.get_config_hash(
+            SkipListHandlers(), None, rs_handler))
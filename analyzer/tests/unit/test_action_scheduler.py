@@ -0,0 +1,100 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the cost based ordering of the analysis actions. """
+
+
+import os
+import tempfile
+import unittest
+
+from codechecker_analyzer import action_scheduler
+
+
+class BuildAction:
+    def __init__(self, source, analyzer_type='clangsa'):
+        self.source = source
+        self.analyzer_type = analyzer_type
+
+
+class ActionSchedulerTest(unittest.TestCase):
+    """
+    Test the longest job first ordering of build actions.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def __create_source(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_order_by_previous_durations(self):
+        """ Previous analysis durations decide the order. """
+        a = self.__create_source('a.cpp', 'int a;\n')
+        b = self.__create_source('b.cpp', 'int b;\n')
+        c = self.__create_source('c.cpp', 'int c;\n')
+
+        actions = [BuildAction(a), BuildAction(b), BuildAction(c)]
+        durations = {'clangsa': {a: 1.0, b: 30.0, c: 5.0}}
+
+        ordered = action_scheduler.order_by_cost(actions, durations)
+        self.assertEqual([x.source for x in ordered], [b, c, a])
+
+    def test_order_by_estimation(self):
+        """ Without history the size and the includes decide the order. """
+        small = self.__create_source('small.cpp', 'int x;\n')
+        includes = self.__create_source(
+            'includes.cpp', '#include <vector>\n#include <map>\n')
+        big = self.__create_source('big.cpp', 'int y;\n' * 10000)
+
+        actions = [BuildAction(small), BuildAction(includes),
+                   BuildAction(big)]
+
+        ordered = action_scheduler.order_by_cost(actions, {})
+        self.assertEqual([x.source for x in ordered], [big, includes, small])
+
+    def test_durations_are_per_analyzer(self):
+        """ Durations of an other analyzer are not used for prediction. """
+        a = self.__create_source('a.cpp', 'int a;\n' * 100)
+        b = self.__create_source('b.cpp', 'int b;\n')
+
+        actions = [BuildAction(a, 'clang-tidy'), BuildAction(b, 'clang-tidy')]
+        durations = {'clangsa': {b: 100.0}}
+
+        ordered = action_scheduler.order_by_cost(actions, durations)
+        self.assertEqual([x.source for x in ordered], [a, b])
+
+    def test_get_durations_from_metadata(self):
+        """ Durations are collected from the tools of the metadata. """
+        metadata = {
+            'version': 2,
+            'tools': [
+                {'name': 'codechecker',
+                 'analysis_durations': {'clangsa': {'a.cpp': 2.0}}},
+                {'name': 'codechecker',
+                 'analysis_durations': {'clangsa': {'b.cpp': 3.0}}}]}
+
+        self.assertEqual(action_scheduler.get_durations(metadata),
+                         {'clangsa': {'a.cpp': 2.0, 'b.cpp': 3.0}})
+        self.assertEqual(action_scheduler.get_durations(None), {})
+
+    def test_worker_utilization(self):
+        """ Utilization is the busy time per available worker time. """
+        self.assertAlmostEqual(
+            action_scheduler.worker_utilization([10.0, 10.0, 20.0], 20.0, 2),
+            1.0)
+        self.assertAlmostEqual(
+            action_scheduler.worker_utilization([10.0], 20.0, 2), 0.25)
+        self.assertEqual(
+            action_scheduler.worker_utilization([], 0.0, 2), 0.0)
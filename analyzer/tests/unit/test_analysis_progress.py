@@ -0,0 +1,124 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the incremental handling of the analysis results. """
+
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_analyzer import analysis_manager, analysis_progress
+
+
+def new_metadata_tool():
+    return {
+        'result_source_files': {},
+        'analyzers': {
+            'clangsa': {'analyzer_statistics': {
+                'failed': 0, 'failed_sources': [],
+                'successful': 0, 'successful_sources': []}}}}
+
+
+class AnalysisProgressTest(unittest.TestCase):
+    """
+    Test that the results are recorded in the metadata and the progress is
+    reported while the analysis is running.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.output_path = self.tmp_dir.name
+        self.metadata_tool = new_metadata_tool()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def __result(self, source, return_code=0, skipped=False):
+        result_file = os.path.join(self.output_path, source + '.plist')
+        if not skipped and return_code == 0:
+            with open(result_file + '.source', 'w', encoding='utf-8') as f:
+                f.write(source + '\n')
+
+        return return_code, skipped, False, 'clangsa', result_file, \
+            source, 1024, 2.0
+
+    def __load_metadata(self):
+        with open(os.path.join(self.output_path, 'metadata.json'),
+                  encoding='utf-8') as f:
+            return json.load(f)['tools'][0]
+
+    def test_streamed_results(self):
+        """ The metadata is updated while the results arrive. """
+        progress = analysis_progress.AnalysisProgress(
+            3, self.metadata_tool, self.output_path)
+        statistics = self.metadata_tool['analyzers']['clangsa'][
+            'analyzer_statistics']
+
+        def results():
+            yield self.__result('a.cpp')
+            self.assertEqual(statistics['successful_sources'], ['a.cpp'])
+            self.assertEqual(
+                self.metadata_tool['result_source_files'],
+                {os.path.join(self.output_path, 'a.cpp.plist'): 'a.cpp'})
+
+            yield self.__result('b.cpp', return_code=1)
+            yield self.__result('c.cpp', skipped=True)
+
+        analysis_manager.worker_result_handler(
+            results(), self.metadata_tool, self.output_path, progress)
+
+        self.assertEqual(statistics['failed_sources'], ['b.cpp'])
+        self.assertEqual(self.metadata_tool['skipped'], 1)
+        self.assertEqual(self.metadata_tool['analysis_durations'],
+                         {'clangsa': {'a.cpp': 2.0, 'b.cpp': 2.0}})
+        self.assertEqual(progress.busy_time, 6.0)
+        self.assertFalse([f for f in os.listdir(self.output_path)
+                          if f.endswith('.source')])
+
+    def test_checkpoint(self):
+        """ The metadata is saved periodically. """
+        progress = analysis_progress.AnalysisProgress(
+            2, self.metadata_tool, self.output_path)
+
+        with mock.patch.object(analysis_progress, 'CHECKPOINT_INTERVAL', 0):
+            analysis_manager.worker_result_handler(
+                iter([self.__result('a.cpp')]), self.metadata_tool,
+                self.output_path, progress)
+
+        metadata_tool = self.__load_metadata()
+        self.assertEqual(metadata_tool['analyzers']['clangsa'][
+            'analyzer_statistics']['successful_sources'], ['a.cpp'])
+        self.assertEqual(os.listdir(self.output_path), ['metadata.json'])
+
+    def test_progress_file(self):
+        """ The progress is written as JSON lines. """
+        progress_file = os.path.join(self.output_path, 'progress.jsonl')
+        progress = analysis_progress.AnalysisProgress(
+            4, self.metadata_tool, self.output_path, progress_file)
+
+        progress.update(0, False, 1.0)
+        progress.update(1, False, 1.0)
+        progress.update(0, True, 0.0)
+        progress.close()
+
+        with open(progress_file, encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+
+        self.assertEqual(lines[0]['event'], 'progress')
+        self.assertEqual(lines[0]['finished'], 1)
+
+        last = lines[-1]
+        self.assertEqual(last['event'], 'finished')
+        self.assertEqual((last['finished'], last['total'],
+                          last['successful'], last['failed'],
+                          last['skipped']), (3, 4, 1, 1, 1))
+        self.assertGreater(last['throughput'], 0)
+        self.assertIsNotNone(last['eta'])
@@ -0,0 +1,149 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the on-disk cache of the analyzer capabilities. """
+
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_analyzer.analyzers import capability_cache
+
+FAKE_ANALYZER = """#!/bin/sh
+echo "$@" >> {log_file}
+echo "{output}"
+if [ "$1" = "--fail" ]; then
+  exit 1
+fi
+"""
+
+
+class AnalyzerCapabilityCacheTest(unittest.TestCase):
+    """
+    Test that the analyzer is run only once for the same command until the
+    analyzer binary or the files of the command change.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.log_file = os.path.join(self.tmp_dir, 'analyzer.log')
+        self.analyzer = os.path.join(self.tmp_dir, 'clang')
+        self.__write_analyzer('checker.A')
+
+        self.env = mock.patch.dict(
+            os.environ, {'CC_ANALYZER_CAPABILITY_CACHE_DIR': self.cache_dir})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def __write_analyzer(self, output):
+        with open(self.analyzer, 'w', encoding='utf-8') as f:
+            f.write(FAKE_ANALYZER.format(log_file=self.log_file,
+                                         output=output))
+        os.chmod(self.analyzer, 0o755)
+
+    def __analyzer_runs(self):
+        if not os.path.exists(self.log_file):
+            return 0
+
+        with open(self.log_file, encoding='utf-8') as f:
+            return len(f.readlines())
+
+    def test_cached_output(self):
+        """ The output of the same command is read from the cache. """
+        command = [self.analyzer, '-analyzer-checker-help']
+
+        self.assertEqual(capability_cache.check_output(command),
+                         "checker.A\n")
+        self.assertEqual(capability_cache.check_output(command),
+                         "checker.A\n")
+        self.assertEqual(self.__analyzer_runs(), 1)
+
+        capability_cache.check_output(command + ['-analyzer-config-help'])
+        self.assertEqual(self.__analyzer_runs(), 2)
+
+    def test_binary_changes(self):
+        """ The entries are invalidated when the binary changes. """
+        command = [self.analyzer, '--version']
+        capability_cache.check_output(command)
+
+        self.__write_analyzer('checker.A checker.B')
+        self.assertEqual(capability_cache.check_output(command),
+                         "checker.A checker.B\n")
+        self.assertEqual(self.__analyzer_runs(), 2)
+
+    def test_plugin_changes(self):
+        """ The entries are invalidated when a loaded plugin changes. """
+        plugin = os.path.join(self.tmp_dir, 'plugin.so')
+        with open(plugin, 'w', encoding='utf-8') as f:
+            f.write('plugin')
+
+        command = [self.analyzer, '-load', plugin]
+        capability_cache.check_output(command)
+        capability_cache.check_output(command)
+        self.assertEqual(self.__analyzer_runs(), 1)
+
+        with open(plugin, 'w', encoding='utf-8') as f:
+            f.write('new plugin')
+        capability_cache.check_output(command)
+        self.assertEqual(self.__analyzer_runs(), 2)
+
+    def test_failure_not_cached(self):
+        """ The output of failing commands is not stored. """
+        command = [self.analyzer, '--fail']
+        for _ in range(2):
+            with self.assertRaises(subprocess.CalledProcessError):
+                capability_cache.check_output(command)
+
+        self.assertEqual(self.__analyzer_runs(), 2)
+
+    def test_disabled(self):
+        """ The cache is disabled by an empty cache directory. """
+        command = [self.analyzer, '--version']
+        with mock.patch.dict(
+                os.environ, {'CC_ANALYZER_CAPABILITY_CACHE_DIR': ''}):
+            capability_cache.check_output(command)
+            capability_cache.check_output(command)
+
+        self.assertEqual(self.__analyzer_runs(), 2)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_isolate_cwd(self):
+        """
+        The configuration files of the current directory are not found by
+        commands which are run in an isolated directory.
+        """
+        with open(self.analyzer, 'w', encoding='utf-8') as f:
+            f.write('#!/bin/sh\ncat .clang-tidy 2>/dev/null\necho done\n')
+
+        project_dir = os.path.join(self.tmp_dir, 'project')
+        os.makedirs(project_dir)
+        with open(os.path.join(project_dir, '.clang-tidy'), 'w',
+                  encoding='utf-8') as f:
+            f.write('Checks: -*\n')
+
+        cwd = os.getcwd()
+        os.chdir(project_dir)
+        try:
+            self.assertEqual(
+                capability_cache.check_output(
+                    [self.analyzer, '-dump-config'], isolate_cwd=True),
+                "done\n")
+            self.assertEqual(
+                capability_cache.check_output(
+                    [self.analyzer, '-dump-config', '-checks=*']),
+                "Checks: -*\ndone\n")
+        finally:
+            os.chdir(cwd)
@@ -172,3 +172,45 @@ class TestCompilationDatabase(unittest.TestCase):
             os.path.join(TestCompilationDatabase.project_dir, "non_existing"))
 
         self.assertIsNone(comp_db)
+
+    def test_stream_compilation_database_file(self):
+        """
+        The build actions of a compilation database file are read while they
+        are iterated.
+        """
+        comp_db = compilation_database.gather_compilation_database(
+            TestCompilationDatabase.comp_db_outer, streaming=True)
+
+        self.assertIsInstance(comp_db,
+                              compilation_database.CompilationDatabaseFile)
+        self.assertEqual(len(comp_db), 2)
+        self.assertEqual(
+            list(comp_db),
+            compilation_database.gather_compilation_database(
+                TestCompilationDatabase.comp_db_outer))
+
+        # Other inputs are still collected into a list.
+        comp_db = compilation_database.gather_compilation_database(
+            TestCompilationDatabase.project_dir, streaming=True)
+        self.assertEqual(len(comp_db), 2)
+
+    def test_dump_compilation_database(self):
+        """ The build actions are dumped like by json.dump(). """
+        comp_db_file = os.path.join(self.project_dir, "dump.json")
+        build_actions = [{"directory": self.project_dir,
+                          "arguments": ["gcc", "-DNAME=\"a b\"", "x.c"],
+                          "file": "x.c"}]
+        with open(comp_db_file, "w", encoding="utf-8") as f:
+            json.dump(build_actions, f)
+
+        dump_file = os.path.join(self.project_dir, "dump_out.json")
+        comp_db = compilation_database.CompilationDatabaseFile(comp_db_file)
+        compilation_database.dump_compilation_database(comp_db, dump_file)
+
+        compilation_database.change_args_to_command_in_comp_db(build_actions)
+        with open(dump_file, encoding="utf-8") as f:
+            self.assertEqual(f.read(), json.dumps(build_actions, indent=2))
+
+        compilation_database.dump_compilation_database([], dump_file)
+        with open(dump_file, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "[]")
@@ -0,0 +1,146 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the on-disk cache of the implicit compiler information. """
+
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_analyzer.buildlog import log_parser
+from codechecker_analyzer.buildlog.compiler_info_cache import \
+    CompilerInfoCache
+from codechecker_analyzer.buildlog.log_parser import ImplicitCompilerInfo
+
+FAKE_COMPILER = """#!/bin/sh
+echo "$@" >> {log_file}
+echo "Target: x86_64-fake-linux-gnu" >&2
+echo "#include <...> search starts here:" >&2
+echo " /fake/include" >&2
+echo "End of search list." >&2
+echo "error: CC_FOUND_STANDARD_VER#17" >&2
+"""
+
+
+class CompilerInfoCacheTest(unittest.TestCase):
+    """
+    Test that the compiler is run only once for the same compiler info.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.log_file = os.path.join(self.tmp_dir, 'compiler.log')
+
+        self.compiler = os.path.join(self.tmp_dir, 'gcc')
+        with open(self.compiler, 'w', encoding='utf-8') as f:
+            f.write(FAKE_COMPILER.format(log_file=self.log_file))
+        os.chmod(self.compiler, 0o755)
+
+        self.env = mock.patch.dict(
+            os.environ, {'CC_COMPILER_INFO_CACHE_DIR': self.cache_dir})
+        self.env.start()
+        self.__reset_compiler_info()
+
+    def tearDown(self):
+        self.env.stop()
+        self.__reset_compiler_info()
+        shutil.rmtree(self.tmp_dir)
+
+    @staticmethod
+    def __reset_compiler_info():
+        ImplicitCompilerInfo.compiler_info = {}
+        ImplicitCompilerInfo.compiler_info_file = None
+        ImplicitCompilerInfo.compiler_info_cache = None
+
+    def __compiler_runs(self):
+        if not os.path.exists(self.log_file):
+            return 0
+
+        with open(self.log_file, encoding='utf-8') as f:
+            return len(f.readlines())
+
+    def test_cache_key(self):
+        """ The entries are invalidated when the compiler changes. """
+        cache = CompilerInfoCache(self.cache_dir)
+        key = cache.get_key(self.compiler, 'c', ['-m32'])
+        self.assertIsNotNone(key)
+        self.assertIsNone(cache.get(key))
+
+        cache.put(key, {'target': 'x86_64'})
+        self.assertEqual(cache.get(key), {'target': 'x86_64'})
+        self.assertIsNone(cache.get(
+            cache.get_key(self.compiler, 'c++', ['-m32'])))
+
+        with open(self.compiler, 'a', encoding='utf-8') as f:
+            f.write("\n")
+        self.assertIsNone(cache.get(
+            cache.get_key(self.compiler, 'c', ['-m32'])))
+
+        self.assertIsNone(cache.get_key(
+            os.path.join(self.tmp_dir, 'missing'), 'c', []))
+
+    def test_collect_once(self):
+        """ The compiler info is read from the cache by later runs. """
+        key = ImplicitCompilerInfo.ImplicitInfoSpecifierKey(
+            self.compiler, 'c++', ())
+
+        info = ImplicitCompilerInfo.collect(key)
+        self.assertEqual(info['compiler_includes'], ['/fake/include'])
+        self.assertEqual(info['compiler_standard'], '-std=gnu++17')
+        self.assertEqual(info['target'], 'x86_64-fake-linux-gnu')
+        self.assertEqual(self.__compiler_runs(), 3)
+
+        self.__reset_compiler_info()
+        self.assertEqual(ImplicitCompilerInfo.collect(key), info)
+        self.assertEqual(self.__compiler_runs(), 3)
+
+    def test_cache_disabled(self):
+        """ An empty cache directory disables the cache. """
+        key = ImplicitCompilerInfo.ImplicitInfoSpecifierKey(
+            self.compiler, 'c', ())
+
+        with mock.patch.dict(os.environ,
+                             {'CC_COMPILER_INFO_CACHE_DIR': ''}):
+            ImplicitCompilerInfo.collect(key)
+            self.__reset_compiler_info()
+            ImplicitCompilerInfo.collect(key)
+
+        self.assertEqual(self.__compiler_runs(), 6)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_dump_worker_compiler_info(self):
+        """
+        The compiler info collected by the worker processes is dumped.
+        """
+        src_file = os.path.join(self.tmp_dir, 'main.cpp')
+        with open(src_file, 'w', encoding='utf-8') as f:
+            f.write("int main() { return 0; }")
+
+        compilation_database = [
+            {"directory": self.tmp_dir,
+             "command": f"{self.compiler} -c {src_file} {flag}",
+             "file": src_file}
+            for flag in ['-O2', '-O3', '-m32']]
+
+        build_actions, _ = log_parser.parse_unique_log(
+            compilation_database, self.tmp_dir, jobs=2)
+        self.assertEqual(len(build_actions), 3)
+        for build_action in build_actions:
+            self.assertEqual(build_action.target, 'x86_64-fake-linux-gnu')
+
+        with open(os.path.join(self.tmp_dir, 'compiler_info.json'),
+                  encoding='utf-8') as f:
+            compiler_info = json.load(f)
+
+        self.assertEqual(sorted(json.loads(k)[2] for k in compiler_info),
+                         [[], ['-m32']])
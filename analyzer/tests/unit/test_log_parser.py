@@ -14,7 +14,9 @@ import os
 import shutil
 import tempfile
 import unittest
+from unittest import mock
 
+from codechecker_analyzer import compilation_database
 from codechecker_analyzer.buildlog import log_parser
 from codechecker_common.skiplist_handler import SkipListHandler, \
     SkipListHandlers
@@ -662,3 +664,35 @@ class LogParserTest(unittest.TestCase):
 
         self.assertEqual(len(build_actions), 3)
         self.assertEqual(build_action.source, file_c_symdir)
+
+    def test_streamed_compilation_database(self):
+        """
+        A compilation database file is parsed in windows, and the build
+        actions are uniqued in the order of the entries.
+        """
+        compilation_cmd = [
+            {"directory": self.tmp_dir,
+             "command": f"g++ -DX={i % 7} -c {self.src_file_path} "
+                        f"-o main{i % 5}.o",
+             "file": self.src_file_path}
+            for i in range(50)]
+
+        with open(self.compile_command_file_path, "w",
+                  encoding="utf-8", errors="ignore") as f:
+            json.dump(compilation_cmd, f)
+
+        comp_db = compilation_database.CompilationDatabaseFile(
+            self.compile_command_file_path)
+
+        with mock.patch.object(log_parser, 'PARSE_WINDOW_ENTRIES_PER_JOB', 3):
+            for uniqueing in ["none", "alpha", "-DX=3"]:
+                expected, _ = log_parser.parse_unique_log(
+                    compilation_cmd, self.__this_dir, uniqueing, jobs=2)
+                build_actions, _ = log_parser.parse_unique_log(
+                    comp_db, self.__this_dir, uniqueing, jobs=2)
+
+                self.assertEqual(
+                    [a.original_command for a in build_actions],
+                    [a.original_command for a in expected])
+
+        self.assertEqual(len(comp_db), 50)
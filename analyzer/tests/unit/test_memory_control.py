@@ -0,0 +1,178 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the memory-aware admission of the analysis actions. """
+
+
+import argparse
+import subprocess
+import sys
+import unittest
+from collections import namedtuple
+from unittest import mock
+
+from codechecker_analyzer import memory_control
+from codechecker_analyzer.arg import memory_size
+
+GiB = 1024 ** 3
+
+VirtualMemory = namedtuple('VirtualMemory', ['total', 'available'])
+
+
+class BuildAction:
+    def __init__(self, source, analyzer_type='clangsa'):
+        self.source = source
+        self.analyzer_type = analyzer_type
+
+
+class MemorySizeTest(unittest.TestCase):
+    """ Test the parsing of the --memory-budget flag. """
+
+    def test_units(self):
+        self.assertEqual(memory_size('1073741824'), GiB)
+        self.assertEqual(memory_size('512M'), 512 * 1024 ** 2)
+        self.assertEqual(memory_size('16g'), 16 * GiB)
+        self.assertEqual(memory_size('1.5GiB'), int(1.5 * GiB))
+        self.assertEqual(memory_size('2T'), 2 * 1024 * GiB)
+
+    def test_wrong_format(self):
+        for arg in ['', 'G', '-1G', '0', '16X', '16 GB extra']:
+            with self.assertRaises(argparse.ArgumentTypeError):
+                memory_size(arg)
+
+
+class AdmissionControllerTest(unittest.TestCase):
+    """ Test the decisions of the admission controller. """
+
+    def setUp(self):
+        self.virtual_memory = mock.patch.object(
+            memory_control.psutil, 'virtual_memory',
+            return_value=VirtualMemory(total=100 * GiB,
+                                       available=50 * GiB))
+        self.virtual_memory.start()
+
+        self.peak_memory = {'clangsa': {'big.cpp': 30 * GiB,
+                                        'small.cpp': 1 * GiB,
+                                        'medium.cpp': 3 * GiB}}
+
+    def tearDown(self):
+        self.virtual_memory.stop()
+
+    def __controller(self, memory_budget=None):
+        return memory_control.AdmissionController(
+            memory_budget, self.peak_memory)
+
+    def __admitted(self, controller, sources):
+        """ Admit the actions of the given sources in one pass. """
+        admitted = []
+        for idx, source in enumerate(sources):
+            if not controller.admit(idx, BuildAction(source)):
+                break
+            admitted.append(source)
+        return admitted
+
+    def test_expected_peak(self):
+        """ Unknown actions are expected to use the median peak memory. """
+        controller = self.__controller()
+        self.assertEqual(controller.expected_peak(BuildAction('big.cpp')),
+                         30 * GiB)
+        self.assertEqual(controller.expected_peak(BuildAction('new.cpp')),
+                         3 * GiB)
+        self.assertEqual(controller.expected_peak(
+            BuildAction('big.cpp', 'clang-tidy')), 3 * GiB)
+
+    def test_default_peak(self):
+        """ Without history a nonzero peak memory is expected. """
+        self.peak_memory = {}
+        controller = self.__controller()
+        self.assertEqual(controller.expected_peak(BuildAction('new.cpp')),
+                         memory_control.DEFAULT_PEAK_MEMORY)
+
+    def test_admit_in_one_pass(self):
+        """
+        The actions admitted in the same pass reserve memory before they
+        allocate it, so they don't exceed the available memory together.
+        """
+        # 50 GiB is available and 10 GiB has to remain available.
+        controller = self.__controller()
+        self.assertEqual(
+            self.__admitted(controller, ['medium.cpp'] * 20),
+            ['medium.cpp'] * 13)
+
+        # Without history every action reserves the default peak memory.
+        self.peak_memory = {}
+        with mock.patch.object(memory_control, 'DEFAULT_PEAK_MEMORY',
+                               8 * GiB):
+            controller = self.__controller()
+            self.assertEqual(len(self.__admitted(controller,
+                                                 ['new.cpp'] * 64)), 5)
+
+    def test_finished_releases_reservation(self):
+        """ A finished action releases its reservation. """
+        controller = self.__controller()
+        self.assertTrue(controller.admit(0, BuildAction('big.cpp')))
+        self.assertFalse(controller.admit(1, BuildAction('big.cpp')))
+
+        controller.finished(0)
+        self.assertTrue(controller.admit(1, BuildAction('big.cpp')))
+
+    def test_measured_memory(self):
+        """
+        An action which uses more memory than expected reserves its
+        measured memory.
+        """
+        controller = self.__controller(15 * GiB)
+        self.assertTrue(controller.admit(0, BuildAction('small.cpp')))
+
+        with mock.patch.object(memory_control, 'descendants_rss',
+                               return_value={1000: 14 * GiB}):
+            controller.refresh({0: 1000})
+
+        self.assertEqual(controller.reservation(0), 14 * GiB)
+        self.assertTrue(controller.admit(1, BuildAction('small.cpp')))
+        self.assertFalse(controller.admit(2, BuildAction('small.cpp')))
+
+    def test_memory_budget(self):
+        """ The reservations and the new action must fit the budget. """
+        controller = self.__controller(16 * GiB)
+        self.assertEqual(
+            self.__admitted(controller, ['medium.cpp'] * 10),
+            ['medium.cpp'] * 5)
+
+    def test_always_admit_first(self):
+        """ An action is started if nothing else is running. """
+        controller = self.__controller(16 * GiB)
+        self.assertTrue(controller.admit(0, BuildAction('big.cpp')))
+
+
+class PeakMemoryTest(unittest.TestCase):
+    """ Test the measurement and the storage of the peak memory. """
+
+    def test_get_peak_memory(self):
+        """ Peak memory is read from the tools of the metadata. """
+        metadata = {'tools': [
+            {memory_control.METADATA_PEAK_MEMORY_KEY:
+                {'clangsa': {'a.cpp': 10}}},
+            {memory_control.METADATA_PEAK_MEMORY_KEY:
+                {'clangsa': {'b.cpp': 20}, 'clang-tidy': {'a.cpp': 30}}}]}
+
+        self.assertEqual(memory_control.get_peak_memory(metadata),
+                         {'clangsa': {'a.cpp': 10, 'b.cpp': 20},
+                          'clang-tidy': {'a.cpp': 30}})
+        self.assertEqual(memory_control.get_peak_memory(None), {})
+
+    def test_sampler(self):
+        """ The peak memory of a process and its children is measured. """
+        proc = subprocess.Popen(
+            [sys.executable, '-c',
+             'import time; data = bytearray(64 * 1024 * 1024); '
+             'time.sleep(1)'])
+        sampler = memory_control.PeakMemorySampler(proc.pid, interval=0.05)
+        proc.wait()
+
+        self.assertGreater(sampler.stop(), 64 * 1024 * 1024)
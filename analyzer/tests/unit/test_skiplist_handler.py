@@ -0,0 +1,78 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the skip list handler. """
+
+
+import unittest
+
+from codechecker_common.skiplist_handler import SkipListHandler
+
+
+class SkipListHandlerTest(unittest.TestCase):
+    """
+    Test matching the file paths with the lines of a skip file.
+    """
+
+    def test_plain_paths(self):
+        """ A plain path skips the file and everything below it. """
+        handler = SkipListHandler("""
+-/src/lib/a.cpp
+-/src/gen/
+-/src/other/../tmp
+""")
+        self.assertTrue(handler.should_skip("/src/lib/a.cpp"))
+        self.assertTrue(handler.should_skip("/src/gen"))
+        self.assertTrue(handler.should_skip("/src/gen/x/y.cpp"))
+        self.assertTrue(handler.should_skip("/src/tmp/b.cpp"))
+        self.assertFalse(handler.should_skip("/src/lib/a.cpp.bak"))
+        self.assertFalse(handler.should_skip("/src/generated/b.cpp"))
+        self.assertFalse(handler.should_skip("/src/lib/b.cpp"))
+
+    def test_first_match_wins(self):
+        """ The first matching line decides, regardless of its kind. """
+        handler = SkipListHandler("""
++/src/lib/keep.cpp
+-/src/lib
++*/tests/*
+-*.cpp
+""")
+        self.assertFalse(handler.should_skip("/src/lib/keep.cpp"))
+        self.assertTrue(handler.should_skip("/src/lib/other.cpp"))
+        self.assertTrue(handler.should_skip("/src/lib/tests/t.cpp"))
+        self.assertFalse(handler.should_skip("/src/app/tests/t.cpp"))
+        self.assertTrue(handler.should_skip("/src/app/main.cpp"))
+        self.assertFalse(handler.should_skip("/src/app/main.h"))
+
+    def test_patterns(self):
+        """ Glob patterns are matched like by fnmatch. """
+        handler = SkipListHandler("""
+-/src/*/generated/*.h
+-/src/file?.c
+-/src/[ab]x.c
+""")
+        self.assertTrue(handler.should_skip("/src/a/b/generated/x.h"))
+        self.assertFalse(handler.should_skip("/src/a/generated/x.cpp"))
+        self.assertTrue(handler.should_skip("/src/file1.c"))
+        self.assertFalse(handler.should_skip("/src/file10.c"))
+        self.assertTrue(handler.should_skip("/src/bx.c"))
+        self.assertFalse(handler.should_skip("/src/cx.c"))
+        self.assertFalse(handler.should_skip("/src/[ab]x.c"))
+
+    def test_overwrite_skip_content(self):
+        """ Overwriting the skip lines drops the remembered results. """
+        handler = SkipListHandler("-/src/a.cpp")
+        self.assertTrue(handler.should_skip("/src/a.cpp"))
+        self.assertTrue(handler.should_skip("/src/a.cpp"))
+
+        handler.overwrite_skip_content(["+/src/a.cpp", "-/src"])
+        self.assertFalse(handler.should_skip("/src/a.cpp"))
+        self.assertTrue(handler.should_skip("/src/b.cpp"))
+
+        handler.overwrite_skip_content([])
+        self.assertFalse(handler.should_skip("/src/b.cpp"))
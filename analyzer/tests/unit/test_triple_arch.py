@@ -9,9 +9,31 @@
 """Compiler flag checking functions."""
 
 
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 from codechecker_analyzer.analyzers.clangsa import ctu_triple_arch
+from codechecker_analyzer.analyzers.clangsa.config_handler import \
+    ClangSAConfigHandler
+from codechecker_analyzer.buildlog.build_action import BuildAction
+
+
+def _build_action(source, target='x86_64-linux-gnu', options=None):
+    return BuildAction(analyzer_options=options or ['-O2'],
+                       compiler_includes=[],
+                       compiler_standard='-std=c++17',
+                       analyzer_type='clangsa',
+                       original_command='',
+                       directory='/tmp',
+                       output='',
+                       lang='c++',
+                       target=target,
+                       source=source,
+                       arch='',
+                       action_type=BuildAction.COMPILE)
 
 
 class TripleArch(unittest.TestCase):
@@ -40,3 +62,110 @@ InstalledDir: /opt/clang+llvm-8.0.0-x86_64-linux-gnu-ubuntu-18.04/bin
  "<blabla>" "main.cpp" "<blabla>"
  '''
         self.assertIsNone(ctu_triple_arch._find_arch_in_command(output))
+
+
+class TripleArchCache(unittest.TestCase):
+    """ Test the memoization of the triple arch detection. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config = ClangSAConfigHandler({})
+        self.config.ctu_dir = os.path.join(self.tmp_dir.name, 'ctu-dir')
+        self.config.add_gcc_include_dirs_with_isystem = False
+        self.commands = []
+
+        self.patches = [
+            mock.patch.object(ctu_triple_arch.analyzer.ClangSA,
+                              'analyzer_binary', return_value='clang'),
+            mock.patch.object(ctu_triple_arch.analyzer_base.SourceAnalyzer,
+                              'run_proc', side_effect=self.__run_proc),
+            mock.patch.dict(ctu_triple_arch._TRIPLE_ARCHS, clear=True)]
+        for patch in self.patches:
+            patch.start()
+        ctu_triple_arch._LOADED_CTU_DIRS.clear()
+
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+        ctu_triple_arch._LOADED_CTU_DIRS.clear()
+        self.tmp_dir.cleanup()
+
+    def __run_proc(self, cmd, _):
+        self.commands.append(cmd)
+        arch = 'i386' if '-m32' in cmd else 'x86_64'
+        return 0, '', f' "-cc1" "-triple" "{arch}-unknown-linux-gnu"'
+
+    def test_key(self):
+        """ Only the target selecting flags are part of the key. """
+        key = ctu_triple_arch.get_triple_arch_key(
+            _build_action('a.cpp', options=['-O2', '-DA', '-m32',
+                                            '-target', 'i386-linux-gnu']),
+            self.config)
+        self.assertEqual(json.loads(key),
+                         ['clang', ['--target=x86_64-linux-gnu', '-x', 'c++',
+                                    '-m32', '-target', 'i386-linux-gnu']])
+
+        self.assertEqual(
+            ctu_triple_arch.get_triple_arch_key(
+                _build_action('a.cpp', options=['-O2']), self.config),
+            ctu_triple_arch.get_triple_arch_key(
+                _build_action('b.cpp', options=['-O3', '-Iinclude']),
+                self.config))
+
+    def test_memoized(self):
+        """ The compiler runs once per distinct target selecting flags. """
+        for source in ['a.cpp', 'b.cpp', 'c.cpp']:
+            self.assertEqual(ctu_triple_arch.get_triple_arch(
+                _build_action(source), source, self.config), 'x86_64')
+            self.assertEqual(ctu_triple_arch.get_triple_arch(
+                _build_action(source, options=['-m32']), source,
+                self.config), 'i386')
+
+        self.assertEqual(len(self.commands), 2)
+
+    def test_collect_and_load(self):
+        """
+        The collected triple archs are read from the CTU directory by the
+        other processes.
+        """
+        actions = [_build_action(source, options=options)
+                   for source in ['a.cpp', 'b.cpp']
+                   for options in [['-O2'], ['-m32']]]
+
+        triple_archs = ctu_triple_arch.collect_triple_archs(
+            actions, self.config)
+        self.assertEqual(sorted(triple_archs.values()), ['i386', 'x86_64'])
+        self.assertEqual(len(self.commands), 2)
+
+        ctu_triple_arch.save_triple_arch_map(self.config.ctu_dir,
+                                             triple_archs)
+
+        # Simulate another process.
+        ctu_triple_arch._TRIPLE_ARCHS.clear()
+        ctu_triple_arch._LOADED_CTU_DIRS.clear()
+        for action in actions:
+            ctu_triple_arch.get_triple_arch(action, action.source,
+                                            self.config)
+        self.assertEqual(len(self.commands), 2)
+
+    def test_seed_from_compiler_info(self):
+        """
+        The compiler is not run for the targets of the compiler info file
+        unless target specific flags are given.
+        """
+        compiler_info_file = os.path.join(self.tmp_dir.name,
+                                          'compiler_info.json')
+        with open(compiler_info_file, 'w', encoding='utf-8') as f:
+            json.dump({'["g++", "c++", []]': {
+                'compiler_includes': [],
+                'compiler_standard': '-std=gnu++17',
+                'target': 'aarch64-linux-gnu'}}, f)
+
+        triple_archs = ctu_triple_arch.collect_triple_archs(
+            [_build_action('a.cpp', target='aarch64-linux-gnu'),
+             _build_action('b.cpp', target='aarch64-linux-gnu',
+                           options=['-m32'])],
+            self.config, compiler_info_file=compiler_info_file)
+
+        self.assertEqual(sorted(triple_archs.values()), ['aarch64', 'i386'])
+        self.assertEqual(len(self.commands), 1)
@@ -52,6 +52,19 @@ def __add_arguments_to_parser(parser):
                         help="Output file where the merged function maps will "
                              "be stored into.")
 
+    parser.add_argument('--incremental',
+                        dest='incremental',
+                        action='store_true',
+                        default=False,
+                        help="Keep every definition in the '<output>.all' "
+                             "file, and if this file already exists, merge "
+                             "the input files into it: the earlier "
+                             "definitions of the AST files in the input "
+                             "are replaced, the others are kept. This way "
+                             "the input folder needs to contain the "
+                             "mapping files of the changed translation "
+                             "units only.")
+
 
 def main():
     """ Merge CTU funcs maps main command line. """
@@ -68,7 +81,8 @@ def main():
 
     args = parser.parse_args()
 
-    merge_clang_extdef_mappings.merge(args.input, args.output)
+    merge_clang_extdef_mappings.merge(args.input, args.output,
+                                      args.incremental)
 
 
 if __name__ == "__main__":
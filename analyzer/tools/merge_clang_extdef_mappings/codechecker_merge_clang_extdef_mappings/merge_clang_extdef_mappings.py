@@ -7,7 +7,29 @@
 # -------------------------------------------------------------------------
 
 import glob
+import heapq
+import itertools
+import logging
 import os
+import tempfile
+from contextlib import nullcontext
+from typing import Iterable, Iterator, List, Set
+
+LOG = logging.getLogger('MergeClangExtdefMappings')
+
+# Maximum number of definitions sorted in memory at once. Larger inputs are
+# split into sorted runs of this size, which are stored in temporary files
+# and merged at the end.
+MAX_DEFINITIONS_IN_MEMORY = 200000
+
+# Suffix of the file next to the merged map which stores every definition,
+# including the conflicting ones, for the incremental merge.
+ALL_DEFINITIONS_SUFFIX = '.all'
+
+# Separator of the name and the AST file in the sorted runs. Neither of them
+# contains it, and it sorts before every other character, so sorting the
+# lines sorts the definitions by name first.
+SEPARATOR = '\0'
 
 
 def _generate_func_map_lines(func_map_dir):
@@ -20,18 +42,17 @@ def _generate_func_map_lines(func_map_dir):
                 yield line
 
 
-def _create_global_ctu_function_map(func_map_lines):
-    """ Takes iterator of individual function maps and creates a global map.
-
-    It will keeping only unique names. We leave conflicting names out of CTU.
-    A function map contains the id of a function (mangled name) and the
-    originating source (the corresponding AST file) name.
+def _generate_definitions(func_map_lines: Iterable[str]) -> Iterator[str]:
+    """
+    Converts the lines of function maps to definition lines which contain
+    the mangled name and the AST file separated by SEPARATOR. Empty lines
+    are skipped.
     """
-    mangled_to_asts = {}
-
-    # We collect all occurences of a function name into a set.
     for line in func_map_lines:
         line = line.strip()
+        if not line:
+            continue
+
         # FIXME: Detect and report invalid input.
         # The format of the external function map file changed in between
         # clang-15 and clang-16, check whether this is the updated format.
@@ -44,21 +65,87 @@ def _create_global_ctu_function_map(func_map_lines):
             ast_file = line[sep_pos + 1:]  # Skipping the ' ' separator
         else:  # The old file format
             mangled_name, ast_file = line.split(' ', 1)
-        if mangled_name not in mangled_to_asts:
-            mangled_to_asts[mangled_name] = {ast_file}
-        else:
-            mangled_to_asts[mangled_name].add(ast_file)
 
-    mangled_ast_pairs = []
+        yield f"{mangled_name}{SEPARATOR}{ast_file}\n"
+
+
+def _read_lines(file_path: str) -> Iterator[str]:
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        yield from f
+
+
+def _create_sorted_runs(
+    definitions: Iterator[str],
+    run_dir: str,
+    max_definitions_in_memory: int
+) -> List[Iterator[str]]:
+    """
+    Splits the definitions into sorted runs. Every run but the last one is
+    written into a temporary file of the given directory, so at most the
+    given number of definitions is kept in memory.
+    """
+    runs = []
+    while True:
+        chunk = list(itertools.islice(definitions,
+                                      max_definitions_in_memory))
+        if not chunk:
+            break
+
+        chunk.sort()
+        if len(chunk) < max_definitions_in_memory:
+            runs.append(iter(chunk))
+            break
+
+        with tempfile.NamedTemporaryFile('w', dir=run_dir, delete=False,
+                                         encoding='utf-8') as run_file:
+            run_file.writelines(chunk)
+        runs.append(_read_lines(run_file.name))
+
+    return runs
+
+
+def _merge_sorted_runs(runs, out_file, all_definitions_file=None) -> int:
+    """
+    Merges the sorted runs and writes the names which are defined in a
+    single AST file into the output file. The names defined in multiple AST
+    files are left out of CTU. Returns the number of these conflicting
+    names.
+    """
+    conflicts = 0
+    mangled_name = None
+    ast_files: List[str] = []
+
+    def flush():
+        nonlocal conflicts
+        if all_definitions_file:
+            all_definitions_file.writelines(
+                f"{mangled_name}{SEPARATOR}{ast_file}"
+                for ast_file in ast_files)
 
-    for mangled_name, ast_files in mangled_to_asts.items():
         if len(ast_files) == 1:
-            mangled_ast_pairs.append((mangled_name, ast_files.pop()))
+            out_file.write(f"{mangled_name} {ast_files[0]}")
+        else:
+            conflicts += 1
+
+    for line in heapq.merge(*runs):
+        name, _, ast_file = line.partition(SEPARATOR)
+        if name != mangled_name:
+            if ast_files:
+                flush()
+            mangled_name = name
+            ast_files = [ast_file]
+        elif ast_file != ast_files[-1]:
+            # The definitions are sorted, so duplicates are adjacent.
+            ast_files.append(ast_file)
 
-    return mangled_ast_pairs
+    if ast_files:
+        flush()
 
+    return conflicts
 
-def merge(func_map_dir, output_file):
+
+def merge(func_map_dir, output_file, incremental=False,
+          max_definitions_in_memory=MAX_DEFINITIONS_IN_MEMORY):
     """ Merge individual function maps into a global one.
 
     As the collect phase runs parallel on multiple threads, all compilation
@@ -67,12 +154,61 @@ def merge(func_map_dir, output_file):
     (AST generated from the source) which had them.
     These files should be merged at the end into a global map file:
     ctu_func_map_file.
+
+    The function maps are sorted in runs of bounded size and merged by a
+    k-way merge, so the whole map is never kept in memory.
+
+    In incremental mode every definition is also kept in a file next to the
+    output file. If this file exists, only the function maps of the changed
+    compilation units have to be in the input folder: the earlier
+    definitions of their AST files are replaced by the new ones, and the
+    definitions of the other AST files are kept.
+
+    Returns the number of names which are left out of the global map because
+    they are defined in multiple AST files.
     """
-    func_map_lines = _generate_func_map_lines(func_map_dir)
-    mangled_ast_pairs = _create_global_ctu_function_map(func_map_lines)
-
-    # Write (mangled function name, ast file) pairs into final file.
-    with open(output_file, 'w',
-              encoding='utf-8', errors='ignore') as out_file:
-        for mangled_name, ast_file in mangled_ast_pairs:
-            out_file.write('%s %s\n' % (mangled_name, ast_file))
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    all_definitions_path = output_file + ALL_DEFINITIONS_SUFFIX
+
+    definitions = _generate_definitions(
+        _generate_func_map_lines(func_map_dir))
+
+    changed_ast_files: Set[str] = set()
+    if incremental:
+        def collect_ast_files(definitions):
+            for definition in definitions:
+                changed_ast_files.add(definition.partition(SEPARATOR)[2])
+                yield definition
+
+        definitions = collect_ast_files(definitions)
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as run_dir:
+        runs = _create_sorted_runs(definitions, run_dir,
+                                   max_definitions_in_memory)
+
+        # The runs of the new definitions are read completely before the
+        # earlier definitions, so the changed AST files are known by then.
+        if incremental and os.path.exists(all_definitions_path):
+            runs.append(definition for definition
+                        in _read_lines(all_definitions_path)
+                        if definition.partition(SEPARATOR)[2]
+                        not in changed_ast_files)
+
+        new_all_definitions_path = os.path.join(run_dir, 'all_definitions')
+
+        # Write (mangled function name, ast file) pairs into final file.
+        with open(output_file, 'w',
+                  encoding='utf-8', errors='ignore') as out_file, \
+                open(new_all_definitions_path, 'w', encoding='utf-8') \
+                if incremental else nullcontext() as all_definitions_file:
+            conflicts = _merge_sorted_runs(runs, out_file,
+                                           all_definitions_file)
+
+        if incremental:
+            os.replace(new_all_definitions_path, all_definitions_path)
+
+    if conflicts:
+        LOG.debug("%d names are defined in multiple AST files, these are "
+                  "left out of %s.", conflicts, output_file)
+
+    return conflicts
@@ -97,3 +97,67 @@ class TestMergeClangExtdefMappingsTest(unittest.TestCase):
                           "c:@F@h# path/to/file2.cpp.ast"]
         for expected_line in expected_lines:
             self.assertTrue(expected_line in lines)
+
+    def __read_lines(self, file_path):
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read().splitlines()
+
+    def __write_map(self, directory, name, lines):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, name), 'w',
+                  encoding='utf-8', errors='ignore') as map_f:
+            map_f.write('\n'.join(lines) + '\n\n')
+
+    def test_merge_sorted_runs(self):
+        """ Merging in small runs gives the same result. """
+        output_file = os.path.join(self.test_workspace, 'runs.txt')
+        conflicts = merge_clang_extdef_mappings.merge(
+            self.extdef_maps_dir, output_file, max_definitions_in_memory=2)
+
+        self.assertEqual(conflicts, 1)
+        self.assertEqual(self.__read_lines(output_file),
+                         ["c:@F@f# path/to/file.cpp.ast",
+                          "c:@F@g# path/to/file.cpp.ast",
+                          "c:@F@h# path/to/file2.cpp.ast",
+                          "c:@F@main# path/to/file2.cpp.ast"])
+        self.assertFalse(os.path.exists(output_file + '.all'))
+
+    def test_merge_new_format(self):
+        """ Names of the new format may contain spaces. """
+        maps_dir = os.path.join(self.test_workspace, 'new_format')
+        self.__write_map(maps_dir, 'a', ["9:c:@F@f #a b.cpp.ast",
+                                         "7:c:@F@g# a b.cpp.ast"])
+        self.__write_map(maps_dir, 'b', ["7:c:@F@g# b.cpp.ast",
+                                         "9:c:@F@f #a b.cpp.ast"])
+
+        output_file = os.path.join(self.test_workspace, 'new_format.txt')
+        self.assertEqual(
+            merge_clang_extdef_mappings.merge(maps_dir, output_file), 1)
+        self.assertEqual(self.__read_lines(output_file),
+                         ["9:c:@F@f #a b.cpp.ast"])
+
+    def test_merge_incremental(self):
+        """ Only the maps of the changed AST files are merged again. """
+        maps_dir = os.path.join(self.test_workspace, 'incremental')
+        output_file = os.path.join(self.test_workspace, 'incremental.txt')
+
+        self.__write_map(maps_dir, 'a', ["c:@F@a# a.cpp.ast",
+                                         "c:@F@both# a.cpp.ast"])
+        self.__write_map(maps_dir, 'b', ["c:@F@b# b.cpp.ast",
+                                         "c:@F@both# b.cpp.ast"])
+        merge_clang_extdef_mappings.merge(maps_dir, output_file,
+                                          incremental=True)
+        self.assertEqual(self.__read_lines(output_file),
+                         ["c:@F@a# a.cpp.ast", "c:@F@b# b.cpp.ast"])
+
+        # 'both' is removed from b.cpp.
+        shutil.rmtree(maps_dir)
+        self.__write_map(maps_dir, 'b2', ["c:@F@b# b.cpp.ast",
+                                          "c:@F@c# b.cpp.ast"])
+        merge_clang_extdef_mappings.merge(maps_dir, output_file,
+                                          incremental=True)
+        self.assertEqual(self.__read_lines(output_file),
+                         ["c:@F@a# a.cpp.ast",
+                          "c:@F@b# b.cpp.ast",
+                          "c:@F@both# a.cpp.ast",
+                          "c:@F@c# b.cpp.ast"])
@@ -9,6 +9,7 @@
 
 
 import argparse
+import importlib
 import textwrap
 
 
@@ -34,3 +35,17 @@ class RawDescriptionDefaultHelpFormatter(
 
         return argparse.RawDescriptionHelpFormatter._split_lines(self, text,
                                                                  width)
+
+
+def lazy_handler(module_name: str, handler_name: str):
+    """
+    Returns a subcommand handler which imports the module of the given
+    handler function only when the handler is called. This way building the
+    argument parser of a command doesn't import the dependencies of every
+    handler of the command.
+    """
+    def handler(args):
+        module = importlib.import_module(module_name)
+        return getattr(module, handler_name)(args)
+
+    return handler
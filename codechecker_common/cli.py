@@ -13,6 +13,7 @@ PYTHON_ARGCOMPLETE_OK
 
 import argparse
 import importlib
+import importlib.util
 import io
 import os
 import pkgutil
@@ -20,6 +21,10 @@ import signal
 import sys
 import argcomplete
 
+# Version of the format of the subcommand manifest (cli_manifest.py) which is
+# understood by this module.
+MANIFEST_VERSION = 1
+
 
 class ArgumentParser(argparse.ArgumentParser):
     def error(self, message):
@@ -94,6 +99,59 @@ def discover_subcommands():
     return subcmds
 
 
+def load_subcommands():
+    """
+    Returns the available subcommands as a dict of subcommand name ->
+    (module name, help message).
+
+    The subcommands are read from the prebuilt manifest, so none of the
+    subcommand modules are imported. Subcommands of packages which are not
+    installed are left out. If the manifest is missing or it has a different
+    version, the subcommands are discovered by importing the packages, and
+    their help message is None.
+    """
+    try:
+        from codechecker_common import cli_manifest
+        if cli_manifest.MANIFEST_VERSION == MANIFEST_VERSION:
+            return {
+                subcommand: (module_name, help_msg)
+                for subcommand, (module_name, help_msg)
+                in cli_manifest.SUBCOMMANDS.items()
+                if importlib.util.find_spec(
+                    module_name.split('.', maxsplit=1)[0])}
+    except ImportError:
+        pass
+
+    return {subcommand: (module_name, None) for subcommand, module_name
+            in discover_subcommands().items()}
+
+
+def get_called_subcommand(subcommands):
+    """
+    Returns the subcommand given on the command line or None if no known
+    subcommand is given.
+
+    On shell completion argcomplete gives the command line in the COMP_LINE
+    environment variable. The word under the cursor doesn't count, because it
+    may be the prefix of several subcommands.
+    """
+    if '_ARGCOMPLETE' in os.environ:
+        line = os.environ.get('COMP_LINE', '')
+        line = line[:int(os.environ.get('COMP_POINT', len(line)))]
+
+        words = line.split()
+        if not line[-1:].isspace():
+            words = words[:-1]
+        args = words[1:]
+    else:
+        args = sys.argv[1:]
+
+    if args and args[0] in subcommands:
+        return args[0]
+
+    return None
+
+
 def get_data_files_dir_path():
     """ Get data files directory path """
     bin_dir = os.environ.get('CC_BIN_DIR')
@@ -158,7 +216,7 @@ def main():
     data_files_dir_path = get_data_files_dir_path()
     os.environ['CC_DATA_FILES_DIR'] = data_files_dir_path
 
-    subcommands = discover_subcommands()
+    subcommands = load_subcommands()
 
     def signal_handler(signum, _):
         """
@@ -206,14 +264,19 @@ output.
             # Try to check if the user has already given us a subcommand to
             # execute. If so, don't load every available parts of CodeChecker
             # to ensure a more optimised run.
-            if len(sys.argv) > 1:
-                first_command = sys.argv[1]
-                if first_command in subcommands:
-
-                    # Consider only the given command as an available one.
-                    subcommands = {first_command: subcommands[first_command]}
+            called_subcommand = get_called_subcommand(subcommands)
+            if called_subcommand:
+                # Consider only the given command as an available one.
+                subcommands = {
+                    called_subcommand: subcommands[called_subcommand]}
+
+            for subcommand, (module_name, help_msg) in subcommands.items():
+                if subcommand != called_subcommand and help_msg is not None:
+                    # Only the help of the subcommand is needed to list the
+                    # available subcommands, so its module isn't imported.
+                    subparsers.add_parser(subcommand, help=help_msg)
+                    continue
 
-            for subcommand, module_name in subcommands.items():
                 try:
                     add_subcommand(subparsers, subcommand, module_name)
                 except (IOError, ImportError):
@@ -0,0 +1,62 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Subcommands of the CodeChecker command line.
+
+This file is generated by scripts/build/generate_subcommand_manifest.py, do
+not modify it by hand.
+"""
+
+# Version of the format of this file.
+MANIFEST_VERSION = 1
+
+# Subcommand name -> (module of the subcommand, help message).
+SUBCOMMANDS = {
+    'analyze': (
+        'codechecker_analyzer.cli.analyze',
+        'Execute the supported code analyzers for the files recorded in a '
+        'JSON Compilation Database.'),
+    'analyzer-version': (
+        'codechecker_analyzer.cli.analyzer_version',
+        'Print the version of CodeChecker analyzer package that is being '
+        'used.'),
+    'analyzers': (
+        'codechecker_analyzer.cli.analyzers',
+        'List supported and available analyzers.'),
+    'check': (
+        'codechecker_analyzer.cli.check',
+        'Perform analysis on a project and print results to standard output.'),
+    'checkers': (
+        'codechecker_analyzer.cli.checkers',
+        'List the checkers available for code analysis.'),
+    'cmd': (
+        'codechecker_client.cli.cmd',
+        'View analysis results on a running server from the command line.'),
+    'fixit': (
+        'codechecker_analyzer.cli.fixit',
+        'Apply automatic fixes based on the suggestions of the analyzers'),
+    'log': (
+        'codechecker_analyzer.cli.log',
+        'Run a build command and collect the executed compilation commands, '
+        'storing them in a JSON file.'),
+    'parse': (
+        'codechecker_analyzer.cli.parse',
+        'Print analysis summary and results in a human-readable format.'),
+    'server': (
+        'codechecker_server.cli.server',
+        'Start and manage the CodeChecker Web server.'),
+    'store': (
+        'codechecker_client.cli.store',
+        'Save analysis results to a database.'),
+    'version': (
+        'codechecker_common.cli_commands.version',
+        'Print the version of CodeChecker package that is being used.'),
+    'web-version': (
+        'codechecker_web.cli.web_version',
+        'Print the version of CodeChecker server package that is being used.'),
+}
@@ -242,6 +242,26 @@ class ReviewStatusHandler:
 
         self.__validate_review_status_yaml_data()
 
+    @property
+    def review_status_config(self) -> Optional[dict]:
+        """
+        Returns the content of the review status config file, or None if no
+        config file is set.
+        """
+        return self.__data
+
+    def has_ignore_rules(self) -> bool:
+        """
+        Returns True if the review status config file has a rule which
+        ignores reports, i.e. should_ignore() may return True for some
+        reports.
+        """
+        if self.__data is None:
+            return False
+
+        return any(rule['actions'].get('ignore')
+                   for rule in self.__data['rules'])
+
     def should_ignore(self, report: Report) -> bool:
         """
         This function returns True if the Report should be ignored based on the
@@ -10,6 +10,7 @@
 import fnmatch
 import re
 import os
+from typing import Optional
 
 from codechecker_common.logger import get_logger
 
@@ -26,11 +27,17 @@ class SkipListHandler:
     -/dir/*
     """
 
+    # The number of paths whose result is remembered by a handler.
+    MAX_CACHED_PATHS = 1 << 16
+
     def __init__(self, skip_file_content=""):
         """
         Process the lines of the skip file.
         """
         self.__skip = []
+        self.__literals = {}
+        self.__globs = []
+        self.__should_skip_cache = {}
         if not skip_file_content:
             skip_file_content = ""
 
@@ -64,6 +71,24 @@ class SkipListHandler:
                 translated_glob = translated_glob[:-2]
             rexpr = re.compile(
                 translated_glob + fr"(?:\{os.path.sep}.*)?$")
+
+            # Most lines of generated skip files are plain paths. These match
+            # the path itself and the paths below it, so they are looked up
+            # by the directories of the checked path. The patterns are only
+            # tried on the paths starting with their literal prefix and
+            # containing their longest literal part.
+            index = len(self.__skip)
+            literals = re.split(r'[*?]', norm_skip_path)
+            if '[' in norm_skip_path:
+                # The characters of a set are not literal parts.
+                literals = [re.split(r'[*?[]', norm_skip_path)[0]]
+
+            if len(literals) == 1 and '[' not in norm_skip_path:
+                self.__literals.setdefault(norm_skip_path, index)
+            else:
+                self.__globs.append((index, literals[0],
+                                     max(literals, key=len), rexpr))
+
             self.__skip.append((skip_line, rexpr))
 
     def __check_line_format(self, skip_lines):
@@ -94,9 +119,41 @@ class SkipListHandler:
         and rebuilds the list from the given skip_lines.
         """
         self.__skip = []
+        self.__literals = {}
+        self.__globs = []
+        self.__should_skip_cache = {}
         valid_lines = self.__check_line_format(skip_lines)
         self.__gen_regex(valid_lines)
 
+    def __first_match(self, source) -> Optional[int]:
+        """
+        Returns the index of the first skip line matching the given source.
+        """
+        if '\n' in source:
+            # The end of line anchor of the expressions makes the trailing
+            # new line optional, the lookup of the plain paths doesn't.
+            for index, (_, rexpr) in enumerate(self.__skip):
+                if rexpr.match(source):
+                    return index
+            return None
+
+        first = self.__literals.get(source)
+        sep_index = source.find(os.path.sep)
+        while sep_index != -1:
+            index = self.__literals.get(source[:sep_index])
+            if index is not None and (first is None or index < first):
+                first = index
+            sep_index = source.find(os.path.sep, sep_index + 1)
+
+        for index, prefix, literal, rexpr in self.__globs:
+            if first is not None and index > first:
+                break
+            if source.startswith(prefix) and literal in source and \
+                    rexpr.match(source):
+                return index
+
+        return first
+
     def should_skip(self, source):
         """
         Check if the given source should be skipped.
@@ -105,11 +162,16 @@ class SkipListHandler:
         if not self.__skip:
             return False
 
-        for line, rexpr in self.__skip:
-            if rexpr.match(source):
-                sign = line[0]
-                return sign == '-'
-        return False
+        skip = self.__should_skip_cache.get(source)
+        if skip is None:
+            index = self.__first_match(source)
+            skip = index is not None and self.__skip[index][0][0] == '-'
+
+            if len(self.__should_skip_cache) >= self.MAX_CACHED_PATHS:
+                self.__should_skip_cache.clear()
+            self.__should_skip_cache[source] = skip
+
+        return skip
 
 
 class SkipListHandlers(list):
@@ -18,7 +18,7 @@ import yaml
 import os
 import pathlib
 import random
-from typing import List, TextIO, Union
+from typing import Iterator, List, TextIO, Union
 
 import portalocker
 
@@ -101,6 +101,76 @@ def load_json(path: Union[str, pathlib.Path],
     return ret
 
 
+def iter_json_array(path: Union[str, pathlib.Path],
+                    chunk_size: int = 1 << 20) -> Iterator:
+    """
+    Yield the items of the JSON array in the given file one by one. The file
+    is read in chunks of the given size, so only the item being decoded is
+    kept in memory instead of the whole array.
+
+    ValueError is raised if the file doesn't contain a valid JSON array.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8', errors='ignore') as handle:
+        buf = ''
+        pos = 0
+        eof = False
+
+        def next_char() -> str:
+            """
+            Skip the whitespaces and return the next character, or an empty
+            string at the end of the file.
+            """
+            nonlocal buf, pos, eof
+            while True:
+                while pos < len(buf) and buf[pos] in ' \t\n\r':
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return buf[pos:pos + 1]
+
+                buf = handle.read(chunk_size)
+                pos = 0
+                eof = not buf
+
+        if next_char() != '[':
+            raise ValueError(f"{path} doesn't contain a JSON array.")
+        pos += 1
+
+        if next_char() == ']':
+            return
+
+        while True:
+            next_char()
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+                # A number at the end of the buffer may continue in the
+                # next chunk.
+                if not eof and (end == len(buf) or buf[end] in '.eE+-'
+                                or buf[end].isdigit()):
+                    raise json.JSONDecodeError("Truncated", buf, end)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+
+                data = handle.read(chunk_size)
+                eof = not data
+                buf = buf[pos:] + data
+                pos = 0
+                continue
+
+            pos = end
+            yield item
+
+            separator = next_char()
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(
+                    f"Invalid JSON array in {path} at item end: "
+                    f"{separator!r}")
+            pos += 1
+
+
 def load_yaml(path: str):
     """
     Load the contents of the given file as a YAML and return it's value.
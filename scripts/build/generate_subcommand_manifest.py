@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Generate the subcommand manifest of the CodeChecker command line.
+
+The top-level parser of CodeChecker lists the subcommands from the manifest
+(codechecker_common/cli_manifest.py), so it doesn't have to import every
+subcommand module. This script imports the subcommand modules and writes
+their names and help messages to the manifest. Run it when a subcommand is
+added, removed or its help message changes.
+
+Usage (from the root of the repository):
+    PYTHONPATH=.:analyzer:web:web/server:web/client:tools/report-converter \\
+        python3 scripts/build/generate_subcommand_manifest.py [--check]
+"""
+
+
+import argparse
+import importlib
+import os
+import sys
+import textwrap
+
+from codechecker_common.cli import MANIFEST_VERSION, discover_subcommands
+
+MANIFEST_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir,
+    'codechecker_common', 'cli_manifest.py')
+
+HEADER = '''# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Subcommands of the CodeChecker command line.
+
+This file is generated by scripts/build/generate_subcommand_manifest.py, do
+not modify it by hand.
+"""
+
+# Version of the format of this file.
+MANIFEST_VERSION = {version}
+
+# Subcommand name -> (module of the subcommand, help message).
+SUBCOMMANDS = {{
+'''
+
+
+def render_string(value, indent):
+    """
+    Returns the given string as a Python literal, split into adjacent string
+    literals which fit into the line length limit.
+    """
+    # Room for the quotes and the closing "),".
+    width = 79 - indent - 4
+    chunks = textwrap.wrap(value, width, break_on_hyphens=False)
+    chunks = [chunk + ' ' for chunk in chunks[:-1]] + chunks[-1:]
+    if ''.join(chunks) != value:
+        chunks = [value]
+
+    return '\n'.join(' ' * indent + repr(chunk) for chunk in chunks)
+
+
+def render_manifest(subcommands):
+    """
+    Returns the content of the manifest file of the given subcommands, which
+    is a dict of subcommand name -> (module name, help message).
+    """
+    content = HEADER.format(version=MANIFEST_VERSION)
+    for subcommand, (module_name, help_msg) in sorted(subcommands.items()):
+        content += f"    {subcommand!r}: (\n" \
+            f"        {module_name!r},\n" \
+            f"{render_string(help_msg, 8)}),\n"
+    content += "}\n"
+
+    return content
+
+
+def collect_subcommands():
+    """
+    Returns the subcommands of the CodeChecker command line with their help
+    messages.
+    """
+    subcommands = {}
+    for subcommand, module_name in discover_subcommands().items():
+        module = importlib.import_module(module_name)
+        help_msg = module.get_argparser_ctor_args().get('help', '')
+        subcommands[subcommand] = (module_name, help_msg)
+
+    return subcommands
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate the subcommand manifest of the CodeChecker "
+                    "command line.")
+    parser.add_argument('--check', action='store_true',
+                        help="Don't write the manifest, only check that it "
+                             "is up to date.")
+    args = parser.parse_args()
+
+    content = render_manifest(collect_subcommands())
+
+    if args.check:
+        with open(MANIFEST_FILE, encoding="utf-8", errors="ignore") as f:
+            if f.read() != content:
+                print(f"{MANIFEST_FILE} is outdated, please regenerate it "
+                      f"by running {__file__}.", file=sys.stderr)
+                return 1
+        return 0
+
+    with open(MANIFEST_FILE, 'w', encoding="utf-8", errors="ignore") as f:
+        f.write(content)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of the startup time of the CodeChecker command line.
+
+The "CodeChecker version" and "CodeChecker cmd runs --help" commands of a
+built CodeChecker package are run several times with Python's import time
+profiling (PYTHONPROFILEIMPORTTIME). The median wall time and the total
+import time of the runs are printed. The benchmark fails if a median exceeds
+the given threshold, or if a command imports a module which is only needed
+by the analysis, the server or the handlers of the commands.
+
+"cmd runs" is run with --help, so its whole argument parser is built, but
+no server is needed.
+
+Usage (from the root of the repository, after "make package"):
+    python3 scripts/test/run_cli_startup_benchmark.py --max-seconds 1.0
+"""
+
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = [
+    ['version'],
+    ['cmd', 'runs', '--help'],
+]
+
+# Top-level modules which must not be imported by the benchmarked commands.
+FORBIDDEN_MODULES = ['alembic', 'lxml', 'multiprocessing', 'sqlalchemy']
+
+
+def run(codechecker, command):
+    """
+    Runs the given CodeChecker command, and returns its wall time, its total
+    import time and the set of the imported top-level modules.
+    """
+    env = os.environ.copy()
+    env['PYTHONPROFILEIMPORTTIME'] = '1'
+
+    start = time.perf_counter()
+    proc = subprocess.run([codechecker] + command, env=env, check=False,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          encoding="utf-8", errors="ignore")
+    duration = time.perf_counter() - start
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"'CodeChecker {' '.join(command)}' failed:\n"
+                           f"{proc.stderr}")
+
+    # The lines of the import time profile look like this, the nested imports
+    # are indented:
+    # import time: self [us] | cumulative | imported package
+    # import time:       123 |        456 |   module.submodule
+    # import time:       789 |       1245 | module
+    import_time = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):
+            import_time += int(cumulative)
+        modules.add(name.strip().split('.')[0])
+
+    return duration, import_time / 1e6, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the startup time of the CodeChecker "
+                    "command line.")
+    parser.add_argument('--package', type=str,
+                        default=os.path.join('build', 'CodeChecker'),
+                        help="Directory of the built CodeChecker package.")
+    parser.add_argument('--runs', type=int, default=5,
+                        help="Number of runs of each command.")
+    parser.add_argument('--max-seconds', type=float, default=1.0,
+                        help="Maximum median wall time of a command.")
+    args = parser.parse_args()
+
+    codechecker = os.path.join(args.package, 'bin', 'CodeChecker')
+
+    failed = False
+    for command in COMMANDS:
+        durations, import_times, modules = [], [], set()
+        for _ in range(args.runs):
+            duration, import_time, run_modules = run(codechecker, command)
+            durations.append(duration)
+            import_times.append(import_time)
+            modules |= run_modules
+
+        median = statistics.median(durations)
+        line = f"CodeChecker {' '.join(command):<16} " \
+            f"wall time: {median:6.3f} s, " \
+            f"import time: {statistics.median(import_times):6.3f} s"
+
+        if median > args.max_seconds:
+            line += f" SLOWER THAN {args.max_seconds} s"
+            failed = True
+
+        forbidden = sorted(modules.intersection(FORBIDDEN_MODULES))
+        if forbidden:
+            line += f" IMPORTS {', '.join(forbidden)}"
+            failed = True
+
+        print(line, flush=True)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
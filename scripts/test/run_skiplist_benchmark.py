@@ -0,0 +1,149 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Micro-benchmark of the skip list matching.
+
+A skip list with the given number of lines and a list of file paths are
+generated, and the time of filtering the paths is measured with the
+SkipListHandler and with the original implementation, which tries the
+regular expression of every skip line one after the other. The results of
+the two implementations are compared as well.
+
+Usage (from the root of the repository):
+    PYTHONPATH=. python3 scripts/test/run_skiplist_benchmark.py
+"""
+
+
+import argparse
+import fnmatch
+import os
+import random
+import re
+import time
+
+from codechecker_common.skiplist_handler import SkipListHandler
+
+
+class OriginalSkipListHandler:
+    """
+    The matching of the original SkipListHandler: one regular expression
+    per skip line, tried in the order of the lines.
+    """
+
+    def __init__(self, skip_file_content):
+        self.__skip = []
+        for line in skip_file_content.splitlines():
+            line = line.strip()
+            if len(line) < 2 or line[0] not in ['-', '+']:
+                continue
+
+            translated_glob = fnmatch.translate(
+                os.path.normpath(line[1:].strip()))
+            if translated_glob.endswith(r"\Z"):
+                translated_glob = translated_glob[:-2]
+            self.__skip.append((line, re.compile(
+                translated_glob + fr"(?:\{os.path.sep}.*)?$")))
+
+    def should_skip(self, source):
+        for line, rexpr in self.__skip:
+            if rexpr.match(source):
+                return line[0] == '-'
+        return False
+
+
+def generate_skip_file(line_count, rnd):
+    """
+    Generate skip lines similar to the generated skip files: mostly exact
+    file paths and directories, some globs and some '+' lines.
+    """
+    lines = []
+    for i in range(line_count):
+        directory = f"/src/module{rnd.randrange(200)}/sub{rnd.randrange(20)}"
+        kind = rnd.random()
+        if kind < 0.6:
+            lines.append(f"-{directory}/file{i}.cpp")
+        elif kind < 0.8:
+            lines.append(f"-{directory}/gen{i}/")
+        elif kind < 0.95:
+            lines.append(f"-*/generated/*{i}*.h")
+        else:
+            lines.append(f"+{directory}/*")
+
+    return '\n'.join(lines)
+
+
+def generate_paths(skip_file_content, path_count, distinct_count, rnd):
+    """
+    Generate file paths, where the distinct paths repeat. Half of the
+    distinct paths are derived from skip lines.
+    """
+    skip_paths = [line[1:].replace('*', 'x')
+                  for line in skip_file_content.splitlines()]
+
+    distinct = []
+    for _ in range(distinct_count):
+        if rnd.random() < 0.5:
+            distinct.append(os.path.join(rnd.choice(skip_paths), "a.cpp"))
+        else:
+            distinct.append(
+                f"/src/module{rnd.randrange(200)}/sub{rnd.randrange(20)}/"
+                f"{rnd.choice(['file', 'gen', 'generated/x'])}"
+                f"{rnd.randrange(10000)}.cpp")
+
+    return [rnd.choice(distinct) for _ in range(path_count)]
+
+
+def measure(handler, paths):
+    start = time.perf_counter()
+    results = [handler.should_skip(path) for path in paths]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmark of the skip list matching.")
+    parser.add_argument('--lines', type=int, default=5000,
+                        help="Number of lines in the skip file.")
+    parser.add_argument('--paths', type=int, default=100000,
+                        help="Number of paths to filter.")
+    parser.add_argument('--distinct-paths', type=int, default=10000,
+                        help="Number of distinct paths among the filtered "
+                             "ones.")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Seed of the random generator.")
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    skip_file_content = generate_skip_file(args.lines, rnd)
+    paths = generate_paths(skip_file_content, args.paths,
+                           args.distinct_paths, rnd)
+
+    start = time.perf_counter()
+    original = OriginalSkipListHandler(skip_file_content)
+    print(f"Original build:  {time.perf_counter() - start:8.3f} s")
+
+    start = time.perf_counter()
+    compiled = SkipListHandler(skip_file_content)
+    print(f"Compiled build:  {time.perf_counter() - start:8.3f} s")
+
+    original_results, original_time = measure(original, paths)
+    print(f"Original filter: {original_time:8.3f} s")
+
+    compiled_results, compiled_time = measure(compiled, paths)
+    print(f"Compiled filter: {compiled_time:8.3f} s")
+
+    mismatches = sum(a != b for a, b in
+                     zip(original_results, compiled_results))
+    print(f"Skipped {sum(compiled_results)} of {len(paths)} paths, "
+          f"{mismatches} mismatches.")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -16,7 +16,7 @@ import os
 
 from typing import Callable, Dict, List, Optional, Protocol, Set, Tuple
 
-from .. import util
+from .. import source_lines, util
 
 
 LOG = logging.getLogger('report-converter')
@@ -45,6 +45,7 @@ class File:
         self.__path = file_path
         self.__original_path = file_path
         self.__content = content
+        self.__lines: Optional[List[str]] = None
         self.__name: Optional[str] = None
 
     @property
@@ -78,9 +79,8 @@ class File:
     def content(self) -> str:
         """ Get file content. """
         if self.__content is None:
-            with open(self.original_path, 'r',
-                      encoding='utf-8', errors='replace') as f:
-                self.__content = f.read()
+            self.__content = source_lines.get_source_lines(
+                self.original_path).get_content(errors='replace')
 
         return self.__content
 
@@ -98,7 +98,10 @@ class File:
         if self.__content is None:
             return util.get_line(self.original_path, line)
 
-        return self.__content.splitlines(keepends=True)[line - 1]
+        if self.__lines is None:
+            self.__lines = self.__content.splitlines(keepends=True)
+
+        return self.__lines[line - 1]
 
     def trim(self, path_prefixes: Optional[List[str]] = None) -> str:
         """ Removes the longest matching leading path from the file paths. """
@@ -7,9 +7,10 @@
 # -------------------------------------------------------------------------
 """Codeclimate output helpers."""
 
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List
 
 from codechecker_report_converter.report import Report
+from codechecker_report_converter.util import iter_json_list
 
 
 def convert(reports: List[Report]) -> List[Dict]:
@@ -28,6 +29,14 @@ def convert(reports: List[Report]) -> List[Dict]:
     return codeclimate_reports
 
 
+def convert_stream(reports: Iterable[Report]) -> Iterator[str]:
+    """
+    Convert the given reports to codeclimate format piece by piece. The
+    pieces make up the JSON encoded output of the 'convert' function.
+    """
+    return iter_json_list(__to_codeclimate(report) for report in reports)
+
+
 __codeclimate_severity_map = {
     'CRITICAL': 'critical',
     'HIGH': 'major',
@@ -12,7 +12,7 @@ import logging
 import os
 import re
 
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Union
 
 from codechecker_report_converter.report import Report
 
@@ -20,7 +20,7 @@ from codechecker_report_converter.report import Report
 LOG = logging.getLogger('report-converter')
 
 
-def convert(reports: List[Report]) -> Dict:
+def convert(reports: Iterable[Report]) -> Dict:
     """Convert reports to gerrit review format.
 
     Process the required environment variables and convert the reports
@@ -58,7 +58,7 @@ def mandatory_env_var_is_set():
     return no_missing_env_var
 
 
-def __convert_reports(reports: List[Report],
+def __convert_reports(reports: Iterable[Report],
                       repo_dir: Union[str, None],
                       report_url: Union[str, None],
                       changed_files: List[str],
@@ -7,17 +7,31 @@
 # -------------------------------------------------------------------------
 """ JSON output helpers. """
 
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List
 
 from codechecker_report_converter.report import Report
+from codechecker_report_converter.util import iter_json_list
+
+
+VERSION = 1
 
 
 def convert(reports: List[Report]) -> Dict:
     """ Convert the given reports to JSON format. """
-    version = 1
+    version = VERSION
 
     json_reports = []
     for report in reports:
         json_reports.append(report.to_json())
 
     return {"version": version, "reports": json_reports}
+
+
+def convert_stream(reports: Iterable[Report]) -> Iterator[str]:
+    """
+    Convert the given reports to JSON format piece by piece. The pieces
+    make up the JSON encoded output of the 'convert' function.
+    """
+    yield f'{{"version": {VERSION}, "reports": '
+    yield from iter_json_list(report.to_json() for report in reports)
+    yield '}'
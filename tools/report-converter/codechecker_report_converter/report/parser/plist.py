@@ -9,10 +9,12 @@
 Parse the plist output of an analyzer
 """
 
+import html
 import importlib
 import logging
 import os
 import plistlib
+import re
 import traceback
 import sys
 
@@ -27,6 +29,7 @@ from codechecker_report_converter.report import \
     File, \
     MacroExpansion, \
     Range, Report, \
+    SkipListHandlers, \
     UnknownChecker, \
     get_or_create_file
 from codechecker_report_converter.report.hash import get_report_hash, HashType
@@ -45,6 +48,10 @@ EXTENSION = 'plist'
 
 PlistItem = Any
 
+FILES_PATTERN = re.compile(
+    rb'<key>files</key>\s*<array>(?P<files>.*?)</array>', re.DOTALL)
+STRING_PATTERN = re.compile(rb'<string>(.*?)</string>', re.DOTALL)
+
 
 class _LXMLPlistEventHandler:
     """
@@ -187,6 +194,139 @@ def get_file_index_map(
     return file_index_map
 
 
+def __get_metadata(analyzer_info: Optional[AnalyzerInfo]) -> Dict:
+    """ Get the metadata which is written by Parser.convert(). """
+    tool_name, tool_version = get_tool_info()
+
+    metadata: Dict[str, Any] = {
+        'generated_by': {'name': tool_name, 'version': tool_version}}
+
+    if analyzer_info:
+        metadata['analyzer'] = {'name': analyzer_info.name}
+
+    return metadata
+
+
+def __get_file_paths(content: bytes) -> Optional[List[str]]:
+    """
+    Get the file paths from the files array of the given plist content
+    without parsing the whole file. None returns if the files array is not
+    found.
+    """
+    # The files array comes after the diagnostics in the plist files of
+    # Clang, so it is searched from the end.
+    idx = content.rfind(b'<key>files</key>')
+    if idx == -1:
+        return None
+
+    m = FILES_PATTERN.match(content, idx)
+    if not m:
+        return None
+
+    return [html.unescape(path.decode('utf-8', errors='replace'))
+            for path in STRING_PATTERN.findall(m.group('files'))]
+
+
+def __add_metadata(content: bytes, metadata: Dict) -> Optional[bytes]:
+    """
+    Insert the given metadata to the end of the root dict of the given plist
+    content. None returns if the content doesn't end with the root dict.
+    """
+    if b'<key>metadata</key>' in content or \
+            not content.rstrip().endswith(b'</plist>'):
+        return None
+
+    root_end = content.rfind(b'</dict>')
+    if root_end == -1:
+        return None
+
+    # The key and the value of the metadata without the enclosing dict.
+    metadata_xml = plistlib.dumps({'metadata': metadata})
+    metadata_xml = metadata_xml[metadata_xml.find(b'<dict>') + 6:
+                                metadata_xml.rfind(b'</dict>')]
+
+    return content[:root_end] + metadata_xml.lstrip(b'\n') + \
+        content[root_end:]
+
+
+def filter_analyzer_result(
+    analyzer_result_file_path: str,
+    source_dir_path: str,
+    skip_handlers: Optional[SkipListHandlers] = None,
+    analyzer_info: Optional[AnalyzerInfo] = None
+) -> bool:
+    """
+    Prepare the given plist file of an analyzer for parsing and storage. The
+    result is the same as reading the reports from the file and writing the
+    not skipped ones back by Parser.convert(), but without creating Report
+    objects:
+    - diagnostics in skipped files are removed,
+    - relative file paths are resolved against the source_dir_path,
+    - the metadata of CodeChecker and the analyzer is added.
+
+    Skipping is decided per file, so if no file of the plist is skipped and
+    every file path is absolute, the metadata is inserted into the file
+    without parsing it. Otherwise the diagnostics are filtered without
+    creating Report objects.
+
+    False returns if the file couldn't be processed, e.g. it is not a valid
+    plist file.
+    """
+    try:
+        with open(analyzer_result_file_path, 'rb') as f:
+            content = f.read()
+    except OSError as err:
+        LOG.warning("Failed to read plist file %s: %s",
+                    analyzer_result_file_path, err)
+        return False
+
+    metadata = __get_metadata(analyzer_info)
+
+    orig_file_paths = __get_file_paths(content)
+    if orig_file_paths is not None:
+        file_paths = [os.path.normpath(os.path.join(source_dir_path, path))
+                      for path in orig_file_paths]
+        if file_paths == orig_file_paths and not (
+                skip_handlers and
+                any(map(skip_handlers.should_skip, file_paths))):
+            new_content = __add_metadata(content, metadata)
+            if new_content is not None:
+                with open(analyzer_result_file_path, 'wb') as f:
+                    f.write(new_content)
+                return True
+
+    try:
+        plist = plistlib.loads(content)
+    except (ExpatError, TypeError, AttributeError, ValueError,
+            plistlib.InvalidFileException) as err:
+        LOG.debug("Failed to parse plist file %s: %s",
+                  analyzer_result_file_path, err)
+        return False
+
+    if not isinstance(plist, dict):
+        return False
+
+    file_paths = [os.path.normpath(os.path.join(source_dir_path, path))
+                  for path in plist.get('files', [])]
+    skipped_files = {idx for idx, path in enumerate(file_paths)
+                     if skip_handlers and skip_handlers.should_skip(path)}
+
+    try:
+        plist['diagnostics'] = [
+            diag for diag in plist.get('diagnostics', [])
+            if diag['location']['file'] not in skipped_files]
+    except (KeyError, TypeError):
+        return False
+
+    plist['files'] = file_paths
+    plist['metadata'] = metadata
+
+    with open(analyzer_result_file_path, 'wb') as f:
+        plistlib.dump(plist, f)
+
+    return True
+
+
 class Parser(BaseParser):
     def get_reports(
         self,
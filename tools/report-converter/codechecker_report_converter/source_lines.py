@@ -0,0 +1,185 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Cache of the source files referenced by the reports.
+
+Thousands of reports may point into the same files, and hashing or printing
+them needs a few lines of these files each. The content of a file is read
+and decoded once and indexed by the offsets of its lines, so looking up a
+line does not scan the file again.
+"""
+
+from array import array
+from collections import OrderedDict
+import os
+import re
+import threading
+
+from typing import Dict, Optional, Tuple
+
+
+# Line endings of the universal newlines mode of text files.
+_NEWLINE_RE = re.compile(r'\r\n|\r|\n')
+
+
+class _DecodedContent:
+    """ Decoded content of a file indexed by the offsets of its lines. """
+
+    def __init__(self, text: str):
+        self.text = text
+
+        # Start offsets of the lines, the last one is the end of the text.
+        self.offsets = array('q', [0])
+        self.offsets.extend(m.end() for m in _NEWLINE_RE.finditer(text))
+        if self.offsets[-1] != len(text):
+            self.offsets.append(len(text))
+
+    @property
+    def size(self) -> int:
+        return len(self.text) + self.offsets.itemsize * len(self.offsets)
+
+
+class SourceLines:
+    """
+    The content of a source file, which is decoded as UTF-8 and indexed by
+    the offsets of its lines when it is first needed with an error handler.
+    """
+
+    def __init__(self, data: bytes):
+        self.__data: Optional[bytes] = data
+        self.__decoded: Dict[str, _DecodedContent] = {}
+
+        try:
+            # Valid files are decoded to the same text with every error
+            # handler, so the raw content is not needed anymore.
+            self.__valid: Optional[_DecodedContent] = \
+                _DecodedContent(data.decode('utf-8'))
+            self.__data = None
+        except UnicodeDecodeError:
+            self.__valid = None
+
+    def __get_decoded(self, errors: str) -> _DecodedContent:
+        if self.__valid:
+            return self.__valid
+
+        # The content is decoded before the line endings are recognized,
+        # like in the text mode of files, because an invalid byte between
+        # '\r' and '\n' could be ignored.
+        decoded = self.__decoded.get(errors)
+        if decoded is None:
+            decoded = _DecodedContent(self.__data.decode('utf-8', errors))
+            self.__decoded[errors] = decoded
+
+        return decoded
+
+    @property
+    def size(self) -> int:
+        """ Approximate memory used by the content and its indices. """
+        size = len(self.__data) if self.__data is not None else 0
+        if self.__valid:
+            size += self.__valid.size
+        return size + sum(d.size for d in self.__decoded.values())
+
+    def get_line(self, line_no: int, errors: str = 'ignore') -> str:
+        """
+        Return the given line as a file opened in text mode with UTF-8
+        encoding would read it: every line ending is translated to '\\n'.
+        If the line does not exist an empty string is returned.
+        """
+        decoded = self.__get_decoded(errors)
+        if line_no < 1 or line_no >= len(decoded.offsets):
+            return ''
+
+        line = decoded.text[decoded.offsets[line_no - 1]:
+                            decoded.offsets[line_no]]
+        if line.endswith('\r\n'):
+            line = line[:-2] + '\n'
+        elif line.endswith('\r'):
+            line = line[:-1] + '\n'
+
+        return line
+
+    def get_content(self, errors: str = 'replace') -> str:
+        """
+        Return the whole content as a file opened in text mode with UTF-8
+        encoding would read it.
+        """
+        return self.__get_decoded(errors).text \
+            .replace('\r\n', '\n').replace('\r', '\n')
+
+
+class SourceLinesCache:
+    """
+    Least recently used cache of indexed source files. An entry is valid as
+    long as the modification time and the size of the file is unchanged.
+    """
+
+    def __init__(self, max_files: int = 256, max_size: int = 128 * 1024 ** 2):
+        self.__max_files = max_files
+        self.__max_size = max_size
+        self.__size = 0
+        # File path -> ((mtime, size), indexed content, accounted size)
+        self.__entries: OrderedDict[
+            str, Tuple[Tuple[int, int], SourceLines, int]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, file_path: str) -> SourceLines:
+        """
+        Return the indexed content of the given file. OSError is raised if
+        the file can not be read.
+        """
+        stat = os.stat(file_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self.__lock:
+            entry = self.__entries.get(file_path)
+            if entry and entry[0] == version:
+                self.__entries.move_to_end(file_path)
+                return entry[1]
+
+        with open(file_path, 'rb') as f:
+            source_lines = SourceLines(f.read())
+
+        with self.__lock:
+            old_entry = self.__entries.pop(file_path, None)
+            if old_entry:
+                self.__size -= old_entry[2]
+
+            size = source_lines.size
+            self.__entries[file_path] = (version, source_lines, size)
+            self.__size += size
+
+            while len(self.__entries) > 1 and (
+                    len(self.__entries) > self.__max_files or
+                    self.__size > self.__max_size):
+                _, (_, _, evicted_size) = self.__entries.popitem(last=False)
+                self.__size -= evicted_size
+
+        return source_lines
+
+    def clear(self):
+        """ Remove every file from the cache. """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+
+_CACHE = SourceLinesCache()
+
+
+def get_source_lines(file_path: str) -> SourceLines:
+    """
+    Return the indexed content of the given file from the cache shared by
+    the whole process. OSError is raised if the file can not be read.
+    """
+    return _CACHE.get(file_path)
+
+
+def clear_cache():
+    """ Remove every file from the shared cache. """
+    _CACHE.clear()
@@ -13,7 +13,9 @@ import sys
 import fnmatch
 import re
 
-from typing import Dict, List, Optional, TextIO
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from .source_lines import get_source_lines
 
 
 LOG = logging.getLogger('report-converter')
@@ -53,10 +55,11 @@ def get_line(file_path: str, line_no: int, errors: str = 'ignore') -> str:
     which depends on the platform.
 
     Changing the encoding error handling can influence the hash content!
+
+    The files are read and indexed only once, see the source_lines module.
     """
     try:
-        with open(file_path, mode='r', encoding='utf-8', errors=errors) as f:
-            return get_linef(f, line_no)
+        return get_source_lines(file_path).get_line(line_no, errors)
     except IOError:
         LOG.error("Failed to open file %s", file_path)
         return ''
@@ -120,3 +123,36 @@ def dump_json_output(
         out.write(f"{data_str}\n")
 
     return data_str
+
+
+def iter_json_list(items: Iterable[Any]) -> Iterator[str]:
+    """
+    Encode the given items as a JSON list piece by piece. The concatenated
+    pieces are the same as the output of json.dumps on a list of the items.
+    """
+    yield '['
+    for idx, item in enumerate(items):
+        if idx:
+            yield ', '
+        yield json.dumps(item)
+    yield ']'
+
+
+def dump_json_stream(
+    data_pieces: Iterable[str],
+    output_file_path: Optional[str] = None,
+    out=sys.stdout
+):
+    """
+    Write the pieces of a JSON document to the given output file while they
+    are produced, so the whole document is never kept in memory.
+    """
+    if output_file_path:
+        with open(output_file_path, mode='w',
+                  encoding='utf-8', errors="ignore") as f:
+            f.writelines(data_pieces)
+
+        LOG.info('JSON report file was created: %s', output_file_path)
+    elif out:
+        out.writelines(data_pieces)
+        out.write("\n")
@@ -0,0 +1,63 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Tests for writing JSON outputs while the reports are produced. """
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from codechecker_report_converter.report import File, Report
+from codechecker_report_converter.report.output import codeclimate, \
+    json as report_to_json
+from codechecker_report_converter.util import dump_json_stream, \
+    iter_json_list
+
+
+class TestJsonStream(unittest.TestCase):
+    def setUp(self):
+        self.reports = [
+            Report(File('/src/main.cpp'), line, 3, f'description {line}',
+                   'my_checker', report_hash=f'hash_{line}', severity='LOW')
+            for line in range(1, 4)]
+
+    def test_json_list(self):
+        """ The pieces make up the same list as json.dumps. """
+        for items in [[], [1], [{"a": [1, 2]}, "b", None]]:
+            self.assertEqual(''.join(iter_json_list(iter(items))),
+                             json.dumps(items))
+
+    def test_convert_stream(self):
+        """ The streamed outputs are the same as the converted ones. """
+        for reports in [[], self.reports]:
+            self.assertEqual(
+                ''.join(report_to_json.convert_stream(iter(reports))),
+                json.dumps(report_to_json.convert(reports)))
+
+            self.assertEqual(
+                ''.join(codeclimate.convert_stream(iter(reports))),
+                json.dumps(codeclimate.convert(reports)))
+
+    def test_dump_json_stream(self):
+        """ The pieces are written to the output file or stream. """
+        out = io.StringIO()
+        dump_json_stream(report_to_json.convert_stream(self.reports),
+                         out=out)
+        self.assertEqual(json.loads(out.getvalue()),
+                         report_to_json.convert(self.reports))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file_path = os.path.join(tmp_dir, 'reports.json')
+            dump_json_stream(codeclimate.convert_stream(self.reports),
+                             output_file_path)
+
+            with open(output_file_path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f),
+                                 codeclimate.convert(self.reports))
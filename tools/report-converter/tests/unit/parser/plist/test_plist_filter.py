@@ -0,0 +1,146 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test that filtering a plist file gives the same reports as reading and
+writing back the reports of the file.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_report_converter.report import report_file
+from codechecker_report_converter.report.parser import plist
+from codechecker_report_converter.report.parser.base import AnalyzerInfo
+
+
+PLIST_TEST_FILES = os.path.join(os.path.dirname(__file__), 'plist_test_files')
+
+
+class SkipListHandlers:
+    def __init__(self, skipped_file_name):
+        self.__skipped_file_name = skipped_file_name
+
+    def should_skip(self, file_path):
+        return os.path.basename(file_path) == self.__skipped_file_name
+
+
+class PlistFilterTestCase(unittest.TestCase):
+    """ Test the filtering of plist files without creating reports. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.analyzer_info = AnalyzerInfo(name='clangsa')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __copy(self, plist_file_name, name, absolute_paths=False):
+        """
+        Copy the given test file, optionally with absolute file paths like
+        in the plist files written during the analysis.
+        """
+        path = os.path.join(self.tmp_dir, name)
+        with open(os.path.join(PLIST_TEST_FILES, plist_file_name),
+                  encoding='utf-8') as f:
+            content = f.read()
+
+        if absolute_paths:
+            for file_name in ['./gen_plist/test.h', 'gen_plist/test.cpp']:
+                content = content.replace(
+                    f'<string>{file_name}</string>',
+                    '<string>' + os.path.normpath(
+                        os.path.join(PLIST_TEST_FILES, file_name)) +
+                    '</string>')
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        return path
+
+    def __reports(self, plist_file):
+        reports = report_file.get_reports(plist_file)
+        self.assertTrue(reports)
+
+        result = []
+        for report in reports:
+            report_json = report.to_json()
+            del report_json['analyzer_result_file_path']
+            result.append(report_json)
+
+        return result
+
+    def __round_trip(self, plist_file, skip_handlers=None):
+        """ Filter the file by creating reports. """
+        reports = report_file.get_reports(
+            plist_file, source_dir_path=PLIST_TEST_FILES)
+        reports = [r for r in reports if not r.skip(skip_handlers)]
+        report_file.create(plist_file, reports, None, self.analyzer_info)
+
+    def __check_same_reports(self, plist_file_name, skip_handlers=None,
+                             absolute_paths=False):
+        expected = self.__copy(plist_file_name, 'expected.plist',
+                               absolute_paths)
+        self.__round_trip(expected, skip_handlers)
+
+        filtered = self.__copy(plist_file_name, 'filtered.plist',
+                               absolute_paths)
+        self.assertTrue(plist.filter_analyzer_result(
+            filtered, PLIST_TEST_FILES, skip_handlers, self.analyzer_info))
+
+        self.assertEqual(self.__reports(filtered), self.__reports(expected))
+        return filtered
+
+    def test_relative_paths(self):
+        """ Relative file paths are resolved. """
+        for plist_file_name in ['clang-3.8-trunk.plist', 'clang-4.0.plist',
+                                'clang-5.0-trunk.plist']:
+            self.__check_same_reports(plist_file_name)
+
+    def test_skipped_file(self):
+        """ Reports in skipped files are removed. """
+        filtered = self.__check_same_reports(
+            'clang-5.0-trunk.plist', SkipListHandlers('test.h'),
+            absolute_paths=True)
+
+        self.assertTrue(all(report['file']['original_path'].endswith(
+            'test.cpp') for report in self.__reports(filtered)))
+
+    def test_metadata_only(self):
+        """
+        If nothing is filtered, only the metadata is added to the file.
+        """
+        original = self.__copy('clang-5.0-trunk.plist', 'original.plist',
+                               absolute_paths=True)
+        with open(original, 'rb') as f:
+            original_content = f.read()
+
+        filtered = self.__check_same_reports(
+            'clang-5.0-trunk.plist', SkipListHandlers('other.cpp'),
+            absolute_paths=True)
+        with open(filtered, 'rb') as f:
+            filtered_content = f.read()
+
+        metadata_start = filtered_content.find(b'\t<key>metadata</key>')
+        self.assertNotEqual(metadata_start, -1)
+        self.assertEqual(filtered_content[:metadata_start],
+                         original_content[:metadata_start])
+        self.assertTrue(filtered_content.endswith(
+            original_content[metadata_start:]))
+
+    def test_invalid_file(self):
+        """ Invalid files are not processed. """
+        invalid = os.path.join(self.tmp_dir, 'invalid.plist')
+        with open(invalid, 'w', encoding='utf-8') as f:
+            f.write('not a plist')
+
+        self.assertFalse(plist.filter_analyzer_result(
+            invalid, PLIST_TEST_FILES, None, self.analyzer_info))
@@ -11,8 +11,11 @@ File reading tests.
 
 
 import os
+import tempfile
 import unittest
 
+from codechecker_report_converter.source_lines import SourceLines, \
+    SourceLinesCache
 from codechecker_report_converter.util import get_line
 
 
@@ -43,3 +46,62 @@ class GetLineTest(unittest.TestCase):
 
         line6 = get_line(file_to_process, 6)
         self.assertEqual(line6, 'line6\n')
+
+    def test_util_getline_changed_file(self):
+        """
+        Lines are read again from a file which has changed since it was
+        last read.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'changed')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write('line1\nline2\n')
+
+            self.assertEqual(get_line(file_path, 2), 'line2\n')
+            self.assertEqual(get_line(file_path, 3), '')
+
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write('line1\nnew line2\nline3')
+            os.utime(file_path, ns=(0, 0))
+
+            self.assertEqual(get_line(file_path, 2), 'new line2\n')
+            self.assertEqual(get_line(file_path, 3), 'line3')
+
+        self.assertEqual(get_line(file_path, 1), '')
+
+    def test_source_lines_invalid_utf8(self):
+        """
+        Invalid bytes are handled before the line endings are recognized,
+        like in files opened in text mode.
+        """
+        source_lines = SourceLines(b'a\r\xff\nb\xe2\x82\r\nc')
+
+        self.assertEqual(source_lines.get_line(1, 'ignore'), 'a\n')
+        self.assertEqual(source_lines.get_line(2, 'ignore'), 'b\n')
+        self.assertEqual(source_lines.get_line(3, 'ignore'), 'c')
+
+        self.assertEqual(source_lines.get_line(1, 'replace'), 'a\n')
+        self.assertEqual(source_lines.get_line(2, 'replace'), '\ufffd\n')
+        self.assertEqual(source_lines.get_content('replace'),
+                         'a\n\ufffd\nb\ufffd\nc')
+
+    def test_source_lines_cache_eviction(self):
+        """ The least recently used files are evicted from the cache. """
+        cache = SourceLinesCache(max_files=2)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i in range(3):
+                paths.append(os.path.join(tmp_dir, str(i)))
+                with open(paths[-1], 'w', encoding='utf-8') as f:
+                    f.write(f'{i}\n')
+
+            first = cache.get(paths[0])
+            self.assertIs(cache.get(paths[0]), first)
+
+            second = cache.get(paths[1])
+            cache.get(paths[0])
+            cache.get(paths[2])
+
+            # The first file was used more recently than the second one.
+            self.assertIs(cache.get(paths[0]), first)
+            self.assertIsNot(cache.get(paths[1]), second)
@@ -571,6 +571,34 @@ struct Rule {
 }
 typedef map<string, list<Rule>> GuidelineRules
 
+struct StoreUploadStatus {
+  1: string uploadId,     // Identifier of the upload in the later calls.
+  2: i64    receivedSize, // Number of bytes the server has already received.
+                          // The client must continue the upload from here.
+  3: i64    chunkSize,    // Maximum size of a chunk accepted by the server.
+}
+
+// A page of the results returned by getRunResultsPage().
+struct RunResultsPage {
+  1: ReportDataList reports,    // The results on this page.
+  2: string         nextCursor, // Cursor to query the next page with. It is
+                                // not set if this is the last page.
+}
+
+// A page of the runs returned by getRunDataPage().
+struct RunDataPage {
+  1: RunDataList runs,       // The runs on this page.
+  2: string      nextCursor, // Cursor to query the next page with. It is not
+                             // set if this is the last page.
+}
+
+// A page of the run history returned by getRunHistoryPage().
+struct RunHistoryDataPage {
+  1: RunHistoryDataList runHistory, // The run history on this page.
+  2: string             nextCursor, // Cursor to query the next page with. It
+                                    // is not set if this is the last page.
+}
+
 service codeCheckerDBAccess {
 
   // Gives back all analyzed runs.
@@ -581,6 +609,18 @@ service codeCheckerDBAccess {
                          4: optional RunSortMode sortMode)
                          throws (1: codechecker_api_shared.RequestFailed requestError),
 
+  // Gives back the runs page by page. The first page is returned when no
+  // cursor is given, the next ones by passing the "nextCursor" of the
+  // previous page. Unlike the offset of getRunData(), the cursor points
+  // directly after the last run of the previous page, so querying a page
+  // doesn't get slower for the later pages.
+  // PERMISSION: PRODUCT_VIEW
+  RunDataPage getRunDataPage(1: RunFilter runFilter,
+                             2: i64 limit,
+                             3: optional string cursor,
+                             4: optional RunSortMode sortMode)
+                             throws (1: codechecker_api_shared.RequestFailed requestError),
+
   // Returns the number of available runs based on the run filter parameter.
   // PERMISSION: PRODUCT_VIEW
   i64 getRunCount(1: RunFilter runFilter)
@@ -610,6 +650,15 @@ service codeCheckerDBAccess {
                                    4: RunHistoryFilter runHistoryFilter)
                                    throws (1: codechecker_api_shared.RequestFailed requestError),
 
+  // Get run history for runs page by page. See getRunDataPage() for the
+  // usage of the cursor.
+  // PERMISSION: PRODUCT_VIEW
+  RunHistoryDataPage getRunHistoryPage(1: list<i64> runIds,
+                                       2: i64       limit,
+                                       3: optional string cursor,
+                                       4: RunHistoryFilter runHistoryFilter)
+                                       throws (1: codechecker_api_shared.RequestFailed requestError),
+
   // Get the number of run history for runs.
   // PERMISSION: PRODUCT_VIEW
   i64 getRunHistoryCount(1: list<i64> runIds,
@@ -644,6 +693,19 @@ service codeCheckerDBAccess {
                                7: optional bool  getDetails)
                                throws (1: codechecker_api_shared.RequestFailed requestError),
 
+  // Get the results like getRunResults() does, page by page. See
+  // getRunDataPage() for the usage of the cursor. A cursor can only be used
+  // with the same sorting and filters as the page it was returned with.
+  // PERMISSION: PRODUCT_VIEW
+  RunResultsPage getRunResultsPage(1: list<i64>      runIds,
+                                   2: i64            limit,
+                                   3: optional string cursor,
+                                   4: list<SortMode> sortType,
+                                   5: ReportFilter   reportFilter,
+                                   6: CompareData    cmpData,
+                                   7: optional bool  getDetails)
+                                   throws (1: codechecker_api_shared.RequestFailed requestError),
+
   // Get report annotation values belonging to the given key.
   // The "key" parameter is optional. If not given then the list of keys returns.
   // PERMISSION: PRODUCT_VIEW
@@ -1051,6 +1113,47 @@ service codeCheckerDBAccess {
       2: SubmittedRunOptions storeOpts)
       throws (1: codechecker_api_shared.RequestFailed requestError),
 
+  // Start or resume the chunked upload of a ZIP file which has the same
+  // structure as the one sent to massStoreRunAsynchronous(), but it is not
+  // compressed by ZLib and not Base64-encoded. Large ZIP files should be sent
+  // this way, because neither the client nor the server has to keep the whole
+  // file in memory.
+  //
+  // The upload is identified by the SHA-256 checksum and the size of the ZIP
+  // file. If an upload of the same file by the same user was interrupted, the
+  // returned status contains the number of bytes the server has already
+  // received, and the client should continue the upload from this offset.
+  //
+  // PERMISSION: PRODUCT_STORE
+  StoreUploadStatus beginStoreUpload(1: string zipfileSha256,
+                                     2: i64    zipfileSize)
+                                     throws (1: codechecker_api_shared.RequestFailed requestError),
+
+  // Append a chunk to an upload started by beginStoreUpload(). The "offset"
+  // must be the number of bytes received by the server so far, and the chunk
+  // must not be longer than the "chunkSize" of the upload status. The chunk is
+  // accepted only if its SHA-256 checksum matches "chunkSha256". Sending an
+  // already received chunk again is not an error.
+  //
+  // Returns the number of bytes received by the server after this call.
+  //
+  // PERMISSION: PRODUCT_STORE
+  i64 uploadStoreChunk(1: string uploadId,
+                       2: i64    offset,
+                       3: binary chunk,
+                       4: string chunkSha256)
+                       throws (1: codechecker_api_shared.RequestFailed requestError),
+
+  // Store the analysis run from a ZIP file which was completely uploaded by
+  // uploadStoreChunk(). Apart from the source of the ZIP file, this function
+  // behaves the same way as massStoreRunAsynchronous().
+  //
+  // PERMISSION: PRODUCT_STORE
+  codechecker_api_shared.TaskToken massStoreRunFromUpload(
+      1: string              uploadId,
+      2: SubmittedRunOptions storeOpts)
+      throws (1: codechecker_api_shared.RequestFailed requestError),
+
   // Returns true if analysis statistics information can be sent to the server,
   // otherwise it returns false.
   // PERMISSION: PRODUCT_STORE
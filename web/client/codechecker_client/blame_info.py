@@ -1,10 +1,15 @@
+import hashlib
+import itertools
 import json
 import os
+import tempfile
 import zipfile
+from collections import defaultdict
 
 from git import Repo
-from git.exc import InvalidGitRepositoryError, GitCommandError
-from typing import Dict, Iterable, Optional
+from git.exc import InvalidGitRepositoryError, GitCommandError, \
+    NoSuchPathError
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from codechecker_common.compatibility.multiprocessing import Pool
 from codechecker_common.logger import get_logger
@@ -13,6 +18,92 @@ LOG = get_logger('system')
 
 
 FileBlameInfo = Dict[str, Optional[Dict]]
+CommitInfo = Dict[str, Dict]
+
+# The blame files of this version don't contain the commits, these are
+# stored once for all files in the COMMITS_FILE of the zip.
+BLAME_INFO_VERSION = 'v2'
+COMMITS_FILE = 'blame_commits.json'
+
+# Increase it when the format of the cached blame information changes, so
+# the earlier entries are not used anymore.
+CACHE_VERSION = 1
+
+# The last commits of the files of a repository are looked up in batches of
+# this many files by a worker process.
+LAST_COMMIT_BATCH_SIZE = 64
+
+# Repository handles and commit information of a worker process by the
+# working tree directory and the commit hash.
+REPOS: Dict[str, Repo] = {}
+COMMITS: CommitInfo = {}
+
+
+def get_default_cache_dir() -> Optional[str]:
+    """
+    Returns the directory of the blame information cache. It can be set by
+    the CC_BLAME_CACHE_DIR environment variable, and the cache is disabled
+    if this variable is set to an empty value.
+    """
+    cache_dir = os.environ.get('CC_BLAME_CACHE_DIR')
+    if cache_dir is not None:
+        return cache_dir or None
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(cache_home, 'codechecker', 'blame')
+
+
+class BlameCache:
+    """
+    Blame information stored in JSON files of a directory, one file per
+    version of a source file. A version is identified by the last commit
+    which modified the file: the blame of the file is determined by its
+    history up to this commit, so the entries never expire.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def __get_file_path(self, key: list) -> str:
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest + '.json')
+
+    def get(self, key: list) -> Optional[dict]:
+        """ Returns the blame information of the given key if cached. """
+        try:
+            with open(self.__get_file_path(key), encoding="utf-8",
+                      errors="ignore") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+
+        return entry.get('blame_info')
+
+    def put(self, key: list, blame_info: dict):
+        """
+        Stores the blame information of the given key. The file is replaced
+        atomically, so other processes never read a partially written entry.
+        """
+        file_path = self.__get_file_path(key)
+        tmp_file_path = None
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    'w', dir=os.path.dirname(file_path), suffix='.tmp',
+                    delete=False, encoding="utf-8") as f:
+                tmp_file_path = f.name
+                json.dump({'key': key, 'blame_info': blame_info}, f)
+
+            os.replace(tmp_file_path, file_path)
+        except OSError as err:
+            LOG.debug("Failed to write blame cache %s: %s", file_path, err)
+            if tmp_file_path and os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
 
 
 def __get_tracking_branch(repo: Repo) -> Optional[str]:
@@ -36,51 +127,136 @@ def __get_tracking_branch(repo: Repo) -> Optional[str]:
     return None
 
 
-def __get_blame_info(file_path: str):
-    """ Get blame info for the given file. """
-    try:
-        real_path = os.path.realpath(file_path)
-        repo = Repo(real_path, search_parent_directories=True)
-        if repo.ignored(real_path):
-            LOG.debug("File %s is an ignored file", file_path)
-            return None
-    except InvalidGitRepositoryError:
-        return None
-    except GitCommandError as ex:
-        LOG.debug("Failed to get blame information for %s: %s", file_path, ex)
-        return None
-
-    tracking_branch = __get_tracking_branch(repo)
-
-    remote_url = None
+def __get_remote_url(repo: Repo) -> Optional[str]:
+    """ Get the remote url of the given repository if it has any. """
     try:
         # Handle the use case when a repository doesn't have a remote url.
-        remote_url = next(repo.remote().urls, None)
+        return next(repo.remote().urls, None)
     except Exception:
         pass
 
+    return None
+
+
+def __get_blob_hashes(repo: Repo, commit_hash: str) -> Dict[str, str]:
+    """
+    Get the hashes of the blobs in the given commit by their paths relative
+    to the working tree directory.
+    """
+    blob_hashes = {}
+    for entry in repo.git.ls_tree('-r', '-z', commit_hash).split('\0'):
+        if not entry:
+            continue
+
+        info, path = entry.split('\t', 1)
+        _, object_type, object_hash = info.split(' ')
+        if object_type == 'blob':
+            blob_hashes[path] = object_hash
+
+    return blob_hashes
+
+
+def __get_last_commits(
+    params: Tuple[str, str, List[str]]
+) -> List[Optional[str]]:
+    """
+    Get the last commits which modified the given files of the repository
+    before the given commit. The files are given by their paths relative to
+    the working tree directory.
+    """
+    root, commit_hash, rel_paths = params
+
+    try:
+        repo = REPOS.get(root)
+        if repo is None:
+            repo = REPOS[root] = Repo(root)
+    except Exception as ex:
+        LOG.debug("Failed to open repository %s: %s", root, ex)
+        return [None] * len(rel_paths)
+
+    last_commits: List[Optional[str]] = []
+    for rel_path in rel_paths:
+        try:
+            last_commits.append(
+                repo.git.rev_list('-1', commit_hash, '--', rel_path) or None)
+        except GitCommandError as ex:
+            LOG.debug("Failed to get the last commit of %s: %s",
+                      rel_path, ex)
+            last_commits.append(None)
+
+    return last_commits
+
+
+def __group_by_repository(
+    file_paths: Iterable[str]
+) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Group the given files by the working tree directory of their
+    repository. The files are given by their original and real paths. Files
+    outside of git repositories are left out.
+    """
+    dir_to_root: Dict[str, Optional[str]] = {}
+    repo_files = defaultdict(list)
+
+    for file_path in file_paths:
+        real_path = os.path.realpath(file_path)
+        directory = os.path.dirname(real_path)
+
+        if directory not in dir_to_root:
+            try:
+                with Repo(directory, search_parent_directories=True) as repo:
+                    dir_to_root[directory] = repo.working_tree_dir
+            except (InvalidGitRepositoryError, NoSuchPathError):
+                dir_to_root[directory] = None
+
+        root = dir_to_root[directory]
+        if root:
+            repo_files[root].append((file_path, real_path))
+        else:
+            LOG.debug("File %s is not in a git repository", file_path)
+
+    return repo_files
+
+
+def __get_commit_info(commit) -> Dict:
+    """
+    Get the information of the given commit. It is read from the repository
+    only once in a process.
+    """
+    info = COMMITS.get(commit.hexsha)
+    if info is None:
+        info = {
+            'author': {
+                'name': commit.author.name,
+                'email': commit.author.email,
+            },
+            'summary': commit.summary,
+            'message': commit.message,
+            'committed_datetime': str(commit.committed_datetime)}
+        COMMITS[commit.hexsha] = info
+
+    return info
+
+
+def __get_blame_info(params: Tuple[str, str, str]) -> Optional[Dict]:
+    """
+    Get the blame and the commits of the given file at the given commit of
+    the repository.
+    """
+    root, commit_hash, file_path = params
+
     try:
-        blame = repo.blame_incremental(repo.head.commit.hexsha, real_path)
+        repo = REPOS.get(root)
+        if repo is None:
+            repo = REPOS[root] = Repo(root)
 
-        res = {
-            'version': 'v1',
-            'tracking_branch': tracking_branch,
-            'remote_url': remote_url,
-            'commits': {},
-            'blame': []}
+        res = {'commits': {}, 'blame': []}
 
-        for b in blame:
+        for b in repo.blame_incremental(commit_hash, file_path):
             commit = b.commit
 
             if commit.hexsha not in res['commits']:
-                res['commits'][commit.hexsha] = {
-                    'author': {
-                        'name': commit.author.name,
-                        'email': commit.author.email,
-                    },
-                    'summary': commit.summary,
-                    'message': commit.message,
-                    'committed_datetime': str(commit.committed_datetime)}
+                res['commits'][commit.hexsha] = __get_commit_info(commit)
 
             res['blame'].append({
                 'from': b.linenos[0],
@@ -99,14 +275,93 @@ def __get_blame_info(file_path: str):
 def __collect_blame_info_for_files(
     file_paths: Iterable[str],
     zip_iter=map
-) -> FileBlameInfo:
-    """ Collect blame information for the given file paths. """
-    file_blame_info = {}
-    for file_path, blame_info in zip(file_paths,
-                                     zip_iter(__get_blame_info, file_paths)):
-        file_blame_info[file_path] = blame_info
+) -> Tuple[FileBlameInfo, CommitInfo]:
+    """
+    Collect blame information for the given file paths.
+
+    The blame information of the files is returned without the commits, and
+    the commits of every file are returned in a single table. The blame of
+    a file is taken from the cache if the file has been blamed before at
+    the last commit which modified it, and the other files are blamed by the
+    given map function.
+    """
+    cache_dir = get_default_cache_dir()
+    cache = BlameCache(cache_dir) if cache_dir else None
+
+    file_blame_info: FileBlameInfo = {}
+    commits: CommitInfo = {}
+
+    def add_blame_info(file_path, repo_info, blame_info):
+        file_blame_info[file_path] = dict(repo_info,
+                                          blame=blame_info['blame'])
+        commits.update(blame_info['commits'])
+
+    # (file path, relative path, repository information, blame parameters)
+    tracked = []
+
+    # Parameters of the last commit lookups.
+    batches = []
+
+    for root, files in __group_by_repository(file_paths).items():
+        try:
+            with Repo(root) as repo:
+                commit_hash = repo.head.commit.hexsha
+                blob_hashes = __get_blob_hashes(repo, commit_hash)
+                repo_info = {
+                    'version': BLAME_INFO_VERSION,
+                    'tracking_branch': __get_tracking_branch(repo),
+                    'remote_url': __get_remote_url(repo)}
+        except (ValueError, GitCommandError) as ex:
+            LOG.debug("Failed to get blame information from %s: %s",
+                      root, ex)
+            continue
+
+        rel_paths = []
+        for file_path, real_path in files:
+            rel_path = os.path.relpath(real_path, root).replace(os.sep, '/')
+
+            # Untracked and ignored files have no blame information.
+            if rel_path not in blob_hashes:
+                LOG.debug("File %s is not tracked by git", file_path)
+                continue
+
+            rel_paths.append(rel_path)
+            tracked.append((file_path, rel_path, repo_info,
+                            (root, commit_hash, real_path)))
 
-    return file_blame_info
+        for i in range(0, len(rel_paths), LAST_COMMIT_BATCH_SIZE):
+            batches.append((root, commit_hash,
+                            rel_paths[i:i + LAST_COMMIT_BATCH_SIZE]))
+
+    # The last commits are only needed for the cache keys.
+    last_commits = [last_commit
+                    for batch in zip_iter(__get_last_commits, batches)
+                    for last_commit in batch] if cache else []
+
+    # (file path, cache key, repository information, blame parameters)
+    pending = []
+
+    for (file_path, rel_path, repo_info, params), last_commit in \
+            itertools.zip_longest(tracked, last_commits):
+        key = [CACHE_VERSION, params[0], rel_path, last_commit]
+        blame_info = cache.get(key) if cache and last_commit else None
+        if blame_info:
+            add_blame_info(file_path, repo_info, blame_info)
+        else:
+            pending.append((file_path, key if last_commit else None,
+                            repo_info, params))
+
+    LOG.debug("Blame information of %d file(s) is cached, %d file(s) have "
+              "to be blamed.", len(file_blame_info), len(pending))
+
+    for (file_path, key, repo_info, _), blame_info in zip(
+            pending, zip_iter(__get_blame_info, [p[3] for p in pending])):
+        if blame_info:
+            add_blame_info(file_path, repo_info, blame_info)
+            if cache and key:
+                cache.put(key, blame_info)
+
+    return file_blame_info, commits
 
 
 def assemble_blame_info(
@@ -115,19 +370,23 @@ def assemble_blame_info(
 ) -> int:
     """
     Collect and write blame information for the given files to the zip file.
+    The commits of the files are written once to the COMMITS_FILE.
 
     Returns the number of collected blame information.
     """
     with Pool() as executor:
-        file_blame_info = __collect_blame_info_for_files(
-            file_paths, executor.map)
+        file_blame_info, commits = __collect_blame_info_for_files(
+            file_paths,
+            lambda func, params: executor.map(func, params, chunksize=8))
 
     # Add blame information to the zip for the files which will be sent
     # to the server if exist.
-    for f, blame_info in file_blame_info.items():
-        if blame_info:
-            zip_file.writestr(
-                os.path.join('blame', f.lstrip('/')),
-                json.dumps(blame_info))
+    for f, blame_info in sorted(file_blame_info.items()):
+        zip_file.writestr(
+            os.path.join('blame', f.lstrip('/')),
+            json.dumps(blame_info))
+
+    if commits:
+        zip_file.writestr(COMMITS_FILE, json.dumps(commits))
 
-    return sum(bool(v) for v in file_blame_info.values())
+    return len(file_blame_info)
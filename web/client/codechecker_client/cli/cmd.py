@@ -19,13 +19,7 @@ import sys
 
 from codechecker_api.codeCheckerDBAccess_v6 import ttypes
 
-from codechecker_client import \
-    cmd_line_client, \
-    permission_client, \
-    product_client, \
-    source_component_client, \
-    task_client, \
-    token_client
+from codechecker_client.cmd_line import run_sort_type_str
 
 from codechecker_common import arg, logger, util
 from codechecker_common.output import USER_FORMATS
@@ -40,6 +34,16 @@ DEFAULT_FILTER_VALUES = {
 DEFAULT_OUTPUT_FORMATS = ["plaintext"] + USER_FORMATS
 
 
+def __handler(client_module, handler_name):
+    """
+    Returns the handler function of the given client module. The module is
+    imported only when the handler is called, because the client modules
+    have heavy dependencies.
+    """
+    return arg.lazy_handler(f"codechecker_client.{client_module}",
+                            handler_name)
+
+
 def valid_time(t):
     """
     Constructs a datetime from a 'year:month:day:hour:minute:second'-formatted
@@ -573,6 +577,7 @@ def __register_diff(parser):
             parser.error("argument --output html: not allowed without "
                          "argument --export-dir")
 
+        from codechecker_client import cmd_line_client
         cmd_line_client.handle_diff_results(args)
 
     parser.set_defaults(func=__handle)
@@ -899,6 +904,7 @@ def __register_products(parser):
                 delattr(args, 'sqlite')
 
             # If everything is fine, do call the handler for the subcommand.
+            from codechecker_client import product_client
             product_client.handle_add_product(args)
 
         parser.set_defaults(func=__handle)
@@ -923,7 +929,8 @@ def __register_products(parser):
         description="List the name and basic information about products "
                     "added to the server.",
         help="List products available on the server.")
-    list_p.set_defaults(func=product_client.handle_list_products)
+    list_p.set_defaults(
+        func=__handler('product_client', 'handle_list_products'))
     __add_common_arguments(list_p,
                            needs_product_url=False,
                            output_formats=DEFAULT_OUTPUT_FORMATS)
@@ -948,7 +955,7 @@ def __register_products(parser):
                     "LOST!",
         help="Delete a product from the server's products.")
     __register_del(del_p)
-    del_p.set_defaults(func=product_client.handle_del_product)
+    del_p.set_defaults(func=__handler('product_client', 'handle_del_product'))
     __add_common_arguments(del_p, needs_product_url=False)
 
 
@@ -1017,7 +1024,7 @@ def __register_source_components(parser):
                     "component added to the server.",
         help="List source components available on the server.")
     list_components.set_defaults(
-        func=source_component_client.handle_list_components)
+        func=__handler('source_component_client', 'handle_list_components'))
     __add_common_arguments(list_components,
                            output_formats=DEFAULT_OUTPUT_FORMATS)
 
@@ -1028,7 +1035,8 @@ def __register_source_components(parser):
                     "one.",
         help="Creates/updates a source component.")
     __register_add(add)
-    add.set_defaults(func=source_component_client.handle_add_component)
+    add.set_defaults(
+        func=__handler('source_component_client', 'handle_add_component'))
     __add_common_arguments(add)
 
     del_c = subcommands.add_parser(
@@ -1037,7 +1045,8 @@ def __register_source_components(parser):
         description="Removes the specified source component.",
         help="Delete a source component from the server.")
     __register_del(del_c)
-    del_c.set_defaults(func=source_component_client.handle_del_component)
+    del_c.set_defaults(
+        func=__handler('source_component_client', 'handle_del_component'))
     __add_common_arguments(del_c)
 
 
@@ -1135,8 +1144,7 @@ def __register_runs(parser):
 
     # Get available sort types.
     sort_type_values = list(ttypes.RunSortType._NAMES_TO_VALUES.values())
-    sort_types = [cmd_line_client.run_sort_type_str(s)
-                  for s in sort_type_values]
+    sort_types = [run_sort_type_str(s) for s in sort_type_values]
 
     # Set 'date' as a default sort type.
     default_sort_type = sort_types[
@@ -1504,7 +1512,7 @@ def __register_token(parser):
         description="List the available personal access tokens.",
         help="List tokens available on the server.")
     list_tokens.set_defaults(
-        func=token_client.handle_list_tokens)
+        func=__handler('token_client', 'handle_list_tokens'))
     __add_common_arguments(list_tokens,
                            needs_product_url=False,
                            output_formats=DEFAULT_OUTPUT_FORMATS)
@@ -1515,7 +1523,7 @@ def __register_token(parser):
         description="Creating a new personal access token.",
         help="Creates a new personal access token.")
     __register_new(new_t)
-    new_t.set_defaults(func=token_client.handle_add_token)
+    new_t.set_defaults(func=__handler('token_client', 'handle_add_token'))
     __add_common_arguments(new_t, needs_product_url=False)
 
     del_t = subcommands.add_parser(
@@ -1524,7 +1532,7 @@ def __register_token(parser):
         description="Removes the specified access token.",
         help="Deletes a token from the server.")
     __register_del(del_t)
-    del_t.set_defaults(func=token_client.handle_del_token)
+    del_t.set_defaults(func=__handler('token_client', 'handle_del_token'))
     __add_common_arguments(del_t, needs_product_url=False)
 
 
@@ -1542,7 +1550,7 @@ def add_arguments_to_parser(parser):
         description="List the analysis runs available on the server.",
         help="List the available analysis runs.")
     __register_runs(runs)
-    runs.set_defaults(func=cmd_line_client.handle_list_runs)
+    runs.set_defaults(func=__handler('cmd_line_client', 'handle_list_runs'))
     __add_common_arguments(runs, output_formats=DEFAULT_OUTPUT_FORMATS)
 
     run_histories = subcommands.add_parser(
@@ -1551,7 +1559,8 @@ def add_arguments_to_parser(parser):
         description="Show run history for some analysis runs.",
         help="Show run history of multiple runs.")
     __register_run_histories(run_histories)
-    run_histories.set_defaults(func=cmd_line_client.handle_list_run_histories)
+    run_histories.set_defaults(
+        func=__handler('cmd_line_client', 'handle_list_run_histories'))
     __add_common_arguments(run_histories,
                            output_formats=DEFAULT_OUTPUT_FORMATS)
 
@@ -1578,7 +1587,8 @@ Get analysis results for a run and filter the analysis results:
     CodeChecker cmd results my_run --review-status confirmed unreviewed \\
         --component my_component_name''')
     __register_results(results)
-    results.set_defaults(func=cmd_line_client.handle_list_results)
+    results.set_defaults(
+        func=__handler('cmd_line_client', 'handle_list_results'))
     __add_common_arguments(results, output_formats=DEFAULT_OUTPUT_FORMATS)
 
     diff = subcommands.add_parser(
@@ -1658,7 +1668,8 @@ Get statistics for all runs filtered by multiple checker names:
 Get statistics for all runs and only for severity 'high':
     CodeChecker cmd sum --all --severity "high"''')
     __register_sum(sum_p)
-    sum_p.set_defaults(func=cmd_line_client.handle_list_result_types)
+    sum_p.set_defaults(
+        func=__handler('cmd_line_client', 'handle_list_result_types'))
     __add_common_arguments(sum_p, output_formats=DEFAULT_OUTPUT_FORMATS)
 
     token = subcommands.add_parser(
@@ -1685,7 +1696,8 @@ NOTE! You can't remove a snapshot of run (a run history), you can remove only
 full runs.""",
         help="Delete analysis runs.")
     __register_delete(del_p)
-    del_p.set_defaults(func=cmd_line_client.handle_remove_run_results)
+    del_p.set_defaults(
+        func=__handler('cmd_line_client', 'handle_remove_run_results'))
     __add_common_arguments(del_p)
 
     update_p = subcommands.add_parser(
@@ -1694,7 +1706,8 @@ full runs.""",
         description="Update the name of an analysis run.",
         help="Update an analysis run.")
     __register_update(update_p)
-    update_p.set_defaults(func=cmd_line_client.handle_update_run)
+    update_p.set_defaults(
+        func=__handler('cmd_line_client', 'handle_update_run'))
     __add_common_arguments(update_p)
 
     suppress = subcommands.add_parser(
@@ -1704,7 +1717,7 @@ full runs.""",
                     "CodeChecker server.",
         help="Manage and import suppressions of a CodeChecker server.")
     __register_suppress(suppress)
-    suppress.set_defaults(func=cmd_line_client.handle_suppress)
+    suppress.set_defaults(func=__handler('cmd_line_client', 'handle_suppress'))
     __add_common_arguments(suppress)
 
     products = subcommands.add_parser(
@@ -1744,7 +1757,7 @@ full runs.""",
                     "command-line.",
         help="Authenticate into CodeChecker servers that require privileges.")
     __register_login(login)
-    login.set_defaults(func=cmd_line_client.handle_login)
+    login.set_defaults(func=__handler('cmd_line_client', 'handle_login'))
     __add_common_arguments(login, needs_product_url=False)
 
     export = subcommands.add_parser(
@@ -1755,7 +1768,7 @@ full runs.""",
         help="Export data from a CodeChecker server to json format."
     )
     __register_export(export)
-    export.set_defaults(func=cmd_line_client.handle_export)
+    export.set_defaults(func=__handler('cmd_line_client', 'handle_export'))
     __add_common_arguments(export)
 
     importer = subcommands.add_parser(
@@ -1766,7 +1779,7 @@ full runs.""",
              "'CodeChecker cmd export' command into CodeChecker"
     )
     __register_importer(importer)
-    importer.set_defaults(func=cmd_line_client.handle_import)
+    importer.set_defaults(func=__handler('cmd_line_client', 'handle_import'))
     __add_common_arguments(importer)
 
     permissions = subcommands.add_parser(
@@ -1778,7 +1791,8 @@ full runs.""",
         help="Get access control information from a CodeChecker server."
     )
     __register_permissions(permissions)
-    permissions.set_defaults(func=permission_client.handle_permissions)
+    permissions.set_defaults(
+        func=__handler('permission_client', 'handle_permissions'))
     __add_common_arguments(permissions, needs_product_url=False)
 
     tasks = subcommands.add_parser(
@@ -1814,7 +1828,7 @@ task, as identified by the token:
 """
     )
     __register_tasks(tasks)
-    tasks.set_defaults(func=task_client.handle_tasks)
+    tasks.set_defaults(func=__handler('task_client', 'handle_tasks'))
     __add_common_arguments(tasks, needs_product_url=False)
 
 # 'cmd' does not have a main() method in itself, as individual subcommands are
@@ -20,7 +20,6 @@ import os
 import signal
 import sys
 import tempfile
-import uuid
 import zipfile
 import zlib
 import shutil
@@ -52,6 +51,8 @@ except ImportError:
         raise NotImplementedError()
 
 from codechecker_client import client as libclient, product
+from codechecker_client.content_hash import get_file_content_hash, \
+    get_file_content_hashes
 from codechecker_client.task_client import await_task_termination
 from codechecker_common import arg, logger, cmd_config
 from codechecker_common.checker_labels import CheckerLabels
@@ -66,7 +67,19 @@ from codechecker_web.shared.env import get_default_workspace
 
 LOG = logger.get_logger('system')
 
-MAX_UPLOAD_SIZE = 1024 ** 3  # 1024^3 = 1 GiB.
+# The report ZIP is uploaded to the server in chunks of at most this size,
+# which bounds the memory needed for the upload on both sides.
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB.
+
+# The files of the report ZIP are compressed with this DEFLATE level. Most of
+# the size reduction is achieved by the fastest level already, the higher
+# levels are much slower on large source files.
+ZIP_COMPRESS_LEVEL = 1
+
+# Timestamp of every entry of the report ZIP. The ZIP of the same results has
+# to be the same byte by byte, so the upload of it can be resumed by the next
+# 'CodeChecker store' if it was interrupted.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
 
 
 AnalyzerResultFileReports = Dict[str, List[Report]]
@@ -135,16 +148,6 @@ class StorageZipStatistics(report_statistics.Statistics):
         out.write("\n----=================----\n")
 
 
-def get_file_content_hash(file_path):
-    """
-    Return the file content hash for a file.
-    """
-    with open(file_path, 'rb') as content:
-        hasher = hashlib.sha256()
-        hasher.update(content.read())
-        return hasher.hexdigest()
-
-
 def get_argparser_ctor_args():
     """
     This method returns a dict containing the kwargs for constructing an
@@ -178,6 +181,20 @@ Environment variables
                    files in the users home directory (e.g. in a CI
                    environment).
 
+  CC_BLAME_CACHE_DIR
+                   The directory where the git blame information of the
+                   source files is cached across runs. By default it is
+                   '~/.cache/codechecker/blame'. Set it to an empty value to
+                   disable the cache.
+
+  CC_CONTENT_HASH_CACHE_DIR
+                   The directory where the content hashes of the source
+                   files are cached across runs. An entry is used while the
+                   modification time, size and inode of the file are
+                   unchanged. By default it is
+                   '~/.cache/codechecker/content_hash'. Set it to an empty
+                   value to disable the cache.
+
 
 The results can be viewed by connecting to such a server in a Web browser or
 via 'CodeChecker cmd'.""",
@@ -438,6 +455,34 @@ class ReportLimitExceedError(Exception):
         super().__init__(self, message)
 
 
+class ReportZipFile(zipfile.ZipFile):
+    """
+    ZIP file whose content depends only on the names and the content of its
+    entries, and not on the modification time of the files or the time of
+    writing. The entries have to be written in a deterministic order.
+    """
+
+    def write(self, filename, arcname=None, compress_type=None,
+              compresslevel=None):
+        with open(filename, 'rb') as f:
+            self.writestr(arcname or filename, f.read(), compress_type,
+                          compresslevel)
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None,
+                 compresslevel=None):
+        if not isinstance(zinfo_or_arcname, zipfile.ZipInfo):
+            zinfo_or_arcname = zipfile.ZipInfo(zinfo_or_arcname,
+                                               ZIP_DATE_TIME)
+            zinfo_or_arcname.compress_type = self.compression
+            zinfo_or_arcname.external_attr = 0o600 << 16
+
+        if compresslevel is None:
+            compresslevel = self.compresslevel
+
+        super().writestr(zinfo_or_arcname, data, compress_type,
+                         compresslevel)
+
+
 def assemble_zip(inputs,
                  zip_file,
                  client,
@@ -450,6 +495,9 @@ def assemble_zip(inputs,
     For each report directory, we create a uniqued zipped directory. Each
     report directory to store could have been made with different
     configurations, so we can't merge them all into a single zip.
+
+    The zip file of the same results is the same, so an interrupted upload
+    can be resumed by storing the results again.
     """
     files_to_compress: Dict[str, set] = defaultdict(set)
     analyzer_result_file_paths = []
@@ -482,6 +530,8 @@ def assemble_zip(inputs,
             files_to_compress[os.path.dirname(coverage)] \
             .add(os.path.join(coverage, 'coverage.json'))
 
+    analyzer_result_file_paths.sort()
+
     LOG.debug(f"Processing {len(analyzer_result_file_paths)} report files ...")
 
     with Pool() as executor:
@@ -522,8 +572,9 @@ def assemble_zip(inputs,
         for analyzer_name, reports in analyzer_reports.items():
             if not analyzer_name:
                 analyzer_name = 'unknown'
+            report_dir_name = hashlib.md5(dirname.encode('utf-8')).hexdigest()
             tmpfile = os.path.join(
-                temp_dir, f'{uuid.uuid4()}-{analyzer_name}.plist')
+                temp_dir, f'{report_dir_name}-{analyzer_name}.plist')
 
             report_file.create(tmpfile, reports, checker_labels,
                                AnalyzerInfo(analyzer_name))
@@ -539,30 +590,28 @@ def assemble_zip(inputs,
         LOG.warning("There is no report to store. After uploading these "
                     "results the previous reports become resolved.")
 
-    hash_to_file: Dict[str, str] = {}
-
+    LOG.info("Hashing source files...")
     # There can be files with same hash, but different path.
-    file_to_hash: Dict[str, str] = {}
-
-    for file_path in file_paths:
-        h = get_file_content_hash(file_path)
-
-        file_to_hash[file_path] = h
-        hash_to_file[h] = file_path
+    with Pool() as executor:
+        file_to_hash: Dict[str, str] = get_file_content_hashes(
+            file_paths,
+            lambda func, params: executor.map(func, params, chunksize=32))
+    LOG.info("Hashing source files done.")
 
-    file_hashes = list(hash_to_file.keys())
+    file_hashes = list(set(file_to_hash.values()))
 
     LOG.info("Get missing file content hashes from the server...")
-    necessary_hashes = client.getMissingContentHashes(file_hashes) \
-        if file_hashes else []
+    necessary_hashes: Set[str] = \
+        set(client.getMissingContentHashes(file_hashes)) \
+        if file_hashes else set()
     LOG.info("Get missing file content hashes done.")
 
     LOG.info(
         "Get file content hashes which do not have blame information from the "
         "server...")
-    necessary_blame_hashes = \
-        client.getMissingContentHashesForBlameInfo(file_hashes) \
-        if file_hashes else []
+    necessary_blame_hashes: Set[str] = \
+        set(client.getMissingContentHashesForBlameInfo(file_hashes)) \
+        if file_hashes else set()
     LOG.info(
         "Get file content hashes which do not have blame information done.")
 
@@ -578,17 +627,19 @@ def assemble_zip(inputs,
         unnecessary_file_report_positions)
 
     for file_path in files_with_comment:
-        necessary_hashes.append(file_to_hash[file_path])
+        necessary_hashes.add(file_to_hash[file_path])
         stats.num_of_source_files_with_source_code_comment += 1
 
     LOG.info("Collecting review comments done.")
 
     LOG.info("Building report zip file...")
-    with zipfile.ZipFile(zip_file, 'a', allowZip64=True) as zipf:
+    with ReportZipFile(zip_file, 'a', compression=zipfile.ZIP_DEFLATED,
+                       compresslevel=ZIP_COMPRESS_LEVEL,
+                       allowZip64=True) as zipf:
         # Add the files to the zip which will be sent to the server.
 
-        for dirname, files in files_to_compress.items():
-            for file_path in files:
+        for dirname, files in sorted(files_to_compress.items()):
+            for file_path in sorted(files):
                 _, file_name = os.path.split(file_path)
 
                 # Create a unique report directory name.
@@ -599,7 +650,7 @@ def assemble_zip(inputs,
                 zipf.write(file_path, zip_target)
 
         collected_file_paths = set()
-        for f, h in file_to_hash.items():
+        for f, h in sorted(file_to_hash.items()):
             if h in necessary_hashes:
                 LOG.debug("File contents for '%s' needed by the server", f)
 
@@ -612,8 +663,8 @@ def assemble_zip(inputs,
                     zipf.write(f, file_path)
 
         if necessary_blame_hashes:
-            file_paths = list(f for f, h in file_to_hash.items()
-                              if h in necessary_blame_hashes)
+            file_paths = sorted(f for f, h in file_to_hash.items()
+                                if h in necessary_blame_hashes)
 
             LOG.info("Collecting blame information for source files...")
             try:
@@ -629,7 +680,8 @@ def assemble_zip(inputs,
                     "Failed to collect blame information. Make sure Git is "
                     "installed on your system.")
 
-        zipf.writestr('content_hashes.json', json.dumps(file_to_hash))
+        zipf.writestr('content_hashes.json',
+                      json.dumps(file_to_hash, sort_keys=True))
 
     LOG.info("Building report zip file (%s) done.", zip_file)
 
@@ -656,22 +708,42 @@ Configured report limit for this product: {p.reportLimit}
         shutil.rmtree(temp_dir)
         raise ReportLimitExceedError("Maximum report limit reached.")
 
-    zip_size = os.stat(zip_file).st_size
+    # We are responsible for deleting these.
+    shutil.rmtree(temp_dir)
 
-    LOG.info("Compressing report zip file...")
 
-    with open(zip_file, 'rb') as source:
-        compressed = zlib.compress(source.read(), zlib.Z_BEST_COMPRESSION)
-    with open(zip_file, 'wb') as target:
-        target.write(compressed)
+def upload_zip(client, zip_file: str) -> str:
+    """
+    Upload the ZIP file to the server in chunks and return the ID of the
+    upload, which can be stored by 'massStoreRunFromUpload()'.
 
-    compressed_zip_size = os.stat(zip_file).st_size
+    If the server has already received a part of the same ZIP file (because
+    a previous upload was interrupted), the upload continues from the last
+    chunk the server acknowledged.
+    """
+    zip_size = os.stat(zip_file).st_size
+    status = client.beginStoreUpload(get_file_content_hash(zip_file),
+                                     zip_size)
+    chunk_size = min(UPLOAD_CHUNK_SIZE, status.chunkSize or UPLOAD_CHUNK_SIZE)
+    offset = status.receivedSize
 
-    LOG.info("Compressing report zip file done (%s / %s).",
-             format_size(zip_size), format_size(compressed_zip_size))
+    if offset:
+        LOG.info("Resuming the upload of the report zip file from %s.",
+                 format_size(offset))
 
-    # We are responsible for deleting these.
-    shutil.rmtree(temp_dir)
+    with open(zip_file, 'rb') as zf:
+        zf.seek(offset)
+        while offset < zip_size:
+            chunk = zf.read(chunk_size)
+            offset = client.uploadStoreChunk(
+                status.uploadId, offset, chunk,
+                hashlib.sha256(chunk).hexdigest())
+            zf.seek(offset)
+
+            LOG.debug("Uploaded %s of %s.",
+                      format_size(offset), format_size(zip_size))
+
+    return status.uploadId
 
 
 def should_be_zipped(input_file: str, input_files: Iterable[str]) -> bool:
@@ -775,7 +847,7 @@ def store_analysis_statistics(client, inputs, run_name):
         # Compressing .zip file
         with open(zip_file, 'rb') as source:
             compressed = zlib.compress(source.read(),
-                                       zlib.Z_BEST_COMPRESSION)
+                                       zlib.Z_BEST_SPEED)
 
         with open(zip_file, 'wb') as target:
             target.write(compressed)
@@ -951,18 +1023,12 @@ def main(args):
             sys.exit(1)
 
         zip_size = os.stat(zip_file).st_size
-        if zip_size > MAX_UPLOAD_SIZE:
-            LOG.error("The result list to upload is too big (max: %s): %s.",
-                      format_size(MAX_UPLOAD_SIZE), format_size(zip_size))
-            sys.exit(1)
-
-        b64zip = ""
-        with open(zip_file, 'rb') as zf:
-            b64zip = base64.b64encode(zf.read()).decode("utf-8")
-        if len(b64zip) == 0:
+        if zip_size == 0:
             LOG.info("Zip content is empty, nothing to store!")
             sys.exit(1)
 
+        LOG.info("Report zip file size: %s.", format_size(zip_size))
+
         trim_path_prefixes = args.trim_path_prefix if \
             'trim_path_prefix' in args else None
 
@@ -971,6 +1037,11 @@ def main(args):
         LOG.info("Storing results to the server ...")
 
         if strtobool(os.environ.get('CC_FORCE_SYNC_STORE', 'no')):
+            with open(zip_file, 'rb') as zf:
+                b64zip = base64.b64encode(
+                    zlib.compress(zf.read(), zlib.Z_BEST_SPEED)) \
+                    .decode("utf-8")
+
             try:
                 with _timeout_watchdog(timedelta(hours=1),
                                        signal.SIGUSR1):
@@ -1026,8 +1097,10 @@ def main(args):
             if client.allowsStoringAnalysisStatistics():
                 store_analysis_statistics(client, args.input, args.name)
         else:
-            task_token: str = client.massStoreRunAsynchronous(
-                b64zip,
+            upload_id = upload_zip(client, zip_file)
+
+            task_token: str = client.massStoreRunFromUpload(
+                upload_id,
                 SubmittedRunOptions(
                     runName=args.name,
                     tag=args.tag if "tag" in args else None,
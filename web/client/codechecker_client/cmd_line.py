@@ -11,6 +11,9 @@ Command line module.
 
 
 import json
+from typing import Optional
+
+from codechecker_api.codeCheckerDBAccess_v6 import ttypes
 
 
 class CmdLineOutputEncoder(json.JSONEncoder):
@@ -19,3 +22,35 @@ class CmdLineOutputEncoder(json.JSONEncoder):
         d = {}
         d.update(o.__dict__)
         return d
+
+
+def run_sort_type_str(value: ttypes.RunSortType) -> Optional[str]:
+    """ Converts the given run sort type to string. """
+    if value == ttypes.RunSortType.NAME:
+        return 'name'
+    elif value == ttypes.RunSortType.UNRESOLVED_REPORTS:
+        return 'unresolved_reports'
+    elif value == ttypes.RunSortType.DATE:
+        return 'date'
+    elif value == ttypes.RunSortType.DURATION:
+        return 'duration'
+    elif value == ttypes.RunSortType.CC_VERSION:
+        return 'codechecker_version'
+
+    assert False, f"Unknown ttypes.RunSortType: {value}"
+
+
+def run_sort_type_enum(value: str) -> Optional[ttypes.RunSortType]:
+    """ Returns the given run sort type Thrift enum value. """
+    if value == 'name':
+        return ttypes.RunSortType.NAME
+    elif value == 'unresolved_reports':
+        return ttypes.RunSortType.UNRESOLVED_REPORTS
+    elif value == 'date':
+        return ttypes.RunSortType.DATE
+    elif value == 'duration':
+        return ttypes.RunSortType.DURATION
+    elif value == 'codechecker_version':
+        return ttypes.RunSortType.CC_VERSION
+
+    assert False, f"Unknown ttypes.RunSortType value: {str}"
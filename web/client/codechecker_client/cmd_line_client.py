@@ -43,7 +43,7 @@ from codechecker_web.shared import convert, webserver_context
 
 from codechecker_client import report_type_converter
 from .client import login_user, setup_client, init_config_client
-from .cmd_line import CmdLineOutputEncoder
+from .cmd_line import CmdLineOutputEncoder, run_sort_type_enum
 from .product import split_server_url
 
 from . import suppress_file_handler
@@ -83,38 +83,6 @@ def filter_local_file_remote_run(
     return local_dirs, baseline_files, run_names
 
 
-def run_sort_type_str(value: ttypes.RunSortType) -> Optional[str]:
-    """ Converts the given run sort type to string. """
-    if value == ttypes.RunSortType.NAME:
-        return 'name'
-    elif value == ttypes.RunSortType.UNRESOLVED_REPORTS:
-        return 'unresolved_reports'
-    elif value == ttypes.RunSortType.DATE:
-        return 'date'
-    elif value == ttypes.RunSortType.DURATION:
-        return 'duration'
-    elif value == ttypes.RunSortType.CC_VERSION:
-        return 'codechecker_version'
-
-    assert False, f"Unknown ttypes.RunSortType: {value}"
-
-
-def run_sort_type_enum(value: str) -> Optional[ttypes.RunSortType]:
-    """ Returns the given run sort type Thrift enum value. """
-    if value == 'name':
-        return ttypes.RunSortType.NAME
-    elif value == 'unresolved_reports':
-        return ttypes.RunSortType.UNRESOLVED_REPORTS
-    elif value == 'date':
-        return ttypes.RunSortType.DATE
-    elif value == 'duration':
-        return ttypes.RunSortType.DURATION
-    elif value == 'codechecker_version':
-        return ttypes.RunSortType.CC_VERSION
-
-    assert False, f"Unknown ttypes.RunSortType value: {str}"
-
-
 def get_diff_type(args) -> ttypes.DiffType:
     """
     Returns Thrift DiffType value by processing the arguments.
@@ -392,13 +360,13 @@ def get_run_data(client, run_filter, sort_mode=None,
 
     all_runs = []
 
-    offset = 0
+    cursor = None
     while True:
-        runs = runs = client.getRunData(run_filter, limit, offset, sort_mode)
-        all_runs.extend(runs)
-        offset += limit
+        page = client.getRunDataPage(run_filter, limit, cursor, sort_mode)
+        all_runs.extend(page.runs)
+        cursor = page.nextCursor
 
-        if len(runs) < limit:
+        if not cursor:
             break
 
     return all_runs
@@ -407,7 +375,6 @@ def get_run_data(client, run_filter, sort_mode=None,
 def get_run_results(client,
                     run_ids,
                     limit,
-                    offset,
                     sort_type,
                     report_filter,
                     compare_data,
@@ -416,22 +383,37 @@ def get_run_results(client,
 
     In each api request get the limit ammount of reports.
     Collect and return all the reports based on the filters.
+
+    Each page is queried by the cursor returned with the previous one, so the
+    server doesn't have to skip the already returned reports again.
     """
 
+    # The server can return the pages in report ID order directly from the
+    # index, without sorting all the remaining reports for every page. The
+    # default ordering of the server (by severity, then by report ID) is
+    # restored after the reports are collected.
+    default_sort = sort_type is None
+    if default_sort:
+        sort_type = []
+
     all_results = []
+    cursor = None
     while True:
-        results = client.getRunResults(run_ids,
-                                       limit,
-                                       offset,
-                                       sort_type,
-                                       report_filter,
-                                       compare_data,
-                                       query_report_details)
-        all_results.extend(results)
-        offset += limit
-        if len(results) < limit:
+        page = client.getRunResultsPage(run_ids,
+                                        limit,
+                                        cursor,
+                                        sort_type,
+                                        report_filter,
+                                        compare_data,
+                                        query_report_details)
+        all_results.extend(page.reports)
+        cursor = page.nextCursor
+        if not cursor:
             break
 
+    if default_sort:
+        all_results.sort(key=lambda report: report.severity, reverse=True)
+
     return all_results
 
 
@@ -716,7 +698,6 @@ def handle_list_results(args):
     all_results = get_run_results(client,
                                   run_ids,
                                   constants.MAX_QUERY_SIZE,
-                                  0,
                                   None,
                                   report_filter,
                                   None,
@@ -1073,7 +1054,7 @@ def get_diff_remote_runs(
         report_filter.detectionStatus = []
 
     all_results = get_run_results(
-        client, base_ids, constants.MAX_QUERY_SIZE, 0, sort_mode,
+        client, base_ids, constants.MAX_QUERY_SIZE, sort_mode,
         report_filter, cmp_data, True)
 
     reports = \
@@ -0,0 +1,194 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Content hashes of the source files which are stored to the server.
+
+Hashing every source file of a large project takes a lot of time, although
+most of them don't change between two storages. The hashes are computed in
+parallel and cached by the path, modification time, size and inode of the
+files across runs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Iterable, List, Optional
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('system')
+
+# Source files are read in chunks of this size while hashing.
+HASH_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB.
+
+CACHE_FILE = 'content_hashes.json'
+
+# Increase it when the format of the cache or the hash function changes, so
+# the earlier entries are not used anymore.
+CACHE_VERSION = 1
+
+# Entries which were not used by any storage for this long are dropped.
+CACHE_EXPIRY = 30 * 24 * 60 * 60  # 30 days.
+
+# Files modified this close to the start of hashing may be modified again
+# without changing their modification time on file systems with a coarse
+# timestamp resolution, so their hashes are not cached.
+RACY_INTERVAL_NS = 2 * 1000 * 1000 * 1000  # 2 seconds.
+
+
+def get_file_content_hash(file_path: str) -> str:
+    """
+    Return the file content hash for a file.
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as content:
+        for chunk in iter(lambda: content.read(HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def get_default_cache_dir() -> Optional[str]:
+    """
+    Returns the directory of the content hash cache. It can be set by the
+    CC_CONTENT_HASH_CACHE_DIR environment variable, and the cache is disabled
+    if this variable is set to an empty value.
+    """
+    cache_dir = os.environ.get('CC_CONTENT_HASH_CACHE_DIR')
+    if cache_dir is not None:
+        return cache_dir or None
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(cache_home, 'codechecker', 'content_hash')
+
+
+class ContentHashCache:
+    """
+    Content hashes stored in a single JSON file of a directory by the
+    absolute paths of the files. An entry is valid while the modification
+    time, size and inode of the file are unchanged.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_file = os.path.join(cache_dir, CACHE_FILE)
+        self.entries: Dict[str, list] = {}
+        self.now = int(time.time())
+
+        try:
+            with open(self.cache_file, encoding="utf-8",
+                      errors="ignore") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(cache, dict) and \
+                cache.get('version') == CACHE_VERSION and \
+                isinstance(cache.get('files'), dict):
+            self.entries = cache['files']
+
+    @staticmethod
+    def get_key(stat: os.stat_result) -> list:
+        """ Returns the key of a file with the given status. """
+        return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+    def get(self, file_path: str, key: list) -> Optional[str]:
+        """ Returns the content hash of the given file if cached. """
+        entry = self.entries.get(file_path)
+        if not isinstance(entry, list) or len(entry) != 3 or \
+                entry[0] != key:
+            return None
+
+        entry[2] = self.now
+        return entry[1]
+
+    def put(self, file_path: str, key: list, content_hash: str):
+        """ Stores the content hash of the given file. """
+        self.entries[file_path] = [key, content_hash, self.now]
+
+    def save(self):
+        """
+        Writes the cache file without the expired entries. The file is
+        replaced atomically, so other processes never read a partially
+        written cache.
+        """
+        entries = {path: entry for path, entry in self.entries.items()
+                   if isinstance(entry, list) and len(entry) == 3 and
+                   isinstance(entry[2], int) and
+                   self.now - entry[2] < CACHE_EXPIRY}
+
+        cache_dir = os.path.dirname(self.cache_file)
+        tmp_file_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    'w', dir=cache_dir, suffix='.tmp', delete=False,
+                    encoding="utf-8") as f:
+                tmp_file_path = f.name
+                json.dump({'version': CACHE_VERSION, 'files': entries}, f)
+
+            os.replace(tmp_file_path, self.cache_file)
+        except OSError as err:
+            LOG.debug("Failed to write content hash cache %s: %s",
+                      self.cache_file, err)
+            if tmp_file_path and os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
+
+
+def get_file_content_hashes(
+    file_paths: Iterable[str],
+    zip_iter=map
+) -> Dict[str, str]:
+    """
+    Return the content hashes of the given files by their paths.
+
+    The hashes of the files which haven't changed since a previous run are
+    taken from the cache, and the other files are hashed by the given map
+    function.
+    """
+    cache_dir = get_default_cache_dir()
+    cache = ContentHashCache(cache_dir) if cache_dir else None
+
+    racy_time_ns = time.time_ns() - RACY_INTERVAL_NS
+
+    file_to_hash: Dict[str, str] = {}
+
+    # (file path, absolute path, cache key)
+    pending: List[tuple] = []
+
+    for file_path in file_paths:
+        abs_path = os.path.abspath(file_path)
+        key = None
+        if cache:
+            try:
+                key = ContentHashCache.get_key(os.stat(abs_path))
+            except OSError:
+                pass
+
+        content_hash = cache.get(abs_path, key) if key else None
+        if content_hash:
+            file_to_hash[file_path] = content_hash
+        else:
+            pending.append((file_path, abs_path, key))
+
+    LOG.debug("Content hash of %d file(s) is cached, %d file(s) have to be "
+              "hashed.", len(file_to_hash), len(pending))
+
+    for (file_path, abs_path, key), content_hash in zip(
+            pending, zip_iter(get_file_content_hash,
+                              [p[0] for p in pending])):
+        file_to_hash[file_path] = content_hash
+        if key and key[0] < racy_time_ns:
+            cache.put(abs_path, key, content_hash)
+
+    if cache and file_to_hash:
+        cache.save()
+
+    return file_to_hash
@@ -9,17 +9,51 @@
 Base Helper class for Thrift api calls.
 """
 
+import gzip
+from io import BytesIO
 import sys
-from thrift.transport import THttpClient
-from thrift.protocol import TJSONProtocol
+from thrift.transport import THttpClient, TTransport
 
 from codechecker_client.product import create_product_url
 
 from codechecker_common.logger import get_logger
 
+from codechecker_web.shared import env, thrift_protocol
+
 LOG = get_logger('system')
 
 
+class HttpClientTransport(THttpClient.THttpClient,
+                          TTransport.CReadableTransport):
+    """
+    HTTP transport which reads the whole response at once, decompressing it
+    if the server sent it gzip compressed. The response is readable through
+    the buffer interface used by the accelerated Thrift protocols.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__response = BytesIO()
+
+    def flush(self):
+        super().flush()
+
+        data = super().read(None)
+        if self.headers.get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        self.__response = BytesIO(data)
+
+    def read(self, sz):
+        return self.__response.read(sz)
+
+    @property
+    def cstringio_buf(self):
+        return self.__response
+
+    def cstringio_refill(self, partialread, reqlen):
+        raise EOFError()
+
+
 class BaseClientHelper:
 
     def __init__(self, protocol, host, port, uri, session_token=None,
@@ -32,7 +66,7 @@ class BaseClientHelper:
         self.transport = None
 
         try:
-            self.transport = THttpClient.THttpClient(url)
+            self.transport = HttpClientTransport(url)
         except ValueError:
             # Initalizing THttpClient may raise an exception if proxy settings
             # are used but the port number is not a valid integer.
@@ -43,7 +77,19 @@ class BaseClientHelper:
         # verify the proxy format in our side.
         self._validate_proxy_format()
 
-        self.protocol = TJSONProtocol.TJSONProtocol(self.transport)
+        # The Thrift HTTP client always sends the JSON content type. The
+        # server uses the first content type of a binary protocol instead.
+        protocol_name = env.get_thrift_protocol()
+        self.__headers = {'Accept-Encoding': 'gzip'}
+        if protocol_name != "json":
+            self.__headers['Content-Type'] = \
+                thrift_protocol.CONTENT_TYPES[protocol_name]
+
+        if self.transport:
+            self.transport.setCustomHeaders(dict(self.__headers))
+
+        self.protocol = thrift_protocol.get_protocol_factory(protocol_name) \
+            .getProtocol(self.transport)
         self.client = None
 
         self.get_new_token = get_new_token
@@ -71,7 +117,8 @@ class BaseClientHelper:
         if not session_token:
             return
 
-        headers = {'Authorization': 'Bearer ' + session_token}
+        headers = dict(self.__headers)
+        headers['Authorization'] = 'Bearer ' + session_token
         self.transport.setCustomHeaders(headers)
 
     def _reset_token(self):
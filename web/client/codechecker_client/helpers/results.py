@@ -33,10 +33,18 @@ class ThriftResultsHelper(BaseClientHelper):
     def getRunData(self, run_name_filter, limit, offset, sort_mode):
         pass
 
+    @thrift_client_call
+    def getRunDataPage(self, run_name_filter, limit, cursor, sort_mode):
+        pass
+
     @thrift_client_call
     def getRunHistory(self, run_ids, limit, offset, run_history_filter):
         pass
 
+    @thrift_client_call
+    def getRunHistoryPage(self, run_ids, limit, cursor, run_history_filter):
+        pass
+
     @thrift_client_call
     def getReportDetails(self, reportId):
         pass
@@ -111,6 +119,11 @@ class ThriftResultsHelper(BaseClientHelper):
                       cmpData, getDetails):
         pass
 
+    @thrift_client_call
+    def getRunResultsPage(self, runIds, limit, cursor, sortType,
+                          reportFilter, cmpData, getDetails):
+        pass
+
     @thrift_client_call
     def getReportAnnotations(self, key):
         pass
@@ -189,6 +202,34 @@ class ThriftResultsHelper(BaseClientHelper):
     ) -> str:
         raise NotImplementedError("Should have called Thrift code!")
 
+    @thrift_client_call
+    def beginStoreUpload(
+        self,
+        zipfile_sha256: str,
+        zipfile_size: int
+    ) -> ttypes.StoreUploadStatus:
+        raise NotImplementedError("Should have called Thrift code!")
+
+    # The server accepts the same chunk again, so the upload can be continued
+    # if the connection breaks.
+    @thrift_client_call(connection_retries=5)
+    def uploadStoreChunk(
+        self,
+        upload_id: str,
+        offset: int,
+        chunk: bytes,
+        chunk_sha256: str
+    ) -> int:
+        raise NotImplementedError("Should have called Thrift code!")
+
+    @thrift_client_call
+    def massStoreRunFromUpload(
+        self,
+        upload_id: str,
+        store_opts: ttypes.SubmittedRunOptions
+    ) -> str:
+        raise NotImplementedError("Should have called Thrift code!")
+
     @thrift_client_call
     def allowsStoringAnalysisStatistics(self):
         pass
@@ -10,7 +10,9 @@ Helper for thrift api calls.
 """
 
 
+import functools
 import sys
+import time
 
 from thrift.protocol.TProtocol import TProtocolException
 from thrift.Thrift import TApplicationException
@@ -21,6 +23,9 @@ from codechecker_common.logger import get_logger
 
 LOG = get_logger('system')
 
+# Seconds to wait before the call is repeated after a connection failure.
+CONNECTION_RETRY_DELAY = 5
+
 
 def truncate_arg(arg, max_len=100):
     """ Truncate the given argument if the length is too large. """
@@ -30,14 +35,20 @@ def truncate_arg(arg, max_len=100):
     return arg
 
 
-def thrift_client_call(function):
+def thrift_client_call(function=None, *, connection_retries=0):
     """ Wrapper function for thrift client calls.
         - open and close transport,
-        - log and handle errors
+        - log and handle errors,
+        - repeat the call at most connection_retries times if the connection
+          fails. Use it only for API functions which can be safely repeated.
     """
+    if function is None:
+        return functools.partial(thrift_client_call,
+                                 connection_retries=connection_retries)
+
     func_name = function.__name__
 
-    def wrapper(self, *args, **kwargs):
+    def wrapper(self, *args, _retries_left=connection_retries, **kwargs):
         self.transport.open()
         func = getattr(self.client, func_name)
         try:
@@ -116,11 +127,19 @@ def thrift_client_call(function):
             LOG.exception("Request failed.")
             sys.exit(1)
         except OSError as oserr:
-            LOG.error("Connection failed.")
-            LOG.error(oserr.strerror)
-            LOG.error("Check if your CodeChecker server is running.")
-            sys.exit(1)
+            if not _retries_left:
+                LOG.error("Connection failed.")
+                LOG.error(oserr.strerror)
+                LOG.error("Check if your CodeChecker server is running.")
+                sys.exit(1)
+
+            LOG.warning("Connection failed: %s. Retrying in %d seconds...",
+                        oserr.strerror, CONNECTION_RETRY_DELAY)
         finally:
             self.transport.close()
 
+        # Only a connection failure with remaining retries gets here.
+        time.sleep(CONNECTION_RETRY_DELAY)
+        return wrapper(self, *args, _retries_left=_retries_left - 1, **kwargs)
+
     return wrapper
@@ -0,0 +1,147 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the collection of git blame information. """
+
+
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from git import Actor, Repo
+
+from codechecker_client import blame_info
+
+
+class BlameInfoTest(unittest.TestCase):
+    """
+    Test that the commits are shared by the blame files and the blame of the
+    files is cached.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo_dir = os.path.join(self.tmp_dir.name, 'repo')
+        self.cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+
+        self.env = mock.patch.dict(
+            os.environ, {'CC_BLAME_CACHE_DIR': self.cache_dir})
+        self.env.start()
+
+        self.author = author = Actor('Author', 'author@example.com')
+        with Repo.init(self.repo_dir) as repo:
+            self.__write('a.cpp', 'int a;\n')
+            self.__write('b.cpp', 'int b;\n')
+            repo.index.add(['a.cpp', 'b.cpp'])
+            self.first = repo.index.commit(
+                'First', author=author, committer=author).hexsha
+
+            self.__write('a.cpp', 'int a;\nint aa;\n')
+            self.__write('b.cpp', 'int b;\nint bb;\n')
+            repo.index.add(['a.cpp', 'b.cpp'])
+            self.second = repo.index.commit(
+                'Second', author=author, committer=author).hexsha
+
+        self.__write('untracked.cpp', 'int u;\n')
+
+        self.file_paths = [os.path.join(self.repo_dir, f)
+                           for f in ['a.cpp', 'b.cpp', 'untracked.cpp']]
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp_dir.cleanup()
+
+    def __write(self, name, content):
+        with open(os.path.join(self.repo_dir, name), 'w',
+                  encoding='utf-8') as f:
+            f.write(content)
+
+    def __assemble(self):
+        zip_path = os.path.join(self.tmp_dir.name, 'store.zip')
+        with zipfile.ZipFile(zip_path, 'w') as zip_file:
+            count = blame_info.assemble_blame_info(zip_file, self.file_paths)
+
+        with zipfile.ZipFile(zip_path) as zip_file:
+            contents = {name: json.loads(zip_file.read(name))
+                        for name in zip_file.namelist()}
+
+        return count, contents
+
+    def test_shared_commits(self):
+        """ The commits are stored once for all blame files. """
+        count, contents = self.__assemble()
+
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            sorted(contents),
+            sorted([blame_info.COMMITS_FILE] +
+                   [os.path.join('blame', p.lstrip('/'))
+                    for p in self.file_paths[:2]]))
+
+        commits = contents[blame_info.COMMITS_FILE]
+        self.assertEqual(sorted(commits), sorted([self.first, self.second]))
+        self.assertEqual(commits[self.second]['summary'], 'Second')
+
+        blame = contents[os.path.join('blame',
+                                      self.file_paths[0].lstrip('/'))]
+        self.assertEqual(blame['version'], 'v2')
+        self.assertNotIn('commits', blame)
+        self.assertEqual(sorted(blame['blame'], key=lambda b: b['from']),
+                         [{'from': 1, 'to': 1, 'commit': self.first},
+                          {'from': 2, 'to': 2, 'commit': self.second}])
+
+    def test_cached(self):
+        """ The blame of an unchanged blob is read from the cache. """
+        _, contents = self.__assemble()
+
+        # Modify the cached entries to see that they are used.
+        for root, _, files in os.walk(self.cache_dir):
+            for f in files:
+                path = os.path.join(root, f)
+                with open(path, encoding='utf-8') as cache_file:
+                    entry = json.load(cache_file)
+                entry['blame_info']['commits'][self.second]['summary'] = \
+                    'Cached'
+                with open(path, 'w', encoding='utf-8') as cache_file:
+                    json.dump(entry, cache_file)
+
+        _, cached_contents = self.__assemble()
+        self.assertEqual(
+            cached_contents[blame_info.COMMITS_FILE][self.second]['summary'],
+            'Cached')
+        del cached_contents[blame_info.COMMITS_FILE]
+        del contents[blame_info.COMMITS_FILE]
+        self.assertEqual(cached_contents, contents)
+
+    def test_same_content_other_history(self):
+        """
+        A file which gets the same content again by a later commit is blamed
+        again, because its history is different.
+        """
+        self.__assemble()
+
+        with Repo(self.repo_dir) as repo:
+            self.__write('a.cpp', 'int a;\n')
+            repo.index.add(['a.cpp'])
+            repo.index.commit('Remove', author=self.author,
+                              committer=self.author)
+
+            self.__write('a.cpp', 'int a;\nint aa;\n')
+            repo.index.add(['a.cpp'])
+            restore = repo.index.commit(
+                'Restore', author=self.author, committer=self.author).hexsha
+
+        _, contents = self.__assemble()
+        blame = contents[os.path.join('blame',
+                                      self.file_paths[0].lstrip('/'))]
+        self.assertEqual(sorted(blame['blame'], key=lambda b: b['from']),
+                         [{'from': 1, 'to': 1, 'commit': self.first},
+                          {'from': 2, 'to': 2, 'commit': restore}])
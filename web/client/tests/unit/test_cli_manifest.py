@@ -0,0 +1,38 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test that the subcommand manifest of the command line is up to date. """
+
+
+import importlib
+import unittest
+
+from codechecker_common import cli, cli_manifest
+
+
+class CliManifestTest(unittest.TestCase):
+    """
+    Test that the manifest lists the subcommands found by importing the
+    subcommand modules. Regenerate the manifest by
+    scripts/build/generate_subcommand_manifest.py if this test fails.
+    """
+
+    def test_version(self):
+        """ The manifest has the format known by the command line. """
+        self.assertEqual(cli_manifest.MANIFEST_VERSION, cli.MANIFEST_VERSION)
+
+    def test_subcommands(self):
+        """ The modules and the help messages of the subcommands match. """
+        subcommands = {}
+        for subcommand, module_name in cli.discover_subcommands().items():
+            module = importlib.import_module(module_name)
+            subcommands[subcommand] = (
+                module_name,
+                module.get_argparser_ctor_args().get('help', ''))
+
+        self.assertEqual(cli_manifest.SUBCOMMANDS, subcommands)
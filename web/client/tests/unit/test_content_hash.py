@@ -0,0 +1,98 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the cached hashing of the source files. """
+
+
+import hashlib
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from codechecker_client import content_hash
+
+
+class ContentHashTest(unittest.TestCase):
+    """
+    Test that only the changed files are hashed again by the later runs.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+
+        self.env = mock.patch.dict(
+            os.environ, {'CC_CONTENT_HASH_CACHE_DIR': self.cache_dir})
+        self.env.start()
+
+        self.file_paths = [os.path.join(self.tmp_dir.name, f)
+                           for f in ['a.cpp', 'b.cpp', 'c.cpp']]
+        for file_path in self.file_paths:
+            self.__write(file_path, file_path)
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def __write(file_path, content):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        # Files modified right before hashing are not cached.
+        mtime = time.time() - 60
+        os.utime(file_path, (mtime, mtime))
+
+    def __get_hashes(self):
+        hashed = []
+
+        def zip_iter(func, params):
+            hashed.extend(params)
+            return map(func, params)
+
+        return content_hash.get_file_content_hashes(
+            self.file_paths, zip_iter), hashed
+
+    def test_cached(self):
+        """ Unchanged files are not hashed again. """
+        hashes, hashed = self.__get_hashes()
+        self.assertEqual(hashed, self.file_paths)
+        for file_path in self.file_paths:
+            self.assertEqual(
+                hashes[file_path],
+                hashlib.sha256(file_path.encode()).hexdigest())
+
+        cached_hashes, hashed = self.__get_hashes()
+        self.assertEqual(hashed, [])
+        self.assertEqual(cached_hashes, hashes)
+
+        self.__write(self.file_paths[1], 'int b;')
+        changed_hashes, hashed = self.__get_hashes()
+        self.assertEqual(hashed, [self.file_paths[1]])
+        self.assertEqual(changed_hashes[self.file_paths[1]],
+                         hashlib.sha256(b'int b;').hexdigest())
+
+    def test_racy_file(self):
+        """ The hash of a file modified right before hashing is not cached. """
+        with open(self.file_paths[0], 'a', encoding='utf-8') as f:
+            f.write('\n')
+
+        self.__get_hashes()
+        _, hashed = self.__get_hashes()
+        self.assertEqual(hashed, [self.file_paths[0]])
+
+    def test_cache_disabled(self):
+        """ An empty cache directory disables the cache. """
+        with mock.patch.dict(os.environ, {'CC_CONTENT_HASH_CACHE_DIR': ''}):
+            self.__get_hashes()
+            _, hashed = self.__get_hashes()
+
+        self.assertEqual(hashed, self.file_paths)
+        self.assertFalse(os.path.exists(self.cache_dir))
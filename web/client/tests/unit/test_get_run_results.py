@@ -0,0 +1,70 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test querying all the results page by page. """
+
+
+import unittest
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import Order, \
+    ReportData, ReportFilter, RunResultsPage, Severity, SortMode, SortType
+
+from codechecker_client.cmd_line_client import get_run_results
+
+
+class FakeClient:
+    """ Returns the reports in pages by their index as the cursor. """
+
+    def __init__(self, reports):
+        self.reports = reports
+        self.calls = []
+
+    # pylint: disable=invalid-name,unused-argument
+    def getRunResultsPage(self, run_ids, limit, cursor, sort_type,
+                          report_filter, cmp_data, get_details):
+        self.calls.append((cursor, sort_type))
+
+        start = int(cursor) if cursor else 0
+        end = start + limit
+        return RunResultsPage(
+            reports=self.reports[start:end],
+            nextCursor=str(end) if end < len(self.reports) else None)
+
+
+class GetRunResultsTest(unittest.TestCase):
+    """ Test that every page is queried by the cursor of the previous one. """
+
+    def setUp(self):
+        severities = [Severity.LOW, Severity.HIGH, Severity.MEDIUM]
+        self.client = FakeClient([
+            ReportData(reportId=i, severity=severities[i % 3])
+            for i in range(10)])
+
+    def test_pages(self):
+        """ All the pages are collected in the order of the server. """
+        sort_type = [SortMode(SortType.FILENAME, Order.ASC)]
+        results = get_run_results(self.client, [1], 4, sort_type,
+                                  ReportFilter(), None, False)
+
+        self.assertEqual([r.reportId for r in results], list(range(10)))
+        self.assertEqual(self.client.calls, [(None, sort_type),
+                                             ('4', sort_type),
+                                             ('8', sort_type)])
+
+    def test_default_sort(self):
+        """
+        Without sort type the reports are queried by report ID and sorted by
+        severity like the server does.
+        """
+        results = get_run_results(self.client, [1], 4, None,
+                                  ReportFilter(), None, False)
+
+        self.assertEqual([r.reportId for r in results],
+                         [1, 4, 7, 2, 5, 8, 0, 3, 6, 9])
+        self.assertTrue(all(sort_type == []
+                            for _, sort_type in self.client.calls))
@@ -0,0 +1,83 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the assembly of the report ZIP file of 'CodeChecker store'. """
+
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_report_converter.report import File, Report, report_file
+from codechecker_report_converter.report.parser.base import AnalyzerInfo
+
+from codechecker_client.cli import store
+from codechecker_client.content_hash import get_file_content_hash
+
+
+class AssembleZipTest(unittest.TestCase):
+    """
+    Test that the report ZIP of the same results is the same, so the upload
+    of it can be resumed.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.report_dir = os.path.join(self.tmp_dir.name, 'reports')
+        os.makedirs(self.report_dir)
+
+        self.source = os.path.join(self.tmp_dir.name, 'main.cpp')
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write('int main() { return 1 / 0; }\n')
+
+        with open(os.path.join(self.report_dir, 'metadata.json'), 'w',
+                  encoding='utf-8') as f:
+            json.dump({'version': 2, 'tools': []}, f)
+
+        for analyzer_name in ['clangsa', 'clang-tidy']:
+            report = Report(File(self.source), 1, 23, 'Division by zero',
+                            'core.DivideZero', report_hash=analyzer_name,
+                            analyzer_name=analyzer_name)
+            report_file.create(
+                os.path.join(self.report_dir,
+                             f'main.cpp_{analyzer_name}.plist'),
+                [report], None, AnalyzerInfo(analyzer_name))
+
+        self.client = mock.Mock()
+        self.client.getMissingContentHashes.side_effect = lambda hashes: hashes
+        self.client.getMissingContentHashesForBlameInfo.return_value = []
+
+        self.prod_client = mock.Mock()
+        self.prod_client.getCurrentProduct.return_value.reportLimit = 100
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def __assemble(self, name):
+        zip_file = os.path.join(self.tmp_dir.name, name)
+        store.assemble_zip([self.report_dir], zip_file, self.client,
+                           self.prod_client, None)
+        return zip_file
+
+    def test_same_zip(self):
+        """ Assembling the ZIP of the same results gives the same file. """
+        first = self.__assemble('first.zip')
+
+        # The modification time of the files is not stored in the ZIP.
+        for root, _, files in os.walk(self.tmp_dir.name):
+            for file_name in files:
+                path = os.path.join(root, file_name)
+                mtime = os.stat(path).st_mtime + 10
+                os.utime(path, (mtime, mtime))
+
+        second = self.__assemble('second.zip')
+
+        self.assertEqual(get_file_content_hash(first),
+                         get_file_content_hash(second))
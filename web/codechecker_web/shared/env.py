@@ -40,6 +40,21 @@ def get_session_file():
                                        ".codechecker.session.json"))
 
 
+def get_thrift_protocol():
+    """
+    Return the name of the Thrift protocol used by the command line client
+    to communicate with the server.
+    """
+    protocol = os.environ.get("CC_THRIFT_PROTOCOL", "json").lower()
+    if protocol not in ["json", "binary", "compact"]:
+        LOG.warning("Invalid CC_THRIFT_PROTOCOL value '%s', falling back to "
+                    "'json'. Valid values are: json, binary, compact.",
+                    protocol)
+        return "json"
+
+    return protocol
+
+
 def get_user_input(msg):
     """
     Get the user input.
@@ -0,0 +1,53 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Thrift protocols understood by the server, and the HTTP content types which
+identify them in the requests and the responses.
+"""
+from typing import Iterable
+
+from thrift.protocol import TBinaryProtocol, TCompactProtocol, TJSONProtocol
+
+
+# The content type of the JSON protocol. The Thrift HTTP clients send this
+# content type regardless of the protocol they use.
+JSON_CONTENT_TYPE = "application/x-thrift"
+
+CONTENT_TYPES = {
+    "json": JSON_CONTENT_TYPE,
+    "binary": "application/vnd.apache.thrift.binary",
+    "compact": "application/vnd.apache.thrift.compact"
+}
+
+PROTOCOL_FACTORIES = {
+    "json": TJSONProtocol.TJSONProtocolFactory,
+    "binary": TBinaryProtocol.TBinaryProtocolAcceleratedFactory,
+    "compact": TCompactProtocol.TCompactProtocolAcceleratedFactory
+}
+
+
+def get_protocol_name(content_types: Iterable[str]) -> str:
+    """
+    Returns the name of the protocol identified by the first of the given
+    Content-Type header values which belongs to a binary protocol. Requests
+    without such a value use the JSON protocol.
+    """
+    for content_type in content_types:
+        mime_type = content_type.split(';', 1)[0].strip().lower()
+        for name, protocol_content_type in CONTENT_TYPES.items():
+            if name != "json" and mime_type == protocol_content_type:
+                return name
+
+    return "json"
+
+
+def get_protocol_factory(name: str):
+    """
+    Returns a factory of the Thrift protocol with the given name.
+    """
+    return PROTOCOL_FACTORIES[name]()
@@ -21,8 +21,7 @@ from pathlib import Path
 import sqlalchemy
 import tempfile
 import time
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, \
-    cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
 import zipfile
 import zlib
 
@@ -33,7 +32,8 @@ from codechecker_common import skiplist_handler
 from codechecker_common.logger import get_logger
 from codechecker_common.review_status_handler import ReviewStatusHandler, \
     SourceReviewStatus
-from codechecker_common.util import format_size, load_json, path_for_fake_root
+from codechecker_common.util import chunks, format_size, load_json, \
+    path_for_fake_root
 
 from codechecker_report_converter import twodim
 from codechecker_report_converter.util import trim_path_prefixes
@@ -42,20 +42,25 @@ from codechecker_report_converter.report import \
 from codechecker_report_converter.report.hash import get_report_path_hash
 
 from ..database import db_cleanup
+from ..database.bulk_insert import insert_rows, reserve_ids
 from ..database.config_db_model import Product
 from ..database.database import DBSession
+from ..database.query_cache import bump_generation
+from ..database.report_counts import refresh_report_counts
 from ..database.run_db_model import \
     AnalysisInfo, AnalysisInfoChecker, AnalyzerStatistic, \
     BugPathEvent, BugReportPoint, \
     Checker, File, \
     ExtendedReportData, \
     File, FileContent, \
-    Report as DBReport, ReportAnnotations, ReviewStatus as ReviewStatusRule, \
+    Report as DBReport, ReportAnalysisInfo, ReportAnnotations, \
+    ReviewStatus as ReviewStatusRule, \
     Run, RunLock as DBRunLock, RunHistory, \
     TestCoverage, TestCoverageSummary
 from ..metadata import checker_is_unavailable, MetadataInfoParser
 
 from .report_annotations import report_annotation_types
+from .store_upload import StoreUpload
 from ..product import Product as ServerProduct
 from ..session_manager import SessionManager
 from ..task_executors.abstract_task import AbstractTask, TaskCancelHonoured
@@ -66,6 +71,10 @@ from .thrift_enum_helper import report_extended_data_type_str
 LOG = get_logger('server')
 STORE_TIME_LOG = get_logger('store_time')
 
+# The number of reports which are collected before they are inserted into the
+# database together with their bug paths, notes, etc.
+REPORT_INSERT_BATCH_SIZE = 1000
+
 
 class StepLog:
     """
@@ -228,6 +237,24 @@ class RunLock:
                   username, str(locked_at), self.__run_name)
 
 
+def extract_zip(run_name: str, zip_file, output_dir: Path):
+    """
+    Extracts the contents of the given ZIP file (a path or a file object) to
+    the output directory.
+    """
+    with StepLog(run_name, "Extract massStoreRun() ZIP contents"), \
+            zipfile.ZipFile(zip_file, 'r', allowZip64=True) as zip_handle:
+        LOG.debug("Extracting massStoreRun() ZIP '%s' to '%s' ...",
+                  getattr(zip_file, "name", zip_file), output_dir)
+        try:
+            zip_handle.extractall(output_dir)
+        except Exception:
+            LOG.error("Failed to extract received ZIP.")
+            import traceback
+            traceback.print_exc()
+            raise
+
+
 def unzip(run_name: str, b64zip: str, output_dir: Path) -> int:
     """
     This function unzips a Base64 encoded and ZLib-compressed ZIP file.
@@ -253,18 +280,8 @@ def unzip(run_name: str, b64zip: str, output_dir: Path) -> int:
                   (size / len(b64zip)),
                   timedelta(seconds=end_time - start_time))
 
-        with StepLog(run_name, "Extract massStoreRun() ZIP contents"), \
-                zipfile.ZipFile(zip_file, 'r', allowZip64=True) as zip_handle:
-            LOG.debug("Extracting massStoreRun() ZIP '%s' to '%s' ...",
-                      zip_file.name, output_dir)
-            try:
-                zip_handle.extractall(output_dir)
-                return size
-            except Exception:
-                LOG.error("Failed to extract received ZIP.")
-                import traceback
-                traceback.print_exc()
-                raise
+        extract_zip(run_name, zip_file, output_dir)
+        return size
 
 
 def get_file_content(file_path: str) -> bytes:
@@ -340,11 +357,16 @@ def add_file_record(
 
 
 def get_blame_file_data(
-    blame_file: Path
+    blame_file: Path,
+    commits: Optional[Dict[str, Dict]] = None
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Get blame information from the given file.
 
+    The blame files of version 'v2' don't contain the commits, these are
+    looked up in the given commits which are shared by every blame file of
+    the zip.
+
     It will return a tuple of 'blame information', 'remote url' and
     'tracking branch'.
     """
@@ -364,6 +386,17 @@ def get_blame_file_data(
             del blame_info["remote_url"]
             del blame_info["tracking_branch"]
 
+            if "commits" not in blame_info:
+                commit_hashes = {b["commit"] for b in blame_info["blame"]}
+                if commits is None or \
+                        any(h not in commits for h in commit_hashes):
+                    LOG.warning("Missing commits in blame file %s",
+                                blame_file)
+                    return None, remote_url, tracking_branch
+
+                blame_info["version"] = "v1"
+                blame_info["commits"] = {h: commits[h] for h in commit_hashes}
+
     return blame_info, remote_url, tracking_branch
 
 
@@ -372,6 +405,43 @@ def checker_name_for_report(report: Report) -> Tuple[str, str]:
             report.checker_name or UnknownChecker[1])
 
 
+def get_path_hash(
+    report: Report,
+    report_path_hash: str,
+    file_path_to_id: Dict[str, int]
+) -> str:
+    """
+    Returns the hash which identifies the stored form of the report: its bug
+    path, message and the database IDs of its source files. The file IDs
+    change if the content of a file changes, so a report pointing to an
+    outdated version of a file is not kept by a subsequent store.
+    """
+    file_ids = sorted(file_path_to_id[path] for path in report.trimmed_files)
+    return sha256(
+        f"{report_path_hash}|{report.message}|{file_ids}".encode()) \
+        .hexdigest()
+
+
+def get_fixed_at(
+    review_status: str,
+    old_report: Optional[DBReport],
+    run_history_time: datetime
+) -> Optional[datetime]:
+    """
+    False positive and intentional reports are considered as closed reports
+    which is indicated with non-null "fixed_at" date. A report which was
+    already closed by its previous review status keeps its date.
+    """
+    if review_status not in ['false_positive', 'intentional']:
+        return None
+
+    if old_report and old_report.review_status in \
+            ['false_positive', 'intentional']:
+        return old_report.fixed_at
+
+    return run_history_time
+
+
 class MassStoreRunInputHandler:
     """Prepares a `MassStoreRunTask` from an API input."""
 
@@ -395,8 +465,9 @@ class MassStoreRunInputHandler:
                  client_version: str,
                  force_overwrite_of_run: bool,
                  path_prefixes_to_trim: Optional[List[str]],
-                 zipfile_contents_base64: str,
-                 user_name: str):
+                 zipfile_contents_base64: Optional[str],
+                 user_name: str,
+                 upload: Optional[StoreUpload] = None):
         self._input_handling_start_time = time.time()
         self._session_manager = session_manager
         self._config_db = config_db_sessionmaker
@@ -404,6 +475,7 @@ class MassStoreRunInputHandler:
         self._tm = task_manager
         self._package_context = package_context
         self._input_zip_blob = zipfile_contents_base64
+        self._input_zip_upload = upload
         self.client_version = client_version
         self.force_overwrite_of_run = force_overwrite_of_run
         self.path_prefixes_to_trim = path_prefixes_to_trim
@@ -439,10 +511,15 @@ class MassStoreRunInputHandler:
         process's memory, as it records the task into the database and
         extracts things to the server's storage area.
         """
+        if self._input_zip_upload:
+            kind = "report_server::massStoreRunFromUpload()"
+        elif is_actually_asynchronous:
+            kind = "report_server::massStoreRunAsynchronous()"
+        else:
+            kind = "report_server::massStoreRun()"
+
         token = self._tm.allocate_task_record(
-            "report_server::massStoreRunAsynchronous()"
-            if is_actually_asynchronous
-            else "report_server::massStoreRun()",
+            kind,
             ("Legacy s" if not is_actually_asynchronous else "S") +
             f"tore of results to '{self._product.endpoint}' - "
             f"'{self.run_name}'",
@@ -455,9 +532,15 @@ class MassStoreRunInputHandler:
         try:
             with StepLog(self.run_name,
                          "Save massStoreRun() ZIP data to server storage"):
-                zip_size = unzip(self.run_name,
-                                 self._input_zip_blob,
-                                 extract_dir)
+                if self._input_zip_upload:
+                    zip_path = temp_dir / "store.zip"
+                    zip_size = self._input_zip_upload.finish(zip_path)
+                    extract_zip(self.run_name, zip_path, extract_dir)
+                    os.remove(zip_path)
+                else:
+                    zip_size = unzip(self.run_name,
+                                     self._input_zip_blob,
+                                     extract_dir)
 
                 if not zip_size:
                     raise RequestFailed(ErrorCode.GENERAL,
@@ -662,11 +745,16 @@ class MassStoreRun:
         self.__already_added_report_hashes: Set[str] = set()
         self.__new_report_hashes: Dict[str, Tuple] = {}
         self.__all_report_checkers: Set[str] = set()
-        self.__added_reports: List[Tuple[DBReport, Report]] = []
+        self.__stored_report_count: int = 0
+        self.__pending_reports: List[
+            Tuple[Dict[str, Any], Report, Optional[int]]] = []
+        self.__kept_reports: Dict[
+            int,
+            Tuple[DBReport, str, SourceReviewStatus, Optional[int]]] = {}
         self.__reports_with_fake_checkers: Dict[
-            # Either a DBReport *without* an ID, or the ID of a committed
-            # DBReport.
-            str, Tuple[Report, Union[DBReport, int]]] = {}
+            # The row of the report in the 'reports' table, which gets its
+            # "id" when the report is inserted.
+            str, Tuple[Report, Dict[str, Any]]] = {}
 
         with DBSession(config_db) as session:
             product = session.query(Product).get(self.__product.id)
@@ -728,6 +816,8 @@ class MassStoreRun:
         .zip file. This function stores blame info even if the corresponding
         source file is not in the .zip file.
         """
+        commits = load_json(self._zip_dir / "blame_commits.json", {})
+
         with DBSession(self.__product.session_factory) as session:
             for subdir, _, files in os.walk(blame_root):
                 for f in files:
@@ -735,7 +825,7 @@ class MassStoreRun:
                     blame_file = Path(subdir) / f
                     file_path = f"/{str(blame_file.relative_to(blame_root))}"
                     blame_info, remote_url, tracking_branch = \
-                        get_blame_file_data(blame_file)
+                        get_blame_file_data(blame_file, commits)
 
                     compressed_blame_info = None
                     if blame_info:
@@ -1119,9 +1209,13 @@ class MassStoreRun:
         detection_time: datetime,
         run_history_time: datetime,
         analysis_info: Optional[AnalysisInfo],
+        path_hash: str,
         fixed_at: Optional[datetime] = None
-    ) -> int:
-        """ Add report to the database. """
+    ):
+        """
+        Add report to the pending reports which are inserted into the database
+        by __insert_pending_reports().
+        """
         checker = self.__checker_for_report(session, report)
         if not checker:
             # It would be too easy to create a 'Checker' instance with the
@@ -1142,23 +1236,32 @@ class MassStoreRun:
                           FakeChecker[0], FakeChecker[1])
                 raise KeyError(FakeChecker[1])
 
-        db_report = DBReport(
-            file_path_to_id[report.file.path], run_id, report.report_hash,
-            checker, report.line, report.column,
-            len(report.bug_path_events), report.message, detection_status,
-            review_status.status, review_status.author,
-            review_status.message, run_history_time,
-            review_status.in_source, detection_time, fixed_at)
-        if analysis_info:
-            db_report.analysis_info.append(analysis_info)
-
-        session.add(db_report)
-        self.__added_reports.append((db_report, report))
-        if db_report.checker.checker_name == FakeChecker[1]:
+        report_row = {
+            "file_id": file_path_to_id[report.file.path],
+            "run_id": run_id,
+            "bug_id": report.report_hash,
+            "checker_id": checker.id,
+            "line": report.line,
+            "column": report.column,
+            "path_length": len(report.bug_path_events),
+            "checker_message": report.message,
+            "detection_status": detection_status,
+            "review_status": review_status.status,
+            "review_status_author": review_status.author,
+            "review_status_message": review_status.message,
+            "review_status_date": run_history_time,
+            "review_status_is_in_source": review_status.in_source,
+            "detected_at": detection_time,
+            "fixed_at": fixed_at,
+            "path_hash": path_hash
+        }
+
+        self.__pending_reports.append(
+            (report_row, report, analysis_info.id if analysis_info else None))
+        self.__stored_report_count += 1
+        if checker.checker_name == FakeChecker[1]:
             self.__reports_with_fake_checkers[report_path_hash] = \
-                (report, db_report)
-
-        return db_report.id
+                (report, report_row)
 
     def __get_faked_checkers(self) \
             -> Set[Tuple[str, str]]:
@@ -1172,22 +1275,6 @@ class MassStoreRun:
                    for report, _
                    in self.__reports_with_fake_checkers.values())
 
-    def __load_report_ids_for_reports_with_fake_checkers(self, session):
-        """
-        Transforms the __reports_with_fake_checkers data structure by loading
-        the report.id column in place for the DBReport ORM objects to allow
-        __realise_fake_checkers() to execute appropriately.
-
-        This must only be run **once** between the __add_report() sequence and
-        the __realise_fake_checkers() operation. The reports **MUST** have
-        been committed prior.
-        """
-        for rph, (report, db_report) in \
-                self.__reports_with_fake_checkers.items():
-            # Only load the "id" field from the database, not the entire row.
-            session.refresh(db_report, ["id"])
-            self.__reports_with_fake_checkers[rph] = (report, db_report.id)
-
     def __realise_fake_checkers(self, session):
         """
         __add_report() might leave some reports that have checker names in
@@ -1205,10 +1292,9 @@ class MassStoreRun:
         """
         grouped_by_checker: Dict[Tuple[str, str], List[int]] = \
             defaultdict(list)
-        for _, (report, db_id) in \
-                self.__reports_with_fake_checkers.items():
+        for report, report_row in self.__reports_with_fake_checkers.values():
             checker: Tuple[str, str] = checker_name_for_report(report)
-            grouped_by_checker[checker].append(cast(int, db_id))
+            grouped_by_checker[checker].append(report_row["id"])
 
         for checker, report_ids in grouped_by_checker.items():
             analyzer_name, checker_name = checker
@@ -1220,50 +1306,154 @@ class MassStoreRun:
                 .update({"checker_id": chk_obj.id},
                         synchronize_session=False)
 
-    def __add_report_context(self, session, file_path_to_id):
-        for db_report, report in self.__added_reports:
-            LOG.debug("Storing bug path positions.")
+    def __insert_pending_reports(self, session, file_path_to_id):
+        """
+        Insert the pending reports and their bug paths, notes, macro
+        expansions and annotations into the database with bulk inserts.
+        The IDs of the reports are reserved in advance, so the rows referring
+        to them don't have to wait for the reports to be inserted one by one.
+        """
+        if not self.__pending_reports:
+            return
+
+        report_ids = reserve_ids(session, DBReport.__table__,
+                                 len(self.__pending_reports))
+
+        report_rows = []
+        analysis_info_rows = []
+        bug_report_point_rows = []
+        bug_path_event_rows = []
+        extended_data_rows = []
+        annotation_rows = []
+
+        note_type = report_extended_data_type_str(
+            ttypes.ExtendedReportDataType.NOTE)
+        macro_type = report_extended_data_type_str(
+            ttypes.ExtendedReportDataType.MACRO)
+
+        for report_id, (report_row, report, analysis_info_id) in \
+                zip(report_ids, self.__pending_reports):
+            report_row["id"] = report_id
+            report_rows.append(report_row)
+
+            if analysis_info_id is not None:
+                analysis_info_rows.append({
+                    "report_id": report_id,
+                    "analysis_info_id": analysis_info_id})
+
             for idx, path_pos in enumerate(report.bug_path_positions):
-                session.add(BugReportPoint(
-                    path_pos.range.start_line, path_pos.range.start_col,
-                    path_pos.range.end_line, path_pos.range.end_col,
-                    idx, file_path_to_id[path_pos.file.path], db_report.id))
+                bug_report_point_rows.append({
+                    "line_begin": path_pos.range.start_line,
+                    "col_begin": path_pos.range.start_col,
+                    "line_end": path_pos.range.end_line,
+                    "col_end": path_pos.range.end_col,
+                    "order": idx,
+                    "file_id": file_path_to_id[path_pos.file.path],
+                    "report_id": report_id})
 
-            LOG.debug("Storing bug path events.")
             for idx, event in enumerate(report.bug_path_events):
-                session.add(BugPathEvent(
-                    event.range.start_line, event.range.start_col,
-                    event.range.end_line, event.range.end_col,
-                    idx, event.message, file_path_to_id[event.file.path],
-                    db_report.id))
-
-            LOG.debug("Storing notes.")
-            for note in report.notes:
-                data_type = report_extended_data_type_str(
-                    ttypes.ExtendedReportDataType.NOTE)
-
-                session.add(ExtendedReportData(
-                    note.range.start_line, note.range.start_col,
-                    note.range.end_line, note.range.end_col,
-                    note.message, file_path_to_id[note.file.path],
-                    db_report.id, data_type))
-
-            LOG.debug("Storing macro expansions.")
-            for macro in report.macro_expansions:
-                data_type = report_extended_data_type_str(
-                    ttypes.ExtendedReportDataType.MACRO)
-
-                session.add(ExtendedReportData(
-                    macro.range.start_line, macro.range.start_col,
-                    macro.range.end_line, macro.range.end_col,
-                    macro.message, file_path_to_id[macro.file.path],
-                    db_report.id, data_type))
+                bug_path_event_rows.append({
+                    "line_begin": event.range.start_line,
+                    "col_begin": event.range.start_col,
+                    "line_end": event.range.end_line,
+                    "col_end": event.range.end_col,
+                    "order": idx,
+                    "msg": event.message,
+                    "file_id": file_path_to_id[event.file.path],
+                    "report_id": report_id})
+
+            for data_type, items in ((note_type, report.notes),
+                                     (macro_type, report.macro_expansions)):
+                for item in items:
+                    extended_data_rows.append({
+                        "line_begin": item.range.start_line,
+                        "col_begin": item.range.start_col,
+                        "line_end": item.range.end_line,
+                        "col_end": item.range.end_col,
+                        "message": item.message,
+                        "file_id": file_path_to_id[item.file.path],
+                        "report_id": report_id,
+                        "type": data_type})
 
             if report.annotations:
-                self.__validate_and_add_report_annotations(
-                    session, db_report.id, report.annotations)
+                annotation_rows.extend(self.__validate_report_annotations(
+                    report_id, report.annotations))
 
-        session.flush()
+        LOG.debug("Inserting %d reports with %d bug path positions, %d bug "
+                  "path events and %d notes and macro expansions.",
+                  len(report_rows), len(bug_report_point_rows),
+                  len(bug_path_event_rows), len(extended_data_rows))
+
+        insert_rows(session, DBReport.__table__, report_rows)
+        insert_rows(session, ReportAnalysisInfo, analysis_info_rows)
+        insert_rows(session, BugReportPoint.__table__, bug_report_point_rows)
+        insert_rows(session, BugPathEvent.__table__, bug_path_event_rows)
+        insert_rows(session, ExtendedReportData.__table__, extended_data_rows)
+        insert_rows(session, ReportAnnotations.__table__, annotation_rows)
+
+        self.__pending_reports = []
+
+    def __update_kept_reports(
+        self,
+        session: DBSession,
+        run_id: int,
+        review_status_rules: Dict[int, ReviewStatusRule],
+        run_history_time: datetime
+    ):
+        """
+        Update the detection status, review status, fixed date and analysis
+        info of the reports which were kept from the previous store of the
+        run. Columns which did not change are not written, so storing the same
+        results again leaves these reports untouched.
+        """
+        linked_analysis_info = set(
+            session.query(ReportAnalysisInfo.c.report_id,
+                          ReportAnalysisInfo.c.analysis_info_id)
+            .join(DBReport, DBReport.id == ReportAnalysisInfo.c.report_id)
+            .filter(DBReport.run_id == run_id))
+
+        analysis_info_rows = []
+        for report_id, (_, _, _, analysis_info_id) in \
+                self.__kept_reports.items():
+            if analysis_info_id is not None and \
+                    (report_id, analysis_info_id) not in linked_analysis_info:
+                analysis_info_rows.append({
+                    "report_id": report_id,
+                    "analysis_info_id": analysis_info_id})
+
+        # The kept reports are linked to the analysis info of this store only,
+        # like the inserted ones.
+        from .report_server import SQLITE_MAX_VARIABLE_NUMBER
+        for chunk in chunks(iter(analysis_info_rows),
+                            SQLITE_MAX_VARIABLE_NUMBER):
+            session.execute(ReportAnalysisInfo.delete().where(
+                ReportAnalysisInfo.c.report_id.in_(
+                    [row["report_id"] for row in chunk])))
+        insert_rows(session, ReportAnalysisInfo, analysis_info_rows)
+
+        for report_id, (db_report, detection_status, review_status, _) in \
+                self.__kept_reports.items():
+            rule = review_status_rules.get(report_id)
+            if rule and not review_status.in_source:
+                review_status = SourceReviewStatus(
+                    status=rule.status, message=rule.message,
+                    author=review_status.author, date=review_status.date)
+
+            fixed_at = get_fixed_at(review_status.status, db_report,
+                                    run_history_time)
+
+            db_report.detection_status = detection_status
+            db_report.fixed_at = fixed_at
+
+            if (db_report.review_status, db_report.review_status_message,
+                    db_report.review_status_is_in_source) != \
+                    (review_status.status, review_status.message,
+                     review_status.in_source):
+                db_report.review_status = review_status.status
+                db_report.review_status_author = review_status.author
+                db_report.review_status_message = review_status.message
+                db_report.review_status_date = review_status.date
+                db_report.review_status_is_in_source = review_status.in_source
 
     def __process_report_file(
         self,
@@ -1274,7 +1464,8 @@ class MassStoreRun:
         run_history_time: datetime,
         skip_handler: skiplist_handler.SkipListHandler,
         review_status_handler: ReviewStatusHandler,
-        hash_map_reports: Dict[str, List[Any]]
+        hash_map_reports: Dict[str, List[Any]],
+        report_by_path_hash: Dict[str, DBReport]
     ) -> bool:
         """
         Process and save reports from the given report file to the database.
@@ -1325,9 +1516,16 @@ class MassStoreRun:
             detection_status = 'new'
             detected_at = run_history_time
 
-            old_report = None
-            if report.report_hash in hash_map_reports:
+            # A report which is already stored with the same path hash is
+            # kept, instead of removing and inserting it again.
+            path_hash = get_path_hash(report, report_path_hash,
+                                      file_path_to_id)
+            kept_report = report_by_path_hash.pop(path_hash, None)
+
+            old_report = kept_report
+            if not old_report and report.report_hash in hash_map_reports:
                 old_report = hash_map_reports[report.report_hash][0]
+            if old_report:
                 old_status = old_report.detection_status
                 detection_status = 'reopened' \
                     if old_status == 'resolved' else 'unresolved'
@@ -1346,53 +1544,59 @@ class MassStoreRun:
             review_status.author = self._user_name
             review_status.date = run_history_time
 
-            # False positive and intentional reports are considered as closed
-            # reports which is indicated with non-null "fixed_at" date.
-            fixed_at = None
-            if review_status.status in ['false_positive', 'intentional']:
+            self.__check_report_count()
+            if kept_report:
+                # The statuses of the kept reports are updated by
+                # __update_kept_reports(), when the review status rules
+                # applying to them are known.
+                self.__kept_reports[kept_report.id] = \
+                    (kept_report, detection_status, review_status,
+                     analysis_info.id if analysis_info else None)
+                self.__stored_report_count += 1
+            else:
                 # Keep in mind that now this is not handling review status
                 # rules, only review status source code comments
-                if old_report and old_report.review_status in \
-                        ['false_positive', 'intentional']:
-                    fixed_at = old_report.fixed_at
-                else:
-                    fixed_at = run_history_time
-
-            self.__check_report_count()
-            self.__add_report(session, run_id, report, report_path_hash,
-                              file_path_to_id, review_status, detection_status,
-                              detected_at, run_history_time, analysis_info,
-                              fixed_at)
+                fixed_at = get_fixed_at(review_status.status, old_report,
+                                        run_history_time)
+                self.__add_report(session, run_id, report, report_path_hash,
+                                  file_path_to_id, review_status,
+                                  detection_status, detected_at,
+                                  run_history_time, analysis_info, path_hash,
+                                  fixed_at)
 
             self.__new_report_hashes[report.report_hash] = \
                 review_status.status
             self.__already_added_report_hashes.add(report_path_hash)
 
+            if len(self.__pending_reports) >= REPORT_INSERT_BATCH_SIZE:
+                self.__insert_pending_reports(session, file_path_to_id)
+
             LOG.debug("Storing report done. "
                       "path_hash=%s, bug_id/report_hash=%s, source_file=%s",
                       report_path_hash, report.report_hash, report_file_path)
 
         return True
 
-    def __validate_and_add_report_annotations(
-        self,
-        session: DBSession,
+    @staticmethod
+    def __validate_report_annotations(
         report_id: int,
         report_annotation: Dict
-    ):
+    ) -> List[Dict[str, Any]]:
         """
         This function checks the format of the annotations. For example a
         "timestamp" annotation must be in datetime format. If the format
         doesn't match then an exception is thrown. In case of proper format the
-        annotation is added to the database.
+        rows of the annotations are returned to be added to the database.
         """
+        annotation_rows = []
         for key, value in report_annotation.items():
             try:
                 # String conversion is for normalizing the format. For example,
                 # "2000-01-01T10:20" timestamp will be stored as
                 # "2000-01-01 10:20".
                 value = str(report_annotation_types[key]["func"](value))
-                session.add(ReportAnnotations(report_id, key, value))
+                annotation_rows.append(
+                    {"report_id": report_id, "key": key, "value": value})
             except KeyError:
                 # pylint: disable=raise-missing-from
                 raise RequestFailed(
@@ -1406,13 +1610,15 @@ class MassStoreRun:
                     f"'{value}' has wrong format. '{key}' annotations must be "
                     f"'{report_annotation_types[key]['display']}'.")
 
+        return annotation_rows
+
     def __check_report_count(self):
         """
         This method comparest the already added report count to the report
         limit, Raises exception if the number of reports is more than the
         that is configured for the product.
         """
-        if len(self.__added_reports) >= self.__report_limit:
+        if self.__stored_report_count >= self.__report_limit:
             LOG.error("The number of reports in the given report folder is " +
                       "larger than the allowed." +
                       f"The limit: {self.__report_limit}!")
@@ -1463,14 +1669,18 @@ class MassStoreRun:
         self.__already_added_report_hashes = set()
         self.__new_report_hashes = {}
         self.__all_report_checkers = set()
+        self.__kept_reports = {}
 
         all_reports = session.query(DBReport) \
             .filter(DBReport.run_id == run_id) \
             .all()
 
         report_to_report_id = defaultdict(list)
+        report_by_path_hash: Dict[str, DBReport] = {}
         for db_report in all_reports:
             report_to_report_id[db_report.bug_id].append(db_report)
+            if db_report.path_hash:
+                report_by_path_hash[db_report.path_hash] = db_report
 
         enabled_checkers: Set[str] = set()
         disabled_checkers: Set[str] = set()
@@ -1505,37 +1715,33 @@ class MassStoreRun:
                 self.__process_report_file(
                     report_file_path, session, run_id,
                     file_path_to_id, run_history_time,
-                    skip_handler, review_status_handler, report_to_report_id)
+                    skip_handler, review_status_handler, report_to_report_id,
+                    report_by_path_hash)
                 processed_result_file_count += 1
 
-        session.flush()
-
-        self.__add_report_context(session, file_path_to_id)
+        self.__insert_pending_reports(session, file_path_to_id)
         # Get all relevant review_statuses for the newly stored reports
         # CHHECK: Call self.getReviewStatusRules instead of the below query
         # but before first check the performance
         reports_to_rs_rules = session.query(ReviewStatusRule, DBReport) \
             .join(DBReport, DBReport.bug_id == ReviewStatusRule.bug_hash) \
-            .filter(sqlalchemy.and_(
-                DBReport.run_id == run_id,
-                DBReport.review_status_is_in_source.is_(False)))
+            .filter(DBReport.run_id == run_id)
 
         # Set the newly stored reports
+        kept_report_rules: Dict[int, ReviewStatusRule] = {}
         for review_status, db_report in reports_to_rs_rules:
             if db_report.bug_id not in self.__new_report_hashes:
                 continue
+            if db_report.id in self.__kept_reports:
+                kept_report_rules[db_report.id] = review_status
+                continue
+            if db_report.review_status_is_in_source:
+                continue
             old_report = None
             if db_report.bug_id in report_to_report_id:
                 old_report = report_to_report_id[db_report.bug_id][0]
-            fixed_at = None
-            if review_status.status in ['false_positive', 'intentional']:
-                # Keep in mind that now this is not handling review status
-                # rules, only review status source code comments
-                if old_report and old_report.review_status in \
-                        ['false_positive', 'intentional']:
-                    fixed_at = old_report.fixed_at
-                else:
-                    fixed_at = run_history_time
+            fixed_at = get_fixed_at(review_status.status, old_report,
+                                    run_history_time)
 
             db_report.review_status = review_status.status
             db_report.review_statuses_author = review_status.author
@@ -1544,6 +1750,8 @@ class MassStoreRun:
             db_report.fixed_at = fixed_at
             db_report.review_status_is_in_source = False
 
+        self.__update_kept_reports(session, run_id, kept_report_rules,
+                                   run_history_time)
         session.flush()
 
         LOG.info("[%s] Processed %d analyzer result file(s).", self._name,
@@ -1561,7 +1769,8 @@ class MassStoreRun:
         reports_to_delete = set()
         for bug_hash, reports in report_to_report_id.items():
             if bug_hash in self.__new_report_hashes:
-                reports_to_delete.update([x.id for x in reports])
+                reports_to_delete.update([x.id for x in reports
+                                          if x.id not in self.__kept_reports])
             else:
                 for report in reports:
                     checker_name: str = report.checker.checker_name
@@ -1827,10 +2036,12 @@ class MassStoreRun:
                             session, report_dir, source_root, run_id,
                             file_path_to_id, run_history_time)
 
+                    with StepLog(self._name, "Summarize report counts"):
+                        refresh_report_counts(session, [run_id])
+
                     self.__graceful_cancel_if_requested()
+                    bump_generation(session)
                     session.commit()
-                    self.__load_report_ids_for_reports_with_fake_checkers(
-                        session)
 
                 # The task should not be cancelled after this point, as the
                 # "main" bulk of the modifications to the database had already
@@ -1857,8 +2068,10 @@ class MassStoreRun:
                         with StepLog(self._name,
                                      "Fix-up report-to-checker associations"):
                             self.__realise_fake_checkers(session)
+                            refresh_report_counts(session, [run_id])
 
                     self.finish_checker_run(session, run_id)
+                    bump_generation(session)
                     session.commit()
 
                 end_time = time.time()
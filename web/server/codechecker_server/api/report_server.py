@@ -22,13 +22,13 @@ import zlib
 from copy import deepcopy
 from collections import OrderedDict, defaultdict, namedtuple
 from datetime import datetime, timedelta
+from functools import wraps
 from typing import Any, Collection, Dict, List, Optional, Set, Tuple
 
 import sqlalchemy
 from sqlalchemy.sql.expression import or_, and_, not_, func, \
-    asc, desc, union_all, select, bindparam, literal_column, case, cast
+    asc, desc, select, literal_column, case, cast
 from sqlalchemy.orm import contains_eager
-from sqlalchemy.types import ARRAY, String
 
 import codechecker_api_shared
 from codechecker_api.codeCheckerDBAccess_v6 import constants, ttypes
@@ -42,11 +42,12 @@ from codechecker_api.codeCheckerDBAccess_v6.ttypes import \
     Order, \
     ReportData, ReportDetails, ReportStatus, ReviewData, ReviewStatusRule, \
     ReviewStatusRuleFilter, ReviewStatusRuleSortMode, \
-    ReviewStatusRuleSortType, Rule, RunData, RunFilter, RunHistoryData, \
-    RunReportCount, RunSortType, RunTagCount, \
+    ReviewStatusRuleSortType, Rule, RunData, RunDataPage, RunFilter, \
+    RunHistoryData, RunHistoryDataPage, RunReportCount, RunResultsPage, \
+    RunSortType, RunTagCount, \
     ReviewStatus as API_ReviewStatus, \
     SourceComponentData, SourceFileData, SortMode, SortType, \
-    SubmittedRunOptions
+    StoreUploadStatus, SubmittedRunOptions
 
 from codechecker_common import util
 from codechecker_common.logger import get_logger
@@ -58,8 +59,13 @@ from codechecker_server.profiler import timeit
 
 from .. import permissions
 from ..database import db_cleanup
+from ..database.bulk_insert import temporary_values
 from ..database.config_db_model import Product
 from ..database.database import conv, DBSession, escape_like
+from ..database.query_cache import bump_generation, get_cache_key, \
+    get_generation
+from ..database.report_counts import refresh_report_counts, \
+    update_review_status_counts
 from ..database.run_db_model import \
     AnalysisInfo, AnalysisInfoChecker as DB_AnalysisInfoChecker, \
     AnalyzerStatistic, \
@@ -67,7 +73,8 @@ from ..database.run_db_model import \
     CleanupPlan, CleanupPlanReportHash, Checker, Comment, \
     ExtendedReportData, \
     File, FileContent, \
-    Report, ReportAnnotations, ReportAnalysisInfo, ReviewStatus, \
+    Report, ReportAnnotations, ReportAnalysisInfo, ReportCount, \
+    ReviewStatus, \
     Run, RunHistory, RunHistoryAnalysisInfo, RunLock, \
     SourceComponent, TestCoverage
 
@@ -76,6 +83,7 @@ from .thrift_enum_helper import detection_status_enum, \
     detection_status_str, report_status_enum, \
     review_status_enum, review_status_str, report_extended_data_type_enum
 from .report_annotations import report_annotation_types
+from .store_upload import CHUNK_SIZE, StoreUpload, remove_stale_uploads
 
 # These names are inherited from Thrift stubs.
 # pylint: disable=invalid-name
@@ -85,7 +93,6 @@ LOG = get_logger('server')
 GEN_OTHER_COMPONENT_NAME = "Other (auto-generated)"
 
 SQLITE_MAX_VARIABLE_NUMBER = 999
-SQLITE_MAX_COMPOUND_SELECT = 500
 
 
 class CommentKindValue:
@@ -279,26 +286,7 @@ def process_report_filter(
         AND.append(or_(*OR))
 
     if report_filter.reportStatus:
-        dst = list(map(detection_status_str,
-                       (DetectionStatus.NEW,
-                        DetectionStatus.UNRESOLVED,
-                        DetectionStatus.REOPENED)))
-        rst = list(map(review_status_str,
-                       (API_ReviewStatus.UNREVIEWED,
-                        API_ReviewStatus.CONFIRMED)))
-
-        OR = []
-        filter_query = and_(
-            Report.review_status.in_(rst),
-            Report.detection_status.in_(dst)
-        )
-        if ReportStatus.OUTSTANDING in report_filter.reportStatus:
-            OR.append(filter_query)
-
-        if ReportStatus.CLOSED in report_filter.reportStatus:
-            OR.append(not_(filter_query))
-
-        AND.append(or_(*OR))
+        AND.append(get_report_status_filter(report_filter.reportStatus))
 
     if report_filter.detectionStatus:
         dst = list(map(detection_status_str,
@@ -392,6 +380,137 @@ def process_report_filter(
     return filter_expr, join_tables
 
 
+def get_report_status_filter(report_statuses, tbl=Report):
+    """ Get the filter of the outstanding or closed reports. """
+    dst = list(map(detection_status_str,
+                   (DetectionStatus.NEW,
+                    DetectionStatus.UNRESOLVED,
+                    DetectionStatus.REOPENED)))
+    rst = list(map(review_status_str,
+                   (API_ReviewStatus.UNREVIEWED,
+                    API_ReviewStatus.CONFIRMED)))
+
+    OR = []
+    filter_query = and_(
+        tbl.review_status.in_(rst),
+        tbl.detection_status.in_(dst)
+    )
+    if ReportStatus.OUTSTANDING in report_statuses:
+        OR.append(filter_query)
+
+    if ReportStatus.CLOSED in report_statuses:
+        OR.append(not_(filter_query))
+
+    return or_(*OR)
+
+
+def is_report_count_filter(report_filter, cmp_data) -> bool:
+    """
+    True if the reports of the filter can be counted by the report count
+    summary, i.e. the filter uses only the run, checker, file, detection
+    status and review status of the reports.
+    """
+    if not is_cmp_data_empty(cmp_data):
+        return False
+
+    if report_filter is None:
+        return True
+
+    if report_filter.filepath and report_filter.fileMatchesAnyPoint:
+        return False
+
+    return not any([report_filter.isUnique,
+                    report_filter.checkerMsg,
+                    report_filter.reportHash is not None,
+                    report_filter.runHistoryTag,
+                    report_filter.firstDetectionDate is not None,
+                    report_filter.fixDate is not None,
+                    report_filter.runTag,
+                    report_filter.componentNames,
+                    report_filter.bugPathLength is not None,
+                    report_filter.date,
+                    report_filter.openReportsDate,
+                    report_filter.cleanupPlanNames,
+                    report_filter.annotations is not None])
+
+
+def process_report_count_filter(run_ids, report_filter):
+    """
+    Process the report filter on the report count summary. Only the filters
+    accepted by is_report_count_filter() are handled.
+    """
+    AND = []
+    join_tables = []
+
+    if run_ids:
+        AND.append(ReportCount.run_id.in_(run_ids))
+
+    if report_filter is None:
+        return and_(*AND), join_tables
+
+    if report_filter.filepath:
+        OR = [File.filepath.ilike(conv(fp))
+              for fp in report_filter.filepath]
+        AND.append(or_(*OR))
+        join_tables.append(File)
+
+    if report_filter.analyzerNames or report_filter.checkerName \
+            or report_filter.severity:
+        if report_filter.analyzerNames:
+            OR = [Checker.analyzer_name.ilike(conv(an))
+                  for an in report_filter.analyzerNames]
+            AND.append(or_(*OR))
+
+        if report_filter.checkerName:
+            OR = [Checker.checker_name.ilike(conv(cn))
+                  for cn in report_filter.checkerName]
+            AND.append(or_(*OR))
+
+        if report_filter.severity:
+            AND.append(Checker.severity.in_(report_filter.severity))
+
+        join_tables.append(Checker)
+
+    if report_filter.runName:
+        OR = [Run.name.ilike(conv(rn))
+              for rn in report_filter.runName]
+        AND.append(or_(*OR))
+        join_tables.append(Run)
+
+    if report_filter.reportStatus:
+        AND.append(get_report_status_filter(report_filter.reportStatus,
+                                            ReportCount))
+
+    if report_filter.detectionStatus:
+        dst = list(map(detection_status_str,
+                       report_filter.detectionStatus))
+        AND.append(ReportCount.detection_status.in_(dst))
+
+    if report_filter.reviewStatus:
+        AND.append(ReportCount.review_status.in_(
+            list(map(review_status_str, report_filter.reviewStatus))))
+
+    return and_(*AND), join_tables
+
+
+def get_report_count_query(session, run_ids, report_filter, columns,
+                           tables=None):
+    """
+    Get the number of the filtered reports grouped by the given columns from
+    the report count summary. The tables of the columns have to be given.
+    """
+    filter_expression, join_tables = process_report_count_filter(
+        run_ids, report_filter)
+
+    q = session.query(*columns, func.sum(ReportCount.count)) \
+        .select_from(ReportCount)
+
+    q = apply_report_filter(q, filter_expression,
+                            join_tables + list(tables or []), tbl=ReportCount)
+
+    return q.group_by(*columns) if columns else q
+
+
 def process_source_component_filter(session, component_names):
     """ Process source component filter.
 
@@ -644,6 +763,63 @@ def get_diff_bug_id_filter(run_ids, tag_ids, open_reports_date):
     return and_(*AND)
 
 
+def get_diff_hashes(session, run_ids, report_hashes, diff_type,
+                    skip_statuses_str, tag_ids, old_client=False):
+    """
+    Returns the hashes of the reports which are new, resolved or unresolved
+    in the given runs and tags compared to the given report hashes.
+
+    The report hashes are loaded into a temporary table which is joined by
+    the queries, so the number of hashes is not limited by the number of
+    bound parameters or compound selects of the database.
+
+    An old client (i.e. API version before 6.50) doesn't consider false
+    positive and intentional reports closed, see
+    filter_open_reports_in_tags_old().
+    """
+    filter_open_reports = filter_open_reports_in_tags_old if old_client \
+        else filter_open_reports_in_tags
+
+    if diff_type not in [DiffType.NEW, DiffType.RESOLVED,
+                         DiffType.UNRESOLVED]:
+        return []
+
+    if diff_type == DiffType.NEW and not report_hashes:
+        return []
+
+    with temporary_values(session, 'diff_report_hashes',
+                          report_hashes or []) as hashes:
+        if diff_type == DiffType.NEW:
+            base_hashes = session.query(Report.bug_id.label('bug_id')) \
+                .filter(Report.detection_status.notin_(skip_statuses_str))
+
+            if not old_client:
+                base_hashes = base_hashes.filter(Report.fixed_at.is_(None))
+            base_hashes = filter_open_reports(base_hashes, run_ids, tag_ids)
+
+            q = session.query(hashes.c.value).except_(base_hashes)
+        elif diff_type == DiffType.RESOLVED:
+            q = session.query(Report.bug_id) \
+                .outerjoin(hashes, hashes.c.value == Report.bug_id)
+
+            if old_client:
+                q = q.filter(hashes.c.value.is_(None))
+            else:
+                q = q.filter(or_(hashes.c.value.is_(None),
+                                 Report.fixed_at.isnot(None)))
+            q = filter_open_reports(q, run_ids, tag_ids)
+        else:
+            q = session.query(Report.bug_id) \
+                .join(hashes, hashes.c.value == Report.bug_id) \
+                .filter(Report.detection_status.notin_(skip_statuses_str))
+
+            if not old_client:
+                q = q.filter(Report.fixed_at.is_(None))
+            q = filter_open_reports(q, run_ids, tag_ids)
+
+        return [res[0] for res in q]
+
+
 def get_diff_run_id_query(session, run_ids, tag_ids):
     """ Get run id query for diff. """
     q = session.query(Run.id.distinct())
@@ -961,25 +1137,28 @@ def create_review_data(
 
 def apply_report_filter(q, filter_expression,
                         join_tables: List[Any],
-                        already_joined_tables: Optional[List[Any]] = None):
+                        already_joined_tables: Optional[List[Any]] = None,
+                        tbl=Report):
     """
     Applies the given filter expression and joins the Checker, File, Run, and
     RunHistory tables if necessary based on join_tables parameter. If a table
     is already joined by the main query and this is indicated, that will not
     be joined by this function to prevent a "duplicate alias" error.
+    The tables are joined to the reports or to the report count summary.
     """
-    def needs_join(tbl):
-        return tbl in join_tables and (already_joined_tables is None or
-                                       tbl not in already_joined_tables)
+    def needs_join(join_tbl):
+        return join_tbl in join_tables and \
+            (already_joined_tables is None or
+             join_tbl not in already_joined_tables)
 
     if needs_join(Checker):
-        q = q.join(Checker, Report.checker_id == Checker.id)
+        q = q.join(Checker, tbl.checker_id == Checker.id)
     if needs_join(File):
-        q = q.outerjoin(File, Report.file_id == File.id)
+        q = q.outerjoin(File, tbl.file_id == File.id)
     if needs_join(Run):
-        q = q.outerjoin(Run, Run.id == Report.run_id)
+        q = q.outerjoin(Run, Run.id == tbl.run_id)
     if needs_join(RunHistory):
-        q = q.outerjoin(RunHistory, RunHistory.run_id == Report.run_id)
+        q = q.outerjoin(RunHistory, RunHistory.run_id == tbl.run_id)
 
     return q.filter(filter_expression)
 
@@ -1027,6 +1206,141 @@ def sort_results_query(query, sort_types, sort_type_map, order_type_map,
     return query
 
 
+def get_sort_keys(sort_types, sort_type_map, columns, table=None):
+    """
+    Returns the (column, order) pairs of the ORDER BY clause which is created
+    by sort_results_query(). The columns which are referred by their label
+    are looked up in the given columns. If a table is given, the columns are
+    translated to the corresponding columns of the table (e.g. a subquery).
+    """
+    columns = {c.name: c for c in columns}
+
+    sort_keys = []
+    for sort in sort_types:
+        for sort_col, label in sort_type_map.get(sort.type):
+            if isinstance(sort_col, str):
+                sort_col = columns.get(label)
+            if sort_col is not None and table is not None:
+                sort_col = table.corresponding_column(sort_col)
+            if sort_col is None:
+                sort_col = sqlalchemy.null()
+            sort_keys.append((sort_col, sort.ord))
+
+    return sort_keys
+
+
+def get_sort_key_columns(sort_keys):
+    """
+    Returns the labeled sort key columns which can be added to a query to
+    get the sort key values of the last row for the cursor of the next page.
+    """
+    return [sort_col.label(f"sort_key_{i}")
+            for i, (sort_col, _) in enumerate(sort_keys)]
+
+
+def encode_cursor(values) -> str:
+    """
+    Encodes the sort key values of the last row of a page to the opaque
+    cursor of the next page.
+    """
+    def encode_value(value):
+        if isinstance(value, datetime):
+            return {'datetime': value.isoformat()}
+        raise TypeError(f"Unsupported sort key value: {value!r}")
+
+    return base64.urlsafe_b64encode(
+        json.dumps(values, default=encode_value).encode('utf-8')) \
+        .decode('ascii')
+
+
+def decode_cursor(cursor: str, sort_keys) -> List[Any]:
+    """
+    Decodes the sort key values from a cursor which was returned by
+    encode_cursor() for the same sort keys.
+    """
+    def decode_value(obj):
+        if 'datetime' in obj:
+            return datetime.fromisoformat(obj['datetime'])
+        return obj
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor),
+                            object_hook=decode_value)
+    except (ValueError, TypeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != len(sort_keys):
+        raise codechecker_api_shared.ttypes.RequestFailed(
+            codechecker_api_shared.ttypes.ErrorCode.GENERAL,
+            f"Invalid cursor: {cursor}")
+
+    return values
+
+
+def get_keyset_filter(sort_keys, values, nulls_first):
+    """
+    Returns the filter expression of the rows which come after the row with
+    the given sort key values in the order of the sort keys. This way a page
+    can be queried by seeking past the last row of the previous page instead
+    of skipping the previous pages with an OFFSET.
+
+    The NULL values are ordered like the database does by default: they are
+    smaller than any other value if "nulls_first" is true (SQLite), and
+    greater otherwise (PostgreSQL).
+    """
+    def greater(column, value):
+        if value is None:
+            return column.isnot(None) if nulls_first else sqlalchemy.false()
+        if nulls_first:
+            return column > value
+        return or_(column > value, column.is_(None))
+
+    def less(column, value):
+        if value is None:
+            return sqlalchemy.false() if nulls_first else column.isnot(None)
+        if nulls_first:
+            return or_(column < value, column.is_(None))
+        return column < value
+
+    def equal(column, value):
+        return column.is_(None) if value is None else column == value
+
+    # (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ... expanded, because SQLite
+    # doesn't compare row values with mixed ordering directions.
+    OR = []
+    for i, ((column, order), value) in enumerate(zip(sort_keys, values)):
+        after = greater if order == Order.ASC else less
+        OR.append(and_(*[equal(c, v) for (c, _), v
+                         in zip(sort_keys[:i], values[:i])],
+                       after(column, value)))
+
+    seek = or_(*OR)
+
+    # A plain range condition on the first sort key lets the database find
+    # the first row of the page in an index on this column.
+    (column, order), value = sort_keys[0], values[0]
+    if len(sort_keys) > 1 and value is not None:
+        if order == Order.ASC and nulls_first:
+            seek = and_(column >= value, seek)
+        elif order == Order.DESC and not nulls_first:
+            seek = and_(column <= value, seek)
+
+    return seek
+
+
+def split_page(rows, limit, get_sort_key_values):
+    """
+    Returns the page from the rows of a query which was limited to one more
+    row than the page size, and the cursor of the next page. The cursor is
+    None if there are no more rows after this page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor(get_sort_key_values(rows[-1]))
+
+
 def filter_unresolved_reports(q):
     """
     Filter reports which are unresolved.
@@ -1068,26 +1382,35 @@ def check_remove_runs_lock(session, run_ids):
             f"are locked: {', '.join([r[0] for r in run_locks])}")
 
 
-def sort_run_data_query(query, sort_mode):
+def get_run_data_sort_keys(sort_mode, report_count):
     """
-    Sort run data query by the given sort type.
+    Returns the (column, order) pairs of the run data query for the given sort
+    mode. "report_count" is the column of the unresolved report counts.
     """
     # Sort by run date by default.
     if not sort_mode:
-        return query.order_by(desc(Run.date))
+        return [(Run.date, Order.DESC)]
+
+    sort_type_map = {
+        RunSortType.NAME: Run.name,
+        RunSortType.UNRESOLVED_REPORTS: report_count,
+        RunSortType.DATE: Run.date,
+        RunSortType.DURATION: Run.duration,
+        RunSortType.CC_VERSION: RunHistory.cc_version}
+
+    if sort_mode.type not in sort_type_map:
+        return []
+
+    return [(sort_type_map[sort_mode.type], sort_mode.ord)]
+
 
+def sort_run_data_query(query, sort_mode):
+    """
+    Sort run data query by the given sort type.
+    """
     order_type_map = {Order.ASC: asc, Order.DESC: desc}
-    order_type = order_type_map.get(sort_mode.ord)
-    if sort_mode.type == RunSortType.NAME:
-        query = query.order_by(order_type(Run.name))
-    elif sort_mode.type == RunSortType.UNRESOLVED_REPORTS:
-        query = query.order_by(order_type('report_count'))
-    elif sort_mode.type == RunSortType.DATE:
-        query = query.order_by(order_type(Run.date))
-    elif sort_mode.type == RunSortType.DURATION:
-        query = query.order_by(order_type(Run.duration))
-    elif sort_mode.type == RunSortType.CC_VERSION:
-        query = query.order_by(order_type(RunHistory.cc_version))
+    for sort_col, order in get_run_data_sort_keys(sort_mode, 'report_count'):
+        query = query.order_by(order_type_map.get(order)(sort_col))
 
     return query
 
@@ -1348,6 +1671,19 @@ def remove_reports(session: DBSession,
             .delete(synchronize_session=False)
 
 
+def cached_query(function):
+    """
+    Serves the results of the decorated report query API function from the
+    query result cache of the product, keyed by the arguments of the call.
+    """
+    @wraps(function)
+    def wrapper(self, *args):
+        return self._get_cached_result(function.__name__, args,
+                                       lambda: function(self, *args))
+
+    return wrapper
+
+
 class ThriftRequestHandler:
     """
     Connect to database and handle thrift client requests.
@@ -1428,6 +1764,25 @@ class ThriftRequestHandler:
             permissions.PERMISSION_VIEW
         ])
 
+    def _get_cached_result(self, name, args, query):
+        """
+        Returns the result of the given report query API call from the query
+        result cache of the product, or runs the query if the result is not
+        cached. A cached result is returned without running the API function,
+        so the view permission is checked here.
+        """
+        self.__require_view()
+
+        cache = self._product.query_cache
+        if not cache:
+            return query()
+
+        with DBSession(self._Session) as session:
+            generation = get_generation(session)
+
+        return cache.get_or_compute(generation, get_cache_key(name, args),
+                                    query)
+
     def __add_comment(self, bug_id, message, kind=CommentKindValue.USER,
                       date=None):
         """ Creates a new comment object. """
@@ -1444,6 +1799,28 @@ class ThriftRequestHandler:
 
         limit = verify_limit_range(limit)
 
+        run_data, _ = self.__get_run_data(run_filter, limit, offset,
+                                          sort_mode)
+        return run_data
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def getRunDataPage(self, run_filter, limit, cursor, sort_mode):
+        self.__require_view()
+
+        limit = verify_limit_range(limit)
+
+        run_data, next_cursor = self.__get_run_data(run_filter, limit, 0,
+                                                    sort_mode, True, cursor)
+        return RunDataPage(runs=run_data, nextCursor=next_cursor)
+
+    def __get_run_data(self, run_filter, limit, offset, sort_mode,
+                       keyset=False, cursor=None):
+        """
+        Get the runs of a page and the cursor of the next page. The page
+        starts after the given cursor in keyset pagination mode, otherwise
+        at the given offset.
+        """
         with DBSession(self._Session) as session:
 
             # Count the reports subquery.
@@ -1485,11 +1862,26 @@ class ThriftRequestHandler:
 
             q = sort_run_data_query(q, sort_mode)
 
-            if limit:
-                q = q.limit(limit).offset(offset)
+            next_cursor = None
+            if keyset:
+                sort_keys = get_run_data_sort_keys(
+                    sort_mode, stmt.c.report_count) + [(Run.id, Order.ASC)]
+
+                q = q.order_by(Run.id)
+                if cursor:
+                    q = q.filter(get_keyset_filter(
+                        sort_keys, decode_cursor(cursor, sort_keys),
+                        session.bind.dialect.name == "sqlite"))
+
+                run_data, next_cursor = split_page(
+                    q.limit(limit + 1).all(), limit,
+                    lambda row: [row._mapping[c] for c, _ in sort_keys])
+            else:
+                if limit:
+                    q = q.limit(limit).offset(offset)
 
-            # Get the runs.
-            run_data = q.all()
+                # Get the runs.
+                run_data = q.all()
 
             # Set run ids filter by using the previous results.
             if not run_filter:
@@ -1538,7 +1930,7 @@ class ThriftRequestHandler:
                                        codeCheckerVersion=cc_version,
                                        analyzerStatistics=analyzer_stats,
                                        description=description))
-            return results
+            return results, next_cursor
 
     @exc_to_thrift_reqfail
     @timeit
@@ -1647,6 +2039,27 @@ class ThriftRequestHandler:
 
         limit = verify_limit_range(limit)
 
+        results, _ = self.__get_run_history(run_ids, limit, offset,
+                                            run_history_filter)
+        return results
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def getRunHistoryPage(self, run_ids, limit, cursor, run_history_filter):
+        self.__require_view()
+
+        limit = verify_limit_range(limit)
+
+        results, next_cursor = self.__get_run_history(
+            run_ids, limit, 0, run_history_filter, True, cursor)
+        return RunHistoryDataPage(runHistory=results, nextCursor=next_cursor)
+
+    def __get_run_history(self, run_ids, limit, offset, run_history_filter,
+                          keyset=False, cursor=None):
+        """
+        Get the run history of a page and the cursor of the next page, like
+        __get_run_data() does.
+        """
         with DBSession(self._Session) as session:
 
             res = session.query(RunHistory)
@@ -1655,7 +2068,21 @@ class ThriftRequestHandler:
 
             res = res.order_by(RunHistory.time.desc())
 
-            if limit:
+            next_cursor = None
+            if keyset:
+                sort_keys = [(RunHistory.time, Order.DESC),
+                             (RunHistory.id, Order.DESC)]
+
+                res = res.order_by(RunHistory.id.desc())
+                if cursor:
+                    res = res.filter(get_keyset_filter(
+                        sort_keys, decode_cursor(cursor, sort_keys),
+                        session.bind.dialect.name == "sqlite"))
+
+                res, next_cursor = split_page(
+                    res.limit(limit + 1).all(), limit,
+                    lambda history: [history.time, history.id])
+            elif limit:
                 res = res.limit(limit).offset(offset)
 
             results = []
@@ -1678,7 +2105,7 @@ class ThriftRequestHandler:
                     analyzerStatistics=analyzer_statistics,
                     description=history.description))
 
-            return results
+            return results, next_cursor
 
     @exc_to_thrift_reqfail
     @timeit
@@ -1764,101 +2191,49 @@ class ThriftRequestHandler:
                              for status in skip_detection_statuses]
 
         with DBSession(self._Session) as session:
-            if diff_type == DiffType.NEW:
-                # In postgresql we can select multiple rows filled with
-                # constants by using `unnest` function. In sqlite we have to
-                # use multiple UNION ALL.
-
-                if not report_hashes:
-                    return []
-
-                base_hashes = session.query(Report.bug_id.label('bug_id')) \
-                    .outerjoin(File, Report.file_id == File.id)
-
-                if client_version >= (6, 50):
-                    base_hashes = base_hashes.filter(
-                        Report.detection_status.notin_(skip_statuses_str),
-                        Report.fixed_at.is_(None))
-                    base_hashes = filter_open_reports_in_tags(
-                        base_hashes, run_ids, tag_ids)
-                else:
-                    base_hashes = base_hashes.filter(
-                        Report.detection_status.notin_(skip_statuses_str))
-                    base_hashes = filter_open_reports_in_tags_old(
-                        base_hashes, run_ids, tag_ids)
-
-                if self._product.driver_name == 'postgresql':
-                    new_hashes = select([
-                        func.unnest(cast(report_hashes, ARRAY(String)))
-                            .label('bug_id')]) \
-                        .except_(base_hashes).alias('new_bugs')
-                    return [res[0] for res in session.query(new_hashes)]
-                else:
-                    # The maximum number of compound select in sqlite is 500
-                    # by default. We increased SQLITE_MAX_COMPOUND_SELECT
-                    # limit but when the number of compound select was larger
-                    # than 8435 sqlite threw a `Segmentation fault` error.
-                    # For this reason we create queries with chunks.
-                    new_hashes = []
-                    for chunk in util.chunks(
-                            iter(report_hashes), SQLITE_MAX_COMPOUND_SELECT):
-                        new_hashes_query = union_all(*[
-                            select([bindparam('bug_id' + str(i), h)
-                                    .label('bug_id')])
-                            for i, h in enumerate(chunk)])
-                        q = select([new_hashes_query.subquery()]) \
-                            .except_(base_hashes)
-                        new_hashes.extend([
-                            res[0] for res in session.query(q.subquery())])
-
-                    return new_hashes
-            elif diff_type == DiffType.RESOLVED:
-                results = session.query(Report.bug_id)
-
-                if client_version >= (6, 50):
-                    results = results.filter(or_(
-                        Report.bug_id.notin_(report_hashes),
-                        Report.fixed_at.isnot(None)))
-                    results = filter_open_reports_in_tags(
-                        results, run_ids, tag_ids)
-                else:
-                    results = results.filter(
-                        Report.bug_id.notin_(report_hashes))
-                    results = filter_open_reports_in_tags_old(
-                        results, run_ids, tag_ids)
-
-                return [res[0] for res in results]
-            elif diff_type == DiffType.UNRESOLVED:
-                results = session.query(Report.bug_id) \
-                    .filter(Report.bug_id.in_(report_hashes))
-
-                if client_version >= (6, 50):
-                    results = results \
-                        .filter(Report.detection_status.notin_(
-                            skip_statuses_str)) \
-                        .filter(Report.fixed_at.is_(None))
-                    results = filter_open_reports_in_tags(
-                        results, run_ids, tag_ids)
-                else:
-                    results = results.filter(
-                        Report.detection_status.notin_(skip_statuses_str))
-                    results = filter_open_reports_in_tags_old(
-                        results, run_ids, tag_ids)
-
-                return [res[0] for res in results]
-            else:
-                return []
+            return get_diff_hashes(session, run_ids, report_hashes,
+                                   diff_type, skip_statuses_str, tag_ids,
+                                   client_version < (6, 50))
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getRunResults(self, run_ids, limit, offset, sort_types,
                       report_filter, cmp_data, get_details):
         self.__require_view()
 
         limit = verify_limit_range(limit)
 
+        results, _ = self.__get_run_results(run_ids, limit, offset,
+                                            sort_types, report_filter,
+                                            cmp_data, get_details)
+        return results
+
+    @exc_to_thrift_reqfail
+    @timeit
+    @cached_query
+    def getRunResultsPage(self, run_ids, limit, cursor, sort_types,
+                          report_filter, cmp_data, get_details):
+        self.__require_view()
+
+        limit = verify_limit_range(limit)
+
+        results, next_cursor = self.__get_run_results(
+            run_ids, limit, 0, sort_types, report_filter, cmp_data,
+            get_details, True, cursor)
+        return RunResultsPage(reports=results, nextCursor=next_cursor)
+
+    def __get_run_results(self, run_ids, limit, offset, sort_types,
+                          report_filter, cmp_data, get_details,
+                          keyset=False, cursor=None):
+        """
+        Get the reports of a page and the cursor of the next page, like
+        __get_run_data() does.
+        """
         with DBSession(self._Session) as session:
             results = []
+            next_cursor = None
+            nulls_first = session.bind.dialect.name == "sqlite"
 
             # Extending "reports" table with report annotation columns.
             #
@@ -1990,11 +2365,33 @@ class ThriftRequestHandler:
                 sub_query = sub_query.subquery().alias()
 
                 q = session.query(sub_query) \
-                           .filter(sub_query.c.row_num == 1) \
-                           .limit(limit).offset(offset)
+                           .filter(sub_query.c.row_num == 1)
 
                 QueryResult = namedtuple('QueryResult', sub_query.c.keys())
-                query_result = [QueryResult(*row) for row in q.all()]
+
+                if keyset:
+                    sort_keys = get_sort_keys(sort_types, sort_type_map,
+                                              annotation_cols.values(),
+                                              sub_query) + \
+                        [(sub_query.c.id, Order.ASC)]
+
+                    q = q.add_columns(*get_sort_key_columns(sort_keys))
+                    for sort_col, order in sort_keys:
+                        q = q.order_by(order_type_map.get(order)(sort_col))
+
+                    if cursor:
+                        q = q.filter(get_keyset_filter(
+                            sort_keys, decode_cursor(cursor, sort_keys),
+                            nulls_first))
+
+                    rows, next_cursor = split_page(
+                        q.limit(limit + 1).all(), limit,
+                        lambda row: list(row[-len(sort_keys):]))
+                    query_result = [QueryResult(*row[:-len(sort_keys)])
+                                    for row in rows]
+                else:
+                    q = q.limit(limit).offset(offset)
+                    query_result = [QueryResult(*row) for row in q.all()]
 
                 # Get report details if it is required.
                 report_details = {}
@@ -2082,8 +2479,11 @@ class ThriftRequestHandler:
                 # number. This is implemented by LIMIT and OFFSET in the SQL
                 # queries. However, if there is no ordering in the query, then
                 # the reports in different pages may overlap. This ordering
-                # prevents it.
-                q = q.order_by(Report.id)
+                # prevents it. The other grouping columns don't change the
+                # order, but the database can return the groups in the order
+                # they are built without sorting them again when there are
+                # no other sort keys.
+                q = q.order_by(Report.id, File.id, Checker.id)
 
                 if report_filter.annotations is not None:
                     annotations = defaultdict(list)
@@ -2096,9 +2496,35 @@ class ThriftRequestHandler:
                                    for v in values])
                     q = q.having(or_(*OR))
 
-                q = q.limit(limit).offset(offset)
+                if keyset:
+                    sort_keys = get_sort_keys(sort_types, sort_type_map,
+                                              annotation_cols.values()) + \
+                        [(Report.id, Order.ASC)]
+
+                    q = q.add_columns(*get_sort_key_columns(sort_keys))
+
+                    if cursor:
+                        seek = get_keyset_filter(
+                            sort_keys, decode_cursor(cursor, sort_keys),
+                            nulls_first)
+
+                        # The annotations are aggregated from the joined
+                        # rows, so they can be compared only after grouping.
+                        if any(isinstance(sort_col, str)
+                               for sort in sort_types
+                               for sort_col, _
+                               in sort_type_map.get(sort.type)):
+                            q = q.having(seek)
+                        else:
+                            q = q.filter(seek)
+
+                    query_result, next_cursor = split_page(
+                        q.limit(limit + 1).all(), limit,
+                        lambda row: list(row[-len(sort_keys):]))
+                else:
+                    q = q.limit(limit).offset(offset)
 
-                query_result = q.all()
+                    query_result = q.all()
 
                 # Get report details if it is required.
                 report_details = {}
@@ -2141,10 +2567,11 @@ class ThriftRequestHandler:
                                    details=report_details.get(report.id),
                                    annotations=annotations))
 
-            return results
+            return results, next_cursor
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getReportAnnotations(self, run_ids, report_filter, cmp_data):
         self.__require_view()
 
@@ -2188,6 +2615,7 @@ class ThriftRequestHandler:
         return list(map(lambda x: x[0], result))
 
     @timeit
+    @cached_query
     def getRunReportCounts(self, run_ids, report_filter, limit, offset):
         """
           Count the results separately for multiple runs.
@@ -2240,10 +2668,15 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getRunResultCount(self, run_ids, report_filter, cmp_data):
         self.__require_view()
 
         with DBSession(self._Session) as session:
+            if is_report_count_filter(report_filter, cmp_data):
+                return get_report_count_query(
+                    session, run_ids, report_filter, []).scalar() or 0
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -2367,6 +2800,12 @@ class ThriftRequestHandler:
                 .filter(Report.review_status_is_in_source.is_(False)) \
                 .update({"fixed_at": None}, synchronize_session=False)
 
+        update_review_status_counts(
+            session,
+            and_(Report.bug_id == report_hash,
+                 Report.review_status_is_in_source.is_(False)),
+            review_status.status)
+
         session \
             .query(Report) \
             .filter(Report.review_status_is_in_source.is_(False)) \
@@ -2425,6 +2864,10 @@ class ThriftRequestHandler:
                     session.query(Report).filter(
                         Report.id == report_id).update({"fixed_at": None})
 
+                update_review_status_counts(
+                    session, Report.id == report_id,
+                    review_status_str(status))
+
                 session.query(Report).filter(Report.id == report_id).update({
                         'review_status': review_status_str(status),
                         'review_status_author': self._get_username(),
@@ -2435,6 +2878,7 @@ class ThriftRequestHandler:
                 raise codechecker_api_shared.ttypes.RequestFailed(
                     codechecker_api_shared.ttypes.ErrorCode.DATABASE,
                     "No report found in the database.")
+            bump_generation(session)
             session.commit()
 
             LOG.info("Review status of report '%s' was changed to '%s' by %s.",
@@ -2513,6 +2957,12 @@ class ThriftRequestHandler:
                 # Reports become unreviewed when the corresponding review
                 # status rule is removed and the report doesn't have a review
                 # status as source code comment.
+                update_review_status_counts(
+                    session,
+                    and_(Report.bug_id == review_status.bug_hash,
+                         Report.review_status_is_in_source.is_(False)),
+                    'unreviewed')
+
                 session \
                     .query(Report) \
                     .filter(Report.bug_id == review_status.bug_hash) \
@@ -2524,6 +2974,7 @@ class ThriftRequestHandler:
                         'review_status_date': None,
                         'fixed_at': None})
 
+            bump_generation(session)
             session.commit()
 
             LOG.info("Review status rules were removed based on filter '%s' by"
@@ -2545,6 +2996,7 @@ class ThriftRequestHandler:
         with DBSession(self._Session) as session:
             self._setReviewStatus(
                 session, report_hash, review_status, message)
+            bump_generation(session)
             session.commit()
             return True
 
@@ -2615,6 +3067,7 @@ class ThriftRequestHandler:
                 comment = self.__add_comment(report.bug_id,
                                              comment_data.message)
                 session.add(comment)
+                bump_generation(session)
                 session.commit()
 
                 return True
@@ -2666,6 +3119,7 @@ class ThriftRequestHandler:
                 comment.message = content.encode('utf-8')
                 session.add(comment)
 
+                bump_generation(session)
                 session.commit()
                 return True
             else:
@@ -2695,6 +3149,7 @@ class ThriftRequestHandler:
                         codechecker_api_shared.ttypes.ErrorCode.UNAUTHORIZED,
                         'Unathorized comment modification!')
                 session.delete(comment)
+                bump_generation(session)
                 session.commit()
 
                 LOG.info("Comment '%s...' was removed from bug hash '%s' by "
@@ -2904,6 +3359,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getCheckerCounts(self, run_ids, report_filter, cmp_data, limit,
                          offset):
         """
@@ -2917,6 +3373,18 @@ class ThriftRequestHandler:
 
         results = []
         with DBSession(self._Session) as session:
+            if is_report_count_filter(report_filter, cmp_data):
+                q = get_report_count_query(
+                    session, run_ids, report_filter,
+                    [Checker.checker_name, Checker.severity], [Checker]) \
+                    .order_by(Checker.checker_name)
+
+                if limit:
+                    q = q.limit(limit).offset(offset)
+
+                return [CheckerCount(name=name, severity=severity, count=count)
+                        for name, severity, count in q]
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -2976,6 +3444,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getCheckerStatusVerificationDetails(self, run_ids, report_filter):
         self.__require_view()
 
@@ -3097,6 +3566,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getAnalyzerNameCounts(self, run_ids, report_filter, cmp_data, limit,
                               offset):
         """
@@ -3110,6 +3580,17 @@ class ThriftRequestHandler:
 
         results = {}
         with DBSession(self._Session) as session:
+            if is_report_count_filter(report_filter, cmp_data):
+                q = get_report_count_query(
+                    session, run_ids, report_filter,
+                    [Checker.analyzer_name], [Checker]) \
+                    .order_by(Checker.analyzer_name)
+
+                if limit:
+                    q = q.limit(limit).offset(offset)
+
+                return dict(q)
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3160,6 +3641,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getSeverityCounts(self, run_ids, report_filter, cmp_data):
         """
           If the run id list is empty the metrics will be counted
@@ -3169,6 +3651,11 @@ class ThriftRequestHandler:
         self.__require_view()
         results = {}
         with DBSession(self._Session) as session:
+            if is_report_count_filter(report_filter, cmp_data):
+                return dict(get_report_count_query(
+                    session, run_ids, report_filter,
+                    [Checker.severity], [Checker]))
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3212,6 +3699,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getCheckerMsgCounts(self, run_ids, report_filter, cmp_data, limit,
                             offset):
         """
@@ -3273,6 +3761,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getReportStatusCounts(self, run_ids, report_filter, cmp_data):
         """
           If the run id list is empty the metrics will be counted
@@ -3281,6 +3770,15 @@ class ThriftRequestHandler:
         """
         self.__require_view()
         with DBSession(self._Session) as session:
+            if is_report_count_filter(report_filter, cmp_data):
+                q = get_report_count_query(
+                    session, run_ids, report_filter,
+                    [get_is_opened_case(ReportCount.__table__)])
+
+                return {report_status_enum(
+                    "outstanding" if is_outstanding else "closed"): count
+                    for is_outstanding, count in q}
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3327,6 +3825,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getReviewStatusCounts(self, run_ids, report_filter, cmp_data):
         """
           If the run id list is empty the metrics will be counted
@@ -3335,6 +3834,14 @@ class ThriftRequestHandler:
         """
         self.__require_view()
         with DBSession(self._Session) as session:
+            if is_report_count_filter(report_filter, cmp_data):
+                q = get_report_count_query(
+                    session, run_ids, report_filter,
+                    [ReportCount.review_status])
+
+                return {review_status_enum(rev_status): count
+                        for rev_status, count in q}
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3371,6 +3878,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getFileCounts(self, run_ids, report_filter, cmp_data, limit, offset):
         """
           If the run id list is empty the metrics will be counted
@@ -3383,6 +3891,17 @@ class ThriftRequestHandler:
 
         results = {}
         with DBSession(self._Session) as session:
+            if is_report_count_filter(report_filter, cmp_data):
+                q = get_report_count_query(
+                    session, run_ids, report_filter,
+                    [File.filepath], [File]) \
+                    .order_by(File.filepath)
+
+                if limit:
+                    q = q.limit(limit).offset(offset)
+
+                return dict(q)
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3426,6 +3945,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getRunHistoryTagCounts(self, run_ids, report_filter, cmp_data, limit,
                                offset):
         """
@@ -3518,6 +4038,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_query
     def getDetectionStatusCounts(self, run_ids, report_filter, cmp_data):
         """
           If the run id list is empty the metrics will be counted
@@ -3527,6 +4048,13 @@ class ThriftRequestHandler:
         self.__require_view()
         results = {}
         with DBSession(self._Session) as session:
+            if is_report_count_filter(report_filter, cmp_data):
+                q = get_report_count_query(
+                    session, run_ids, report_filter,
+                    [ReportCount.detection_status])
+
+                return {detection_status_enum(k): v for k, v in q}
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3654,7 +4182,7 @@ class ThriftRequestHandler:
                 filter_expression, join_tables = process_report_filter(
                     session, run_ids, report_filter, cmp_data)
 
-                q = session.query(Report.id)
+                q = session.query(Report.id, Report.run_id)
 
                 if report_filter.annotations is not None:
                     q = q.outerjoin(ReportAnnotations,
@@ -3663,10 +4191,14 @@ class ThriftRequestHandler:
 
                 q = apply_report_filter(q, filter_expression, join_tables)
 
-                reports_to_delete = [r[0] for r in q]
+                reports = q.all()
+                reports_to_delete = [r[0] for r in reports]
                 if reports_to_delete:
                     remove_reports(session, reports_to_delete)
+                    refresh_report_counts(
+                        session, {r[1] for r in reports if r[1] is not None})
 
+                bump_generation(session)
                 session.commit()
                 session.close()
 
@@ -3716,6 +4248,7 @@ class ThriftRequestHandler:
                 try:
                     runs.append(run.name)
                     session.delete(run)
+                    bump_generation(session)
                     session.commit()
                     deleted_run_cnt += 1
                 except Exception as e:
@@ -3780,6 +4313,7 @@ class ThriftRequestHandler:
                 old_run_name = run_data.name
                 run_data.name = new_run_name
                 session.add(run_data)
+                bump_generation(session)
                 session.commit()
 
                 LOG.info("Run name '%s' (%d) was changed to %s by '%s'.",
@@ -3826,6 +4360,7 @@ class ThriftRequestHandler:
                                             user)
 
             session.add(component)
+            bump_generation(session)
             session.commit()
 
             return True
@@ -3878,6 +4413,7 @@ class ThriftRequestHandler:
             component = session.query(SourceComponent).get(name)
             if component:
                 session.delete(component)
+                bump_generation(session)
                 session.commit()
                 LOG.info("Source component '%s' has been removed by '%s'",
                          name, self._get_username())
@@ -3922,8 +4458,10 @@ class ThriftRequestHandler:
             return list(set(file_hashes) -
                         set(fc.content_hash for fc in q))
 
-    def __massStoreRun_common(self, is_async: bool, zipfile_blob: str,
-                              store_opts: SubmittedRunOptions) -> str:
+    def __massStoreRun_common(self, is_async: bool,
+                              zipfile_blob: Optional[str],
+                              store_opts: SubmittedRunOptions,
+                              upload: Optional[StoreUpload] = None) -> str:
         self.__require_store()
         if not store_opts.runName:
             raise ValueError("A run name is needed to know where to store!")
@@ -3942,7 +4480,8 @@ class ThriftRequestHandler:
                                       store_opts.force,
                                       store_opts.trimPathPrefixes,
                                       zipfile_blob,
-                                      self._get_username())
+                                      self._get_username(),
+                                      upload)
         ih.check_store_input_validity_at_face_value()
         m: MassStoreRunTask = ih.create_mass_store_task(is_async)
         self._task_manager.push_task(m)
@@ -4009,6 +4548,41 @@ class ThriftRequestHandler:
         token = self.__massStoreRun_common(True, zipfile_blob, store_opts)
         return token
 
+    @exc_to_thrift_reqfail
+    @timeit
+    def beginStoreUpload(self, zip_sha256: str,
+                         zip_size: int) -> StoreUploadStatus:
+        self.__require_store()
+
+        upload_dir = self._task_manager.upload_dir
+        remove_stale_uploads(upload_dir)
+
+        upload = StoreUpload.begin(upload_dir, self._product.id,
+                                   self._get_username(), zip_sha256, zip_size)
+        return StoreUploadStatus(uploadId=upload.upload_id,
+                                 receivedSize=upload.received_size,
+                                 chunkSize=CHUNK_SIZE)
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def uploadStoreChunk(self, upload_id: str, offset: int, chunk: bytes,
+                         chunk_sha256: str) -> int:
+        self.__require_store()
+
+        upload = StoreUpload(self._task_manager.upload_dir, upload_id,
+                             self._product.id, self._get_username())
+        return upload.write_chunk(offset, chunk, chunk_sha256)
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def massStoreRunFromUpload(self, upload_id: str,
+                               store_opts: SubmittedRunOptions) -> str:
+        self.__require_store()
+
+        upload = StoreUpload(self._task_manager.upload_dir, upload_id,
+                             self._product.id, self._get_username())
+        return self.__massStoreRun_common(True, None, store_opts, upload)
+
     @exc_to_thrift_reqfail
     @timeit
     def allowsStoringAnalysisStatistics(self):
@@ -4200,6 +4774,7 @@ class ThriftRequestHandler:
                                       imported_review.comment,
                                       date)
 
+            bump_generation(session)
             session.commit()
             return True
 
@@ -4224,6 +4799,7 @@ class ThriftRequestHandler:
                 datetime.fromtimestamp(dueDate) if dueDate else None
 
             session.add(cleanup_plan)
+            bump_generation(session)
             session.commit()
 
             LOG.info("New cleanup plan '%s' has been created by '%s'",
@@ -4244,6 +4820,7 @@ class ThriftRequestHandler:
                 datetime.fromtimestamp(dueDate) if dueDate else None
 
             session.add(cleanup_plan)
+            bump_generation(session)
             session.commit()
 
             LOG.info("Cleanup plan '%d' has been updated by '%s'",
@@ -4299,6 +4876,7 @@ class ThriftRequestHandler:
             name = cleanup_plan.name
 
             session.delete(cleanup_plan)
+            bump_generation(session)
             session.commit()
 
             LOG.info("Cleanup plan '%s' has been removed by '%s'",
@@ -4316,6 +4894,7 @@ class ThriftRequestHandler:
 
             cleanup_plan.closed_at = datetime.now()
             session.add(cleanup_plan)
+            bump_generation(session)
             session.commit()
 
             LOG.info("Cleanup plan '%s' has been closed by '%s'",
@@ -4333,6 +4912,7 @@ class ThriftRequestHandler:
 
             cleanup_plan.closed_at = None
             session.add(cleanup_plan)
+            bump_generation(session)
             session.commit()
             LOG.info("Cleanup plan '%s' has been reopened by '%s'",
                      cleanup_plan.name, self._get_username())
@@ -4357,6 +4937,7 @@ class ThriftRequestHandler:
                 session.add(CleanupPlanReportHash(
                     cleanup_plan_id=cleanup_plan.id, bug_hash=report_hash))
 
+            bump_generation(session)
             session.commit()
 
             return True
@@ -4376,6 +4957,7 @@ class ThriftRequestHandler:
                 .filter(CleanupPlanReportHash.bug_hash.in_(reportHashes)) \
                 .delete(synchronize_session=False)
 
+            bump_generation(session)
             session.commit()
             session.close()
 
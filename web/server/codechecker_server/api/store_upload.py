@@ -0,0 +1,298 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Handles the chunked upload of the ZIP files sent by ``CodeChecker store``.
+
+The chunks of a ZIP file are written into a partial file in the upload
+directory of the server. The number of bytes which were acknowledged to the
+client is saved next to it, so an interrupted upload can be resumed from the
+last acknowledged chunk, even if the next request is served by another API
+worker process. A completed upload is moved into the data directory of the
+``MassStoreRunTask`` which processes it.
+"""
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+import time
+from typing import Optional
+
+import portalocker
+
+from codechecker_api_shared.ttypes import ErrorCode, RequestFailed
+
+from codechecker_common.logger import get_logger
+from codechecker_common.util import format_size
+
+
+LOG = get_logger('server')
+
+# The maximum size of a chunk accepted by the server. This is also the peak
+# memory needed by an API handler to receive a chunk.
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Uploads which were not continued for this many seconds are removed.
+STALE_UPLOAD_AGE = 24 * 60 * 60
+
+UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+def get_upload_id(product_id: int, user_name: str, zip_sha256: str,
+                  zip_size: int) -> str:
+    """
+    Returns the identifier of the upload of a ZIP file. The same file
+    uploaded by the same user to the same product gets the same identifier,
+    which makes resuming an interrupted upload possible.
+    """
+    return sha256(
+        f"{product_id}:{user_name}:{zip_sha256}:{zip_size}".encode()) \
+        .hexdigest()
+
+
+def remove_stale_uploads(upload_dir: Path,
+                         max_age: int = STALE_UPLOAD_AGE) -> int:
+    """
+    Removes the uploads from the given directory which were not continued
+    for at least ``max_age`` seconds. Returns the number of removed files.
+    """
+    removed = 0
+    now = time.time()
+    for entry in upload_dir.iterdir():
+        try:
+            if now - entry.stat().st_mtime < max_age:
+                continue
+
+            entry.unlink()
+            removed += 1
+        except OSError:
+            # The file may have been removed or finished concurrently by
+            # another API worker.
+            pass
+
+    if removed:
+        LOG.debug("Removed %d stale upload file(s) from '%s'.",
+                  removed, upload_dir)
+    return removed
+
+
+class StoreUpload:
+    """
+    A ZIP file under upload, which is stored as a partial data file and a
+    JSON file containing the details of the upload.
+    """
+
+    def __init__(self, upload_dir: Path, upload_id: str,
+                 product_id: int, user_name: str):
+        if not UPLOAD_ID_PATTERN.match(upload_id or ''):
+            raise RequestFailed(ErrorCode.GENERAL,
+                                f"Invalid upload ID '{upload_id}'!")
+
+        self.upload_id = upload_id
+        self.data_file = upload_dir / f"{upload_id}.zip.part"
+        self.info_file = upload_dir / f"{upload_id}.json"
+
+        try:
+            with open(self.info_file, 'r', encoding="utf-8") as info_f:
+                info = json.load(info_f)
+        except (OSError, ValueError) as ex:
+            raise RequestFailed(
+                ErrorCode.GENERAL,
+                f"No upload with ID '{upload_id}' is in progress! It may "
+                "have been finished or removed as stale.") from ex
+
+        if info["product_id"] != product_id or \
+                info["user_name"] != user_name:
+            raise RequestFailed(ErrorCode.UNAUTHORIZED,
+                                "The upload was started by a different "
+                                "user or to a different product!")
+
+        self.zip_sha256: str = info["zip_sha256"]
+        self.zip_size: int = info["zip_size"]
+        self.received_size: int = info["received_size"]
+        self._info = info
+
+    @classmethod
+    def begin(cls, upload_dir: Path, product_id: int, user_name: str,
+              zip_sha256: str, zip_size: int) -> "StoreUpload":
+        """
+        Starts a new upload of a ZIP file, or returns the upload in progress
+        if the same file is already being uploaded.
+        """
+        if zip_size <= 0:
+            raise RequestFailed(ErrorCode.GENERAL,
+                                "The uploaded ZIP file is empty!")
+
+        upload_id = get_upload_id(product_id, user_name, zip_sha256, zip_size)
+        info_file = upload_dir / f"{upload_id}.json"
+        data_file = upload_dir / f"{upload_id}.zip.part"
+
+        if info_file.exists() and data_file.exists():
+            upload = cls(upload_dir, upload_id, product_id, user_name)
+            LOG.info("Resuming upload '%s' from %s of %s.", upload_id,
+                     format_size(upload.received_size),
+                     format_size(zip_size))
+            upload.touch()
+            return upload
+
+        data_file.touch()
+        _write_json_atomically(info_file, {
+            "product_id": product_id,
+            "user_name": user_name,
+            "zip_sha256": zip_sha256,
+            "zip_size": zip_size,
+            "received_size": 0
+        })
+
+        LOG.debug("Started upload '%s' of %s.", upload_id,
+                  format_size(zip_size))
+        return cls(upload_dir, upload_id, product_id, user_name)
+
+    def touch(self):
+        """ Marks the upload as recently used, so it is not stale. """
+        self.data_file.touch()
+        self.info_file.touch()
+
+    def write_chunk(self, offset: int, chunk: bytes,
+                    chunk_sha256: Optional[str]) -> int:
+        """
+        Writes the chunk to the given offset of the upload, and returns the
+        number of received bytes. Chunks which were received before are
+        accepted again without writing them, so the client can safely resend
+        a chunk if the acknowledgement of it was lost.
+        """
+        if len(chunk) > CHUNK_SIZE:
+            raise RequestFailed(ErrorCode.GENERAL,
+                                f"The chunk of {format_size(len(chunk))} is "
+                                "larger than the allowed "
+                                f"{format_size(CHUNK_SIZE)}!")
+
+        if sha256(chunk).hexdigest() != chunk_sha256:
+            raise RequestFailed(ErrorCode.GENERAL,
+                                "The checksum of the chunk at offset "
+                                f"{offset} does not match, it was corrupted "
+                                "during the transfer!")
+
+        try:
+            data_f = open(self.data_file, 'r+b')
+        except OSError as ex:
+            raise RequestFailed(
+                ErrorCode.GENERAL,
+                f"No upload with ID '{self.upload_id}' is in progress! It "
+                "may have been finished or removed as stale.") from ex
+
+        with data_f:
+            # A chunk which is resent by the client while the previous
+            # request is still being processed may be served by another API
+            # worker. The upload is locked while a chunk is written, and the
+            # received size is read again under the lock, so concurrent
+            # requests can't write the same part of the file.
+            portalocker.lock(data_f, portalocker.LOCK_EX)
+            try:
+                self.__reload_received_size()
+                return self.__write_locked_chunk(data_f, offset, chunk)
+            finally:
+                portalocker.unlock(data_f)
+
+    def __reload_received_size(self):
+        """
+        Reads the received size of the upload, which may have been updated
+        by another API worker.
+        """
+        try:
+            with open(self.info_file, 'r', encoding="utf-8") as info_f:
+                self._info = json.load(info_f)
+        except (OSError, ValueError) as ex:
+            raise RequestFailed(
+                ErrorCode.GENERAL,
+                f"No upload with ID '{self.upload_id}' is in progress! It "
+                "may have been finished or removed as stale.") from ex
+
+        self.received_size = self._info["received_size"]
+
+    def __write_locked_chunk(self, data_f, offset: int, chunk: bytes) -> int:
+        """
+        Writes the chunk to the locked data file of the upload, and returns
+        the number of received bytes.
+        """
+        if offset + len(chunk) <= self.received_size:
+            self.touch()
+            return self.received_size
+
+        if offset != self.received_size:
+            raise RequestFailed(ErrorCode.GENERAL,
+                                f"Upload '{self.upload_id}' expected the "
+                                f"chunk at offset {self.received_size}, "
+                                f"but got one at {offset}!")
+
+        if offset + len(chunk) > self.zip_size:
+            raise RequestFailed(ErrorCode.GENERAL,
+                                "The uploaded data is larger than the "
+                                "announced size of the ZIP file!")
+
+        # The data is written before the received size is updated, so only
+        # the bytes which are surely on the disk are acknowledged.
+        data_f.seek(offset)
+        data_f.write(chunk)
+        data_f.truncate()
+        data_f.flush()
+        os.fsync(data_f.fileno())
+
+        self.received_size = offset + len(chunk)
+        self._info["received_size"] = self.received_size
+        _write_json_atomically(self.info_file, self._info)
+
+        return self.received_size
+
+    def finish(self, target_file: Path) -> int:
+        """
+        Verifies that the upload is complete and moves the uploaded ZIP file
+        to the given path. Returns the size of the ZIP file.
+        """
+        if self.received_size != self.zip_size:
+            raise RequestFailed(ErrorCode.GENERAL,
+                                f"Upload '{self.upload_id}' is incomplete, "
+                                f"only {format_size(self.received_size)} of "
+                                f"{format_size(self.zip_size)} was "
+                                "received!")
+
+        hasher = sha256()
+        with open(self.data_file, 'rb') as data_f:
+            for data in iter(lambda: data_f.read(CHUNK_SIZE), b''):
+                hasher.update(data)
+
+        if hasher.hexdigest() != self.zip_sha256:
+            self.remove()
+            raise RequestFailed(ErrorCode.GENERAL,
+                                "The checksum of the uploaded ZIP file does "
+                                "not match, the upload has to be restarted!")
+
+        shutil.move(str(self.data_file), str(target_file))
+        self.remove()
+
+        return self.zip_size
+
+    def remove(self):
+        """ Removes the files of the upload. """
+        for path in (self.data_file, self.info_file):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _write_json_atomically(path: Path, data: dict):
+    """
+    Writes the data to the given JSON file such that concurrent readers see
+    either the old or the new content.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding="utf-8") as tmp_f:
+        json.dump(data, tmp_f)
+    os.replace(tmp_path, path)
@@ -0,0 +1,105 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Helpers to insert a large number of rows into the database with a few
+statements, bypassing the unit of work of the ORM.
+"""
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List
+
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+
+def reserve_ids(session: Session,
+                table: sqlalchemy.Table,
+                count: int) -> List[int]:
+    """
+    Reserves ``count`` values of the integer ``id`` primary key of the given
+    table. Rows inserted with these IDs can be referenced by other rows
+    inserted in bulk in the same transaction.
+
+    On SQLite the IDs are allocated after the largest existing one, which is
+    only safe if the transaction of the session already holds the write lock
+    of the database, i.e. it has already written to the database.
+    """
+    if count <= 0:
+        return []
+
+    if session.bind.dialect.name == "postgresql":
+        sequence = sqlalchemy.func.pg_get_serial_sequence(table.name, "id")
+        result = session.execute(
+            sqlalchemy.select(sqlalchemy.func.nextval(sequence))
+            .select_from(sqlalchemy.func.generate_series(1, count)))
+        return [row[0] for row in result]
+
+    max_id = session.execute(
+        sqlalchemy.select(sqlalchemy.func.max(table.c.id))).scalar() or 0
+    return list(range(max_id + 1, max_id + 1 + count))
+
+
+def insert_rows(session: Session,
+                table: sqlalchemy.Table,
+                rows: List[Dict[str, Any]]):
+    """
+    Inserts the given rows into the table. All rows must have the same keys.
+
+    The rows are sent in one ``executemany()`` call with a statement that is
+    compiled only once. The psycopg2 dialect executes it as paged multi-row
+    ``INSERT ... VALUES`` statements on PostgreSQL, while SQLite executes the
+    same prepared statement for each row.
+    """
+    if not rows:
+        return
+
+    session.execute(table.insert(), rows)
+
+
+@contextmanager
+def temporary_values(session: Session,
+                     name: str,
+                     values: Iterable[str]) -> Iterator[sqlalchemy.Table]:
+    """
+    Loads the distinct values into a temporary table with a single unique
+    ``value`` column, which can be joined in the queries of the session
+    instead of sending the values in large ``IN`` clauses.
+
+    The table is visible only to the database connection of the session. It
+    is dropped at the end of the block, and a table left over on a pooled
+    connection by a failed request is dropped before it is created again.
+    """
+    table = sqlalchemy.Table(
+        name, sqlalchemy.MetaData(),
+        sqlalchemy.Column('value', sqlalchemy.String, primary_key=True),
+        prefixes=['TEMPORARY'])
+
+    connection = session.connection()
+    table.drop(connection, checkfirst=True)
+    table.create(connection)
+
+    # Sorted values are appended to the end of the unique index.
+    values = sorted(set(values))
+
+    if session.bind.dialect.name == "postgresql":
+        # The values are sent as a single array parameter.
+        session.execute(table.insert().from_select(
+            ['value'],
+            sqlalchemy.select(sqlalchemy.func.unnest(sqlalchemy.cast(
+                sqlalchemy.bindparam('values', values),
+                ARRAY(sqlalchemy.String))))))
+    elif values:
+        # SQLite executes the same prepared statement for each value, the
+        # parameters are passed to the driver as they are.
+        connection.exec_driver_sql(
+            str(table.insert().compile(dialect=session.bind.dialect)),
+            [(value,) for value in values])
+
+    yield table
+
+    table.drop(connection)
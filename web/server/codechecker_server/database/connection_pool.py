@@ -0,0 +1,158 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Connection pooling for the database engines of the server.
+
+The connections of a pool are shared by the request handler threads of one
+API worker process. The pools are created in the main server process before
+the workers are forked, so every connection records the process that opened
+it, and a connection opened by another process is never handed out.
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+# The values used for the options not set in the "database_pool" section of
+# the server configuration file.
+DEFAULT_POOL_CONFIG = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True
+}
+
+
+class PoolStatistics:
+    """
+    Counters about the connection checkouts of a pool.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def record_checkout(self, wait_time: float, timed_out: bool):
+        """
+        Records a connection request which waited for ``wait_time`` seconds.
+        """
+        with self.__lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    A QueuePool which measures how long the callers wait for a connection,
+    including the time needed to open a new one.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statistics = PoolStatistics()
+
+    def connect(self):
+        start = time.monotonic()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.statistics.record_checkout(time.monotonic() - start,
+                                            timed_out)
+
+    def recreate(self):
+        # Engine.dispose() replaces the pool with a recreated one. The
+        # statistics are kept for the lifetime of the engine.
+        pool = super().recreate()
+        pool.statistics = self.statistics
+        return pool
+
+
+def get_engine_pool_args(pool_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the keyword arguments of sqlalchemy.create_engine() which set up
+    a pool with the given configuration.
+    """
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": pool_config["pool_size"],
+        "max_overflow": pool_config["max_overflow"],
+        "pool_timeout": pool_config["pool_timeout"],
+        "pool_recycle": pool_config["pool_recycle"],
+        "pool_pre_ping": pool_config["pool_pre_ping"]
+    }
+
+
+def register_fork_guard(engine):
+    """
+    Invalidates the pooled connections of the engine which are checked out
+    in a process other than the one that opened them, and makes the pool open
+    a new connection instead.
+    """
+    @event.listens_for(engine, "connect")
+    def _connect(_dbapi_connection, connection_record):
+        connection_record.info["pid"] = os.getpid()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(_dbapi_connection, connection_record, connection_proxy):
+        pid = os.getpid()
+        if connection_record.info["pid"] != pid:
+            # The connection is dropped without closing it, because the
+            # socket still belongs to the process which opened it.
+            connection_record.dbapi_connection = \
+                connection_proxy.dbapi_connection = None
+            raise exc.DisconnectionError(
+                f"Connection record belongs to pid "
+                f"{connection_record.info['pid']}, attempting to check out "
+                f"in pid {pid}")
+
+
+def dispose_inherited_connections(engine):
+    """
+    Drops the pooled connections of the engine that a forked process
+    inherited from its parent, without closing them.
+    """
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.dispose(close=False)
+
+
+def get_pool_status(engine) -> Optional[Dict[str, Any]]:
+    """
+    Returns the occupancy and wait time statistics of the engine's pool, or
+    None if the engine does not pool its connections.
+    """
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return None
+
+    stats = pool.statistics
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "wait_time_total": stats.total_wait_time,
+        "wait_time_max": stats.max_wait_time
+    }
@@ -11,6 +11,7 @@ Database connection handling to a database backend.
 from abc import ABCMeta, abstractmethod
 import os
 import subprocess
+from typing import Any, Dict, Optional
 
 from alembic import command, config
 from alembic import script
@@ -29,6 +30,8 @@ from codechecker_common.logger import get_logger
 
 from codechecker_web.shared import host_check, pgpass
 
+from . import connection_pool
+
 
 LOG = get_logger('system')
 
@@ -386,9 +389,15 @@ class SQLServer(metaclass=ABCMeta):
         by create_engine.
         """
 
-    def create_engine(self):
+    def create_engine(self, pool_config: Optional[Dict[str, Any]] = None):
         """
         Creates a new SQLAlchemy engine.
+
+        If a pool configuration is given (see
+        SessionManager.get_database_pool_config()), the connections to a
+        PostgreSQL server are kept open in a pool. SQLite databases, and every
+        database without a pool configuration, are connected to anew at each
+        checkout.
         """
 
         if make_url(self.get_connection_string()).drivername == \
@@ -401,6 +410,12 @@ class SQLServer(metaclass=ABCMeta):
                                               connect_args={'timeout': 600,
                                               'check_same_thread': False},
                                               poolclass=NullPool)
+        elif pool_config:
+            engine = sqlalchemy.create_engine(
+                self.get_connection_string(),
+                encoding='utf8',
+                **connection_pool.get_engine_pool_args(pool_config))
+            connection_pool.register_fork_guard(engine)
         else:
             engine = sqlalchemy.create_engine(self.get_connection_string(),
                                               encoding='utf8',
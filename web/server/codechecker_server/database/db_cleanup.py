@@ -20,6 +20,7 @@ from codechecker_common import util
 from codechecker_common.logger import get_logger
 
 from .database import DBSession
+from .query_cache import bump_generation
 from .run_db_model import \
     AnalysisInfo, \
     BugPathEvent, BugReportPoint, \
@@ -335,6 +336,7 @@ def upgrade_severity_levels(product, checker_labels):
             if count:
                 LOG.debug("[%s] %d checker severities upgraded.",
                           product.endpoint, count)
+                bump_generation(session)
 
             session.commit()
 
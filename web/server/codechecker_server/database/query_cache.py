@@ -0,0 +1,155 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Cache of the results of the report query APIs of a product.
+
+Every API worker process keeps its own cache for each product. The API
+workers and the background storage tasks are separate processes, so the
+validity of the cached results is decided by a generation counter in the
+product's database: every transaction which changes the results of the
+report queries increments it, and a cached result is used only while the
+counter has the value at which the result was computed.
+"""
+from collections import OrderedDict
+import hashlib
+import json
+import pickle
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .run_db_model import QueryCacheGeneration
+
+
+# The bound of the cache size when the "query_cache" section of the server
+# configuration file doesn't set it.
+DEFAULT_MAX_SIZE_MB = 64
+
+# The estimated memory used by an entry besides its pickled result.
+ENTRY_OVERHEAD = 256
+
+
+def get_generation(session: Session) -> Optional[int]:
+    """
+    Returns the current value of the generation counter of the product, or
+    None if the database has no counter.
+    """
+    return session.query(QueryCacheGeneration.generation) \
+        .filter(QueryCacheGeneration.id == 1) \
+        .scalar()
+
+
+def bump_generation(session: Session):
+    """
+    Invalidates the cached query results of the product. It has to be called
+    in the transaction which modifies the reports, as late as possible before
+    the commit, because the counter row stays locked until the end of the
+    transaction.
+    """
+    session.query(QueryCacheGeneration) \
+        .filter(QueryCacheGeneration.id == 1) \
+        .update({QueryCacheGeneration.generation:
+                 QueryCacheGeneration.generation + 1},
+                synchronize_session=False)
+
+
+def get_cache_key(name: str, args: tuple) -> str:
+    """
+    Returns a canonical key of an API call from the API function's name and
+    its arguments, which can be Thrift structures.
+    """
+    def encode(obj):
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj)
+        return vars(obj)
+
+    serialized = json.dumps([name, args], default=encode, sort_keys=True)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+class QueryResultCache:
+    """
+    A least recently used cache of query results, bounded by the size of the
+    pickled results. The results are stored pickled, so the callers can't
+    modify the cached values through the returned objects.
+    """
+
+    def __init__(self, max_size: int):
+        self.__lock = threading.Lock()
+        self.__max_size = max_size
+        self.__entries: OrderedDict[str, Tuple[int, bytes]] = OrderedDict()
+        self.__size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, generation: Optional[int], key: str,
+                       compute: Callable[[], Any]) -> Any:
+        """
+        Returns the result cached for the key at the given generation, or the
+        result of the compute function, which is cached if it is not too
+        large. The result is not cached when the generation is unknown.
+        """
+        if generation is None:
+            return compute()
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry and entry[0] == generation:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(entry[1])
+
+            self.misses += 1
+
+        result = compute()
+
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # A single large result would evict every other entry.
+        if len(data) + ENTRY_OVERHEAD > self.__max_size // 4:
+            return result
+
+        with self.__lock:
+            self.__remove(key)
+
+            # Entries of older generations are never served again, the least
+            # recently used ones are dropped right away.
+            while self.__entries and \
+                    next(iter(self.__entries.values()))[0] < generation:
+                self.__remove(next(iter(self.__entries)))
+
+            self.__entries[key] = (generation, data)
+            self.__size += len(data) + ENTRY_OVERHEAD
+
+            while self.__size > self.__max_size:
+                self.__remove(next(iter(self.__entries)))
+                self.evictions += 1
+
+        return result
+
+    def __remove(self, key: str):
+        entry = self.__entries.pop(key, None)
+        if entry:
+            self.__size -= len(entry[1]) + ENTRY_OVERHEAD
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Returns the statistics of the cache.
+        """
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.__entries),
+                "size_bytes": self.__size,
+                "max_size_bytes": self.__max_size
+            }
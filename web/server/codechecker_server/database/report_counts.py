@@ -0,0 +1,92 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Maintenance of the report count summary table.
+
+The summary of a run is rebuilt by the statements which replace many reports
+of the run (storage, report removal), while review status changes, which
+touch a few reports of many runs, move the counts of the affected reports
+only.
+"""
+from typing import Collection
+
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from .run_db_model import Report, ReportCount
+
+# The dimensions of the summary in the order of the columns.
+SUMMARY_COLUMNS = ['run_id', 'checker_id', 'file_id', 'detection_status',
+                   'review_status']
+
+
+def refresh_report_counts(session: Session, run_ids: Collection[int]):
+    """
+    Recomputes the summary rows of the given runs from their reports.
+    """
+    if not run_ids:
+        return
+
+    run_ids = list(run_ids)
+    report_columns = [getattr(Report, c) for c in SUMMARY_COLUMNS]
+
+    session.query(ReportCount) \
+        .filter(ReportCount.run_id.in_(run_ids)) \
+        .delete(synchronize_session=False)
+
+    counts = sqlalchemy.select(
+        report_columns + [sqlalchemy.func.count(Report.id)]) \
+        .where(Report.run_id.in_(run_ids)) \
+        .group_by(*report_columns)
+
+    session.execute(ReportCount.__table__.insert().from_select(
+        SUMMARY_COLUMNS + ['count'], counts))
+
+
+def __add_count(session: Session, key: tuple, count: int):
+    """
+    Adds the given number to the summary row of the given key. The row is
+    created if it doesn't exist yet and removed when it drops to zero.
+    """
+    row = session.query(ReportCount) \
+        .filter(*[getattr(ReportCount, c) == v
+                  for c, v in zip(SUMMARY_COLUMNS, key)])
+
+    updated = row.update({ReportCount.count: ReportCount.count + count},
+                         synchronize_session=False)
+
+    if count < 0:
+        row.filter(ReportCount.count <= 0).delete(synchronize_session=False)
+    elif not updated:
+        session.execute(ReportCount.__table__.insert().values(
+            dict(zip(SUMMARY_COLUMNS, key), count=count)))
+
+
+def update_review_status_counts(
+    session: Session,
+    report_filter,
+    review_status: str
+):
+    """
+    Moves the reports which are selected by the given filter expression to
+    the given review status in the summary. It has to be called before the
+    review status of the reports is updated.
+    """
+    dimensions = [getattr(Report, c) for c in SUMMARY_COLUMNS[:-1]]
+
+    counts = session.query(*dimensions, Report.review_status,
+                           sqlalchemy.func.count(Report.id)) \
+        .filter(report_filter,
+                Report.run_id.isnot(None),
+                Report.review_status != review_status) \
+        .group_by(*dimensions, Report.review_status) \
+        .all()
+
+    for *dimension_values, old_review_status, count in counts:
+        __add_count(session, (*dimension_values, old_review_status), -count)
+        __add_count(session, (*dimension_values, review_status), count)
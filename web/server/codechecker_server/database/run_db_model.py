@@ -442,6 +442,11 @@ class Report(Base):
     # to false positive or intentional.
     fixed_at = Column(DateTime)
 
+    # Hash of the bug path, the message and the source files of the report.
+    # A report found again with the same path hash by a subsequent store is
+    # kept instead of being removed and inserted again.
+    path_hash = Column(String, nullable=True)
+
     analysis_info = relationship(
         "AnalysisInfo",
         secondary=ReportAnalysisInfo)
@@ -505,6 +510,43 @@ class ReportAnnotations(Base):
     value = Column(String, nullable=False)
 
 
+class ReportCount(Base):
+    """
+    Number of the reports of a run by checker, file, detection status and
+    review status. It is maintained by the storage, the report removal and
+    the review status changes, so the report count APIs don't have to
+    aggregate the reports table.
+    """
+    __tablename__ = 'report_counts'
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+    run_id = Column(Integer,
+                    ForeignKey('runs.id', deferrable=True,
+                               initially="DEFERRED", ondelete='CASCADE'),
+                    nullable=False, index=True)
+    checker_id = Column(Integer,
+                        ForeignKey('checkers.id', ondelete='CASCADE'),
+                        nullable=False)
+    file_id = Column(Integer,
+                     ForeignKey('files.id', deferrable=True,
+                                initially="DEFERRED", ondelete='CASCADE'))
+    detection_status = Column(String)
+    review_status = Column(String, nullable=False)
+    count = Column(Integer, nullable=False)
+
+
+class QueryCacheGeneration(Base):
+    """
+    A single row counter which is incremented by every transaction that
+    changes the results of the report queries. The query results cached by the
+    API workers belong to the value of the counter they were computed at.
+    """
+    __tablename__ = 'query_cache_generation'
+
+    id = Column(Integer, primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
+
+
 class Comment(Base):
     __tablename__ = 'comments'
 
@@ -0,0 +1,28 @@
+"""
+Add path hash for report
+
+Revision ID: 4f55082e290e
+Revises:     a1b2c3d4e5f6
+Create Date: 2026-10-18 10:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic.
+revision = '4f55082e290e'
+down_revision = 'a1b2c3d4e5f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The column is filled by the subsequent stores. Reports stored before
+    # are replaced once by the next store of their run, as they were before.
+    op.add_column('reports',
+                  sa.Column('path_hash', sa.String(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('reports', 'path_hash')
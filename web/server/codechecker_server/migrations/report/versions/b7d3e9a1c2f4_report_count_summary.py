@@ -0,0 +1,63 @@
+"""
+Report count summary
+
+Revision ID: b7d3e9a1c2f4
+Revises:     4f55082e290e
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic.
+revision = 'b7d3e9a1c2f4'
+down_revision = '4f55082e290e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'report_counts',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('checker_id', sa.Integer(), nullable=False),
+        sa.Column('file_id', sa.Integer(), nullable=True),
+        sa.Column('detection_status', sa.String(), nullable=True),
+        sa.Column('review_status', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['run_id'], ['runs.id'],
+            name=op.f('fk_report_counts_run_id_runs'),
+            ondelete='CASCADE', initially='DEFERRED', deferrable=True),
+        sa.ForeignKeyConstraint(
+            ['checker_id'], ['checkers.id'],
+            name=op.f('fk_report_counts_checker_id_checkers'),
+            ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(
+            ['file_id'], ['files.id'],
+            name=op.f('fk_report_counts_file_id_files'),
+            ondelete='CASCADE', initially='DEFERRED', deferrable=True),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_report_counts'))
+    )
+    op.create_index(op.f('ix_report_counts_run_id'),
+                    'report_counts', ['run_id'], unique=False)
+
+    # Summarize the reports which were stored before.
+    op.execute("""
+        INSERT INTO report_counts (run_id, checker_id, file_id,
+                                   detection_status, review_status, count)
+        SELECT run_id, checker_id, file_id, detection_status, review_status,
+               COUNT(*)
+        FROM reports
+        WHERE run_id IS NOT NULL
+        GROUP BY run_id, checker_id, file_id, detection_status,
+                 review_status
+    """)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_report_counts_run_id'),
+                  table_name='report_counts')
+    op.drop_table('report_counts')
@@ -0,0 +1,32 @@
+"""
+Query cache generation counter
+
+Revision ID: c4a8f2d61e93
+Revises:     b7d3e9a1c2f4
+Create Date: 2026-10-18 21:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic.
+revision = 'c4a8f2d61e93'
+down_revision = 'b7d3e9a1c2f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    table = op.create_table(
+        'query_cache_generation',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('generation', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_query_cache_generation'))
+    )
+
+    op.bulk_insert(table, [{'id': 1, 'generation': 0}])
+
+
+def downgrade():
+    op.drop_table('query_cache_generation')
@@ -12,7 +12,7 @@ analysis results and associated information, which a CodeChecker server can
 connect to.
 """
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from sqlalchemy.orm import sessionmaker
 
@@ -20,9 +20,10 @@ from codechecker_api_shared.ttypes import DBStatus
 
 from codechecker_common.logger import get_logger
 
-from .database import database, db_cleanup
+from .database import connection_pool, database, db_cleanup
 from .database.config_db_model import Product as DBProduct
 from .database.database import DBSession
+from .database.query_cache import QueryResultCache
 from .database.run_db_model import \
     IDENTIFIER as RUN_META, \
     Run, RunLock
@@ -42,9 +43,15 @@ class Product:
     CONNECT_RETRY_TIMEOUT = 300
 
     def __init__(self, id_: int, endpoint: str, display_name: str,
-                 connection_string: str, context, check_env):
+                 connection_string: str, context, check_env,
+                 pool_config: Optional[Dict[str, Any]] = None,
+                 query_cache_size: Optional[int] = None):
         """
         Set up a new managed product object for the configuration given.
+
+        If pool_config is given, the connections to the product's database are
+        pooled with this configuration. If query_cache_size is given, the
+        results of the report queries are cached up to this many bytes.
         """
         self.__id = id_
         self.__endpoint = endpoint
@@ -53,6 +60,9 @@ class Product:
         self.__driver_name = None
         self.__context = context
         self.__check_env = check_env
+        self.__pool_config = pool_config
+        self.__query_cache = QueryResultCache(query_cache_size) \
+            if query_cache_size else None
         self.__engine = None
         self.__session = None
         self.__db_status = DBStatus.MISSING
@@ -85,6 +95,14 @@ class Product:
         """
         return self.__session
 
+    @property
+    def query_cache(self) -> Optional[QueryResultCache]:
+        """
+        Returns the cache of the report query results of this process, or None
+        if the results are not cached.
+        """
+        return self.__query_cache
+
     @property
     def driver_name(self):
         """
@@ -135,7 +153,7 @@ class Product:
             LOG.debug("Trying to connect to the database")
 
             # Create the SQLAlchemy engine.
-            self.__engine = sql_server.create_engine()
+            self.__engine = sql_server.create_engine(self.__pool_config)
             LOG.debug(self.__engine)
 
             self.__session = sessionmaker(bind=self.__engine)
@@ -193,6 +211,24 @@ class Product:
         self.__session = None
         self.__engine = None
 
+    def dispose_inherited_connections(self):
+        """
+        Drops the pooled database connections which were inherited from the
+        parent process after a fork.
+        """
+        if self.__engine:
+            connection_pool.dispose_inherited_connections(self.__engine)
+
+    def get_pool_status(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the statistics of the product's connection pool, or None if
+        the connections to the product's database are not pooled.
+        """
+        if not self.__engine:
+            return None
+
+        return connection_pool.get_pool_status(self.__engine)
+
     def cleanup_run_db(self):
         """
         Cleanup the run database which belongs to this product.
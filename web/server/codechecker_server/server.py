@@ -14,6 +14,8 @@ and browser requests.
 import atexit
 from collections import Counter
 from functools import partial
+import gzip
+import hashlib
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 import os
 import pathlib
@@ -23,12 +25,11 @@ import socket
 import ssl
 import sys
 import time
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.sql.expression import func
-from thrift.protocol import TJSONProtocol
 from thrift.transport import TTransport
 from thrift.Thrift import TApplicationException
 from thrift.Thrift import TMessageType
@@ -52,7 +53,7 @@ from codechecker_common.compatibility.multiprocessing import \
     Pool, Process, Queue, Value, cpu_count, SyncManager
 from codechecker_common.logger import get_logger, signal_log
 
-from codechecker_web.shared import database_status
+from codechecker_web.shared import database_status, thrift_protocol
 from codechecker_web.shared.version import get_version_str
 
 from . import instance_manager, permissions, routing, session_manager
@@ -65,6 +66,7 @@ from .api.server_info_handler import \
 from .api.tasks import ThriftTaskHandler as TaskHandler_v6
 from .database.config_db_model import Product as ORMProduct, \
     Configuration as ORMConfiguration
+from .database import connection_pool
 from .database.database import DBSession
 from .database.run_db_model import Run
 from .product import Product
@@ -75,6 +77,22 @@ from .task_executors.task_manager import \
 
 LOG = get_logger('server')
 
+# Thrift responses smaller than this many bytes are never compressed.
+GZIP_RESPONSE_MIN_SIZE = 1024
+
+# The fastest compression level, the bulk of the gain on the redundant
+# Thrift messages is achieved by it already.
+GZIP_LEVEL = 1
+
+
+def get_metrics_product_label(endpoint: str) -> str:
+    """
+    Returns the value of the product label of the metrics. The metrics can
+    be scraped by monitoring systems which are not allowed to see the
+    products, so the endpoint is not shown, only a stable hash of it.
+    """
+    return hashlib.sha256(endpoint.encode('utf-8')).hexdigest()[:16]
+
 
 class ProductNotFoundError(ValueError):
     pass
@@ -86,6 +104,7 @@ class RequestHandler(SimpleHTTPRequestHandler):
     Simply modified and extended version of SimpleHTTPRequestHandler
     """
     auth_session = None
+    thrift_protocol = "json"
 
     def __init__(self, request, client_address, server):
         self.path = None
@@ -98,7 +117,7 @@ class RequestHandler(SimpleHTTPRequestHandler):
     def send_thrift_exception(self, error_msg, iprot, oprot, otrans):
         """
         Send an exception response to the client in a proper format which can
-        be parsed by the Thrift clients expecting JSON responses.
+        be parsed by the Thrift clients expecting the protocol of the request.
         """
         ex = TApplicationException(TApplicationException.INTERNAL_ERROR,
                                    error_msg)
@@ -107,9 +126,27 @@ class RequestHandler(SimpleHTTPRequestHandler):
         ex.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
-        result = otrans.getvalue()
+        self.send_thrift_response(otrans.getvalue())
+
+    def send_thrift_response(self, result: bytes):
+        """
+        Send the serialized Thrift response, compressed with gzip if the
+        client accepts it and the response is large enough to benefit.
+        """
+        # The header may be repeated, e.g. the Python HTTP client always sends
+        # "identity" before the encodings added by the caller.
+        accept_encoding = ','.join(self.headers.get_all('Accept-Encoding', []))
+        gzip_response = len(result) >= GZIP_RESPONSE_MIN_SIZE and \
+            'gzip' in [encoding.split(';', 1)[0].strip()
+                       for encoding in accept_encoding.split(',')]
+        if gzip_response:
+            result = gzip.compress(result, compresslevel=GZIP_LEVEL)
+
         self.send_response(200)
-        self.send_header("content-type", "application/x-thrift")
+        self.send_header("content-type",
+                         thrift_protocol.CONTENT_TYPES[self.thrift_protocol])
+        if gzip_response:
+            self.send_header("Content-Encoding", "gzip")
         self.send_header("Content-Length", str(len(result)))
         self.end_headers()
         self.wfile.write(result)
@@ -188,6 +225,44 @@ class RequestHandler(SimpleHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(b'CODECHECKER_SERVER_IS_LIVE')
 
+    def __handle_metrics(self):
+        """
+        Handle the request of the database connection pool and query cache
+        metrics of the API worker process serving the request. If
+        authentication is enabled, the metrics are served only to superusers.
+        """
+        if self.server.manager.is_enabled:
+            auth_session = self.__check_session_header()
+
+            with DBSession(self.server.config_session) as session:
+                is_superuser = auth_session is not None and \
+                    permissions.require_permission(
+                        permissions.SUPERUSER,
+                        {"config_db_session": session},
+                        auth_session)
+
+            if not is_superuser:
+                self.send_response(401 if auth_session is None else 403)
+                self.send_header("WWW-Authenticate", "Bearer")
+                self.end_headers()
+                return
+
+        metrics = []
+        for prefix, statuses in [
+                ("codechecker_db_pool", self.server.get_pool_statuses()),
+                ("codechecker_query_cache",
+                 self.server.get_query_cache_statuses())]:
+            for labels, status in statuses:
+                label_str = ','.join(f'{key}="{value}"'
+                                     for key, value in labels.items())
+                for name, value in status.items():
+                    metrics.append(f"{prefix}_{name}{{{label_str}}} {value}")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.end_headers()
+        self.wfile.write(('\n'.join(metrics) + '\n').encode('utf-8'))
+
     def end_headers(self):
         """
         Headers in this section are based on the OWASP Secure Headers Project.
@@ -301,6 +376,11 @@ class RequestHandler(SimpleHTTPRequestHandler):
             self.__handle_readiness()
             return
 
+        if self.path == '/metrics' and \
+                self.server.manager.is_metrics_enabled():
+            self.__handle_metrics()
+            return
+
         product_endpoint, _ = routing.split_client_GET_request(self.path)
 
         # Check that path contains a product endpoint.
@@ -367,16 +447,18 @@ class RequestHandler(SimpleHTTPRequestHandler):
         """
         Handles POST queries, which are usually Thrift messages.
         """
-        protocol_factory = TJSONProtocol.TJSONProtocolFactory()
+        self.thrift_protocol = thrift_protocol.get_protocol_name(
+            self.headers.get_all('Content-Type', []))
+        protocol_factory = \
+            thrift_protocol.get_protocol_factory(self.thrift_protocol)
         input_protocol_factory = protocol_factory
         output_protocol_factory = protocol_factory
 
-        # Get Thrift API function name to print to the log output.
-        itrans = TTransport.TFileObjectTransport(self.rfile)
-        itrans = TTransport.TBufferedTransport(itrans,
-                                               int(self.headers[
-                                                   'Content-Length']))
-        iprot = input_protocol_factory.getProtocol(itrans)
+        # The request is read only once, the Thrift API function name to print
+        # to the log output and the processor read it from the same buffer.
+        request_body = self.rfile.read(int(self.headers['Content-Length']))
+        iprot = input_protocol_factory.getProtocol(
+            TTransport.TMemoryBuffer(request_body))
         fname, _, _ = iprot.readMessageBegin()
 
         client_host, client_port, is_ipv6 = \
@@ -392,8 +474,7 @@ class RequestHandler(SimpleHTTPRequestHandler):
         # Create new thrift handler.
         version = self.server.version
 
-        cstringio_buf = itrans.cstringio_buf.getvalue()
-        itrans = TTransport.TMemoryBuffer(cstringio_buf)
+        itrans = TTransport.TMemoryBuffer(request_body)
         iprot = input_protocol_factory.getProtocol(itrans)
 
         otrans = TTransport.TMemoryBuffer()
@@ -512,13 +593,7 @@ class RequestHandler(SimpleHTTPRequestHandler):
                 return
 
             processor.process(iprot, oprot)
-            result = otrans.getvalue()
-
-            self.send_response(200)
-            self.send_header("content-type", "application/x-thrift")
-            self.send_header("Content-Length", str(len(result)))
-            self.end_headers()
-            self.wfile.write(result)
+            self.send_thrift_response(otrans.getvalue())
             return
 
         except BrokenPipeError as ex:
@@ -534,9 +609,8 @@ class RequestHandler(SimpleHTTPRequestHandler):
                 import traceback
                 traceback.print_exc()
 
-            cstringio_buf = itrans.cstringio_buf.getvalue()
-            if cstringio_buf:
-                itrans = TTransport.TMemoryBuffer(cstringio_buf)
+            if request_body:
+                itrans = TTransport.TMemoryBuffer(request_body)
                 iprot = input_protocol_factory.getProtocol(itrans)
 
             self.send_thrift_exception(str(ex), iprot, oprot, otrans)
@@ -664,7 +738,8 @@ class CCSimpleHttpServer(HTTPServer):
 
         # Create a database engine for the configuration database.
         LOG.debug("Creating database engine for CONFIG DATABASE...")
-        self.__engine = product_db_sql_server.create_engine()
+        self.__engine = product_db_sql_server.create_engine(
+            self.manager.get_database_pool_config())
         self.config_session = sessionmaker(bind=self.__engine)
         self.manager.set_database_connection(self.config_session)
 
@@ -812,8 +887,52 @@ class CCSimpleHttpServer(HTTPServer):
             self.terminate()
 
         signal.signal(signal.SIGINT, _handler)
+
+        # The API worker is forked from the main server process, which has
+        # already connected to the databases. The pooled connections of the
+        # parent must not be shared, so the worker opens its own ones.
+        connection_pool.dispose_inherited_connections(self.__engine)
+        for product in self.__products.values():
+            product.dispose_inherited_connections()
+
         return self.serve_forever()
 
+    def get_pool_statuses(self) \
+            -> List[Tuple[Dict[str, str], Dict[str, Any]]]:
+        """
+        Returns the statistics of the database connection pools of this
+        process, along with the labels identifying the databases.
+        """
+        pid = str(os.getpid())
+        statuses = []
+
+        status = connection_pool.get_pool_status(self.__engine)
+        if status:
+            statuses.append(({"pid": pid, "database": "config"}, status))
+
+        for endpoint, product in sorted(self.__products.items()):
+            status = product.get_pool_status()
+            if status:
+                statuses.append(({"pid": pid,
+                                  "database": "product",
+                                  "product": get_metrics_product_label(
+                                      endpoint)}, status))
+
+        return statuses
+
+    def get_query_cache_statuses(self) \
+            -> List[Tuple[Dict[str, str], Dict[str, Any]]]:
+        """
+        Returns the statistics of the query result caches of the products in
+        this process, along with the labels identifying the products.
+        """
+        pid = str(os.getpid())
+
+        return [({"pid": pid, "product": get_metrics_product_label(endpoint)},
+                 product.query_cache.get_status())
+                for endpoint, product in sorted(self.__products.items())
+                if product.query_cache]
+
     def add_product(self, orm_product, init_db=False):
         """
         Adds a product to the list of product databases connected to
@@ -831,7 +950,10 @@ class CCSimpleHttpServer(HTTPServer):
                        orm_product.display_name,
                        orm_product.connection,
                        self.context,
-                       self.check_env)
+                       self.check_env,
+                       self.manager.get_database_pool_config(
+                           orm_product.endpoint),
+                       self.manager.get_query_cache_size())
 
         # Update the product database status.
         prod.connect()
@@ -16,7 +16,7 @@ import uuid
 
 from datetime import datetime
 import hashlib
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from codechecker_common.compatibility.multiprocessing import cpu_count
 from codechecker_common.logger import get_logger
@@ -30,6 +30,8 @@ from .database.config_db_model import Session as SessionRecord
 from .database.config_db_model import OAuthToken
 from .database.config_db_model import PersonalAccessToken
 from .database.config_db_model import SystemPermission
+from .database.connection_pool import DEFAULT_POOL_CONFIG
+from .database.query_cache import DEFAULT_MAX_SIZE_MB
 from .permissions import SUPERUSER
 
 
@@ -197,6 +199,9 @@ class SessionManager:
         self.__max_run_count = self.scfg_dict.get('max_run_count', None)
         self.__store_config = self.scfg_dict.get('store', {})
         self.__keepalive_config = self.scfg_dict.get('keepalive', {})
+        self.__database_pool_config = self.scfg_dict.get('database_pool', {})
+        self.__query_cache_config = self.scfg_dict.get('query_cache', {})
+        self.__metrics_config = self.scfg_dict.get('metrics', {})
         self.__auth_config = self.scfg_dict['authentication']
 
         if force_auth:
@@ -1041,6 +1046,46 @@ class SessionManager:
         """ Get keepalive max probe count. """
         return self.__keepalive_config.get('max_probe')
 
+    def get_database_pool_config(self, endpoint: Optional[str] = None) \
+            -> Optional[Dict[str, Any]]:
+        """
+        Get the connection pool configuration of the database of the given
+        product endpoint, or of the configuration database if no endpoint is
+        given. None is returned if the connections should not be pooled.
+        """
+        pool_config = dict(DEFAULT_POOL_CONFIG)
+        pool_config["enabled"] = False
+
+        pool_config.update({key: value for key, value in
+                            self.__database_pool_config.items()
+                            if key != "products"})
+        if endpoint is not None:
+            pool_config.update(self.__database_pool_config
+                               .get("products", {}).get(endpoint, {}))
+
+        if not pool_config.pop("enabled"):
+            return None
+
+        return pool_config
+
+    def get_query_cache_size(self) -> Optional[int]:
+        """
+        Get the maximum size in bytes of the query result cache of a product
+        in an API worker process. None is returned if the cache is disabled.
+        """
+        if not self.__query_cache_config.get('enabled', False):
+            return None
+
+        return int(self.__query_cache_config.get(
+            'max_size_mb', DEFAULT_MAX_SIZE_MB) * 1024 * 1024)
+
+    def is_metrics_enabled(self) -> bool:
+        """
+        Returns whether the statistics of the database connection pools and
+        the query caches are served at the /metrics endpoint.
+        """
+        return bool(self.__metrics_config.get('enabled', False))
+
     def __get_local_session_from_db(self, token):
         """
         Creates a local session if a valid session token can be found in the
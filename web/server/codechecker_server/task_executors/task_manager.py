@@ -65,9 +65,13 @@ class TaskManager:
         self._temp_dir_root = (temp_dir or Path(tempfile.gettempdir())) \
             / "codechecker_tasks" \
             / CHARS_INVALID_IN_PATH.sub('_', machine_id)
+        self._upload_dir_root = (temp_dir or Path(tempfile.gettempdir())) \
+            / "codechecker_uploads" \
+            / CHARS_INVALID_IN_PATH.sub('_', machine_id)
         self.__task_pipes = task_pipes
 
         os.makedirs(self._temp_dir_root, exist_ok=True)
+        os.makedirs(self._upload_dir_root, exist_ok=True)
 
     @property
     def configuration_database_session_factory(self):
@@ -87,6 +91,15 @@ class TaskManager:
         """Returns the ``machine_id`` the instance was constructed with."""
         return self._machine_id
 
+    @property
+    def upload_dir(self) -> Path:
+        """
+        Returns the directory where the partially uploaded inputs of tasks
+        are stored. Unlike the data of the tasks, this directory is kept
+        when the server shuts down, so the clients can resume the uploads.
+        """
+        return self._upload_dir_root
+
     def allocate_task_record(self, kind: str, summary: str,
                              user_name: Optional[str],
                              product: Optional[Product] = None) -> str:
@@ -0,0 +1,75 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for reading the blame files of the stored zip. """
+
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from codechecker_server.api.mass_store_run import get_blame_file_data
+
+
+COMMIT = {'author': {'name': 'Author', 'email': 'author@example.com'},
+          'summary': 'Summary',
+          'message': 'Summary\n',
+          'committed_datetime': '2024-01-01 00:00:00+00:00'}
+
+
+class BlameFileDataTest(unittest.TestCase):
+    """ Test the blame files of both versions. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.blame_file = Path(self.tmp_dir.name) / 'main.cpp'
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def __write(self, data):
+        with open(self.blame_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_v1(self):
+        """ The commits of the file are kept. """
+        self.__write({'version': 'v1',
+                      'tracking_branch': 'origin/main',
+                      'remote_url': 'https://example.com/repo.git',
+                      'commits': {'abc': COMMIT},
+                      'blame': [{'from': 1, 'to': 2, 'commit': 'abc'}]})
+
+        blame_info, remote_url, tracking_branch = \
+            get_blame_file_data(self.blame_file)
+
+        self.assertEqual(blame_info, {
+            'version': 'v1',
+            'commits': {'abc': COMMIT},
+            'blame': [{'from': 1, 'to': 2, 'commit': 'abc'}]})
+        self.assertEqual(remote_url, 'https://example.com/repo.git')
+        self.assertEqual(tracking_branch, 'origin/main')
+
+    def test_v2(self):
+        """ The commits of the file are taken from the shared commits. """
+        self.__write({'version': 'v2',
+                      'tracking_branch': 'origin/main',
+                      'remote_url': None,
+                      'blame': [{'from': 1, 'to': 2, 'commit': 'abc'}]})
+
+        blame_info, _, _ = get_blame_file_data(
+            self.blame_file, {'abc': COMMIT, 'def': COMMIT})
+        self.assertEqual(blame_info, {
+            'version': 'v1',
+            'commits': {'abc': COMMIT},
+            'blame': [{'from': 1, 'to': 2, 'commit': 'abc'}]})
+
+        blame_info, _, tracking_branch = get_blame_file_data(
+            self.blame_file, {'def': COMMIT})
+        self.assertIsNone(blame_info)
+        self.assertEqual(tracking_branch, 'origin/main')
@@ -0,0 +1,104 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the bulk insert helpers of the database. """
+
+
+from datetime import datetime
+import unittest
+
+import sqlalchemy
+from sqlalchemy.orm import sessionmaker
+
+from codechecker_server.database.bulk_insert import insert_rows, reserve_ids
+from codechecker_server.database.run_db_model import Base, BugPathEvent, \
+    Checker, File, FileContent, Report, Run
+
+
+class BulkInsertTest(unittest.TestCase):
+    """
+    Test the bulk insertion of reports into an SQLite database.
+    """
+
+    def setUp(self):
+        engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+
+        self.run = Run("run", "v1")
+        self.checker = Checker("clangsa", "core.NullDereference", 0)
+        self.session.add_all([self.run, self.checker,
+                              FileContent("hash", b"content", None)])
+        self.session.flush()
+        self.file = File("/main.c", "hash", None, None)
+        self.session.add(self.file)
+        self.session.flush()
+
+    def tearDown(self):
+        self.session.close()
+
+    def report_row(self, report_id):
+        return {
+            "id": report_id,
+            "file_id": self.file.id,
+            "run_id": self.run.id,
+            "bug_id": f"hash{report_id}",
+            "checker_id": self.checker.id,
+            "line": 1,
+            "column": 1,
+            "path_length": 1,
+            "checker_message": "message",
+            "detection_status": "new",
+            "review_status": "unreviewed",
+            "review_status_author": None,
+            "review_status_message": None,
+            "review_status_date": None,
+            "review_status_is_in_source": False,
+            "detected_at": datetime.now(),
+            "fixed_at": None
+        }
+
+    def test_reserve_ids(self):
+        """ The reserved IDs follow the largest existing ID. """
+        self.assertEqual(reserve_ids(self.session, Report.__table__, 0), [])
+        self.assertEqual(reserve_ids(self.session, Report.__table__, 3),
+                         [1, 2, 3])
+
+        insert_rows(self.session, Report.__table__,
+                    [self.report_row(i) for i in [1, 2, 3]])
+        self.assertEqual(reserve_ids(self.session, Report.__table__, 2),
+                         [4, 5])
+
+    def test_insert_rows(self):
+        """ The rows can refer to the rows inserted with reserved IDs. """
+        report_ids = reserve_ids(self.session, Report.__table__, 10)
+        insert_rows(self.session, Report.__table__,
+                    [self.report_row(i) for i in report_ids])
+
+        event_count = 1000
+        insert_rows(self.session, BugPathEvent.__table__, [{
+            "line_begin": i,
+            "col_begin": 1,
+            "line_end": i,
+            "col_end": 2,
+            "order": i,
+            "msg": f"event {i}",
+            "file_id": self.file.id,
+            "report_id": report_ids[i % len(report_ids)]
+        } for i in range(event_count)])
+
+        self.assertEqual(self.session.query(Report).count(), 10)
+        self.assertEqual(
+            self.session.query(Report).get(report_ids[-1]).checker,
+            self.checker)
+        self.assertEqual(self.session.query(BugPathEvent).count(),
+                         event_count)
+        self.assertEqual(
+            self.session.query(BugPathEvent)
+            .filter(BugPathEvent.report_id == report_ids[0]).count(),
+            event_count // len(report_ids))
@@ -0,0 +1,173 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the database connection pooling of the server. """
+
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import sqlalchemy
+
+from codechecker_server.database import connection_pool
+from codechecker_server.server import get_metrics_product_label
+from codechecker_server.session_manager import SessionManager
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    """
+    Test the pooled engines on an SQLite database file.
+    """
+
+    def setUp(self):
+        self.workspace = tempfile.TemporaryDirectory()
+        pool_config = dict(connection_pool.DEFAULT_POOL_CONFIG)
+        pool_config["pool_size"] = 2
+        pool_config["max_overflow"] = 1
+        pool_config["pool_timeout"] = 0.1
+
+        self.engine = sqlalchemy.create_engine(
+            "sqlite:///" + os.path.join(self.workspace.name, "test.sqlite"),
+            **connection_pool.get_engine_pool_args(pool_config))
+        connection_pool.register_fork_guard(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.workspace.cleanup()
+
+    def test_pool_status(self):
+        """ The occupancy and the checkouts of the pool are reported. """
+        connections = [self.engine.connect() for _ in range(3)]
+
+        status = connection_pool.get_pool_status(self.engine)
+        self.assertEqual(status["size"], 2)
+        self.assertEqual(status["checked_out"], 3)
+        self.assertEqual(status["overflow"], 1)
+        self.assertEqual(status["checkouts"], 3)
+        self.assertEqual(status["timeouts"], 0)
+
+        with self.assertRaises(sqlalchemy.exc.TimeoutError):
+            self.engine.connect()
+
+        for connection in connections:
+            connection.close()
+
+        status = connection_pool.get_pool_status(self.engine)
+        self.assertEqual(status["checked_in"], 2)
+        self.assertEqual(status["checked_out"], 0)
+        self.assertEqual(status["timeouts"], 1)
+        self.assertGreaterEqual(status["wait_time_max"], 0.1)
+
+        # The statistics survive the recreation of the pool.
+        connection_pool.dispose_inherited_connections(self.engine)
+        status = connection_pool.get_pool_status(self.engine)
+        self.assertEqual(status["checked_in"], 0)
+        self.assertEqual(status["checkouts"], 3)
+
+    def test_fork_guard(self):
+        """
+        A connection opened by another process is replaced at checkout.
+        """
+        with self.engine.connect() as connection:
+            parent_connection = connection.connection.dbapi_connection
+
+        with mock.patch.object(connection_pool.os, "getpid",
+                               return_value=os.getpid() + 1):
+            with self.engine.connect() as connection:
+                self.assertIsNot(connection.connection.dbapi_connection,
+                                 parent_connection)
+                self.assertEqual(connection.execute("SELECT 1").scalar(), 1)
+
+    def test_null_pool(self):
+        """ No statistics are reported for engines without a pool. """
+        engine = sqlalchemy.create_engine(
+            "sqlite://", poolclass=sqlalchemy.pool.NullPool)
+        self.assertIsNone(connection_pool.get_pool_status(engine))
+
+
+class PoolConfigTest(unittest.TestCase):
+    """
+    Test reading the connection pool options from the server configuration.
+    """
+
+    def get_session_manager(self, pool_config):
+        with tempfile.TemporaryDirectory() as workspace:
+            config_file = os.path.join(workspace, "server_config.json")
+            with open(config_file, 'w', encoding="utf-8") as f:
+                json.dump({"authentication": {"enabled": False},
+                           "database_pool": pool_config}, f)
+            os.chmod(config_file, 0o600)
+
+            return SessionManager(config_file,
+                                  os.path.join(workspace, "secrets.json"))
+
+    def test_pool_disabled(self):
+        """ Connections are not pooled by default. """
+        manager = self.get_session_manager({})
+        self.assertIsNone(manager.get_database_pool_config())
+        self.assertIsNone(manager.get_database_pool_config("product"))
+
+    def test_product_overrides(self):
+        """ The options of a product override the top level options. """
+        manager = self.get_session_manager({
+            "enabled": True,
+            "pool_size": 3,
+            "products": {
+                "big": {"pool_size": 20, "max_overflow": 0},
+                "small": {"enabled": False}
+            }
+        })
+
+        config_db = manager.get_database_pool_config()
+        self.assertEqual(config_db["pool_size"], 3)
+        self.assertEqual(config_db["max_overflow"],
+                         connection_pool.DEFAULT_POOL_CONFIG["max_overflow"])
+        self.assertNotIn("enabled", config_db)
+        self.assertNotIn("products", config_db)
+
+        self.assertEqual(manager.get_database_pool_config("other"),
+                         config_db)
+
+        big = manager.get_database_pool_config("big")
+        self.assertEqual(big["pool_size"], 20)
+        self.assertEqual(big["max_overflow"], 0)
+
+        self.assertIsNone(manager.get_database_pool_config("small"))
+
+
+class MetricsConfigTest(unittest.TestCase):
+    """
+    Test the options of the /metrics endpoint of the server.
+    """
+
+    def get_session_manager(self, metrics_config):
+        with tempfile.TemporaryDirectory() as workspace:
+            config_file = os.path.join(workspace, "server_config.json")
+            with open(config_file, 'w', encoding="utf-8") as f:
+                json.dump({"authentication": {"enabled": False},
+                           "metrics": metrics_config}, f)
+            os.chmod(config_file, 0o600)
+
+            return SessionManager(config_file,
+                                  os.path.join(workspace, "secrets.json"))
+
+    def test_metrics_disabled(self):
+        """ The metrics are not served by default. """
+        self.assertFalse(self.get_session_manager({}).is_metrics_enabled())
+        self.assertTrue(self.get_session_manager(
+            {"enabled": True}).is_metrics_enabled())
+
+    def test_product_label(self):
+        """ The product endpoints are not shown in the metrics. """
+        label = get_metrics_product_label("secret-product")
+        self.assertNotIn("secret", label)
+        self.assertEqual(label, get_metrics_product_label("secret-product"))
+        self.assertNotEqual(label, get_metrics_product_label("other"))
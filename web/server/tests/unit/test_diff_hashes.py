@@ -0,0 +1,134 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the report hash comparison of 'CodeChecker cmd diff'. """
+
+
+from datetime import datetime
+import unittest
+
+import sqlalchemy
+from sqlalchemy.orm import sessionmaker
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import DiffType
+
+from codechecker_server.api.report_server import get_diff_hashes
+from codechecker_server.database.bulk_insert import insert_rows, \
+    temporary_values
+from codechecker_server.database.run_db_model import Base, Checker, File, \
+    FileContent, Report, Run
+
+SKIP_STATUSES = ['resolved', 'off', 'unavailable']
+
+
+class DiffHashesTest(unittest.TestCase):
+    """
+    Test the new, resolved and unresolved reports compared to local report
+    hashes.
+    """
+
+    def setUp(self):
+        engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+
+        self.runs = [Run("run1", "v1"), Run("run2", "v1")]
+        checker = Checker("clangsa", "core.NullDereference", 1)
+        self.session.add_all(self.runs + [
+            checker, FileContent("hash", b"content", None)])
+        self.session.flush()
+        file = File("/a.c", "hash", None, None)
+        self.session.add(file)
+        self.session.flush()
+
+        # Run 1 contains the hashes 0-5, run 2 contains the hash 0.
+        reports = [(0, "new", None), (1, "unresolved", None),
+                   (2, "resolved", datetime.now()), (3, "new", None),
+                   (4, "unresolved", datetime.now()), (5, "off", None)]
+        rows = [(self.runs[0].id, f"hash{i}", status, fixed_at)
+                for i, status, fixed_at in reports]
+        rows.append((self.runs[1].id, "hash0", "new", None))
+
+        insert_rows(self.session, Report.__table__, [{
+            "file_id": file.id,
+            "run_id": run_id,
+            "bug_id": bug_id,
+            "checker_id": checker.id,
+            "line": 1,
+            "column": 1,
+            "path_length": 1,
+            "checker_message": "message",
+            "detection_status": status,
+            "review_status": "unreviewed",
+            "review_status_author": None,
+            "review_status_message": None,
+            "review_status_date": None,
+            "review_status_is_in_source": False,
+            "detected_at": datetime.now(),
+            "fixed_at": fixed_at} for run_id, bug_id, status, fixed_at
+            in rows])
+
+        self.local_hashes = ["hash0", "hash2", "hash4", "hash6", "hash6"]
+
+    def tearDown(self):
+        self.session.close()
+
+    def __diff(self, diff_type, old_client=False, report_hashes=None):
+        if report_hashes is None:
+            report_hashes = self.local_hashes
+        return sorted(get_diff_hashes(
+            self.session, [self.runs[0].id], report_hashes, diff_type,
+            SKIP_STATUSES, None, old_client))
+
+    def test_new(self):
+        """ Local hashes which are not open in the run are new. """
+        self.assertEqual(self.__diff(DiffType.NEW),
+                         ["hash2", "hash4", "hash6"])
+        self.assertEqual(self.__diff(DiffType.NEW, True), ["hash2", "hash6"])
+        self.assertEqual(self.__diff(DiffType.NEW, report_hashes=[]), [])
+
+    def test_resolved(self):
+        """ Reports of the run which are missing or fixed are resolved. """
+        self.assertEqual(self.__diff(DiffType.RESOLVED),
+                         ["hash1", "hash2", "hash3", "hash4", "hash5"])
+        self.assertEqual(self.__diff(DiffType.RESOLVED, True),
+                         ["hash1", "hash3", "hash5"])
+        self.assertEqual(self.__diff(DiffType.RESOLVED, report_hashes=[]),
+                         [f"hash{i}" for i in range(6)])
+
+    def test_unresolved(self):
+        """ Local hashes which are open in the run are unresolved. """
+        self.assertEqual(self.__diff(DiffType.UNRESOLVED), ["hash0"])
+        self.assertEqual(self.__diff(DiffType.UNRESOLVED, True),
+                         ["hash0", "hash4"])
+
+    def test_many_hashes(self):
+        """
+        The number of hashes is not limited by the number of SQL variables.
+        """
+        report_hashes = [f"local{i}" for i in range(50000)] + ["hash1"]
+
+        self.assertEqual(len(self.__diff(DiffType.NEW, False, report_hashes)),
+                         50000)
+        self.assertEqual(self.__diff(DiffType.UNRESOLVED, False,
+                                     report_hashes), ["hash1"])
+
+    def test_temporary_table(self):
+        """
+        The temporary table can be created again on the same connection, even
+        if it was left there by a failed query.
+        """
+        with self.assertRaises(ZeroDivisionError):
+            with temporary_values(self.session, "values", ["a"]):
+                _ = 1 / 0
+
+        with temporary_values(self.session, "values", ["b", "c", "b"]) \
+                as table:
+            self.assertEqual(
+                self.session.query(table.c.value)
+                .order_by(table.c.value).all(), [("b",), ("c",)])
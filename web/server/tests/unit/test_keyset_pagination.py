@@ -0,0 +1,140 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the keyset pagination of the query results. """
+
+
+from datetime import datetime
+import itertools
+import unittest
+
+import sqlalchemy
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.expression import asc, desc
+
+from codechecker_api_shared.ttypes import RequestFailed
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import Order
+
+from codechecker_server.api.report_server import decode_cursor, \
+    encode_cursor, get_keyset_filter, split_page
+from codechecker_server.database.bulk_insert import insert_rows
+from codechecker_server.database.run_db_model import Base, Checker, File, \
+    FileContent, Report, Run
+
+
+class KeysetPaginationTest(unittest.TestCase):
+    """
+    Test that querying the pages after each other's cursor gives the same
+    rows as a single query.
+    """
+
+    def setUp(self):
+        engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+
+        run = Run("run", "v1")
+        checker = Checker("clangsa", "core.NullDereference", 1)
+        self.session.add_all([run, checker,
+                              FileContent("hash", b"content", None)])
+        self.session.flush()
+        file = File("/a.c", "hash", None, None)
+        self.session.add(file)
+        self.session.flush()
+
+        insert_rows(self.session, Report.__table__, [{
+            "file_id": file.id,
+            "run_id": run.id,
+            "bug_id": f"hash{i}",
+            "checker_id": checker.id,
+            "line": [None, 1, 2][i % 3] if i % 4 else None,
+            "column": 1,
+            "path_length": i % 5,
+            "checker_message": "message",
+            "detection_status": "new",
+            "review_status": "unreviewed",
+            "review_status_author": None,
+            "review_status_message": None,
+            "review_status_date": None,
+            "review_status_is_in_source": False,
+            "detected_at": datetime.now(),
+            "fixed_at": None} for i in range(50)])
+
+    def tearDown(self):
+        self.session.close()
+
+    def __query(self, sort_keys, nulls_first):
+        """
+        Query the report IDs ordered by the sort keys. SQLite orders the NULL
+        values first, the ordering of other databases is emulated by placing
+        them explicitly.
+        """
+        q = self.session.query(Report.id, Report.line, Report.path_length)
+        for column, order in sort_keys:
+            if order == Order.ASC:
+                order_by = asc(column)
+                if not nulls_first:
+                    order_by = order_by.nullslast()
+            else:
+                order_by = desc(column)
+                if not nulls_first:
+                    order_by = order_by.nullsfirst()
+            q = q.order_by(order_by)
+        return q
+
+    def __pages(self, sort_keys, nulls_first, limit):
+        rows = []
+        cursor = None
+        while True:
+            q = self.__query(sort_keys, nulls_first)
+            if cursor:
+                q = q.filter(get_keyset_filter(
+                    sort_keys, decode_cursor(cursor, sort_keys), nulls_first))
+
+            page, cursor = split_page(
+                q.limit(limit + 1).all(), limit,
+                lambda row: [row._mapping[c] for c, _ in sort_keys])
+            self.assertLessEqual(len(page), limit)
+
+            rows.extend(page)
+            if not cursor:
+                return rows
+
+    def test_pages(self):
+        """ The pages contain every row in the order of the sort keys. """
+        columns = [Report.line, Report.path_length]
+        for nulls_first, limit in itertools.product([True, False], [1, 7]):
+            for orders in itertools.product([Order.ASC, Order.DESC],
+                                            repeat=len(columns)):
+                sort_keys = list(zip(columns, orders)) + \
+                    [(Report.id, Order.ASC)]
+
+                self.assertEqual(
+                    self.__pages(sort_keys, nulls_first, limit),
+                    self.__query(sort_keys, nulls_first).all())
+
+    def test_last_page(self):
+        """ No cursor is returned when there are no more rows. """
+        self.assertEqual(split_page([1, 2], 2, list), ([1, 2], None))
+
+        page, cursor = split_page([1, 2, 3], 2, lambda row: [row])
+        self.assertEqual(page, [1, 2])
+        self.assertEqual(decode_cursor(cursor, [None]), [2])
+
+    def test_cursor(self):
+        """ The sort key values are decoded from the cursor. """
+        values = [None, 42, "core.NullDereference", datetime(2024, 1, 2, 3)]
+        sort_keys = [(None, Order.ASC)] * len(values)
+
+        self.assertEqual(decode_cursor(encode_cursor(values), sort_keys),
+                         values)
+
+        with self.assertRaises(RequestFailed):
+            decode_cursor(encode_cursor(values), sort_keys[1:])
+        with self.assertRaises(RequestFailed):
+            decode_cursor("not a cursor", sort_keys)
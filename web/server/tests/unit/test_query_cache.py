@@ -0,0 +1,215 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the query result cache. """
+
+
+from datetime import datetime
+import unittest
+from unittest import mock
+
+import sqlalchemy
+from sqlalchemy.orm import sessionmaker
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import CommentData, \
+    CompareData, ReportData, ReportFilter
+
+from codechecker_server.api.report_server import ThriftRequestHandler, \
+    webserver_context
+from codechecker_server.database.query_cache import ENTRY_OVERHEAD, \
+    QueryResultCache, bump_generation, get_cache_key, get_generation
+from codechecker_server.database.run_db_model import Base, Checker, \
+    File, FileContent, QueryCacheGeneration, Report, Run
+
+
+class QueryCacheGenerationTest(unittest.TestCase):
+    """ Test the generation counter of the product database. """
+
+    def setUp(self):
+        engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_bump(self):
+        """ The counter is incremented by every bump. """
+        self.session.add(QueryCacheGeneration(id=1, generation=0))
+        self.session.flush()
+
+        self.assertEqual(get_generation(self.session), 0)
+        bump_generation(self.session)
+        bump_generation(self.session)
+        self.assertEqual(get_generation(self.session), 2)
+
+    def test_missing_counter(self):
+        """ The results are not cached without a counter. """
+        bump_generation(self.session)
+        self.assertIsNone(get_generation(self.session))
+
+        cache = QueryResultCache(1024 * 1024)
+        for _ in range(2):
+            cache.get_or_compute(get_generation(self.session), "key",
+                                 lambda: 42)
+        self.assertEqual(cache.get_status()["entries"], 0)
+
+
+class QueryResultCacheTest(unittest.TestCase):
+    """ Test the caching and the eviction of the query results. """
+
+    def setUp(self):
+        self.computed = []
+
+    def __compute(self, value):
+        def compute():
+            self.computed.append(value)
+            return value
+        return compute
+
+    def test_hit(self):
+        """ The result is computed once per generation. """
+        cache = QueryResultCache(1024 * 1024)
+
+        for _ in range(3):
+            result = cache.get_or_compute(1, "key", self.__compute([1, 2]))
+            self.assertEqual(result, [1, 2])
+
+            # The cached value is not modified through the returned one.
+            result.append(3)
+
+        self.assertEqual(len(self.computed), 1)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+
+    def test_generation(self):
+        """ The results of older generations are not used. """
+        cache = QueryResultCache(1024 * 1024)
+
+        cache.get_or_compute(1, "key1", self.__compute("old1"))
+        cache.get_or_compute(1, "key2", self.__compute("old2"))
+
+        self.assertEqual(
+            cache.get_or_compute(2, "key1", self.__compute("new")), "new")
+        self.assertEqual(cache.get_or_compute(2, "key1", self.__compute("x")),
+                         "new")
+
+        # The other entry of the old generation is dropped.
+        self.assertEqual(cache.get_status()["entries"], 1)
+
+    def test_lru(self):
+        """ The least recently used entries are evicted over the bound. """
+        value = "x" * 1000
+        cache = QueryResultCache(8 * (1100 + ENTRY_OVERHEAD))
+
+        for i in range(8):
+            cache.get_or_compute(1, str(i), self.__compute(value))
+        cache.get_or_compute(1, "0", self.__compute(value))
+        cache.get_or_compute(1, "8", self.__compute(value))
+
+        status = cache.get_status()
+        self.assertLessEqual(status["size_bytes"], status["max_size_bytes"])
+        self.assertEqual(status["evictions"], 1)
+
+        self.computed = []
+        cache.get_or_compute(1, "0", self.__compute(value))
+        cache.get_or_compute(1, "1", self.__compute(value))
+        self.assertEqual(len(self.computed), 1)
+
+    def test_large_result(self):
+        """ Results larger than a quarter of the cache are not cached. """
+        cache = QueryResultCache(4000)
+
+        cache.get_or_compute(1, "small", self.__compute("x"))
+        cache.get_or_compute(1, "large", self.__compute("x" * 1000))
+
+        self.assertEqual(cache.get_status()["entries"], 1)
+
+    def test_cache_key(self):
+        """ Equal arguments give the same key. """
+        def key(checkers, run_ids):
+            return get_cache_key("getRunResultCount", (
+                run_ids, ReportFilter(checkerName=checkers, isUnique=True),
+                CompareData(runIds=[3])))
+
+        self.assertEqual(key(["a", "b"], [1, 2]), key(["a", "b"], [1, 2]))
+        self.assertEqual(key({"a", "b"}, [1]), key({"b", "a"}, [1]))
+        self.assertNotEqual(key(["a"], [1, 2]), key(["a"], [1]))
+        self.assertNotEqual(
+            get_cache_key("getRunResultCount", ([1],)),
+            get_cache_key("getFileCounts", ([1],)))
+
+    def test_thrift_result(self):
+        """ Thrift structures are cached. """
+        cache = QueryResultCache(1024 * 1024)
+        reports = [ReportData(reportId=i, checkerMsg="msg") for i in range(3)]
+
+        cache.get_or_compute(1, "key", self.__compute(reports))
+        self.assertEqual(cache.get_or_compute(1, "key", self.__compute([])),
+                         reports)
+
+
+class CommentCacheTest(unittest.TestCase):
+    """ Test that the comment changes invalidate the cached report details. """
+
+    def setUp(self):
+        engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+
+        session = Session()
+        session.add(QueryCacheGeneration(id=1, generation=0))
+        session.add(FileContent("hash", b"int main() {}", None))
+        run = Run("run", "v1")
+        file = File("/main.cpp", "hash", None, None)
+        checker = Checker("clangsa", "core.DivideZero", 0)
+        session.add_all([run, file, checker])
+        session.flush()
+
+        report = Report(file.id, run.id, "bug", checker, 1, 1, 1, "msg",
+                        "new", "unreviewed", None, None, None, False,
+                        datetime.now(), None)
+        session.add(report)
+        session.commit()
+        self.run_id, self.report_id = run.id, report.id
+        session.close()
+
+        product = mock.Mock(id=1, query_cache=QueryResultCache(1024 * 1024))
+        self.handler = ThriftRequestHandler(
+            mock.Mock(is_enabled=False), None, Session, product, None, None,
+            None, None, None)
+
+        for patcher in [
+                mock.patch.object(
+                    ThriftRequestHandler,
+                    "_ThriftRequestHandler__require_permission",
+                    return_value=True),
+                mock.patch.object(
+                    webserver_context, "get_context",
+                    return_value=mock.Mock(system_comment_map={}))]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def __get_comments(self):
+        reports = self.handler.getRunResults(
+            [self.run_id], 10, 0, None, ReportFilter(), None, True)
+        return [c.message for c in reports[0].details.comments]
+
+    def test_comment_changes(self):
+        """ The cached reports have the added and changed comments. """
+        self.assertEqual(self.__get_comments(), [])
+
+        self.handler.addComment(self.report_id, CommentData(message="old"))
+        self.assertEqual(self.__get_comments(), ["old"])
+
+        comment_id = self.handler.getComments(self.report_id)[0].id
+        self.handler.updateComment(comment_id, "new")
+        self.assertIn("new", self.__get_comments())
+
+        self.handler.removeComment(comment_id)
+        self.assertNotIn("new", self.__get_comments())
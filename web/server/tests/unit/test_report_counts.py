@@ -0,0 +1,161 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the report count summary. """
+
+
+from datetime import datetime
+import unittest
+
+import sqlalchemy
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.expression import func
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import CompareData, \
+    DetectionStatus, ReportFilter, ReviewStatus, Severity
+
+from codechecker_server.api.report_server import apply_report_filter, \
+    get_report_count_query, is_report_count_filter, process_report_filter
+from codechecker_server.database.bulk_insert import insert_rows
+from codechecker_server.database.report_counts import \
+    refresh_report_counts, update_review_status_counts
+from codechecker_server.database.run_db_model import Base, Checker, File, \
+    FileContent, Report, ReportCount, Run
+
+
+class ReportCountTest(unittest.TestCase):
+    """
+    Test that the summary counts the reports like the queries of the reports
+    table.
+    """
+
+    def setUp(self):
+        engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+
+        self.runs = [Run("run1", "v1"), Run("run2", "v1")]
+        self.checkers = [Checker("clangsa", "core.NullDereference",
+                                 Severity.HIGH),
+                         Checker("clang-tidy", "misc-unused", Severity.LOW)]
+        self.session.add_all(self.runs + self.checkers +
+                             [FileContent("hash", b"content", None)])
+        self.session.flush()
+        self.files = [File("/a.c", "hash", None, None),
+                      File("/b.c", "hash", None, None)]
+        self.session.add_all(self.files)
+        self.session.flush()
+
+        rows = []
+        for i in range(40):
+            rows.append({
+                "file_id": self.files[i % 2].id,
+                "run_id": self.runs[i % 3 % 2].id,
+                "bug_id": f"hash{i % 10}",
+                "checker_id": self.checkers[i % 5 % 2].id,
+                "line": i,
+                "column": 1,
+                "path_length": 1,
+                "checker_message": "message",
+                "detection_status": ["new", "resolved", "unresolved"][i % 3],
+                "review_status": ["unreviewed", "confirmed"][i % 7 % 2],
+                "review_status_author": None,
+                "review_status_message": None,
+                "review_status_date": None,
+                "review_status_is_in_source": i % 4 == 0,
+                "detected_at": datetime.now(),
+                "fixed_at": None})
+        insert_rows(self.session, Report.__table__, rows)
+
+        refresh_report_counts(self.session, [run.id for run in self.runs])
+
+    def tearDown(self):
+        self.session.close()
+
+    def __summary(self):
+        return sorted(self.session.query(
+            ReportCount.run_id, ReportCount.checker_id, ReportCount.file_id,
+            ReportCount.detection_status, ReportCount.review_status,
+            ReportCount.count))
+
+    def __counts(self, run_ids, report_filter, columns, tables=None,
+                 report_columns=None):
+        """ Count the reports both from the summary and the reports. """
+        self.assertTrue(is_report_count_filter(report_filter, None))
+
+        summary = sorted(get_report_count_query(
+            self.session, run_ids, report_filter, columns, tables).all())
+
+        report_columns = report_columns or columns
+        filter_expression, join_tables = process_report_filter(
+            self.session, run_ids, report_filter)
+        q = self.session.query(*report_columns, func.count(Report.id)) \
+            .select_from(Report)
+        q = apply_report_filter(q, filter_expression,
+                                join_tables + list(tables or []))
+        reports = sorted(q.group_by(*report_columns).all())
+
+        self.assertEqual(summary, reports)
+        return summary
+
+    def test_counts(self):
+        """ The grouped counts are the same as the counts of the reports. """
+        run_ids = [self.runs[0].id]
+
+        counts = self.__counts(None, ReportFilter(),
+                               [Checker.checker_name, Checker.severity],
+                               [Checker])
+        self.assertEqual(sum(c for _, _, c in counts), 40)
+
+        self.__counts(run_ids, ReportFilter(), [File.filepath], [File])
+        self.__counts(run_ids, ReportFilter(
+            checkerName=['core.*'],
+            detectionStatus=[DetectionStatus.NEW]),
+            [ReportCount.review_status],
+            report_columns=[Report.review_status])
+        self.__counts(None, ReportFilter(
+            filepath=['/a*'],
+            reviewStatus=[ReviewStatus.CONFIRMED]),
+            [Checker.analyzer_name], [Checker])
+
+    def test_review_status_change(self):
+        """ The counts follow the review status changes of the reports. """
+        for bug_hash, review_status in [('hash1', 'false_positive'),
+                                        ('hash2', 'unreviewed'),
+                                        ('hash1', 'confirmed')]:
+            condition = sqlalchemy.and_(
+                Report.bug_id == bug_hash,
+                Report.review_status_is_in_source.is_(False))
+
+            update_review_status_counts(self.session, condition,
+                                        review_status)
+            self.session.query(Report).filter(condition) \
+                .update({'review_status': review_status},
+                        synchronize_session=False)
+
+            summary = self.__summary()
+            refresh_report_counts(self.session,
+                                  [run.id for run in self.runs])
+            self.assertEqual(summary, self.__summary())
+
+    def test_uncovered_filter(self):
+        """ Filters on other fields are not counted by the summary. """
+        self.assertTrue(is_report_count_filter(None, None))
+        self.assertTrue(is_report_count_filter(
+            ReportFilter(runName=['run*'], severity=[Severity.HIGH]), None))
+
+        for report_filter in [ReportFilter(isUnique=True),
+                              ReportFilter(checkerMsg=['message']),
+                              ReportFilter(reportHash=[]),
+                              ReportFilter(runTag=[1]),
+                              ReportFilter(filepath=['/a.c'],
+                                           fileMatchesAnyPoint=True)]:
+            self.assertFalse(is_report_count_filter(report_filter, None))
+
+        self.assertFalse(is_report_count_filter(
+            ReportFilter(), CompareData(runIds=[1])))
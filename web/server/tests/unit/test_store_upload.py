@@ -0,0 +1,133 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the chunked upload of store ZIP files. """
+
+
+from hashlib import sha256
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+from codechecker_api_shared.ttypes import RequestFailed
+
+from codechecker_server.api.store_upload import StoreUpload, \
+    remove_stale_uploads
+
+
+def checksum(data: bytes) -> str:
+    return sha256(data).hexdigest()
+
+
+class StoreUploadTest(unittest.TestCase):
+    """
+    Test the assembly of uploaded chunks.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.upload_dir = Path(self.tmp_dir.name)
+        self.data = os.urandom(1000)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def begin(self, user_name="user"):
+        return StoreUpload.begin(self.upload_dir, 1, user_name,
+                                 checksum(self.data), len(self.data))
+
+    def upload(self, upload, start, end):
+        chunk = self.data[start:end]
+        return upload.write_chunk(start, chunk, checksum(chunk))
+
+    def test_upload(self):
+        """ The uploaded chunks are assembled to the original file. """
+        upload = self.begin()
+        self.assertEqual(upload.received_size, 0)
+
+        self.assertEqual(self.upload(upload, 0, 400), 400)
+        self.assertEqual(self.upload(upload, 400, 1000), 1000)
+
+        target = self.upload_dir / "store.zip"
+        self.assertEqual(upload.finish(target), len(self.data))
+        self.assertEqual(target.read_bytes(), self.data)
+        self.assertEqual(list(self.upload_dir.iterdir()), [target])
+
+    def test_resume(self):
+        """ An interrupted upload continues from the received size. """
+        self.upload(self.begin(), 0, 400)
+
+        upload = self.begin()
+        self.assertEqual(upload.received_size, 400)
+
+        # Resending an already received chunk is accepted.
+        self.assertEqual(self.upload(upload, 0, 400), 400)
+        self.assertEqual(self.upload(upload, 400, 1000), 1000)
+
+        target = self.upload_dir / "store.zip"
+        upload.finish(target)
+        self.assertEqual(target.read_bytes(), self.data)
+
+    def test_concurrent_workers(self):
+        """
+        The received size is read again before a chunk is written, because
+        the same upload may be continued by another API worker.
+        """
+        upload = self.begin()
+        other_worker = StoreUpload(self.upload_dir, upload.upload_id, 1,
+                                   "user")
+
+        self.assertEqual(self.upload(upload, 0, 400), 400)
+
+        # The other worker doesn't write the resent chunk again, and it
+        # accepts the next chunk.
+        self.assertEqual(self.upload(other_worker, 0, 400), 400)
+        self.assertEqual(self.upload(other_worker, 400, 1000), 1000)
+
+        # The first worker sees the chunks written by the other one.
+        self.assertEqual(self.upload(upload, 400, 500), 1000)
+
+        target = self.upload_dir / "store.zip"
+        upload.finish(target)
+        self.assertEqual(target.read_bytes(), self.data)
+
+    def test_invalid_chunks(self):
+        """ Corrupted and out of order chunks are rejected. """
+        upload = self.begin()
+
+        with self.assertRaises(RequestFailed):
+            upload.write_chunk(0, self.data[:100], checksum(b"other"))
+
+        with self.assertRaises(RequestFailed):
+            self.upload(upload, 100, 200)
+
+        with self.assertRaises(RequestFailed):
+            upload.finish(self.upload_dir / "store.zip")
+
+        self.assertEqual(upload.received_size, 0)
+
+    def test_other_user(self):
+        """ An upload can not be continued by another user. """
+        upload = self.begin()
+
+        with self.assertRaises(RequestFailed):
+            StoreUpload(self.upload_dir, upload.upload_id, 1, "other")
+
+        with self.assertRaises(RequestFailed):
+            StoreUpload(self.upload_dir, "../" + upload.upload_id, 1, "user")
+
+        self.assertNotEqual(self.begin("other").upload_id, upload.upload_id)
+
+    def test_remove_stale_uploads(self):
+        """ Uploads which were not continued for a long time are removed. """
+        self.begin()
+
+        self.assertEqual(remove_stale_uploads(self.upload_dir), 0)
+        self.assertEqual(remove_stale_uploads(self.upload_dir, max_age=-1), 2)
+        self.assertEqual(list(self.upload_dir.iterdir()), [])
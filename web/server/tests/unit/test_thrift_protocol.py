@@ -0,0 +1,58 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the Thrift protocol negotiation. """
+
+
+import unittest
+
+from thrift.transport import TTransport
+
+from codechecker_api.codeCheckerDBAccess_v6 import ttypes
+
+from codechecker_web.shared.thrift_protocol import CONTENT_TYPES, \
+    get_protocol_factory, get_protocol_name
+
+
+class ThriftProtocolTest(unittest.TestCase):
+    """
+    Test selecting the Thrift protocol by the Content-Type of the request.
+    """
+
+    def test_protocol_name(self):
+        """ The first binary protocol content type is used. """
+        self.assertEqual(get_protocol_name([]), "json")
+        self.assertEqual(get_protocol_name(["application/x-thrift"]), "json")
+        self.assertEqual(
+            get_protocol_name(["application/vnd.apache.thrift.json"]), "json")
+        self.assertEqual(
+            get_protocol_name(["application/x-thrift",
+                               "application/vnd.apache.thrift.binary"]),
+            "binary")
+        self.assertEqual(
+            get_protocol_name(["Application/Vnd.Apache.Thrift.Compact; "
+                               "charset=utf-8"]),
+            "compact")
+
+    def test_round_trip(self):
+        """ Every protocol reads back the message it wrote. """
+        report = ttypes.ReportData(runId=1,
+                                   checkerId="core.NullDereference",
+                                   bugHash="hash",
+                                   checkerMsg="Dereference of null pointer",
+                                   reportId=42,
+                                   line=10)
+
+        for name in CONTENT_TYPES:
+            otrans = TTransport.TMemoryBuffer()
+            report.write(get_protocol_factory(name).getProtocol(otrans))
+
+            result = ttypes.ReportData()
+            result.read(get_protocol_factory(name).getProtocol(
+                TTransport.TMemoryBuffer(otrans.getvalue())))
+            self.assertEqual(result, report, name)
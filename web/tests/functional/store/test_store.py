@@ -22,7 +22,8 @@ import unittest
 
 from codechecker_report_converter import util
 
-from codechecker_api.codeCheckerDBAccess_v6.ttypes import AnalysisInfoFilter
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import \
+    AnalysisInfoFilter, DetectionStatus
 from libtest import codechecker
 from libtest import env
 from libtest import plist_test
@@ -243,6 +244,108 @@ class TestStore(unittest.TestCase):
         for report in reports:
             self.assertIn(report["checkedFile"], trimmed_paths)
 
+    def test_store_unchanged_reports(self):
+        """
+        Storing the same results again keeps the already stored reports and
+        only updates their detection status.
+        """
+        run_name = "unchanged_store_test"
+        store_cmd = [
+            env.codechecker_cmd(), "store",
+            self._divide_zero_workspace,
+            "--name", run_name,
+            "--url", env.parts_to_url(self._codechecker_cfg)]
+        query_cmd = [
+            env.codechecker_cmd(), "cmd", "results",
+            run_name,
+            "--url", env.parts_to_url(self._codechecker_cfg),
+            "-o", "json"]
+
+        def get_reports():
+            ret, out, _ = _call_cmd(query_cmd)
+            self.assertEqual(ret, 0, "Could not read from server.")
+            return {r["reportId"]: r["detectionStatus"]
+                    for r in json.loads(out)}
+
+        ret, _, _ = _call_cmd(store_cmd)
+        self.assertEqual(ret, 0, "Plist file could not store.")
+        reports = get_reports()
+        self.assertTrue(reports)
+        self.assertEqual(set(reports.values()), {DetectionStatus.NEW})
+
+        ret, _, _ = _call_cmd(store_cmd)
+        self.assertEqual(ret, 0, "Plist file could not store.")
+        stored_again = get_reports()
+        self.assertEqual(stored_again.keys(), reports.keys())
+        self.assertEqual(set(stored_again.values()),
+                         {DetectionStatus.UNRESOLVED})
+
+        rm_cmd = [
+            env.codechecker_cmd(), "cmd", "del",
+            "-n", run_name,
+            "--url", env.parts_to_url(self._codechecker_cfg)]
+        _call_cmd(rm_cmd)
+
+    def test_store_unchanged_reports_analysis_info(self):
+        """
+        The reports kept by a store get the analysis info of that store.
+        """
+        run_name = "unchanged_store_analysis_info_test"
+        cfg = dict(self._codechecker_cfg)
+        codechecker.log(cfg, self._divide_zero_workspace)
+
+        report_dir = os.path.join(self._temp_workspace, 'kept_reports')
+        cfg['reportdir'] = report_dir
+        codechecker.analyze(cfg, self._divide_zero_workspace)
+
+        store_cmd = [
+            env.codechecker_cmd(), "store", report_dir,
+            "--name", run_name,
+            "--url", env.parts_to_url(self._codechecker_cfg)]
+        query_cmd = [
+            env.codechecker_cmd(), "cmd", "results",
+            run_name,
+            "--url", env.parts_to_url(self._codechecker_cfg),
+            "-o", "json"]
+
+        def get_report_analysis_info():
+            ret, _, _ = _call_cmd(store_cmd)
+            self.assertEqual(ret, 0, "Plist file could not store.")
+
+            ret, out, _ = _call_cmd(query_cmd)
+            self.assertEqual(ret, 0, "Could not read from server.")
+            reports = json.loads(out)
+            self.assertTrue(reports)
+
+            return {r["reportId"]: self._cc_client.getAnalysisInfo(
+                AnalysisInfoFilter(reportId=r["reportId"]), None, 0)
+                for r in reports}
+
+        analysis_info = get_report_analysis_info()
+
+        with open(os.path.join(report_dir, 'metadata.json'), 'r+',
+                  encoding="utf-8", errors="ignore") as f:
+            data = json.load(f)
+            data["tools"][0]["command"].append("--kept-report-test")
+
+            f.seek(0)
+            f.truncate()
+            json.dump(data, f)
+
+        kept_analysis_info = get_report_analysis_info()
+        self.assertEqual(kept_analysis_info.keys(), analysis_info.keys())
+        for infos in kept_analysis_info.values():
+            self.assertEqual(len(infos), 1)
+            self.assertIn("--kept-report-test", infos[0].analyzerCommand)
+
+        rm_cmd = [
+            env.codechecker_cmd(), "cmd", "del",
+            "-n", run_name,
+            "--url", env.parts_to_url(self._codechecker_cfg)]
+        _call_cmd(rm_cmd)
+
+        shutil.rmtree(report_dir, ignore_errors=True)
+
     def test_store_multiple_report_dirs(self):
         """ Test storing multiple report directories.
 